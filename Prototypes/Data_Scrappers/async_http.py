@@ -0,0 +1,296 @@
+#!/usr/bin/env python3
+"""
+Opt-in asyncio HTTP engine for universal_scraper (brand config ``"engine": "async"`` or ``--engine async``).
+
+Strategies whose fan-out is one request per item (viewport tiles per grid level, geohash buckets,
+country catalog, pagination_fetch_urls) hand the whole batch to ``request_many``: the requests run as coroutines on
+one shared event loop (aiohttp, or httpx when aiohttp is not installed), paced by the host's token
+bucket, with per-host ``asyncio.Semaphore`` limits deciding how many sockets a host gets.
+``AsyncHttpClient`` also keeps the request/get/post/close surface of ``http_client.BrandHttpClient``,
+so strategies with multi-step work per item (pagination within a center or country) still run on
+worker threads that each wait on one coroutine at a time.
+"""
+
+import asyncio
+import json
+import threading
+import time
+from typing import Any, Dict, List, Optional, Tuple
+from urllib.parse import urlparse
+
+import requests
+from requests.structures import CaseInsensitiveDict
+
+try:
+    import aiohttp
+    ASYNC_BACKEND: Optional[str] = "aiohttp"
+except ImportError:
+    aiohttp = None
+    try:
+        import httpx
+        ASYNC_BACKEND = "httpx"
+    except ImportError:
+        httpx = None
+        ASYNC_BACKEND = None
+
+from http_client import (
+    DEFAULT_BACKOFF_FACTOR,
+    DEFAULT_RETRIES,
+    DEFAULT_USER_AGENT,
+    RETRY_METHODS,
+    RETRY_STATUS_FORCELIST,
+    TokenBucket,
+)
+
+DEFAULT_PER_HOST_LIMIT = 8
+DEFAULT_TOTAL_LIMIT = 64
+DEFAULT_TIMEOUT = 30
+
+
+class AsyncResponse:
+    """The subset of ``requests.Response`` the strategies read (status, headers, body, json)."""
+
+    def __init__(self, url: str, status_code: int, headers: Dict[str, str], content: bytes, encoding: Optional[str]):
+        self.url = url
+        self.status_code = status_code
+        self.headers = CaseInsensitiveDict(headers)
+        self.content = content
+        self.encoding = encoding or "utf-8"
+
+    @property
+    def ok(self) -> bool:
+        return self.status_code < 400
+
+    @property
+    def text(self) -> str:
+        return self.content.decode(self.encoding, errors="replace")
+
+    def json(self) -> Any:
+        return json.loads(self.text)
+
+    def raise_for_status(self) -> None:
+        if 400 <= self.status_code < 600:
+            kind = "Client" if self.status_code < 500 else "Server"
+            raise requests.exceptions.HTTPError(
+                f"{self.status_code} {kind} Error for url: {self.url}", response=self
+            )
+
+
+def _timeout_seconds(timeout: Any) -> float:
+    """requests accepts a float or a (connect, read) tuple; the async backends get one total."""
+    if isinstance(timeout, (tuple, list)):
+        return float(sum(t for t in timeout if t))
+    return float(timeout) if timeout else DEFAULT_TIMEOUT
+
+
+class AsyncHttpClient:
+    """
+    Brand-scoped asyncio client with per-host concurrency limits.
+
+    Optional brand config ``async_engine`` object:
+      - per_host_limit (int): concurrent requests per host (default ``concurrency`` or 8)
+      - total_limit (int): concurrent requests across all hosts (default 64)
+    ``http_pool.per_host`` sizes override the per-host limit for those hosts, and
+    ``http_pool.retries`` / ``backoff_factor`` retry 429/5xx, connection errors and timeouts like the sync client.
+    """
+
+    is_async = True
+
+    def __init__(self, brand_config: Optional[Dict] = None):
+        if ASYNC_BACKEND is None:
+            raise RuntimeError("async engine needs aiohttp or httpx (pip install aiohttp)")
+        brand_config = brand_config or {}
+        engine_cfg = brand_config.get("async_engine") if isinstance(brand_config.get("async_engine"), dict) else {}
+        pool_cfg = brand_config.get("http_pool") if isinstance(brand_config.get("http_pool"), dict) else {}
+
+        try:
+            default_per_host = int(brand_config.get("concurrency") or DEFAULT_PER_HOST_LIMIT)
+        except (TypeError, ValueError):
+            default_per_host = DEFAULT_PER_HOST_LIMIT
+        self.per_host_limit = max(1, int(engine_cfg.get("per_host_limit", default_per_host)))
+        self.total_limit = max(self.per_host_limit, int(engine_cfg.get("total_limit", DEFAULT_TOTAL_LIMIT)))
+        # Strategies cap their fan-out workers at pool_maxsize, same as with BrandHttpClient
+        self.pool_maxsize = self.total_limit
+        self.retries = int(pool_cfg.get("retries", DEFAULT_RETRIES))
+        self.backoff_factor = float(pool_cfg.get("backoff_factor", DEFAULT_BACKOFF_FACTOR))
+
+        self._host_limits: Dict[str, int] = {}
+        per_host = pool_cfg.get("per_host") if isinstance(pool_cfg.get("per_host"), dict) else {}
+        for host, size in per_host.items():
+            try:
+                host_size = max(1, int(size))
+            except (TypeError, ValueError):
+                continue
+            host = urlparse(host).netloc or str(host).strip().strip("/")
+            if host:
+                self._host_limits[host.lower()] = host_size
+
+        self.headers: Dict[str, str] = {"User-Agent": DEFAULT_USER_AGENT}
+        custom_headers = brand_config.get("custom_headers")
+        if isinstance(custom_headers, dict):
+            self.headers.update(custom_headers)
+
+        self._semaphores: Dict[str, asyncio.Semaphore] = {}
+        self._session: Any = None
+        self._loop = asyncio.new_event_loop()
+        self._thread = threading.Thread(target=self._loop.run_forever, name="async-http", daemon=True)
+        self._thread.start()
+
+    # -- event loop side ------------------------------------------------------
+
+    def _semaphore(self, host: str) -> asyncio.Semaphore:
+        sem = self._semaphores.get(host)
+        if sem is None:
+            sem = asyncio.Semaphore(self._host_limits.get(host, self.per_host_limit))
+            self._semaphores[host] = sem
+        return sem
+
+    async def _get_session(self) -> Any:
+        if self._session is None:
+            if ASYNC_BACKEND == "aiohttp":
+                connector = aiohttp.TCPConnector(limit=self.total_limit, limit_per_host=0)
+                self._session = aiohttp.ClientSession(connector=connector)
+            else:
+                limits = httpx.Limits(max_connections=self.total_limit, max_keepalive_connections=self.total_limit)
+                self._session = httpx.AsyncClient(limits=limits)
+        return self._session
+
+    async def _send_once(self, method: str, url: str, headers: Dict[str, str], kwargs: Dict[str, Any]) -> AsyncResponse:
+        session = await self._get_session()
+        timeout = _timeout_seconds(kwargs.get("timeout"))
+        allow_redirects = kwargs.get("allow_redirects", True)
+        params, data, json_body = kwargs.get("params"), kwargs.get("data"), kwargs.get("json")
+        try:
+            if ASYNC_BACKEND == "aiohttp":
+                async with session.request(
+                    method, url, headers=headers, params=params, data=data, json=json_body,
+                    allow_redirects=allow_redirects, timeout=aiohttp.ClientTimeout(total=timeout),
+                ) as resp:
+                    body = await resp.read()
+                    return AsyncResponse(str(resp.url), resp.status, dict(resp.headers), body, resp.charset)
+            resp = await session.request(
+                method, url, headers=headers, params=params, data=data, json=json_body,
+                follow_redirects=allow_redirects, timeout=timeout,
+            )
+            return AsyncResponse(str(resp.url), resp.status_code, dict(resp.headers), resp.content, resp.charset_encoding)
+        except asyncio.TimeoutError as e:
+            raise requests.exceptions.Timeout(f"Request to {url} timed out after {timeout}s") from e
+        except Exception as e:
+            if ASYNC_BACKEND == "httpx" and isinstance(e, httpx.TimeoutException):
+                raise requests.exceptions.Timeout(str(e)) from e
+            raise requests.exceptions.ConnectionError(f"{type(e).__name__}: {e}") from e
+
+    async def arequest(self, method: str, url: str, limiter: Optional[TokenBucket] = None, **kwargs: Any) -> AsyncResponse:
+        """
+        Coroutine form of ``request``; retries 429/5xx, connection errors and timeouts with exponential
+        backoff, as urllib3's Retry does for the sync client.
+        ``limiter`` (the host's token bucket) paces every attempt without blocking the loop.
+        """
+        method = method.upper()
+        headers = dict(self.headers)
+        if kwargs.get("headers"):
+            headers.update(kwargs["headers"])
+        retries = self.retries if method in RETRY_METHODS else 0
+        host = urlparse(url).netloc.lower()
+        attempt = 0
+        while True:
+            if limiter is not None:
+                wait = limiter.try_acquire()
+                while wait:
+                    await asyncio.sleep(wait)
+                    wait = limiter.try_acquire()
+            async with self._semaphore(host):
+                try:
+                    resp = await self._send_once(method, url, headers, kwargs)
+                except (requests.exceptions.ConnectionError, requests.exceptions.Timeout):
+                    if attempt >= retries:
+                        raise
+                    resp = None
+            if resp is not None and (resp.status_code not in RETRY_STATUS_FORCELIST or attempt >= retries):
+                return resp
+            attempt += 1
+            # Same schedule as urllib3's Retry (no wait before the first retry); sleep outside
+            # the semaphore so a backing-off request does not hold a host slot
+            if attempt > 1:
+                await asyncio.sleep(self.backoff_factor * (2 ** (attempt - 1)))
+
+    async def _gather(self, calls: List[Tuple[str, str, Dict[str, Any]]], limiter: Optional[TokenBucket]) -> List[Any]:
+        return await asyncio.gather(
+            *(self.arequest(method, url, limiter=limiter, **kwargs) for method, url, kwargs in calls),
+            return_exceptions=True,
+        )
+
+    # -- caller side ----------------------------------------------------------
+
+    def request(self, method: str, url: str, **kwargs: Any) -> AsyncResponse:
+        return asyncio.run_coroutine_threadsafe(self.arequest(method, url, **kwargs), self._loop).result()
+
+    def get(self, url: str, **kwargs: Any) -> AsyncResponse:
+        return self.request("GET", url, **kwargs)
+
+    def post(self, url: str, **kwargs: Any) -> AsyncResponse:
+        return self.request("POST", url, **kwargs)
+
+    def request_many(self, calls: List[Tuple[str, str, Dict[str, Any]]], limiter: Optional[TokenBucket] = None) -> List[Any]:
+        """
+        Run ``(method, url, kwargs)`` calls as concurrent coroutines, each paced by ``limiter``
+        when given. Returns responses in call order; a failed call yields its exception instead of raising.
+        """
+        return asyncio.run_coroutine_threadsafe(self._gather(calls, limiter), self._loop).result()
+
+    def close(self) -> None:
+        if not self._loop.is_running():
+            return
+
+        async def _close_session() -> None:
+            if self._session is not None:
+                if ASYNC_BACKEND == "aiohttp":
+                    await self._session.close()
+                else:
+                    await self._session.aclose()
+                self._session = None
+
+        asyncio.run_coroutine_threadsafe(_close_session(), self._loop).result()
+        self._loop.call_soon_threadsafe(self._loop.stop)
+        self._thread.join(timeout=5)
+        self._loop.close()
+
+
+if __name__ == "__main__":
+    # Self-test against a local server: per-host limit is respected and order is preserved.
+    from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+    state = {"active": 0, "peak": 0}
+    lock = threading.Lock()
+
+    class _Handler(BaseHTTPRequestHandler):
+        def log_message(self, *args: Any) -> None:
+            pass
+
+        def do_GET(self) -> None:
+            with lock:
+                state["active"] += 1
+                state["peak"] = max(state["peak"], state["active"])
+            time.sleep(0.05)
+            with lock:
+                state["active"] -= 1
+            body = json.dumps({"path": self.path}).encode()
+            self.send_response(200)
+            self.send_header("Content-Type", "application/json")
+            self.end_headers()
+            self.wfile.write(body)
+
+    server = ThreadingHTTPServer(("127.0.0.1", 0), _Handler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    base = f"http://127.0.0.1:{server.server_port}"
+
+    client = AsyncHttpClient({"concurrency": 4})
+    started = time.time()
+    responses = client.request_many([("GET", f"{base}/{i}", {"timeout": 5}) for i in range(20)])
+    elapsed = time.time() - started
+    assert [r.json()["path"] for r in responses] == [f"/{i}" for i in range(20)]
+    assert state["peak"] <= 4, state
+    assert client.get(f"{base}/x").json() == {"path": "/x"}
+    client.close()
+    server.shutdown()
+    print(f"✅ async_http self-test passed ({ASYNC_BACKEND}, 20 requests in {elapsed:.2f}s, peak {state['peak']}/host)")
@@ -0,0 +1,5 @@
+"""Pytest collection settings for Prototypes/Data_Scrappers."""
+
+# dev_tools/test_scraping.py is a CLI that scrapes live brand sites (python dev_tools/test_scraping.py),
+# not a pytest module; its test_brand(brand_id, ...) would be collected as a test with missing fixtures
+collect_ignore = ["dev_tools"]
@@ -1,11 +1,39 @@
 #!/usr/bin/env python3
-"""Shared coordinate validation for data_normalizer and pattern_detector."""
+"""
+Shared coordinate validation and distance helpers for data_normalizer, validate_csv,
+pattern_detector and near_duplicates.
+
+validate_coordinate_columns checks whole Latitude/Longitude columns at once (parse, range,
+precision, 0,0 and swapped-axis suspects) with NumPy when it is installed, and falls back to the
+same per-value rules in plain Python when it is not; both give identical results.
+"""
 
 import math
-from typing import Any, Optional
+from functools import cached_property
+from typing import Any, Iterable, List, Optional, Tuple
+
+try:
+    import numpy as np
+    NUMPY_AVAILABLE = True
+except ImportError:
+    np = None
+    NUMPY_AVAILABLE = False
 
 EARTH_RADIUS_METERS = 6371000
 
+COORDINATE_DECIMALS = 7  # normalized output precision; more than this in the input is flagged
+COORDINATE_ERRORS = (None, "empty", "not_a_number", "invalid_number", "out_of_range")  # error code = position
+SUSPECT_ZERO_ISLAND = "zero_island"
+SUSPECT_SWAPPED = "swapped"
+
+_EMPTY, _NOT_A_NUMBER, _INVALID_NUMBER, _OUT_OF_RANGE = 1, 2, 3, 4
+_LATITUDE_LIMIT = 90.0
+_LONGITUDE_LIMIT = 180.0
+_ZERO_ISLAND_DEGREES = 1e-6  # same threshold as near_duplicates.usable_coordinates
+
+# (lat error, lat decimals if > COORDINATE_DECIMALS, lon error, lon decimals, suspect)
+CoordinateCheck = Tuple[Optional[str], Optional[int], Optional[str], Optional[int], Optional[str]]
+
 
 def validate_coordinate_value(value: Any, coord_type: str = "latitude") -> Optional[float]:
     if value is None or value == "":
@@ -32,3 +60,250 @@ def validate_coordinate_value(value: Any, coord_type: str = "latitude") -> Optio
 def normalize_coordinate_string(value: Any, coord_type: str = "latitude") -> str:
     coord = validate_coordinate_value(value, coord_type)
     return f"{coord:.7f}" if coord is not None else ""
+
+
+def coordinate_decimals(value: float) -> int:
+    """Decimal places in str(value): 48.8566 → 4; exponent forms like 1e-08 count as 0."""
+    text = str(value)
+    return len(text.split('.')[1]) if '.' in text else 0
+
+
+def _coordinate_text(value: Any) -> str:
+    return value if isinstance(value, str) else "" if value is None else str(value)
+
+
+def _parse_coordinate(text: str, limit: float) -> Tuple[float, int]:
+    """(value, error code); value is nan unless the text is a finite number, kept when out of range."""
+    if not text.strip():
+        return math.nan, _EMPTY
+    try:
+        coord = float(text)
+    except ValueError:
+        return math.nan, _NOT_A_NUMBER
+    if not math.isfinite(coord):
+        return math.nan, _INVALID_NUMBER
+    if not -limit <= coord <= limit:
+        return coord, _OUT_OF_RANGE
+    return coord, 0
+
+
+def _excess_decimals(value: float, code: int) -> Optional[int]:
+    # round() leaves exactly the values whose shortest repr has at most that many decimals unchanged
+    if code or round(value, COORDINATE_DECIMALS) == value:
+        return None
+    decimals = coordinate_decimals(value)
+    return decimals if decimals > COORDINATE_DECIMALS else None
+
+
+def _suspect(lat: float, lat_code: int, lon: float, lon_code: int) -> Optional[str]:
+    if not lat_code and not lon_code and abs(lat) < _ZERO_ISLAND_DEGREES and abs(lon) < _ZERO_ISLAND_DEGREES:
+        return SUSPECT_ZERO_ISLAND
+    if lat_code == _OUT_OF_RANGE and abs(lat) <= _LONGITUDE_LIMIT and not lon_code and abs(lon) <= _LATITUDE_LIMIT:
+        return SUSPECT_SWAPPED
+    return None
+
+
+def check_coordinate_pair(latitude: Any, longitude: Any) -> CoordinateCheck:
+    """
+    One row's coordinate check, as CSVValidator reports it: each axis's COORDINATE_ERRORS name
+    (None if valid) and its decimal places when over COORDINATE_DECIMALS, then SUSPECT_ZERO_ISLAND,
+    SUSPECT_SWAPPED or None.
+    """
+    lat, lat_code = _parse_coordinate(_coordinate_text(latitude), _LATITUDE_LIMIT)
+    lon, lon_code = _parse_coordinate(_coordinate_text(longitude), _LONGITUDE_LIMIT)
+    return (
+        COORDINATE_ERRORS[lat_code], _excess_decimals(lat, lat_code),
+        COORDINATE_ERRORS[lon_code], _excess_decimals(lon, lon_code),
+        _suspect(lat, lat_code, lon, lon_code),
+    )
+
+
+def _is_array(column: Any) -> bool:
+    return NUMPY_AVAILABLE and isinstance(column, np.ndarray)
+
+
+def _indices(mask: Any) -> List[int]:
+    if _is_array(mask):
+        return np.flatnonzero(mask).tolist()
+    return [i for i, flag in enumerate(mask) if flag]
+
+
+def _tolist(column: Any) -> list:
+    return column.tolist() if _is_array(column) else list(column)
+
+
+def _parse_column(texts: List[str]) -> Tuple[List[float], List[int]]:
+    """
+    float() of every text (nan when blank or not a number) and codes that are _EMPTY for blank
+    texts, _NOT_A_NUMBER for other texts that do not parse and 0 otherwise. CPython's float() is
+    faster on str than NumPy's string-to-float64 cast, and accepts exactly what the per-row path does.
+    """
+    nan = math.nan
+    values: List[float] = []
+    unparsed: List[int] = []
+    remaining = iter(texts)
+    while True:
+        try:
+            # A text that raises is already consumed, so the next extend resumes after it
+            values.extend(float(text) if text and not text.isspace() else nan for text in remaining)
+            break
+        except ValueError:
+            unparsed.append(len(values))
+            values.append(nan)
+    codes = [0 if text and not text.isspace() else _EMPTY for text in texts]
+    for i in unparsed:
+        codes[i] = _NOT_A_NUMBER
+    return values, codes
+
+
+def _classify(values: List[float], codes: List[int], limit: float, use_numpy: bool) -> Tuple[Any, Any]:
+    """Finite and range checks over a parsed column; inf becomes nan, like an unparsed value."""
+    if use_numpy:
+        values = np.array(values, dtype=np.float64)
+        codes = np.array(codes, dtype=np.int8)
+        finite = np.isfinite(values)
+        codes[(codes == 0) & ~finite] = _INVALID_NUMBER
+        codes[finite & (np.abs(values) > limit)] = _OUT_OF_RANGE
+        values[~finite] = np.nan
+        return values, codes
+    codes = [
+        code or (0 if -limit <= value <= limit else _OUT_OF_RANGE if math.isfinite(value) else _INVALID_NUMBER)
+        for value, code in zip(values, codes)
+    ]
+    values = [value if code != _INVALID_NUMBER else math.nan for value, code in zip(values, codes)]
+    return values, codes
+
+
+def _precise(values: Any, codes: Any) -> Any:
+    # round() leaves exactly the values whose shortest repr has at most that many decimals
+    # unchanged; coordinate_decimals settles the rest (1e-08 has none by its count)
+    digits = COORDINATE_DECIMALS
+    if _is_array(values):
+        flagged = (codes == 0) & (np.round(values, digits) != values)
+        for i in np.flatnonzero(flagged).tolist():
+            flagged[i] = coordinate_decimals(float(values[i])) > digits
+        return flagged
+    return [not code and round(value, digits) != value and coordinate_decimals(value) > digits
+            for value, code in zip(values, codes)]
+
+
+_FORMAT_COORDINATE = f"%.{COORDINATE_DECIMALS}f".__mod__
+
+
+class CoordinateColumns:
+    """
+    validate_coordinate_columns results, one entry per row. Columns are NumPy arrays when NumPy
+    is available and lists otherwise:
+      latitude, longitude        parsed floats; nan unless a finite number (out-of-range values kept)
+      lat_error, lon_error       error codes, COORDINATE_ERRORS[code] (0 = valid)
+      lat_valid, lon_valid       error code is 0
+      lat_precise, lon_precise   valid with more than COORDINATE_DECIMALS decimal places
+      zero_island                both valid and within 1e-6° of 0,0 (a placeholder, not a store)
+      swapped                    latitude out of range but fits as a longitude, and the longitude
+                                 fits as a latitude: the columns look swapped
+    The last three are computed on first use, so normalized() alone pays only for parsing.
+    """
+
+    def __init__(self, latitude: Any, lat_error: Any, longitude: Any, lon_error: Any):
+        self.latitude = latitude
+        self.longitude = longitude
+        self.lat_error = lat_error
+        self.lon_error = lon_error
+        if _is_array(lat_error):
+            self.lat_valid = lat_error == 0
+            self.lon_valid = lon_error == 0
+        else:
+            self.lat_valid = [code == 0 for code in lat_error]
+            self.lon_valid = [code == 0 for code in lon_error]
+
+    def __len__(self) -> int:
+        return len(self.lat_error)
+
+    @cached_property
+    def lat_precise(self) -> Any:
+        return _precise(self.latitude, self.lat_error)
+
+    @cached_property
+    def lon_precise(self) -> Any:
+        return _precise(self.longitude, self.lon_error)
+
+    @cached_property
+    def zero_island(self) -> Any:
+        lat, lon, zero = self.latitude, self.longitude, _ZERO_ISLAND_DEGREES
+        if _is_array(lat):
+            return self.lat_valid & self.lon_valid & (np.abs(lat) < zero) & (np.abs(lon) < zero)
+        return [a and b and abs(x) < zero and abs(y) < zero
+                for x, a, y, b in zip(lat, self.lat_valid, lon, self.lon_valid)]
+
+    @cached_property
+    def swapped(self) -> Any:
+        lat, lon, lat_limit, lon_limit = self.latitude, self.longitude, _LATITUDE_LIMIT, _LONGITUDE_LIMIT
+        if _is_array(lat):
+            return ((self.lat_error == _OUT_OF_RANGE) & (np.abs(lat) <= lon_limit)
+                    & self.lon_valid & (np.abs(lon) <= lat_limit))
+        return [code == _OUT_OF_RANGE and abs(x) <= lon_limit and ok and abs(y) <= lat_limit
+                for x, code, y, ok in zip(lat, self.lat_error, lon, self.lon_valid)]
+
+    def normalized(self) -> Tuple[List[str], List[str]]:
+        """Both columns as normalize_coordinate_string gives them: 7 decimals, "" when invalid."""
+        return (
+            self._format(self.latitude, self.lat_error),
+            self._format(self.longitude, self.lon_error),
+        )
+
+    @staticmethod
+    def _format(values: Any, codes: Any) -> List[str]:
+        # CPython's float formatting beats np.char.mod and NumPy string ufuncs; same digits either way
+        texts = list(map(_FORMAT_COORDINATE, _tolist(values)))
+        for i in _indices(codes != 0 if _is_array(codes) else [code != 0 for code in codes]):
+            texts[i] = ""
+        return texts
+
+    def checks(self) -> List[CoordinateCheck]:
+        """check_coordinate_pair for every row."""
+        n = len(self)
+        lat_decimals: List[Optional[int]] = [None] * n
+        lon_decimals: List[Optional[int]] = [None] * n
+        for i in _indices(self.lat_precise):
+            lat_decimals[i] = coordinate_decimals(float(self.latitude[i]))
+        for i in _indices(self.lon_precise):
+            lon_decimals[i] = coordinate_decimals(float(self.longitude[i]))
+        suspects: List[Optional[str]] = [None] * n
+        for i in _indices(self.zero_island):
+            suspects[i] = SUSPECT_ZERO_ISLAND
+        for i in _indices(self.swapped):
+            suspects[i] = SUSPECT_SWAPPED
+        lat_errors = [COORDINATE_ERRORS[code] for code in _tolist(self.lat_error)]
+        lon_errors = [COORDINATE_ERRORS[code] for code in _tolist(self.lon_error)]
+        return list(zip(lat_errors, lat_decimals, lon_errors, lon_decimals, suspects))
+
+
+def validate_coordinate_columns(
+    latitudes: Iterable[Any], longitudes: Iterable[Any], use_numpy: Optional[bool] = None
+) -> CoordinateColumns:
+    """
+    Validate whole Latitude/Longitude columns in one pass: parsed values, error codes, precision
+    flags and 0,0 / swapped-axis suspects per row (see CoordinateColumns). Values follow
+    CSVValidator.validate_coordinate and normalize_coordinate_string: surrounding whitespace is
+    ignored, blank is "empty", nan/inf are "invalid_number", and latitude must be within ±90,
+    longitude within ±180. use_numpy=False forces the pure-Python path (None = NumPy if installed).
+    """
+    lat_texts = [value if isinstance(value, str) else "" if value is None else str(value) for value in latitudes]
+    lon_texts = [value if isinstance(value, str) else "" if value is None else str(value) for value in longitudes]
+    if len(lat_texts) != len(lon_texts):
+        raise ValueError(f"{len(lat_texts)} latitudes but {len(lon_texts)} longitudes")
+    use_numpy = NUMPY_AVAILABLE and use_numpy is not False
+    return CoordinateColumns(
+        *_classify(*_parse_column(lat_texts), _LATITUDE_LIMIT, use_numpy),
+        *_classify(*_parse_column(lon_texts), _LONGITUDE_LIMIT, use_numpy),
+    )
+
+
+def haversine_meters(lat1: float, lon1: float, lat2: float, lon2: float) -> float:
+    """Great-circle distance in meters on a sphere of EARTH_RADIUS_METERS."""
+    phi1 = math.radians(lat1)
+    phi2 = math.radians(lat2)
+    d_phi = math.radians(lat2 - lat1)
+    d_lambda = math.radians(lon2 - lon1)
+    a = math.sin(d_phi / 2) ** 2 + math.cos(phi1) * math.cos(phi2) * math.sin(d_lambda / 2) ** 2
+    return 2 * EARTH_RADIUS_METERS * math.asin(min(1.0, math.sqrt(a)))
@@ -0,0 +1,197 @@
+#!/usr/bin/env python3
+"""
+Prebuilt country-name index shared by universal_scraper, country_normalize and data_normalizer.
+
+Walking pycountry and Babel's CLDR territory names for ~75 locales takes hundreds of
+milliseconds, so it is done offline into country_index.json and loaded lazily on first
+lookup. The project's own watch_store_countries.json table is read lazily here too, so
+there is one place that answers "what is this country called".
+
+Rebuild after upgrading pycountry/Babel or editing VARIANT_OVERRIDES:
+
+  python3 country_index.py --build
+"""
+
+import argparse
+import json
+import os
+import sys
+import threading
+from typing import Any, Dict, Optional
+
+_HERE = os.path.dirname(os.path.abspath(__file__))
+INDEX_FILE = os.path.join(_HERE, "country_index.json")
+COUNTRIES_FILE = os.path.join(_HERE, "watch_store_countries.json")
+INDEX_VERSION = 1
+
+BABEL_LOCALES = [
+    'af', 'ar', 'az', 'be', 'bg', 'bn', 'bs', 'ca', 'cs', 'cy',
+    'da', 'de', 'el', 'en', 'es', 'et', 'eu', 'fa', 'fi', 'fr',
+    'ga', 'gl', 'gu', 'he', 'hi', 'hr', 'hu', 'hy', 'id', 'is',
+    'it', 'ja', 'ka', 'kk', 'km', 'kn', 'ko', 'ky', 'lo', 'lt',
+    'lv', 'mk', 'ml', 'mn', 'mr', 'ms', 'my', 'nb', 'ne', 'nl',
+    'or', 'pa', 'pl', 'pt', 'ro', 'ru', 'si', 'sk', 'sl', 'sq',
+    'sr', 'sv', 'sw', 'ta', 'te', 'th', 'tl', 'tr', 'uk', 'ur',
+    'uz', 'vi', 'zh', 'zu',
+]
+
+# Manual overrides for common abbreviations / colloquial names not in CLDR
+VARIANT_OVERRIDES = {
+    'uk': 'United Kingdom',
+    'usa': 'United States',
+    'u.s.a.': 'United States',
+    'u.s.': 'United States',
+    'uae': 'United Arab Emirates',
+    'u.a.e.': 'United Arab Emirates',
+    'south korea': 'South Korea',
+    'north korea': 'North Korea',
+    'taiwan': 'Taiwan',
+    'hong kong': 'Hong Kong',
+    'macau': 'Macao',
+    'macao': 'Macao',
+    'czech republic': 'Czechia',
+    'slovak republic': 'Slovakia',
+    'ivory coast': "Côte d'Ivoire",
+    'congo': 'Congo',
+    'dr congo': 'Congo, The Democratic Republic of the',
+    'drc': 'Congo, The Democratic Republic of the',
+    'trinidad': 'Trinidad and Tobago',
+}
+
+_index: Optional[Dict[str, Any]] = None
+_watch_store: Optional[Dict[str, Dict[str, str]]] = None
+_lock = threading.Lock()
+
+
+def build_country_index() -> Dict[str, Any]:
+    """
+    Build the index from pycountry + Babel (slow; run offline via --build).
+
+    ``variants`` maps any known country-name variant (lower-case) to the ISO 3166 canonical
+    English name — alpha_2, alpha_3, name, common_name, official_name and every CLDR
+    localised territory name. ``alpha2`` maps ISO alpha-2 codes to the pycountry name.
+    Falls back gracefully if either library is unavailable.
+    """
+    variants: Dict[str, str] = {}
+    alpha2: Dict[str, str] = {}
+    sources: Dict[str, str] = {}
+    try:
+        import pycountry
+        sources["pycountry"] = str(getattr(pycountry, "__version__", "unknown"))
+        for c in pycountry.countries:
+            eng = c.name
+            alpha2[c.alpha_2] = eng
+            for key in (c.alpha_2, c.alpha_3, eng,
+                        getattr(c, 'common_name', None),
+                        getattr(c, 'official_name', None)):
+                if key:
+                    variants[key.lower()] = eng
+    except Exception:
+        pass
+
+    try:
+        import babel
+        from babel import Locale
+        sources["babel"] = babel.__version__
+        for locale_code in BABEL_LOCALES:
+            try:
+                loc = Locale.parse(locale_code)
+                for code, local_name in loc.territories.items():
+                    eng = alpha2.get(code)
+                    if eng and local_name:
+                        variants[local_name.lower()] = eng
+            except Exception:
+                pass
+    except Exception:
+        pass
+
+    variants.update(VARIANT_OVERRIDES)
+    return {
+        "version": INDEX_VERSION,
+        "sources": sources,
+        "variants": dict(sorted(variants.items())),
+        "alpha2": dict(sorted(alpha2.items())),
+    }
+
+
+def write_country_index(filename: str = INDEX_FILE) -> Dict[str, Any]:
+    index = build_country_index()
+    tmp = f"{filename}.tmp"
+    with open(tmp, "w", encoding="utf-8") as f:
+        json.dump(index, f, ensure_ascii=False, separators=(",", ":"))
+        f.write("\n")
+    os.replace(tmp, filename)
+    return index
+
+
+def _get_index() -> Dict[str, Any]:
+    global _index
+    if _index is None:
+        with _lock:
+            if _index is None:
+                try:
+                    with open(INDEX_FILE, "r", encoding="utf-8") as f:
+                        loaded = json.load(f)
+                    if loaded.get("version") != INDEX_VERSION:
+                        raise ValueError("stale country index")
+                except (OSError, ValueError):
+                    # Missing or stale prebuilt file: build in-process (the old import-time cost)
+                    loaded = build_country_index()
+                _index = loaded
+    return _index
+
+
+def country_variants() -> Dict[str, str]:
+    """Lower-case country-name variant (any language, ISO codes) → canonical English name."""
+    return _get_index()["variants"]
+
+
+def iso_alpha2_name(code: str) -> Optional[str]:
+    """pycountry's English name for an ISO alpha-2 code, or None."""
+    return _get_index()["alpha2"].get(code.upper())
+
+
+def _get_watch_store() -> Dict[str, Dict[str, str]]:
+    global _watch_store
+    if _watch_store is None:
+        codes: Dict[str, str] = {}
+        try:
+            with open(COUNTRIES_FILE, "r", encoding="utf-8") as f:
+                raw = json.load(f).get("countries") or {}
+            if isinstance(raw, dict):
+                codes = {
+                    k.upper(): v.strip()
+                    for k, v in raw.items()
+                    if isinstance(k, str) and isinstance(v, str)
+                }
+        except (OSError, ValueError, AttributeError):
+            pass  # graceful degradation — the prebuilt index still works
+        _watch_store = {"codes": codes, "names": {v.lower(): v for v in codes.values()}}
+    return _watch_store
+
+
+def watch_store_country_codes() -> Dict[str, str]:
+    """watch_store_countries.json: "US" → "United States" (project-preferred names)."""
+    return _get_watch_store()["codes"]
+
+
+def watch_store_country_names() -> Dict[str, str]:
+    """watch_store_countries.json: "united states" → "United States"."""
+    return _get_watch_store()["names"]
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Prebuilt country-name index")
+    parser.add_argument("--build", action="store_true", help=f"Rebuild {os.path.basename(INDEX_FILE)} from pycountry + Babel")
+    args = parser.parse_args()
+    if args.build:
+        index = write_country_index()
+        print(f"✅ Wrote {INDEX_FILE}: {len(index['variants'])} variants, {len(index['alpha2'])} ISO codes {index['sources']}")
+        return 0
+    index = _get_index()
+    print(f"{INDEX_FILE}: {len(index['variants'])} variants, {len(index['alpha2'])} ISO codes {index.get('sources')}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
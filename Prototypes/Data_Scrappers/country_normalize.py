@@ -12,36 +12,13 @@ Resolution order for any input value:
   3. Full-name values → case-insensitive match against JSON values for canonical spelling
   4. Unrecognised values → returned unchanged (original casing preserved)
 
-The JSON lookup table is loaded once at import time.
+The JSON table and the pycountry names come from country_index (loaded lazily on first use).
 """
 
-import os
 import re
-import json
 from typing import Optional
 
-# ── Module-level JSON cache ────────────────────────────────────────────────────
-
-_JSON_CODES: dict[str, str] = {}   # "US" → "United States"
-_JSON_NAMES: dict[str, str] = {}   # "united states" → "United States"
-
-def _load_json() -> None:
-    """Load watch_store_countries.json into module-level dicts (idempotent)."""
-    global _JSON_CODES, _JSON_NAMES
-    if _JSON_CODES:
-        return  # already loaded
-    countries_file = os.path.join(os.path.dirname(__file__), "watch_store_countries.json")
-    try:
-        with open(countries_file, "r", encoding="utf-8") as f:
-            data = json.load(f)
-        codes = data.get("countries", {})
-        _JSON_CODES = {k.upper(): v for k, v in codes.items()}
-        _JSON_NAMES = {v.lower(): v for v in codes.values()}
-    except Exception:
-        pass  # graceful degradation — pycountry still works
-
-
-_load_json()
+from country_index import iso_alpha2_name, watch_store_country_codes, watch_store_country_names
 
 # ── Alias table ────────────────────────────────────────────────────────────────
 # Maps common abbreviations / alternate spellings to canonical full names.
@@ -122,27 +99,22 @@ def normalize_country(value: str) -> str:
         code = stripped.upper()
 
         # JSON first (project-preferred names)
-        json_result = _JSON_CODES.get(code)
+        json_result = watch_store_country_codes().get(code)
         if json_result:
             return json_result
 
-        # Fall back to pycountry for codes not in our JSON (e.g. AD → Andorra)
-        try:
-            import pycountry
-            country_obj = pycountry.countries.get(alpha_2=code)
-            if country_obj:
-                # Check if pycountry's name has a cleaner alias
-                pc_name_lower = country_obj.name.lower()
-                alias_for_pc = _ALIASES.get(pc_name_lower)
-                return alias_for_pc if alias_for_pc else country_obj.name
-        except ImportError:
-            pass
+        # Fall back to pycountry's name for codes not in our JSON (e.g. AD → Andorra)
+        pc_name = iso_alpha2_name(code)
+        if pc_name:
+            # Check if pycountry's name has a cleaner alias
+            alias_for_pc = _ALIASES.get(pc_name.lower())
+            return alias_for_pc if alias_for_pc else pc_name
 
         # Unknown 2-letter code — return as-is
         return stripped
 
     # 3. Full-name canonicalization against JSON values (case-insensitive)
-    json_canon = _JSON_NAMES.get(lower)
+    json_canon = watch_store_country_names().get(lower)
     if json_canon:
         return json_canon
 
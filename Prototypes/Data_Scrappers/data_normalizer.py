@@ -3,15 +3,30 @@
 
 import re
 import csv
+import gzip
 import html
+import io
 import os
 import json
 import time
-from typing import Dict, List, Any, Optional, Tuple, Set
+from concurrent.futures import ProcessPoolExecutor
+from functools import lru_cache
+from typing import Callable, Dict, Iterable, List, Any, Optional, Tuple, Set
 from urllib.parse import urlparse, urljoin
 
+try:
+    import phonenumbers
+    from phonenumbers import PhoneNumberFormat
+    PHONENUMBERS_AVAILABLE = True
+except ImportError:
+    phonenumbers = None
+    PhoneNumberFormat = None
+    PHONENUMBERS_AVAILABLE = False
+
 from scraper_utils import resolve_partial_url, dict_get_ci
 from country_normalize import normalize_country
+from country_index import watch_store_country_codes
+from dedup_utils import RULES as DEDUP_RULES, Deduplicator, address_key, build_keys, dedupe, format_counts, geo_key, id_key
 
 CANONICAL_SCHEMA = [
     "Handle", "Name", "Status", "Address Line 1", "Address Line 2", "Postal/ZIP Code",
@@ -54,32 +69,27 @@ def load_canonical_schema():
 
 SCHEMA = load_canonical_schema()
 
-# ISO alpha-2 -> English name from watch_store_countries.json (lazy, for combined-address parsing)
-_ALPHA2_COUNTRY_NAMES: Optional[Dict[str, str]] = None
-
-
 def _alpha2_country_name(code: str) -> Optional[str]:
-    """Resolve a 2-letter country code to the canonical English name, or None."""
-    global _ALPHA2_COUNTRY_NAMES
+    """Resolve a 2-letter country code to the canonical English name (watch_store_countries.json), or None."""
     if not code or len(code) != 2:
         return None
-    c = code.strip().upper()
-    if _ALPHA2_COUNTRY_NAMES is None:
-        _ALPHA2_COUNTRY_NAMES = {}
-        countries_file = os.path.join(os.path.dirname(__file__), "watch_store_countries.json")
-        try:
-            if os.path.exists(countries_file):
-                with open(countries_file, "r", encoding="utf-8") as f:
-                    data = json.load(f)
-                raw = data.get("countries") or {}
-                if isinstance(raw, dict):
-                    for k, v in raw.items():
-                        if isinstance(k, str) and isinstance(v, str) and len(k) == 2:
-                            _ALPHA2_COUNTRY_NAMES[k.upper()] = v.strip()
-        except (OSError, json.JSONDecodeError, TypeError):
-            pass
-    name = _ALPHA2_COUNTRY_NAMES.get(c) if _ALPHA2_COUNTRY_NAMES else None
-    return name or None
+    return watch_store_country_codes().get(code.strip().upper()) or None
+
+
+# clean_html_tags runs on every extracted value, so its patterns are compiled once
+_UNICODE_ESCAPE_RE = re.compile(r'[\\/]u([0-9a-fA-F]{4})')
+_BR_TAG_RE = re.compile(r"(?i)<\s*br\s*/?\s*>")
+_P_CLOSE_TAG_RE = re.compile(r"(?i)</\s*p\s*>")
+_HTML_TAG_RE = re.compile(r"<[^>]+>")
+_BIDI_CONTROL_RE = re.compile(r"[\u200E\u200F\u202A-\u202E\u2066-\u2069]")
+_WHITESPACE_RE = re.compile(r"\s+")
+
+
+def _replace_unicode_escape(match: "re.Match[str]") -> str:
+    try:
+        return chr(int(match.group(1), 16))
+    except (ValueError, OverflowError):
+        return match.group(0)
 
 
 def _decode_unicode_escapes(text: str) -> str:
@@ -88,14 +98,8 @@ def _decode_unicode_escapes(text: str) -> str:
     Handles both proper (\\uXXXX) and malformed (/uXXXX) sequences that can appear when
     JSON/API data is mis-encoded or the backslash is corrupted to forward slash.
     """
-    def replace_escape(match: re.Match) -> str:
-        try:
-            return chr(int(match.group(1), 16))
-        except (ValueError, OverflowError):
-            return match.group(0)
-
     # Match \uXXXX or /uXXXX (4 hex digits)
-    return re.sub(r'[\\/]u([0-9a-fA-F]{4})', replace_escape, text)
+    return _UNICODE_ESCAPE_RE.sub(_replace_unicode_escape, text)
 
 
 def clean_html_tags(text: Any) -> str:
@@ -113,12 +117,13 @@ def clean_html_tags(text: Any) -> str:
     text_str = html.unescape(text_str)
 
     # Block/line breaks → space before stripping remaining tags (readable addresses)
-    text_str = re.sub(r"(?i)<\s*br\s*/?\s*>", " ", text_str)
-    text_str = re.sub(r"(?i)</\s*p\s*>", " ", text_str)
-    text_str = re.sub(r"<[^>]+>", " ", text_str)
+    if "<" in text_str:
+        text_str = _BR_TAG_RE.sub(" ", text_str)
+        text_str = _P_CLOSE_TAG_RE.sub(" ", text_str)
+        text_str = _HTML_TAG_RE.sub(" ", text_str)
 
-    text_str = re.sub(r"[\u200E\u200F\u202A-\u202E\u2066-\u2069]", "", text_str)
-    text_str = re.sub(r"\s+", " ", text_str)
+    text_str = _BIDI_CONTROL_RE.sub("", text_str)
+    text_str = _WHITESPACE_RE.sub(" ", text_str)
 
     return text_str.strip()
 
@@ -347,26 +352,40 @@ def validate_coordinate(value: Any, coord_type: str = "latitude") -> str:
     return normalize_coordinate_string(value, coord_type)
 
 
+# validate_phone: patterns compiled once, parse results memoized per (cleaned number, region)
+_PHONE_EXTENSION_RE = re.compile(r'(?:\s+[xX]\s*\d[\d\s]*|\s+ext\.?\s*\d[\d\s]*)$', re.IGNORECASE)
+_PHONE_INVALID_CHARS_RE = re.compile(r'[^\d+\-()\s]')
+_CN_AREA_IN_PARENS_RE = re.compile(r'\(\+86(\d*)\)\s*')
+_COUNTRY_CODE_IN_PARENS_RE = re.compile(r'\(\+(\d{1,3})\)\s*')
+_DOMESTIC_ZERO_PREFIX_RE = re.compile(r'\s*\(0\)\s*')
+_DOMESTIC_ZERO_AREA_RE = re.compile(r'\(0(\d+)\)')
+_ALPHA2_RE = re.compile(r'^[A-Za-z]{2}$')
+PHONE_CACHE_SIZE = 32768
+# Set once the "phonenumbers not installed" warning has been printed
+_phone_fallback_warned = False
+
+
 def _normalize_phone_for_parse(phone_str: str) -> str:
     """Preprocess phone string to help phonenumbers parse."""
     s = phone_str.strip()
     # (+8628) 12345678 -> +86 28 12345678 (China style with area in parens)
-    s = re.sub(r'\(\+86(\d*)\)\s*', r'+86 \1 ', s)
+    s = _CN_AREA_IN_PARENS_RE.sub(r'+86 \1 ', s)
     # (+1) or (+44) etc -> +1  or +44
-    s = re.sub(r'\(\+(\d{1,3})\)\s*', r'+\1 ', s)
+    s = _COUNTRY_CODE_IN_PARENS_RE.sub(r'+\1 ', s)
     # Remove (0) domestic prefix (e.g. +31 (0)10 -> +31 10)
-    s = re.sub(r'\s*\(0\)\s*', ' ', s)
+    s = _DOMESTIC_ZERO_PREFIX_RE.sub(' ', s)
     # Strip domestic leading 0 from area codes: (022) -> 22, (010) -> 10 (China, Europe, etc.)
-    s = re.sub(r'\(0(\d+)\)', r'\1', s)
+    s = _DOMESTIC_ZERO_AREA_RE.sub(r'\1', s)
     return s.strip()
 
 
+@lru_cache(maxsize=1024)
 def _country_name_to_alpha2(country_name: str) -> Optional[str]:
     """Convert a country display name (e.g. 'South Korea') to ISO alpha-2 ('KR') for phonenumbers."""
     if not country_name:
         return None
     s = country_name.strip()
-    if re.match(r'^[A-Za-z]{2}$', s):
+    if _ALPHA2_RE.match(s):
         return s.upper()
     try:
         import pycountry
@@ -381,15 +400,39 @@ def _country_name_to_alpha2(country_name: str) -> Optional[str]:
     return None
 
 
+@lru_cache(maxsize=PHONE_CACHE_SIZE)
+def _format_phone_number(normalized: str, region: Optional[str]) -> Optional[str]:
+    """
+    phonenumbers INTERNATIONAL format for a cleaned number, or None when it does not parse.
+    Memoized because chains repeat one switchboard number across many rows.
+    """
+    # Try with region hint first — essential for local numbers that have no + prefix
+    if region:
+        try:
+            parsed = phonenumbers.parse(normalized, region)
+            if phonenumbers.is_valid_number(parsed):
+                return phonenumbers.format_number(parsed, PhoneNumberFormat.INTERNATIONAL)
+        except Exception:
+            pass
+
+    # Fall back to region-free parse for numbers that already carry a country code (+XX...)
+    try:
+        parsed = phonenumbers.parse(normalized, None)
+        if phonenumbers.is_valid_number(parsed) or phonenumbers.is_possible_number(parsed):
+            return phonenumbers.format_number(parsed, PhoneNumberFormat.INTERNATIONAL)
+    except Exception:
+        pass
+    return None
+
+
 def validate_phone(phone: Any, country: str = "") -> str:
     """
     Normalize phone number format using Google's phonenumbers library.
     Pass country (display name or alpha-2) so local numbers without a + prefix
-    can be correctly identified and formatted.
+    can be correctly identified and formatted. Without phonenumbers installed,
+    the cleaned number is returned as-is (a warning is printed once).
     """
-    import phonenumbers
-    from phonenumbers import PhoneNumberFormat
-
+    global _phone_fallback_warned
     if not phone:
         return ""
 
@@ -398,41 +441,29 @@ def validate_phone(phone: Any, country: str = "") -> str:
     # Preserve extension - extract before parsing (x 123, ext. 123)
     # Note: hyphen-only extensions (-8008) are intentionally excluded because they are
     # indistinguishable from the last segment of a normal phone number (e.g. 031-690-1557).
-    ext_match = re.search(r'(?:\s+[xX]\s*\d[\d\s]*|\s+ext\.?\s*\d[\d\s]*)$', phone_str, re.IGNORECASE)
+    ext_match = _PHONE_EXTENSION_RE.search(phone_str)
     extension = ext_match.group(0).strip() if ext_match else ""
     if extension:
         phone_str = phone_str[: ext_match.start()].strip()
 
     # Remove common unwanted chars but preserve valid ones
-    phone_str = re.sub(r'[^\d+\-()\s]', '', phone_str)
-    phone_str = re.sub(r'\s+', ' ', phone_str).strip()
+    phone_str = _PHONE_INVALID_CHARS_RE.sub('', phone_str)
+    phone_str = _WHITESPACE_RE.sub(' ', phone_str).strip()
 
     if not phone_str:
         return ""
 
-    normalized = _normalize_phone_for_parse(phone_str)
-    region = _country_name_to_alpha2(country) if country else None
-
-    # Try with region hint first — essential for local numbers that have no + prefix
-    if region:
-        try:
-            parsed = phonenumbers.parse(normalized, region)
-            if phonenumbers.is_valid_number(parsed):
-                formatted = phonenumbers.format_number(parsed, PhoneNumberFormat.INTERNATIONAL)
-                return (formatted + " " + extension).strip() if extension else formatted
-        except Exception:
-            pass
-
-    # Fall back to region-free parse for numbers that already carry a country code (+XX...)
-    try:
-        parsed = phonenumbers.parse(normalized, None)
-        if phonenumbers.is_valid_number(parsed) or phonenumbers.is_possible_number(parsed):
-            formatted = phonenumbers.format_number(parsed, PhoneNumberFormat.INTERNATIONAL)
-            return (formatted + " " + extension).strip() if extension else formatted
-    except Exception:
-        pass
-
-    return (phone_str + " " + extension).strip() if extension else phone_str
+    formatted = None
+    if PHONENUMBERS_AVAILABLE:
+        region = _country_name_to_alpha2(country) if country else None
+        formatted = _format_phone_number(_normalize_phone_for_parse(phone_str), region)
+    elif not _phone_fallback_warned:
+        _phone_fallback_warned = True
+        print("⚠️  phonenumbers is not installed — phone numbers are cleaned but not formatted "
+              "(pip install -r requirements.txt)", flush=True)
+    if formatted is None:
+        formatted = phone_str
+    return (formatted + " " + extension).strip() if extension else formatted
 
 
 def validate_email(email: Any) -> str:
@@ -551,11 +582,13 @@ def validate_url(url: Any, validate_http: bool = False, base_url: Optional[str]
     # Optional HTTP validation
     if validate_http:
         try:
-            import requests
-            response = requests.head(url_str, timeout=5, allow_redirects=True)
+            from http_client import URL_CHECK_CONFIG, get_http_client, read_bounded
+            client = get_http_client(URL_CHECK_CONFIG)
+            response = client.request("HEAD", url_str, timeout=5, allow_redirects=True)
             if response.status_code >= 400:
-                # If HEAD fails, try GET
-                response = requests.get(url_str, timeout=5, allow_redirects=True, stream=True)
+                # If HEAD fails, try GET (status only: the body is never downloaded)
+                response = client.get(url_str, timeout=5, allow_redirects=True, stream=True)
+                read_bounded(response, 0)
                 if response.status_code >= 400:
                     return ""  # URL not accessible
         except Exception:
@@ -621,16 +654,22 @@ def generate_handle(name: str, city: str = "", existing_handles: Optional[Set[st
     
     # Ensure uniqueness if existing_handles provided
     if existing_handles is not None:
-        if handle in existing_handles:
-            counter = 1
-            while f"{handle}-{counter}" in existing_handles:
-                counter += 1
-            handle = f"{handle}-{counter}"
-        existing_handles.add(handle)
+        handle = _claim_unique_handle(handle, existing_handles)
     
     return handle
 
 
+def _claim_unique_handle(handle: str, existing_handles: Set[str]) -> str:
+    """Add handle to existing_handles, suffixed -1, -2, ... when it is already taken."""
+    if handle in existing_handles:
+        counter = 1
+        while f"{handle}-{counter}" in existing_handles:
+            counter += 1
+        handle = f"{handle}-{counter}"
+    existing_handles.add(handle)
+    return handle
+
+
 # FIELD MAPPING AND EXTRACTION
 
 # Canonical field aliases for fuzzy key matching (when explicit mapping is missing/empty)
@@ -757,25 +796,33 @@ def _fuzzy_extract(raw_data: Dict, canonical_field: str) -> str:
         value = _extract_value_by_path(raw_data, alias)
         if value is not None and value != "":
             return normalize_field_value(value)
-    if isinstance(raw_data, dict):
-        for key, val in raw_data.items():
-            if val and isinstance(val, (str, int, float)):
-                key_lower = key.lower()
-                if canonical_field == "Phone" and any(p in key_lower for p in ["phone", "tel"]):
-                    return normalize_field_value(val)
-                if canonical_field == "Email" and any(p in key_lower for p in ["email", "mail"]):
-                    return normalize_field_value(val)
-                if canonical_field == "Address Line 1" and any(p in key_lower for p in ["address", "street", "line1"]):
-                    return normalize_field_value(val)
-            if isinstance(val, dict) and canonical_field in [
-                "Phone",
-                "Email",
-                "Address Line 1",
-                "Name",
-            ]:
-                nested = _fuzzy_extract(val, canonical_field)
-                if nested:
-                    return nested
+    return _fuzzy_scan(raw_data, canonical_field)
+
+
+# _fuzzy_scan: key substrings that identify a field, and fields worth looking for in nested objects
+_FUZZY_KEY_HINTS = {
+    "Phone": ("phone", "tel"),
+    "Email": ("email", "mail"),
+    "Address Line 1": ("address", "street", "line1"),
+}
+_FUZZY_NESTED_FIELDS = frozenset({"Phone", "Email", "Address Line 1", "Name"})
+
+
+def _fuzzy_scan(raw_data: Dict, canonical_field: str) -> str:
+    """Last resort after the aliases: keys containing phone/email/address, then nested objects."""
+    key_hints = _FUZZY_KEY_HINTS.get(canonical_field)
+    nested = canonical_field in _FUZZY_NESTED_FIELDS
+    if not isinstance(raw_data, dict) or not (key_hints or nested):
+        return ""
+    for key, val in raw_data.items():
+        if key_hints and val and isinstance(val, (str, int, float)):
+            key_lower = key.lower()
+            if any(p in key_lower for p in key_hints):
+                return normalize_field_value(val)
+        if nested and isinstance(val, dict):
+            nested_value = _fuzzy_extract(val, canonical_field)
+            if nested_value:
+                return nested_value
     return ""
 
 
@@ -832,17 +879,20 @@ def extract_field(raw_data: Dict, field_config: Any, canonical_field: str = "",
     return result
 
 
-def apply_field_mapping(raw_data: Dict, field_mapping: Dict[str, Any]) -> Dict[str, str]:
+def apply_field_mapping(raw_data: Dict, field_mapping: Any) -> Dict[str, str]:
     """
     Apply field mapping to transform raw data into canonical schema
     
     Args:
         raw_data: Raw scraped data dictionary
-        field_mapping: Dictionary mapping canonical field names to source field configs
+        field_mapping: Dictionary mapping canonical field names to source field configs,
+                      or a plan from compile_field_mapping (same output, no per-row reinterpretation)
     
     Returns:
         Dictionary with canonical field names and extracted values
     """
+    if callable(field_mapping):
+        return field_mapping(raw_data)
     mapped_data = {}
     for canonical_field, source_config in field_mapping.items():
         # Skip special keys (e.g. _base_url for URL resolution context)
@@ -852,8 +902,413 @@ def apply_field_mapping(raw_data: Dict, field_mapping: Dict[str, Any]) -> Dict[s
     return mapped_data
 
 
+def _row_key_index(raw_data: Dict) -> Dict[str, str]:
+    """lower-case key → first matching key, so dict_get_ci misses on a row cost one lookup."""
+    index: Dict[str, str] = {}
+    for k in raw_data:
+        if isinstance(k, str):
+            index.setdefault(k.lower(), k)
+    return index
+
+
+def _top_level_accessor(key: str) -> Callable[[Dict, Dict[str, str]], Any]:
+    """dict_get_ci(raw_data, key) using the row's key index."""
+    key_lower = key.lower()
+
+    def _get(raw_data: Dict, key_index: Dict[str, str]) -> Any:
+        if key in raw_data:
+            return raw_data[key]
+        found = key_index.get(key_lower)
+        return raw_data[found] if found is not None else None
+
+    return _get
+
+
+def _path_accessor(path: str) -> Callable[[Dict, Dict[str, str]], Any]:
+    """_extract_value_by_path with the path split (and list indices parsed) once."""
+    if not path:
+        return lambda raw_data, key_index: None
+    if '.' not in path:
+        return _top_level_accessor(path)
+    first, *rest = path.split('.')
+    get_first = _top_level_accessor(first) if first else (lambda raw_data, key_index: None)
+    parts: List[Tuple[str, Optional[int]]] = []
+    for part in rest:
+        try:
+            parts.append((part, int(part)))
+        except ValueError:
+            parts.append((part, None))
+
+    def _get(raw_data: Dict, key_index: Dict[str, str]) -> Any:
+        value = get_first(raw_data, key_index)
+        for part, idx in parts:
+            if value is None:
+                return None
+            if isinstance(value, dict):
+                value = dict_get_ci(value, part)
+            elif isinstance(value, list):
+                if idx is None or not 0 <= idx < len(value):
+                    return None
+                value = value[idx]
+            else:
+                return None
+        return value
+
+    return _get
+
+
+def _nested_accessor(path: str) -> Callable[[Dict, Dict[str, str]], Any]:
+    """get_nested_value with the path split once."""
+    first, *rest = path.split('.')
+    get_first = _top_level_accessor(first) if first else (lambda raw_data, key_index: None)
+
+    def _get(raw_data: Dict, key_index: Dict[str, str]) -> Any:
+        value = get_first(raw_data, key_index)
+        for key in rest:
+            if not isinstance(value, dict):
+                return None
+            value = dict_get_ci(value, key)
+        return value
+
+    return _get
+
+
+def _compile_source(field_config: Any) -> Callable[[Dict, Dict[str, str]], Any]:
+    """Accessor returning extract_field's raw value (before normalize_field_value) for one config."""
+    if isinstance(field_config, str):
+        return _path_accessor(field_config)
+    if isinstance(field_config, list):
+        getters = [_nested_accessor(key) for key in field_config if key]
+
+        def _first(raw_data: Dict, key_index: Dict[str, str]) -> Any:
+            value = None
+            for get in getters:
+                value = get(raw_data, key_index)
+                if value is not None and value != "":
+                    break
+            return value
+
+        return _first
+    if isinstance(field_config, dict):
+        join_paths = field_config.get("join")
+        if join_paths and isinstance(join_paths, list):
+            sep = str(field_config.get("separator", " "))
+            skip_tokens = field_config.get("skip_tokens", ["n/a", "na", "-", "—"])
+            skip_l = {str(t).strip().lower() for t in skip_tokens if str(t).strip()}
+            getters = [_path_accessor(str(p)) for p in join_paths if p]
+
+            def _join(raw_data: Dict, key_index: Dict[str, str]) -> Any:
+                parts: List[str] = []
+                for get in getters:
+                    v = get(raw_data, key_index)
+                    if v is None:
+                        continue
+                    s = str(v).strip()
+                    if not s or s.lower() in skip_l:
+                        continue
+                    sl = s.lower()
+                    if any(sl in ex.lower() or ex.lower() in sl for ex in parts):
+                        continue
+                    parts.append(s)
+                return sep.join(parts) if parts else None
+
+            return _join
+        key = field_config.get("key", "")
+        default = field_config.get("default", "")
+        transform = field_config.get("transform")
+        get_key = _nested_accessor(key) if key else (lambda raw_data, key_index: None)
+
+        def _keyed(raw_data: Dict, key_index: Dict[str, str]) -> Any:
+            value = get_key(raw_data, key_index)
+            if value is None:
+                value = default
+            if transform and callable(transform):
+                value = transform(value)
+            return value
+
+        return _keyed
+    return lambda raw_data, key_index: None
+
+
+def _compile_fuzzy(canonical_field: str) -> Callable[[Dict, Dict[str, str]], str]:
+    """
+    _fuzzy_extract for one canonical field, remembering which alias matched.
+
+    Aliases whose first key is not in the row are skipped with one lookup. A brand's rows
+    usually share one shape, so the outcome of a search is also kept as a hint for rows
+    with the same keys: the aliases that were present but empty are re-probed, then the
+    alias that matched is read directly. If it is empty on this row the search resumes
+    after it, so the result is always the first alias hit, as in _fuzzy_extract.
+    """
+    aliases = [
+        (_path_accessor(alias), alias.split('.', 1)[0].lower())
+        for alias in FIELD_MAPPING_ALIASES.get(canonical_field, [])
+    ]
+    hint: List[Any] = [None]  # (row key index, matched alias index or None, alias indexes to re-probe)
+
+    def _search(raw_data: Dict, key_index: Dict[str, str], start: int) -> Tuple[Optional[int], str]:
+        for i in range(start, len(aliases)):
+            get, first = aliases[i]
+            if first not in key_index:
+                continue
+            value = get(raw_data, key_index)
+            if value is not None and value != "":
+                return i, normalize_field_value(value)
+        return None, _fuzzy_scan(raw_data, canonical_field)
+
+    def _fuzzy(raw_data: Dict, key_index: Dict[str, str]) -> str:
+        cached = hint[0]
+        if cached is not None and cached[0] == key_index:
+            _, matched, recheck = cached
+            for i in recheck:
+                value = aliases[i][0](raw_data, key_index)
+                if value is not None and value != "":
+                    return normalize_field_value(value)
+            if matched is None:
+                return _fuzzy_scan(raw_data, canonical_field)
+            value = aliases[matched][0](raw_data, key_index)
+            if value is not None and value != "":
+                return normalize_field_value(value)
+            return _search(raw_data, key_index, matched + 1)[1]
+
+        matched, result = _search(raw_data, key_index, 0)
+        stop = len(aliases) if matched is None else matched
+        hint[0] = (key_index, matched, [i for i in range(stop) if aliases[i][1] in key_index])
+        return result
+
+    return _fuzzy
+
+
+def compile_field_mapping(field_mapping: Dict[str, Any]) -> Callable[[Dict], Dict[str, str]]:
+    """
+    Compile a brand's field mapping once into a plan: ``plan(raw_data)`` returns exactly what
+    ``apply_field_mapping(raw_data, field_mapping)`` would, but dotted paths are pre-split,
+    join/default configs are resolved up front, case-insensitive key lookups use one index per
+    row and fuzzy alias lookups reuse the alias that matched on earlier rows.
+    batch_normalize builds one plan per batch.
+    """
+    extractors: List[Tuple[str, Callable[[Dict, Dict[str, str]], Any], Optional[Callable[[Dict, Dict[str, str]], str]]]] = []
+    for canonical_field, source_config in field_mapping.items():
+        # Skip special keys (e.g. _base_url for URL resolution context)
+        if canonical_field.startswith("_"):
+            continue
+        fuzzy = _compile_fuzzy(canonical_field) if canonical_field else None
+        extractors.append((canonical_field, _compile_source(source_config), fuzzy))
+
+    def _plan(raw_data: Dict) -> Dict[str, str]:
+        if not isinstance(raw_data, dict):
+            return {
+                canonical_field: extract_field(raw_data, field_mapping[canonical_field], canonical_field=canonical_field)
+                for canonical_field, _, _ in extractors
+            }
+        key_index = _row_key_index(raw_data)
+        mapped_data = {}
+        for canonical_field, get, fuzzy in extractors:
+            value = get(raw_data, key_index)
+            result = normalize_field_value(value) if value is not None else ""
+            if not result and fuzzy is not None:
+                result = fuzzy(raw_data, key_index)
+            mapped_data[canonical_field] = result
+        return mapped_data
+
+    return _plan
+
+
 # COUNTRY INFERENCE FUNCTION
 
+# Common variations, added after the watch_store_countries.json names they belong to
+_COUNTRY_NAME_VARIATIONS = {
+    "United States": ["USA", "US", "U.S.", "U.S.A.", "United States of America"],
+    "United Kingdom": ["UK", "U.K.", "Great Britain", "Britain", "England", "Scotland", "Wales"],
+    "United Arab Emirates": ["UAE", "U.A.E."],
+    "South Korea": ["Korea", "South Korea", "Republic of Korea"],
+    "Czech Republic": ["Czechia"],
+    "Hong Kong": ["HK"],
+}
+
+# Fallback to common country names if file not found
+_FALLBACK_COUNTRY_NAMES = [
+    "United States", "Canada", "Mexico", "United Kingdom", "France", "Germany",
+    "Italy", "Spain", "Switzerland", "Japan", "China", "Hong Kong", "Singapore",
+    "Australia", "United Arab Emirates", "Saudi Arabia", "Brazil", "Argentina"
+]
+
+# Never matched as a substring (to avoid matching "New South Wales")
+_COUNTRY_NAME_EXCLUDED = {"wales"}
+
+_AUSTRALIAN_STATES_ABBREV = frozenset({"NSW", "VIC", "QLD", "WA", "SA", "TAS", "ACT", "NT"})
+
+# Note: WA is excluded here as it could be Western Australia
+_US_STATES = frozenset({
+    "AL", "AK", "AZ", "AR", "CA", "CO", "CT", "DE", "FL", "GA", "HI", "ID", "IL", "IN", "IA",
+    "KS", "KY", "LA", "ME", "MD", "MA", "MI", "MN", "MS", "MO", "MT", "NE", "NV", "NH", "NJ",
+    "NM", "NY", "NC", "ND", "OH", "OK", "OR", "PA", "RI", "SC", "SD", "TN", "TX", "UT", "VT",
+    "VA", "WV", "WI", "WY"
+})
+
+_WA_AUSTRALIAN_CITIES = frozenset({"perth", "fremantle", "bunbury", "geraldton", "kalgoorlie"})
+
+_CANADIAN_PROVINCES = frozenset({
+    "AB", "BC", "MB", "NB", "NL", "NS", "NT", "NU", "ON", "PE", "QC", "SK", "YT"
+})
+
+_AUSTRALIAN_STATES_FULL = frozenset({
+    "New South Wales", "Victoria", "Queensland", "Western Australia",
+    "South Australia", "Tasmania", "Australian Capital Territory", "Northern Territory"
+})
+
+# Common city-to-country mappings (for well-known cities)
+_CITY_COUNTRY_MAP = {
+    "london": "United Kingdom",
+    "paris": "France",
+    "tokyo": "Japan",
+    "berlin": "Germany",
+    "rome": "Italy",
+    "madrid": "Spain",
+    "amsterdam": "Netherlands",
+    "vienna": "Austria",
+    "zurich": "Switzerland",
+    "geneva": "Switzerland",
+    "milan": "Italy",
+    "barcelona": "Spain",
+    "munich": "Germany",
+    "frankfurt": "Germany",
+    "brussels": "Belgium",
+    "copenhagen": "Denmark",
+    "stockholm": "Sweden",
+    "oslo": "Norway",
+    "helsinki": "Finland",
+    "dublin": "Ireland",
+    "lisbon": "Portugal",
+    "athens": "Greece",
+    "warsaw": "Poland",
+    "prague": "Czech Republic",
+    "budapest": "Hungary",
+    "bucharest": "Romania",
+    "sydney": "Australia",
+    "melbourne": "Australia",
+    "auckland": "New Zealand",
+    "singapore": "Singapore",
+    "hong kong": "Hong Kong",
+    "dubai": "United Arab Emirates",
+    "riyadh": "Saudi Arabia",
+    "doha": "Qatar",
+    "kuwait city": "Kuwait",
+    "manama": "Bahrain",
+    "muscat": "Oman",
+    "tel aviv": "Israel",
+    "istanbul": "Turkey",
+    "cairo": "Egypt",
+    "johannesburg": "South Africa",
+    "cape town": "South Africa",
+    "sao paulo": "Brazil",
+    "rio de janeiro": "Brazil",
+    "buenos aires": "Argentina",
+    "santiago": "Chile",  # Most common Santiago is in Chile
+    "lima": "Peru",
+    "bogota": "Colombia",
+    "mexico city": "Mexico",
+    "moscow": "Russia",
+    "beijing": "China",
+    "shanghai": "China",
+    "seoul": "South Korea",
+    "taipei": "Taiwan",
+    "bangkok": "Thailand",
+    "kuala lumpur": "Malaysia",
+    "jakarta": "Indonesia",
+    "manila": "Philippines",
+    "ho chi minh city": "Vietnam",
+    "mumbai": "India",
+    "delhi": "India",
+    "karachi": "Pakistan",
+    "marigot": "France",  # Saint Martin (French territory)
+}
+
+# US territories and special cases
+_US_TERRITORIES = {
+    "saipan": "United States",  # Northern Mariana Islands (US territory)
+    "guam": "United States",
+    "puerto rico": "United States",
+    "us virgin islands": "United States",
+}
+
+_country_matcher: Optional[Tuple["re.Pattern[str]", Dict[str, Tuple[int, str]]]] = None
+
+
+def _load_country_names() -> List[str]:
+    """Country names from watch_store_countries.json plus _COUNTRY_NAME_VARIATIONS."""
+    countries_file = os.path.join(os.path.dirname(__file__), "watch_store_countries.json")
+    country_names: List[str] = []
+    try:
+        if os.path.exists(countries_file):
+            with open(countries_file, 'r', encoding='utf-8') as f:
+                data = json.load(f)
+            if "countries" in data:
+                country_names = list(data["countries"].values())
+                for main_name, variations in _COUNTRY_NAME_VARIATIONS.items():
+                    if main_name in country_names:
+                        country_names.extend(variations)
+    except Exception:
+        country_names = list(_FALLBACK_COUNTRY_NAMES)
+    return country_names
+
+
+def _trie_pattern(words: Iterable[str]) -> str:
+    """Regex source matching any of ``words``, longest first, with shared prefixes factored out."""
+    trie: Dict[str, Any] = {}
+    for word in words:
+        node = trie
+        for ch in word:
+            node = node.setdefault(ch, {})
+        node[""] = {}
+
+    def _build(node: Dict[str, Any]) -> str:
+        branches = [re.escape(ch) + _build(child) for ch, child in sorted(node.items()) if ch]
+        if not branches:
+            return ""
+        body = branches[0] if len(branches) == 1 else "(?:" + "|".join(branches) + ")"
+        if "" in node:
+            # Greedy optional: try the longer name first, fall back to the one ending here
+            return f"(?:{body})?" if len(branches) == 1 else f"{body}?"
+        return body
+
+    return _build(trie)
+
+
+def _get_country_matcher() -> Tuple["re.Pattern[str]", Dict[str, Tuple[int, str]]]:
+    """
+    Build (once) a single regex over every country name and variation, compiled as a trie so
+    each text position costs one branch per character instead of one try per name.
+
+    At any position the trie matches the longest name; _match_country_name then keeps the
+    lowest-ranked (longest first, file order) name across all positions, which is the same
+    answer as trying each name as a substring, longest first.
+    """
+    global _country_matcher
+    if _country_matcher is None:
+        ranked: Dict[str, Tuple[int, str]] = {}
+        for name in sorted(_load_country_names(), key=len, reverse=True):
+            lower = name.lower()
+            if lower and lower not in _COUNTRY_NAME_EXCLUDED and lower not in ranked:
+                ranked[lower] = (len(ranked), name)
+        if ranked:
+            # Zero-width lookahead so overlapping candidates at every position are seen
+            pattern = re.compile(f"(?=({_trie_pattern(ranked)}))")
+        else:
+            pattern = re.compile(r"(?!)")
+        _country_matcher = (pattern, ranked)
+    return _country_matcher
+
+
+def _match_country_name(search_text: str) -> str:
+    """Longest country name or variation occurring anywhere in lowercased ``search_text``."""
+    pattern, ranked = _get_country_matcher()
+    matches = {m.group(1) for m in pattern.finditer(search_text)}
+    if not matches:
+        return ""
+    return min(ranked[lower] for lower in matches)[1]
+
+
 def infer_country_from_address(
     address: str,
     city: str = "",
@@ -876,199 +1331,64 @@ def infer_country_from_address(
     if country and country.strip():
         return country.strip()
     
-    # Load country names from watch_store_countries.json
-    countries_file = os.path.join(os.path.dirname(__file__), "watch_store_countries.json")
-    country_names = []
-    country_codes_to_names = {}
-    
-    try:
-        if os.path.exists(countries_file):
-            with open(countries_file, 'r', encoding='utf-8') as f:
-                data = json.load(f)
-                if "countries" in data:
-                    # Get country code to name mapping
-                    country_codes_to_names = data["countries"]
-                    # Get all country names (values)
-                    country_names = list(country_codes_to_names.values())
-                    # Also add common variations
-                    country_variations = {
-                        "United States": ["USA", "US", "U.S.", "U.S.A.", "United States of America"],
-                        "United Kingdom": ["UK", "U.K.", "Great Britain", "Britain", "England", "Scotland", "Wales"],
-                        "United Arab Emirates": ["UAE", "U.A.E."],
-                        "South Korea": ["Korea", "South Korea", "Republic of Korea"],
-                        "Czech Republic": ["Czechia"],
-                        "Hong Kong": ["HK"],
-                    }
-                    for main_name, variations in country_variations.items():
-                        if main_name in country_names:
-                            country_names.extend(variations)
-    except Exception:
-        # Fallback to common country names if file not found
-        country_names = [
-            "United States", "Canada", "Mexico", "United Kingdom", "France", "Germany",
-            "Italy", "Spain", "Switzerland", "Japan", "China", "Hong Kong", "Singapore",
-            "Australia", "United Arab Emirates", "Saudi Arabia", "Brazil", "Argentina"
-        ]
-    
     # Combine all address fields into one search string
     search_text = f"{address} {city} {state}".lower()
     
     # Search for country names (longest first to match "United States" before "States")
-    # But avoid false matches like "Wales" in "New South Wales"
-    country_names_sorted = sorted(country_names, key=len, reverse=True)
-    
-    # Exclude "Wales" from matching (to avoid matching "New South Wales")
-    excluded_matches = {"wales"}  # Can add more if needed
-    
-    for country_name in country_names_sorted:
-        country_lower = country_name.lower()
-        if country_lower in excluded_matches:
-            continue  # Skip excluded matches
-        if country_lower in search_text:
-            # Additional check: if matching "Wales", make sure it's not part of "New South Wales" or similar
-            if country_lower == "wales":
-                if "new south wales" in search_text or "south wales" in search_text:
-                    continue
-            return country_name
+    matched = _match_country_name(search_text)
+    if matched:
+        return matched
+    
+    state_upper = state.strip().upper() if state else ""
     
     # Try to infer from Australian states first (to avoid WA conflict)
-    australian_states_abbrev = {"NSW", "VIC", "QLD", "WA", "SA", "TAS", "ACT", "NT"}
-    if state and state.strip().upper() in australian_states_abbrev:
+    if state_upper in _AUSTRALIAN_STATES_ABBREV:
         return "Australia"
     
     # Try to infer from US state abbreviations (common pattern)
-    # Note: WA is excluded here as it could be Western Australia
-    us_states = {
-        "AL", "AK", "AZ", "AR", "CA", "CO", "CT", "DE", "FL", "GA", "HI", "ID", "IL", "IN", "IA",
-        "KS", "KY", "LA", "ME", "MD", "MA", "MI", "MN", "MS", "MO", "MT", "NE", "NV", "NH", "NJ",
-        "NM", "NY", "NC", "ND", "OH", "OK", "OR", "PA", "RI", "SC", "SD", "TN", "TX", "UT", "VT",
-        "VA", "WV", "WI", "WY"
-    }
-    if state and state.strip().upper() in us_states:
+    if state_upper in _US_STATES:
         return "United States"
     
     # Handle WA specifically - check city for context
-    if state and state.strip().upper() == "WA":
+    if state_upper == "WA":
         # If city is known Australian city, it's Australia; otherwise assume US
-        australian_cities = {"perth", "fremantle", "bunbury", "geraldton", "kalgoorlie"}
-        if city and city.lower().strip() in australian_cities:
+        if city and city.lower().strip() in _WA_AUSTRALIAN_CITIES:
             return "Australia"
         else:
             return "United States"  # Default to US (Washington)
     
     # Try to infer from Canadian provinces
-    canadian_provinces = {
-        "AB", "BC", "MB", "NB", "NL", "NS", "NT", "NU", "ON", "PE", "QC", "SK", "YT"
-    }
-    if state and state.strip().upper() in canadian_provinces:
+    if state_upper in _CANADIAN_PROVINCES:
         return "Canada"
     
     # Try to infer from Australian states/territories (full names)
-    australian_states_full = {
-        "New South Wales", "Victoria", "Queensland", "Western Australia",
-        "South Australia", "Tasmania", "Australian Capital Territory", "Northern Territory"
-    }
-    if state and state.strip() in australian_states_full:
+    if state and state.strip() in _AUSTRALIAN_STATES_FULL:
         return "Australia"
     # Also check if state contains Australian state name
     state_lower = state.lower() if state else ""
     if "queensland" in state_lower or "new south wales" in state_lower or "western australia" in state_lower:
         return "Australia"
     
-    # Common city-to-country mappings (for well-known cities)
-    city_country_map = {
-        "london": "United Kingdom",
-        "paris": "France",
-        "tokyo": "Japan",
-        "berlin": "Germany",
-        "rome": "Italy",
-        "madrid": "Spain",
-        "amsterdam": "Netherlands",
-        "vienna": "Austria",
-        "zurich": "Switzerland",
-        "geneva": "Switzerland",
-        "milan": "Italy",
-        "barcelona": "Spain",
-        "munich": "Germany",
-        "frankfurt": "Germany",
-        "brussels": "Belgium",
-        "copenhagen": "Denmark",
-        "stockholm": "Sweden",
-        "oslo": "Norway",
-        "helsinki": "Finland",
-        "dublin": "Ireland",
-        "lisbon": "Portugal",
-        "athens": "Greece",
-        "warsaw": "Poland",
-        "prague": "Czech Republic",
-        "budapest": "Hungary",
-        "bucharest": "Romania",
-        "sydney": "Australia",
-        "melbourne": "Australia",
-        "auckland": "New Zealand",
-        "singapore": "Singapore",
-        "hong kong": "Hong Kong",
-        "dubai": "United Arab Emirates",
-        "riyadh": "Saudi Arabia",
-        "doha": "Qatar",
-        "kuwait city": "Kuwait",
-        "manama": "Bahrain",
-        "muscat": "Oman",
-        "tel aviv": "Israel",
-        "istanbul": "Turkey",
-        "cairo": "Egypt",
-        "johannesburg": "South Africa",
-        "cape town": "South Africa",
-        "sao paulo": "Brazil",
-        "rio de janeiro": "Brazil",
-        "buenos aires": "Argentina",
-        "santiago": "Chile",  # Most common Santiago is in Chile
-        "lima": "Peru",
-        "bogota": "Colombia",
-        "mexico city": "Mexico",
-        "moscow": "Russia",
-        "beijing": "China",
-        "shanghai": "China",
-        "seoul": "South Korea",
-        "taipei": "Taiwan",
-        "bangkok": "Thailand",
-        "kuala lumpur": "Malaysia",
-        "jakarta": "Indonesia",
-        "manila": "Philippines",
-        "ho chi minh city": "Vietnam",
-        "mumbai": "India",
-        "delhi": "India",
-        "karachi": "Pakistan",
-        "marigot": "France",  # Saint Martin (French territory)
-    }
-    
     city_lower = city.lower().strip()
-    if city_lower in city_country_map:
-        return city_country_map[city_lower]
-    
-    # Check for US territories and special cases
-    us_territories = {
-        "saipan": "United States",  # Northern Mariana Islands (US territory)
-        "guam": "United States",
-        "puerto rico": "United States",
-        "us virgin islands": "United States",
-    }
+    if city_lower in _CITY_COUNTRY_MAP:
+        return _CITY_COUNTRY_MAP[city_lower]
     
-    search_lower = search_text.lower()
-    for territory, country in us_territories.items():
-        if territory in search_lower:
-            return country
+    for territory, territory_country in _US_TERRITORIES.items():
+        if territory in search_text:
+            return territory_country
     
     return ""
 
 
 # COORDINATE & GEOCODING (delegate to shared utilities)
 
-from coordinate_utils import normalize_coordinate_string
+from coordinate_utils import normalize_coordinate_string, validate_coordinate_columns
 from geocoding_utils import (
     GEOPY_AVAILABLE as _GEOPY_AVAILABLE,
     get_geocoder,
     geocode_address,
+    geocode_query_key,
+    purge_geocode_cache,
 )
 GEOPY_AVAILABLE = _GEOPY_AVAILABLE
 
@@ -1078,7 +1398,8 @@ GEOPY_AVAILABLE = _GEOPY_AVAILABLE
 def normalize_location(
     raw_data: Dict[str, Any],
     field_mapping: Optional[Dict[str, Any]] = None,
-    existing_handles: Optional[Set[str]] = None
+    existing_handles: Optional[Set[str]] = None,
+    field_plan: Optional[Callable[[Dict], Dict[str, str]]] = None,
 ) -> Dict[str, str]:
     """
     The definitive algorithm for normalizing store location data
@@ -1090,17 +1411,45 @@ def normalize_location(
         field_mapping: Optional mapping of canonical fields to source fields
                       If None, assumes raw_data already uses canonical field names
         existing_handles: Set of existing handles (for uniqueness)
+        field_plan: compile_field_mapping(field_mapping), when the caller normalizes many rows
     
     Returns:
         Normalized dictionary matching the canonical schema
     """
+    normalized, handle_generated = _normalize_row(raw_data, field_mapping, field_plan)
+    _claim_handle(normalized, handle_generated, existing_handles)
+    return normalized
+
+
+def _claim_handle(normalized: Dict[str, str], handle_generated: bool, existing_handles: Optional[Set[str]]) -> None:
+    """Make a generated handle unique among existing_handles; source handles are only recorded."""
+    if existing_handles is None:
+        return
+    if handle_generated:
+        normalized["Handle"] = _claim_unique_handle(normalized["Handle"], existing_handles)
+    else:
+        existing_handles.add(normalized["Handle"])
+
+
+def _normalize_row(
+    raw_data: Dict[str, Any],
+    field_mapping: Optional[Dict[str, Any]],
+    field_plan: Optional[Callable[[Dict], Dict[str, str]]],
+    coordinates: bool = True,
+) -> Tuple[Dict[str, str], bool]:
+    """
+    normalize_location without handle uniqueness, which depends on every earlier row.
+    Returns (normalized, handle_generated); a generated handle is still the bare name-city slug.
+    With coordinates=False, Latitude/Longitude keep their mapped values for
+    _normalize_coordinate_columns to validate as whole columns.
+    """
     # Initialize with empty values for all canonical fields
     normalized = {field: "" for field in SCHEMA}
     
     # Apply field mapping if provided (and has actual field rules, not just _base_url etc.)
     data_fields = [k for k in (field_mapping or {}) if not k.startswith("_")]
     if field_mapping and data_fields:
-        mapped_data = apply_field_mapping(raw_data, field_mapping)
+        mapped_data = apply_field_mapping(raw_data, field_plan or field_mapping)
     else:
         mapped_data = raw_data
     
@@ -1177,19 +1526,18 @@ def normalize_location(
     normalized["Image URL"] = validate_url(mapped_data.get("Image URL", ""), base_url=base_url, url_base=url_base)
     
     # Coordinates (critical for mapping)
-    normalized["Latitude"] = validate_coordinate(mapped_data.get("Latitude", ""), "latitude")
-    normalized["Longitude"] = validate_coordinate(mapped_data.get("Longitude", ""), "longitude")
+    if coordinates:
+        normalized["Latitude"] = validate_coordinate(mapped_data.get("Latitude", ""), "latitude")
+        normalized["Longitude"] = validate_coordinate(mapped_data.get("Longitude", ""), "longitude")
+    else:
+        normalized["Latitude"] = mapped_data.get("Latitude", "")
+        normalized["Longitude"] = mapped_data.get("Longitude", "")
     
     # Generate handle if missing
     normalized["Handle"] = str(mapped_data.get("Handle", "")).strip()
-    if not normalized["Handle"]:
-        normalized["Handle"] = generate_handle(
-            normalized["Name"],
-            normalized["City"],
-            existing_handles
-        )
-    elif existing_handles is not None:
-        existing_handles.add(normalized["Handle"])
+    handle_generated = not normalized["Handle"]
+    if handle_generated:
+        normalized["Handle"] = generate_handle(normalized["Name"], normalized["City"])
     
     # Store hours (typically left empty, but include if provided)
     for day in ["Monday", "Tuesday", "Wednesday", "Thursday", "Friday", "Saturday", "Sunday"]:
@@ -1240,7 +1588,136 @@ def normalize_location(
             normalized[title_key] = str(mapped_data.get(title_key, "")).strip()
             normalized[url_key] = validate_url(mapped_data.get(url_key, ""), base_url=base_url)
     
-    return normalized
+    return normalized, handle_generated
+
+
+def _dedup_key(normalized: Dict[str, str]) -> int:
+    """
+    Geography (rounded coords + country), else address fingerprint + city + country, else handle.
+    Name is intentionally excluded from the key — two entries for the same physical place under
+    different names should collapse; two same-named stores at different locations should not.
+    Returns a dedup_utils key (NO_KEY when the row has none and is always kept).
+    """
+    country = (normalized.get("Country", "").strip().lower(),)
+    return (
+        geo_key(normalized.get("Latitude", ""), normalized.get("Longitude", ""), scope=country)
+        or address_key(normalized.get("Address Line 1", ""), normalized.get("City", ""), scope=country)
+        or id_key(normalized.get("Handle", "").strip().lower(), scope=("handle",))
+    )
+
+
+def _drop_duplicates(rows: List[Dict[str, str]], timings: Dict[str, Any]) -> List[Dict[str, str]]:
+    """Keep the first row for each _dedup_key (rows without a key are always kept)."""
+    result = dedupe(build_keys(rows, _dedup_key))
+    _count_duplicates(result, timings)
+    return result.kept(rows)
+
+
+def _count_duplicates(result: Deduplicator, timings: Dict[str, Any]) -> None:
+    """Accumulate dropped-row counts per dedup rule into timings["duplicates_<rule>"]."""
+    for rule, n in result.counts().items():
+        timings[f"duplicates_{rule}"] = timings.get(f"duplicates_{rule}", 0) + n
+
+
+def _has_coordinates(row: Dict[str, str]) -> bool:
+    return bool(row.get("Latitude", "").strip() and row.get("Longitude", "").strip())
+
+
+def _row_geocode_query(row: Dict[str, str]) -> Tuple[str, Tuple[str, str, str, str]]:
+    """(normalized query key, geocode_address args); the key is "" when there is nothing to look up."""
+    store_address = row.get("Address Line 1", "").strip()
+    store_city = row.get("City", "").strip()
+    store_state = row.get("State/Province/Region", "").strip()
+    store_country = row.get("Country", "").strip()
+    args = (store_address, store_city, store_state, store_country)
+    # Try geocoding if we have address information
+    if not (store_address or store_city):
+        return "", args
+    return geocode_query_key(*args), args
+
+
+def _geocode_missing(
+    rows: List[Dict[str, str]],
+    geocoder: Optional[Callable[..., Optional[Tuple[float, float]]]],
+    timings: Dict[str, Any],
+) -> None:
+    """
+    Fill missing Latitude/Longitude in place with one lookup per distinct geocode query.
+
+    Runs before dedup: rows that share a street and city but differ in state or country
+    geocode to different places, so they may only be collapsed once their coordinates are known.
+    """
+    stage_start = time.time()
+    results: Dict[str, Optional[Tuple[float, float]]] = {}
+    geocoded_rows = 0
+    for row in rows:
+        if _has_coordinates(row):
+            continue
+        query, args = _row_geocode_query(row)
+        if not query:
+            continue
+        if query not in results:
+            results[query] = geocoder(*args)
+        geocoded = results[query]
+        if not geocoded:
+            continue
+        lat, lon = geocoded
+        row["Latitude"] = f"{lat:.7f}"
+        row["Longitude"] = f"{lon:.7f}"
+        geocoded_rows += 1
+    timings["geocode_queries"] = len(results)
+    timings["geocoded_rows"] = geocoded_rows
+    timings["geocode"] = time.time() - stage_start
+
+
+def _normalize_coordinate_columns(rows: List[Dict[str, Any]]) -> None:
+    """validate_coordinate over the Latitude/Longitude columns of rows at once, in place."""
+    columns = validate_coordinate_columns([row["Latitude"] for row in rows], [row["Longitude"] for row in rows])
+    for row, lat, lon in zip(rows, *columns.normalized()):
+        row["Latitude"] = lat
+        row["Longitude"] = lon
+
+
+# Parallel normalization: below this many rows, starting the pool costs more than it saves
+PARALLEL_NORMALIZE_MIN_ROWS = 2000
+# Chunks per worker, so a slow shard (long addresses, many phones) does not leave cores idle
+PARALLEL_NORMALIZE_CHUNKS_PER_WORKER = 4
+
+_worker_field_mapping: Optional[Dict[str, Any]] = None
+_worker_field_plan: Optional[Callable[[Dict], Dict[str, str]]] = None
+
+
+def _init_normalize_worker(field_mapping: Optional[Dict[str, Any]]) -> None:
+    global _worker_field_mapping, _worker_field_plan
+    _worker_field_mapping = field_mapping
+    _worker_field_plan = compile_field_mapping(field_mapping) if field_mapping else None
+
+
+def _normalize_chunk(chunk: List[Dict[str, Any]]) -> List[Tuple[Dict[str, str], bool]]:
+    rows = [_normalize_row(raw_data, _worker_field_mapping, _worker_field_plan, coordinates=False) for raw_data in chunk]
+    _normalize_coordinate_columns([normalized for normalized, _ in rows])
+    return rows
+
+
+def _normalize_parallel(
+    raw_data_list: List[Dict[str, Any]],
+    field_mapping: Optional[Dict[str, Any]],
+    workers: int,
+) -> Optional[List[Tuple[Dict[str, str], bool]]]:
+    """
+    _normalize_row over contiguous shards in a process pool, results in input order.
+    Returns None if the pool cannot run (e.g. an unpicklable transform in the mapping).
+    """
+    chunk_size = -(-len(raw_data_list) // (workers * PARALLEL_NORMALIZE_CHUNKS_PER_WORKER))
+    chunks = [raw_data_list[i:i + chunk_size] for i in range(0, len(raw_data_list), chunk_size)]
+    try:
+        with ProcessPoolExecutor(
+            max_workers=workers, initializer=_init_normalize_worker, initargs=(field_mapping,)
+        ) as pool:
+            return [row for rows in pool.map(_normalize_chunk, chunks) for row in rows]
+    except Exception as e:
+        print(f"⚠️  Parallel normalization failed ({type(e).__name__}: {e}) — normalizing serially", flush=True)
+        return None
 
 
 def batch_normalize(
@@ -1249,10 +1726,15 @@ def batch_normalize(
     deduplicate: bool = True,
     geocode_missing: bool = True,
     allow_missing_coordinates: bool = False,
+    geocoder: Optional[Callable[..., Optional[Tuple[float, float]]]] = None,
+    stage_timings: Optional[Dict[str, Any]] = None,
+    workers: Optional[int] = None,
 ) -> Tuple[List[Dict[str, str]], List[Dict[str, str]]]:
     """
     Normalize a batch of locations with comprehensive deduplication.
-    Attempts to geocode stores missing coordinates, then excludes stores without coordinates and logs them clearly.
+    Runs as stages: normalize → geocode → coordinate check → deduplicate.
+    Geocoding makes one lookup per distinct address query, so repeated addresses pay the
+    geocoder's rate limit once. Stores still without coordinates are excluded and logged.
     
     Args:
         raw_data_list: List of raw data dictionaries
@@ -1261,42 +1743,58 @@ def batch_normalize(
         geocode_missing: If True, attempt to geocode stores missing coordinates (default: True)
         allow_missing_coordinates: If True, keep rows with empty Latitude/Longitude (e.g. dry-run text QA;
             production exports should leave this False so only mappable stores ship).
+        geocoder: Callable with geocode_address's signature (default: geocode_address / Nominatim).
+            Pass geocoding_utils.offline_geocoder_from_csv(...) to run against a local stand-in.
+        stage_timings: Optional dict filled with seconds spent per stage
+            (normalize, dedup, geocode, total) plus geocode query/row counts,
+            geocode_cache_purged (expired geocode cache rows deleted; default geocoder only) and
+            duplicates_<rule> counts of rows dropped by each dedup_utils rule.
+        workers: Processes for the normalize stage (default 1; 0 = one per CPU). Rows are sharded
+            across a process pool and merged back in input order; handles are then made unique
+            in one serial pass, so the output matches a serial run. Batches under
+            PARALLEL_NORMALIZE_MIN_ROWS always run serially.
     
     Returns:
         Tuple of (normalized_list, excluded_stores).
         normalized_list: Kept records (deduplicated, with coordinates).
         excluded_stores: Dropped records with name, address, reason (missing coordinates).
     """
+    timings = stage_timings if stage_timings is not None else {}
+    batch_start = time.time()
     existing_handles = set() if deduplicate else None
+    
+    stage_start = time.time()
+    workers = (os.cpu_count() or 1) if workers == 0 else max(1, workers or 1)
+    if len(raw_data_list) < PARALLEL_NORMALIZE_MIN_ROWS:
+        workers = 1
+    results = _normalize_parallel(raw_data_list, field_mapping, workers) if workers > 1 else None
+    if results is None:
+        workers = 1
+        field_plan = compile_field_mapping(field_mapping) if field_mapping else None
+        results = [_normalize_row(raw_data, field_mapping, field_plan, coordinates=False) for raw_data in raw_data_list]
+        _normalize_coordinate_columns([normalized for normalized, _ in results])
+    # Handle uniqueness depends on every earlier row, so it is settled serially in input order
+    rows = []
+    for normalized, handle_generated in results:
+        _claim_handle(normalized, handle_generated, existing_handles)
+        rows.append(normalized)
+    timings["normalize"] = time.time() - stage_start
+    timings["normalize_workers"] = workers
+    
+    if geocode_missing:
+        if geocoder is None:
+            # Each run drops expired rows so the shared cache file does not grow without bound
+            timings["geocode_cache_purged"] = purge_geocode_cache()
+        _geocode_missing(rows, geocoder or geocode_address, timings)
+    else:
+        timings["geocode"] = 0.0
+    
     normalized_list = []
-    seen_combinations = set()  # Track name+address+city combinations
     excluded_stores = []  # Track stores excluded due to missing coordinates
-    
-    for raw_data in raw_data_list:
-        normalized = normalize_location(raw_data, field_mapping, existing_handles)
-        
-        # Check if coordinates are missing (critical - store cannot be mapped without coordinates)
+    for normalized in rows:
         lat = normalized.get("Latitude", "").strip()
         lon = normalized.get("Longitude", "").strip()
         
-        # If coordinates are missing, try to geocode the address
-        if (not lat or not lon) and geocode_missing:
-            store_address = normalized.get("Address Line 1", "").strip()
-            store_city = normalized.get("City", "").strip()
-            store_state = normalized.get("State/Province/Region", "").strip()
-            store_country = normalized.get("Country", "").strip()
-            
-            # Try geocoding if we have address information
-            if store_address or store_city:
-                geocoded = geocode_address(store_address, store_city, store_state, store_country)
-                if geocoded:
-                    lat, lon = geocoded
-                    normalized["Latitude"] = f"{lat:.7f}"
-                    normalized["Longitude"] = f"{lon:.7f}"
-                    # Update lat/lon variables for the check below
-                    lat = normalized["Latitude"]
-                    lon = normalized["Longitude"]
-        
         # If still no coordinates after geocoding attempt, exclude the store (unless dry-run / QA mode)
         if not lat or not lon:
             store_name = normalized.get("Name", "Unknown").strip()
@@ -1318,35 +1816,27 @@ def batch_normalize(
                 })
                 continue  # Skip this store - exclude from output
         
-        # Deduplicate by geography (rounded coords + country) or address fingerprint + city + country.
-        # Name is intentionally excluded from the key — two entries for the same physical place under
-        # different names should collapse; two same-named stores at different locations should not.
-        if deduplicate:
-            _lat_str = normalized.get("Latitude", "").strip()
-            _lon_str = normalized.get("Longitude", "").strip()
-            _addr_fp = re.sub(r'[^a-z0-9]', '', normalized.get("Address Line 1", "").strip().lower())
-            _city_norm = re.sub(r'[^a-z0-9]', '', normalized.get("City", "").strip().lower())
-            _country_norm = normalized.get("Country", "").strip().lower()
-            try:
-                _lat_r = round(float(_lat_str), 5)
-                _lon_r = round(float(_lon_str), 5)
-                combo_key = f"geo|{_lat_r}|{_lon_r}|{_country_norm}"
-            except (ValueError, TypeError):
-                if _addr_fp and _city_norm:
-                    combo_key = f"addr|{_addr_fp}|{_city_norm}|{_country_norm}"
-                else:
-                    combo_key = None
-            if not combo_key:
-                _h = normalized.get("Handle", "").strip().lower()
-                if _h:
-                    combo_key = f"handle|{_h}"
-            if combo_key:
-                if combo_key in seen_combinations:
-                    continue
-                seen_combinations.add(combo_key)
-        
         normalized_list.append(normalized)
     
+    # Dedup after geocoding so geocoded rows are keyed by their coordinates, as before
+    stage_start = time.time()
+    if deduplicate:
+        normalized_list = _drop_duplicates(normalized_list, timings)
+    timings["dedup"] = time.time() - stage_start
+    timings["total"] = time.time() - batch_start
+    
+    stage_summary = " | ".join(
+        f"{stage} {timings[stage]:.2f}s" for stage in ("normalize", "dedup", "geocode", "total")
+    )
+    if workers > 1:
+        stage_summary += f" | normalized on {workers} processes"
+    duplicate_counts = {rule: timings[f"duplicates_{rule}"] for rule in DEDUP_RULES if timings.get(f"duplicates_{rule}")}
+    if duplicate_counts:
+        stage_summary += f" | {sum(duplicate_counts.values())} duplicates ({format_counts(duplicate_counts)})"
+    if geocode_missing:
+        stage_summary += f" | {timings['geocode_queries']} geocode queries → {timings['geocoded_rows']} rows"
+    print(f"   ⏱️  {stage_summary}", flush=True)
+    
     # Log excluded stores clearly (flush immediately so it appears in scraper output)
     if excluded_stores:
         import sys
@@ -1371,32 +1861,64 @@ def batch_normalize(
 
 # CSV I/O FUNCTIONS
 
-def write_normalized_csv(data: List[Dict[str, str]], filename: str = "output/locations.csv"):
+class _UnixLineEndings:
+    """File wrapper that turns \\r\\n into \\n in each CSV record as it is written, including
+    inside quoted values, instead of rewriting the finished file."""
+
+    __slots__ = ("_file",)
+
+    def __init__(self, file):
+        self._file = file
+
+    def write(self, s: str) -> int:
+        if '\r' in s:
+            s = s.replace('\r\n', '\n')
+        return self._file.write(s)
+
+
+def write_normalized_csv(
+    data: Iterable[Dict[str, str]],
+    filename: str = "output/locations.csv",
+    compress: Optional[bool] = None,
+) -> int:
     """
-    Write normalized data to CSV using the canonical schema with Unix line endings
-    
+    Stream normalized rows to CSV using the canonical schema with Unix line endings.
+
+    Rows are written in one pass to ``<filename>.tmp`` and renamed over ``filename`` only once
+    complete, so a concurrent reader (e.g. the backend import) sees the old file or the new one,
+    never a partial write.
+
     Args:
-        data: List of normalized location dictionaries
+        data: Any iterable of normalized location dictionaries (a list or a generator)
         filename: Output CSV file path
+        compress: Gzip the output; defaults to True when filename ends with ".gz"
+
+    Returns:
+        Number of rows written
     """
     os.makedirs(os.path.dirname(filename) if os.path.dirname(filename) else '.', exist_ok=True)
-    
-    # Write CSV with standard newline handling
-    with open(filename, 'w', newline='', encoding='utf-8') as csvfile:
-        writer = csv.DictWriter(csvfile, fieldnames=SCHEMA, lineterminator='\n')
-        writer.writeheader()
-        for row in data:
-            writer.writerow(row)
-    
-    # Post-process to ensure Unix line endings (\n only, no \r\n)
-    # This is necessary because csv module may still write \r\n on some systems
-    with open(filename, 'rb') as f:
-        content = f.read()
-    content = content.replace(b'\r\n', b'\n')  # Convert Windows to Unix
-    with open(filename, 'wb') as f:
-        f.write(content)
-    
-    print(f"✅ Exported {len(data)} normalized locations to {filename}")
+    if compress is None:
+        compress = filename.endswith('.gz')
+
+    tmp_path = f"{filename}.tmp"
+    count = 0
+    try:
+        with open(tmp_path, 'wb') as raw:
+            # mtime=0 keeps gzip output byte-identical across runs of the same data
+            binary = gzip.GzipFile(fileobj=raw, mode='wb', mtime=0) if compress else raw
+            with io.TextIOWrapper(binary, encoding='utf-8', newline='') as csvfile:
+                writer = csv.DictWriter(_UnixLineEndings(csvfile), fieldnames=SCHEMA, lineterminator='\n')
+                writer.writeheader()
+                for row in data:
+                    writer.writerow(row)
+                    count += 1
+        os.replace(tmp_path, filename)
+    finally:
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+
+    print(f"✅ Exported {count} normalized locations to {filename}")
+    return count
 
 
 def read_csv_to_dict(filename: str) -> List[Dict[str, str]]:
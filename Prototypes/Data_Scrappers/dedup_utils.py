@@ -0,0 +1,191 @@
+#!/usr/bin/env python3
+"""
+Shared first-occurrence dedup for batch_normalize, viewport_grid and validate_csv.
+
+Each row is reduced up front to one int64 key: a 56-bit hash of the fields that identify it,
+tagged in the top byte with the rule that produced it. Coordinates are quantized to integer
+cells before hashing, so "same place" is integer equality instead of re-parsed float strings.
+A batch's keys sit in a single array('q') column and the dedup pass only compares ints.
+Hashes are Python's own (salted per process), so keys are not stable across runs or processes.
+
+Rules (0 = the row has no key and is always kept):
+  id       exact identifier values (store ID, handle, a CSV duplicate-key tuple)
+  geo      latitude/longitude quantized to GEO_DECIMALS (5 ≈ 1.1 m), within a scope such as country
+  address  alphanumeric fingerprint of address + city, within a scope
+"""
+
+import operator
+import re
+from array import array
+from collections import Counter
+from itertools import compress
+from typing import Any, Callable, Dict, Iterable, List, Optional, Sequence, Tuple
+
+RULE_ID = "id"
+RULE_GEO = "geo"
+RULE_ADDRESS = "address"
+RULES = (RULE_ID, RULE_GEO, RULE_ADDRESS)  # rule code = position + 1
+
+NO_KEY = 0
+GEO_DECIMALS = 5
+
+_HASH_BITS = 56
+_HASH_MASK = (1 << _HASH_BITS) - 1
+_ID_TAG = 1 << _HASH_BITS
+_MAX_COORDINATE = 1e9  # finite and small enough that the scaled cell fits in int64
+_NON_ALNUM_RE = re.compile(r'[^a-z0-9]')
+
+
+def _tagged_hash(rule_code: int, parts: Tuple[Any, ...]) -> int:
+    # Built-in tuple hash (SipHash over the strings, in C): keys only compare within one process
+    return (rule_code << _HASH_BITS) | (hash(parts) & _HASH_MASK)
+
+
+def rule_of(key: int) -> Optional[str]:
+    """Rule name a key was built by, or None for NO_KEY."""
+    return RULES[(key >> _HASH_BITS) - 1] if key else None
+
+
+def fingerprint(text: Any) -> str:
+    """Lower-case alphanumerics only: "12 Rue de la Paix," → "12ruedelapaix"."""
+    return _NON_ALNUM_RE.sub('', str(text or "").strip().lower())
+
+
+def quantize_coordinate(value: Any, decimals: int = GEO_DECIMALS) -> Optional[int]:
+    """Coordinate → integer cell index (round(value, decimals) scaled to an int); None if unparseable."""
+    try:
+        coord = float(value)  # accepts surrounding whitespace, like float(str.strip())
+    except (ValueError, TypeError):
+        return None
+    if not -_MAX_COORDINATE <= coord <= _MAX_COORDINATE:  # also rejects nan
+        return None
+    return int(round(round(coord, decimals) * 10 ** decimals))
+
+
+def id_key(*values: Any, scope: Tuple[str, ...] = ()) -> int:
+    """Key on exact stripped values; NO_KEY if any value is empty."""
+    parts = tuple([v.strip() if isinstance(v, str) else "" if v is None else str(v).strip() for v in values])
+    if "" in parts:
+        return NO_KEY
+    return _ID_TAG | (hash(scope + parts) & _HASH_MASK)
+
+
+def id_keys(values: Iterable[Any]) -> array:
+    """id_key over a column of single values, in one pass with no per-row calls."""
+    texts = [v.strip() if isinstance(v, str) else "" if v is None else str(v).strip() for v in values]
+    return array('q', [_ID_TAG | (hash((text,)) & _HASH_MASK) if text else NO_KEY for text in texts])
+
+
+def geo_key(lat: Any, lon: Any, scope: Tuple[str, ...] = ()) -> int:
+    """Key on the GEO_DECIMALS cell of (lat, lon); NO_KEY if either does not parse."""
+    q_lat = quantize_coordinate(lat)
+    if q_lat is None:
+        return NO_KEY
+    q_lon = quantize_coordinate(lon)
+    if q_lon is None:
+        return NO_KEY
+    return _tagged_hash(2, scope + (q_lat, q_lon))
+
+
+def address_key(address: Any, city: Any, scope: Tuple[str, ...] = ()) -> int:
+    """Key on address + city fingerprints; NO_KEY unless both are non-empty."""
+    addr_fp = fingerprint(address)
+    city_fp = fingerprint(city)
+    if not (addr_fp and city_fp):
+        return NO_KEY
+    return _tagged_hash(3, scope + (addr_fp, city_fp))
+
+
+def build_keys(items: Iterable[Any], key_func: Callable[[Any], int]) -> array:
+    """Precompute one key per item into an int64 column."""
+    return array('q', map(key_func, items))
+
+
+class Deduplicator:
+    """
+    First occurrence of each key wins; NO_KEY rows are always kept. Rows can be added a batch at
+    a time (e.g. per viewport level) and only two int64 columns are kept per row seen: its key and
+    the index of the row it collapsed into (itself when kept), from which the rule is reported.
+    """
+
+    __slots__ = ("keys", "first", "_first_by_key")
+
+    def __init__(self):
+        self.keys = array('q')
+        self.first = array('q')
+        self._first_by_key: Dict[int, int] = {}
+
+    def __len__(self) -> int:
+        return len(self.first)
+
+    def add_keys(self, keys: array) -> range:
+        """Dedup the next batch of precomputed keys; returns the row indices they were given."""
+        start = len(self.first)
+        setdefault = self._first_by_key.setdefault
+        self.keys.extend(keys)
+        self.first.extend([setdefault(key, i) if key else i for i, key in enumerate(keys, start)])
+        return range(start, len(self.first))
+
+    def filter(self, items: Sequence[Any], keys: array) -> List[Any]:
+        """Add a batch of items with their precomputed keys and return the ones kept, in order."""
+        rows = self.add_keys(keys)
+        return list(compress(items, map(operator.eq, self.first[rows.start:], rows)))
+
+    def is_kept(self, index: int) -> bool:
+        return self.first[index] == index
+
+    def kept(self, items: Sequence[Any]) -> List[Any]:
+        """The kept items among every row added, given the items in the order they were added."""
+        return list(compress(items, map(operator.eq, self.first, range(len(self.first)))))
+
+    def collapsed(self) -> List[Tuple[int, str, int]]:
+        """(dropped row, rule, kept row) for every dropped row."""
+        keys = self.keys
+        return [(i, rule_of(keys[i]), j) for i, j in enumerate(self.first) if j != i]
+
+    @property
+    def removed(self) -> int:
+        return len(self.first) - sum(map(operator.eq, self.first, range(len(self.first))))
+
+    def counts(self) -> Dict[str, int]:
+        """Dropped rows per rule, e.g. {"geo": 12, "address": 3}."""
+        keys = self.keys
+        codes = Counter(keys[i] >> _HASH_BITS for i, j in enumerate(self.first) if j != i)
+        return {RULES[code - 1]: n for code, n in sorted(codes.items())}
+
+
+def dedupe(keys: array) -> Deduplicator:
+    """Dedup one batch of precomputed keys."""
+    deduplicator = Deduplicator()
+    deduplicator.add_keys(keys)
+    return deduplicator
+
+
+def format_counts(counts: Dict[str, int]) -> str:
+    """"geo 12, address 3" in RULES order."""
+    return ", ".join(f"{rule} {counts[rule]}" for rule in RULES if counts.get(rule))
+
+
+if __name__ == "__main__":
+    stores = [
+        {"id": "A", "lat": "40.712801", "lng": "-74.0060"},
+        {"id": "A", "lat": "40.7128", "lng": "-74.0060"},
+        {"id": "", "lat": "51.500001", "lng": "-0.1"},
+        {"id": "", "lat": "51.5", "lng": "-0.100001"},
+        {"id": "", "lat": "", "lng": ""},
+        {"id": "", "lat": "", "lng": ""},
+    ]
+    result = dedupe(build_keys(stores, lambda s: id_key(s["id"]) or geo_key(s["lat"], s["lng"])))
+    assert result.kept(stores) == [stores[0], stores[2], stores[4], stores[5]]
+    assert result.collapsed() == [(1, RULE_ID, 0), (3, RULE_GEO, 2)]
+    assert format_counts(result.counts()) == "id 1, geo 1"
+    incremental = Deduplicator()
+    key_func = lambda s: id_key(s["id"]) or geo_key(s["lat"], s["lng"])  # noqa: E731
+    batches = [stores[:3], stores[3:]]
+    assert sum((incremental.filter(b, build_keys(b, key_func)) for b in batches), []) == result.kept(stores)
+    assert incremental.collapsed() == result.collapsed() and incremental.removed == 2
+    assert quantize_coordinate("nan") is None and quantize_coordinate("abc") is None
+    assert address_key("12 Rue de la Paix", "Paris") == address_key("12, rue de la paix", "PARIS")
+    assert rule_of(address_key("1 Main St", "X")) == RULE_ADDRESS and rule_of(NO_KEY) is None
+    assert list(id_keys(["A ", "", None, 7])) == [id_key("A"), NO_KEY, NO_KEY, id_key("7")]
+    print("dedup_utils self-test passed")
@@ -0,0 +1,99 @@
+#!/usr/bin/env python3
+"""
+Benchmark coordinate_utils.validate_coordinate_columns against the per-row path it replaced in
+batch_normalize (normalize_coordinate_string per value) and CSVValidator.validate_row
+(check_coordinate_pair per row), with NumPy and with the pure-Python fallback. Checks all three
+give the same normalized strings and the same per-row checks.
+
+Rows are test_output/*.csv coordinates repeated to --rows (default 200k); about one in ten is
+replaced by a blank, non-numeric, nan/inf, out-of-range, swapped, 0,0 or over-precise value.
+
+  python3 dev_tools/bench_coordinates.py
+  python3 dev_tools/bench_coordinates.py --rows 1000000
+"""
+
+import argparse
+import os
+import random
+import sys
+import time
+from typing import Any, Callable, List, Tuple
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+for path in (ROOT, os.path.dirname(os.path.abspath(__file__))):
+    if path not in sys.path:
+        sys.path.insert(0, path)
+
+from bench_field_mapping import load_values  # noqa: E402
+from coordinate_utils import (  # noqa: E402
+    NUMPY_AVAILABLE,
+    check_coordinate_pair,
+    normalize_coordinate_string,
+    validate_coordinate_columns,
+)
+
+ODD_VALUES = [
+    "", " ", None, "nan", "-inf", "abc", "1,5", "0x10", "1_0.5", " 12.5 ", "١٢", "95.5", "-181",
+    "0", "-0.0000001", "1e-08", "48.856613912", "2.35222189123", 48.8566, 7, "12.5" + " " * 60, "1\x00",
+]
+
+
+def coordinate_rows(limit: int, seed: int) -> Tuple[List[Any], List[Any]]:
+    rng = random.Random(seed)
+    lats: List[Any] = []
+    lons: List[Any] = []
+    for value in load_values(limit):
+        lat, lon = value.get("Latitude", ""), value.get("Longitude", "")
+        roll = rng.random()
+        if roll < 0.02:
+            lat, lon = lon, lat
+        elif roll < 0.1:
+            if rng.random() < 0.5:
+                lat = rng.choice(ODD_VALUES)
+            else:
+                lon = rng.choice(ODD_VALUES)
+        lats.append(lat)
+        lons.append(lon)
+    return lats, lons
+
+
+def timed(fn: Callable[[], Any]) -> Tuple[Any, float]:
+    start = time.perf_counter()
+    result = fn()
+    return result, time.perf_counter() - start
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Benchmark column coordinate validation against the per-row path")
+    parser.add_argument("--rows", type=int, default=200000, help="Rows (default 200000)")
+    args = parser.parse_args()
+
+    lats, lons = coordinate_rows(args.rows, seed=0)
+    per_row_strings, per_row_s = timed(lambda: (
+        [normalize_coordinate_string(v, "latitude") for v in lats],
+        [normalize_coordinate_string(v, "longitude") for v in lons],
+    ))
+    per_row_checks, per_row_check_s = timed(lambda: [check_coordinate_pair(a, b) for a, b in zip(lats, lons)])
+
+    modes = [("pure Python", False)] + ([("NumPy", True)] if NUMPY_AVAILABLE else [])
+    failed = 0
+    print(f"Rows: {len(lats)} | per-row: normalize {per_row_s:.3f}s, validator checks {per_row_check_s:.3f}s")
+    for label, use_numpy in modes:
+        columns, columns_s = timed(lambda: validate_coordinate_columns(lats, lons, use_numpy=use_numpy))
+        strings, strings_s = timed(columns.normalized)
+        checks, checks_s = timed(columns.checks)
+        same = strings == per_row_strings and checks == per_row_checks
+        failed += not same
+        print(f"  {label:12s} columns {columns_s:.3f}s + normalized {strings_s:.3f}s "
+              f"({per_row_s / (columns_s + strings_s):.1f}x) + checks {checks_s:.3f}s "
+              f"({per_row_check_s / (columns_s + checks_s):.1f}x) | identical: {same}")
+    if not NUMPY_AVAILABLE:
+        print("  NumPy not installed: only the fallback was measured")
+    errors = sum(1 for check in per_row_checks if check[0] or check[2])
+    suspects = sum(1 for check in per_row_checks if check[4])
+    print(f"  {errors} rows with coordinate errors, {suspects} 0,0 / swapped suspects")
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,189 @@
+#!/usr/bin/env python3
+"""
+Benchmark the dedup_utils engine against the three dedup implementations it replaced:
+batch_normalize's f-string geo/address/handle keys, viewport_grid.deduplicate_stores' ID probes
+and CSVValidator.dedupe_rows_by_key's tuple keys. Checks each keeps exactly the same rows.
+
+Rows are test_output/*.csv stores, each repeated 1–10 times in shuffled order the way
+overlapping viewports return them (--rows total, default 100k). Peak memory is the key
+structures only (tracemalloc, in a separate run).
+
+  python3 dev_tools/bench_dedup.py
+  python3 dev_tools/bench_dedup.py --rows 500000
+"""
+
+import argparse
+import contextlib
+import io
+import random
+import re
+import sys
+import time
+import tracemalloc
+import os
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+for path in (ROOT, os.path.dirname(os.path.abspath(__file__))):
+    if path not in sys.path:
+        sys.path.insert(0, path)
+
+from bench_field_mapping import load_values  # noqa: E402
+from data_normalizer import _drop_duplicates  # noqa: E402
+from validate_csv import CSVValidator, DEFAULT_DUPLICATE_KEY, DEFAULT_REQUIRED  # noqa: E402
+from viewport_grid import deduplicate_stores  # noqa: E402
+
+
+def legacy_dedup_key(normalized: Dict[str, str]) -> Optional[str]:
+    """data_normalizer._dedup_key before dedup_utils."""
+    _lat_str = normalized.get("Latitude", "").strip()
+    _lon_str = normalized.get("Longitude", "").strip()
+    _addr_fp = re.sub(r'[^a-z0-9]', '', normalized.get("Address Line 1", "").strip().lower())
+    _city_norm = re.sub(r'[^a-z0-9]', '', normalized.get("City", "").strip().lower())
+    _country_norm = normalized.get("Country", "").strip().lower()
+    try:
+        _lat_r = round(float(_lat_str), 5)
+        _lon_r = round(float(_lon_str), 5)
+        combo_key = f"geo|{_lat_r}|{_lon_r}|{_country_norm}"
+    except (ValueError, TypeError):
+        if _addr_fp and _city_norm:
+            combo_key = f"addr|{_addr_fp}|{_city_norm}|{_country_norm}"
+        else:
+            combo_key = None
+    if not combo_key:
+        _h = normalized.get("Handle", "").strip().lower()
+        if _h:
+            combo_key = f"handle|{_h}"
+    return combo_key
+
+
+def legacy_drop_duplicates(rows: List[Dict[str, str]]) -> List[Dict[str, str]]:
+    seen_combinations = set()
+    kept = []
+    for row in rows:
+        combo_key = legacy_dedup_key(row)
+        if combo_key:
+            if combo_key in seen_combinations:
+                continue
+            seen_combinations.add(combo_key)
+        kept.append(row)
+    return kept
+
+
+def legacy_deduplicate_stores(stores: List[Dict[str, Any]], key_field: str = "id") -> List[Dict[str, Any]]:
+    seen = set()
+    unique_stores = []
+    possible_keys = [key_field, "id", "storeId", "dealerId", "handle", "Handle"]
+    for store in stores:
+        store_id = None
+        for key in possible_keys:
+            if key in store and store[key]:
+                store_id = str(store[key])
+                break
+        if not store_id:
+            name = store.get("name", store.get("nameTranslated", store.get("Name", "")))
+            lat = store.get("lat", store.get("latitude", store.get("Latitude", "")))
+            lng = store.get("lng", store.get("longitude", store.get("Longitude", "")))
+            store_id = f"{name}_{lat}_{lng}"
+        if store_id not in seen:
+            seen.add(store_id)
+            unique_stores.append(store)
+    return unique_stores
+
+
+def legacy_dedupe_rows_by_key(rows: List[Dict[str, str]], key_fields: List[str]) -> Tuple[List[Dict[str, str]], int]:
+    seen = set()
+    out = []
+    removed = 0
+    for row in rows:
+        key = tuple((row.get(f) or "").strip() for f in key_fields)
+        if all(key):
+            if key in seen:
+                removed += 1
+                continue
+            seen.add(key)
+        out.append(row)
+    return out, removed
+
+
+def viewport_rows(limit: int, seed: int) -> List[Dict[str, Any]]:
+    """Raw API-shaped stores, each returned by 1–10 overlapping viewports; every third lacks an ID."""
+    rng = random.Random(seed)
+    rows: List[Dict[str, Any]] = []
+    for i, value in enumerate(load_values(max(1, limit // 5))):
+        store = {
+            "id": f"S{i}" if i % 3 else "",
+            "name": value.get("Name", ""),
+            "lat": value.get("Latitude", ""),
+            "lng": value.get("Longitude", ""),
+        }
+        rows.extend([store] * rng.randint(1, 10))
+    rng.shuffle(rows)
+    return rows[:limit]
+
+
+def normalized_rows(limit: int, seed: int) -> List[Dict[str, str]]:
+    """Canonical rows, each repeated 1–10 times; some lose coordinates so address/handle keys run."""
+    rng = random.Random(seed)
+    rows: List[Dict[str, str]] = []
+    for i, value in enumerate(load_values(max(1, limit // 5))):
+        row = dict(value, Handle=f"{value.get('Handle', '')}-{i}")
+        if i % 4 == 0:
+            row = dict(row, Latitude="", Longitude="")
+        rows.extend([row] * rng.randint(1, 10))
+    rng.shuffle(rows)
+    return rows[:limit]
+
+
+def measure(fn: Callable[[], Any]) -> Tuple[Any, float, float]:
+    """(result, seconds, peak MB); memory is traced in a second run so it doesn't skew the timing."""
+    start = time.perf_counter()
+    result = fn()
+    elapsed = time.perf_counter() - start
+    tracemalloc.start()
+    fn()
+    peak = tracemalloc.get_traced_memory()[1] / 1e6
+    tracemalloc.stop()
+    return result, elapsed, peak
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Benchmark dedup_utils against the legacy dedup paths")
+    parser.add_argument("--rows", type=int, default=100000, help="Rows per caller (default 100000)")
+    args = parser.parse_args()
+
+    normalized = normalized_rows(args.rows, seed=0)
+    stores = viewport_rows(args.rows, seed=1)
+    validator = CSVValidator(DEFAULT_REQUIRED)
+    cases = [
+        ("batch_normalize", lambda: legacy_drop_duplicates(normalized), lambda: _drop_duplicates(normalized, {})),
+        ("viewport_grid", lambda: legacy_deduplicate_stores(stores), lambda: deduplicate_stores(stores)),
+        ("validate_csv",
+         lambda: legacy_dedupe_rows_by_key(normalized, DEFAULT_DUPLICATE_KEY)[0],
+         lambda: validator.dedupe_rows_by_key(normalized, DEFAULT_DUPLICATE_KEY)[0]),
+    ]
+
+    failed = 0
+    print(f"Rows per caller: {args.rows}")
+    for label, legacy_fn, engine_fn in cases:
+        with contextlib.redirect_stdout(io.StringIO()):  # log_debug
+            legacy, legacy_s, legacy_mb = measure(legacy_fn)
+            engine, engine_s, engine_mb = measure(engine_fn)
+        legacy_ids = [id(r) for r in legacy]
+        engine_ids = [id(r) for r in engine]
+        if label == "viewport_grid":
+            # ID-less stores now collapse by name within a GEO_DECIMALS cell, not exact coordinate text
+            kept_ids = set(engine_ids)
+            same = [i for i in legacy_ids if i in kept_ids] == engine_ids
+            note = f"same rows: {same} ({len(legacy) - len(engine)} more collapsed by geo cell)"
+        else:
+            same = legacy_ids == engine_ids
+            note = f"same rows: {same}"
+        failed += not same
+        print(f"  {label:16s} kept {len(engine):7d} | legacy {legacy_s:.3f}s {legacy_mb:6.1f} MB "
+              f"→ engine {engine_s:.3f}s {engine_mb:6.1f} MB | {note}")
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
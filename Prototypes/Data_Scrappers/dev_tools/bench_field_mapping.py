@@ -0,0 +1,138 @@
+#!/usr/bin/env python3
+"""
+Benchmark apply_field_mapping: interpreting each brand's field_mapping per row vs the plan from
+compile_field_mapping. Also checks both produce the same mapped row for every input.
+
+Raw rows are synthesised per brand in brand_configs.json from test_output/*.csv values, placed at
+the brand's own source paths; some fields are dropped, blanked or moved to a fuzzy alias key so
+the fallback search is exercised too.
+
+  python3 dev_tools/bench_field_mapping.py
+  python3 dev_tools/bench_field_mapping.py --rows 50000
+"""
+
+import argparse
+import csv
+import glob
+import json
+import os
+import random
+import sys
+import time
+from typing import Any, Dict, List, Tuple
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if ROOT not in sys.path:
+    sys.path.insert(0, ROOT)
+
+from data_normalizer import FIELD_MAPPING_ALIASES, apply_field_mapping, compile_field_mapping  # noqa: E402
+
+
+def load_values(limit: int) -> List[Dict[str, str]]:
+    rows: List[Dict[str, str]] = []
+    for path in sorted(glob.glob(os.path.join(ROOT, "test_output", "*.csv"))):
+        with open(path, newline="", encoding="utf-8") as f:
+            rows.extend(csv.DictReader(f))
+    if not rows:
+        sys.exit("No CSVs in test_output/")
+    return [rows[i % len(rows)] for i in range(limit)]
+
+
+def _set_path(obj: Dict[str, Any], path: str, value: Any) -> None:
+    parts = path.split(".")
+    for part, nxt in zip(parts, parts[1:]):
+        child = obj.get(part)
+        if not isinstance(child, (dict, list)):
+            child = [{}] * (int(nxt) + 1) if nxt.isdigit() else {}
+            obj[part] = child
+        if isinstance(child, list):
+            break  # list paths are only read, not synthesised past the index
+        obj = child
+    else:
+        obj[parts[-1]] = value
+
+
+def _source_paths(config: Any) -> List[str]:
+    if isinstance(config, str):
+        return [config]
+    if isinstance(config, list):
+        return [p for p in config if p]
+    if isinstance(config, dict):
+        if isinstance(config.get("join"), list):
+            return [str(p) for p in config["join"] if p]
+        return [config["key"]] if config.get("key") else []
+    return []
+
+
+def synth_rows(field_mapping: Dict[str, Any], values: List[Dict[str, str]], seed: int) -> List[Dict[str, Any]]:
+    rng = random.Random(seed)
+    rows = []
+    for value_row in values:
+        raw: Dict[str, Any] = {"internalRef": rng.randint(0, 10 ** 6), "updatedAt": "2024-01-01"}
+        for field, config in field_mapping.items():
+            if field.startswith("_"):
+                continue
+            paths = _source_paths(config)
+            value = value_row.get(field, "")
+            roll = rng.random()
+            if roll < 0.1 or not paths:
+                continue
+            if roll < 0.15:
+                value = ""
+            if roll < 0.25 and FIELD_MAPPING_ALIASES.get(field):
+                _set_path(raw, rng.choice(FIELD_MAPPING_ALIASES[field]), value)
+                continue
+            path = rng.choice(paths)
+            if rng.random() < 0.05:
+                path = path.upper()
+            _set_path(raw, path, value)
+        rows.append(raw)
+    return rows
+
+
+def run_brand(field_mapping: Dict[str, Any], rows: List[Dict[str, Any]]) -> Tuple[float, float, int]:
+    start = time.perf_counter()
+    legacy = [apply_field_mapping(raw, field_mapping) for raw in rows]
+    legacy_s = time.perf_counter() - start
+
+    start = time.perf_counter()
+    plan = compile_field_mapping(field_mapping)
+    compiled = [plan(raw) for raw in rows]
+    compiled_s = time.perf_counter() - start
+    return legacy_s, compiled_s, sum(1 for a, b in zip(legacy, compiled) if a != b)
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Benchmark compiled field-mapping plans")
+    parser.add_argument("--rows", type=int, default=10000, help="Rows per brand (default 10000)")
+    args = parser.parse_args()
+
+    with open(os.path.join(ROOT, "brand_configs.json"), encoding="utf-8") as f:
+        configs = json.load(f)
+    values = load_values(args.rows)
+
+    total_legacy = total_compiled = 0.0
+    total_mismatches = brands = 0
+    for seed, (brand, config) in enumerate(sorted(configs.items())):
+        field_mapping = config.get("field_mapping") if isinstance(config, dict) else None
+        if not field_mapping:
+            continue
+        rows = synth_rows(field_mapping, values, seed)
+        legacy_s, compiled_s, mismatches = run_brand(field_mapping, rows)
+        total_legacy += legacy_s
+        total_compiled += compiled_s
+        total_mismatches += mismatches
+        brands += 1
+        flag = f"  ❌ {mismatches} mismatches" if mismatches else ""
+        print(f"  {brand:40s} {legacy_s / len(rows) * 1e6:6.1f} → {compiled_s / len(rows) * 1e6:6.1f} µs/row{flag}")
+
+    print(f"Brands: {brands} × {args.rows} rows")
+    print(f"  per-row interpretation : {total_legacy:.3f}s")
+    print(f"  compiled plans         : {total_compiled:.3f}s")
+    print(f"  speedup                : {total_legacy / total_compiled:.1f}x")
+    print(f"  mismatches             : {total_mismatches}")
+    return 1 if total_mismatches else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
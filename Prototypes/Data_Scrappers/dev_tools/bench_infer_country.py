@@ -0,0 +1,104 @@
+#!/usr/bin/env python3
+"""
+Benchmark infer_country_from_address: per-row cost of the precompiled country matcher vs the
+legacy per-call scan (re-read watch_store_countries.json, rebuild and sort the name list,
+substring-test every name). Also checks both return the same country for every row.
+
+Rows come from test_output/*.csv with Country blanked, repeated up to --rows (default 10k).
+
+  python3 dev_tools/bench_infer_country.py
+  python3 dev_tools/bench_infer_country.py --rows 50000
+"""
+
+import argparse
+import csv
+import glob
+import json
+import os
+import sys
+import time
+from typing import Dict, List
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if ROOT not in sys.path:
+    sys.path.insert(0, ROOT)
+
+import data_normalizer  # noqa: E402
+from data_normalizer import infer_country_from_address  # noqa: E402
+
+
+def _legacy_match_country_name(search_text: str) -> str:
+    """The scan infer_country_from_address used to run on every call."""
+    countries_file = os.path.join(ROOT, "watch_store_countries.json")
+    country_names = []
+    try:
+        if os.path.exists(countries_file):
+            with open(countries_file, 'r', encoding='utf-8') as f:
+                data = json.load(f)
+                if "countries" in data:
+                    country_names = list(data["countries"].values())
+                    for main_name, variations in data_normalizer._COUNTRY_NAME_VARIATIONS.items():
+                        if main_name in country_names:
+                            country_names.extend(variations)
+    except Exception:
+        country_names = list(data_normalizer._FALLBACK_COUNTRY_NAMES)
+    for country_name in sorted(country_names, key=len, reverse=True):
+        country_lower = country_name.lower()
+        if country_lower in data_normalizer._COUNTRY_NAME_EXCLUDED:
+            continue
+        if country_lower in search_text:
+            return country_name
+    return ""
+
+
+def load_rows(limit: int) -> List[Dict[str, str]]:
+    rows: List[Dict[str, str]] = []
+    for path in sorted(glob.glob(os.path.join(ROOT, "test_output", "*.csv"))):
+        with open(path, newline="", encoding="utf-8") as f:
+            rows.extend(csv.DictReader(f))
+    if not rows:
+        sys.exit("No CSVs in test_output/")
+    return [rows[i % len(rows)] for i in range(limit)]
+
+
+def run(rows: List[Dict[str, str]]) -> List[str]:
+    return [
+        infer_country_from_address(
+            row.get("Address Line 1", ""),
+            row.get("City", ""),
+            row.get("State/Province/Region", ""),
+        )
+        for row in rows
+    ]
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Benchmark infer_country_from_address")
+    parser.add_argument("--rows", type=int, default=10000, help="Rows to infer (default 10000)")
+    args = parser.parse_args()
+    rows = load_rows(args.rows)
+
+    current = data_normalizer._match_country_name
+    data_normalizer._match_country_name = _legacy_match_country_name
+    try:
+        start = time.perf_counter()
+        legacy = run(rows)
+        legacy_s = time.perf_counter() - start
+    finally:
+        data_normalizer._match_country_name = current
+
+    start = time.perf_counter()
+    compiled = run(rows)
+    compiled_s = time.perf_counter() - start
+
+    mismatches = sum(1 for a, b in zip(legacy, compiled) if a != b)
+    print(f"Rows: {len(rows)} | countries inferred: {sum(1 for c in compiled if c)}")
+    print(f"  legacy scan : {legacy_s:.3f}s  ({legacy_s / len(rows) * 1e6:.1f} µs/row)")
+    print(f"  precompiled : {compiled_s:.3f}s  ({compiled_s / len(rows) * 1e6:.1f} µs/row)")
+    print(f"  speedup     : {legacy_s / compiled_s:.1f}x")
+    print(f"  mismatches  : {mismatches}")
+    return 1 if mismatches else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
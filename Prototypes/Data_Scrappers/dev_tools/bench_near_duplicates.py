@@ -0,0 +1,110 @@
+#!/usr/bin/env python3
+"""
+Benchmark near_duplicates.find_near_duplicates and check the grid index finds exactly the pairs
+an all-pairs haversine scan finds.
+
+Rows are test_output/*.csv stores plus a re-reported copy of every fifth one, moved up to 40 m
+and given a name/address variant the way a second brand API reports the same boutique. A few
+are placed at the antimeridian and the poles, where grid cells wrap or widen. The
+all-pairs check runs on the first --check rows (default 3000); the timing on all --rows.
+
+  python3 dev_tools/bench_near_duplicates.py
+  python3 dev_tools/bench_near_duplicates.py --rows 200000 --radius 50
+"""
+
+import argparse
+import csv
+import glob
+import math
+import os
+import random
+import sys
+import time
+from typing import Dict, List, Set, Tuple
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if ROOT not in sys.path:
+    sys.path.insert(0, ROOT)
+
+from coordinate_utils import haversine_meters  # noqa: E402
+from near_duplicates import METERS_PER_DEGREE, find_near_duplicates, usable_coordinates  # noqa: E402
+
+
+def synth_rows(limit: int, seed: int) -> List[Dict[str, str]]:
+    rng = random.Random(seed)
+    base = []
+    for path in sorted(glob.glob(os.path.join(ROOT, "test_output", "*.csv"))):
+        with open(path, newline="", encoding="utf-8") as f:
+            base.extend(r for r in csv.DictReader(f) if usable_coordinates(r.get("Latitude"), r.get("Longitude")))
+    rows: List[Dict[str, str]] = []
+    while len(rows) < limit:
+        value = dict(rng.choice(base))
+        if rng.random() < 0.02:
+            # Grid edge cases: the antimeridian and the poles
+            lat = rng.choice([rng.uniform(-90, -89.99), rng.uniform(89.99, 90), rng.uniform(-60, 60)])
+            lon = rng.choice([rng.uniform(179.999, 180), rng.uniform(-180, -179.999)])
+        else:
+            # Spread the corpus so repeated base rows don't all stack on one point
+            lat = float(value["Latitude"]) + rng.uniform(-0.5, 0.5)
+            lon = float(value["Longitude"]) + rng.uniform(-0.5, 0.5)
+        lat = max(-90.0, min(90.0, lat))
+        value["Latitude"], value["Longitude"] = f"{lat:.7f}", f"{lon:.7f}"
+        rows.append(value)
+        if rng.random() < 0.2:
+            meters = rng.uniform(0, 40)
+            bearing = rng.uniform(0, 2 * math.pi)
+            dup = dict(value)
+            dup_lat = max(-90.0, min(90.0, lat + meters * math.cos(bearing) / METERS_PER_DEGREE))
+            dup_lon = lon + meters * math.sin(bearing) / (METERS_PER_DEGREE * max(math.cos(math.radians(lat)), 1e-3))
+            dup["Latitude"] = f"{dup_lat:.7f}"
+            dup["Longitude"] = f"{(dup_lon + 180) % 360 - 180:.7f}"
+            dup["Name"] = value.get("Name", "") + rng.choice(["", " Boutique", " Ltd", ""])
+            dup["Address Line 1"] = value.get("Address Line 1", "").replace("Street", "St")
+            rows.append(dup)
+    return rows[:limit]
+
+
+def brute_force_pairs(rows: List[Dict[str, str]], radius_m: float) -> Set[Tuple[int, int]]:
+    coords = [usable_coordinates(r.get("Latitude"), r.get("Longitude")) for r in rows]
+    pairs = set()
+    for i in range(len(rows)):
+        if not coords[i]:
+            continue
+        for j in range(i):
+            if coords[j] and haversine_meters(*coords[i], *coords[j]) <= radius_m:
+                pairs.add((j, i))
+    return pairs
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Benchmark near-duplicate detection")
+    parser.add_argument("--rows", type=int, default=50000, help="Rows to search (default 50000)")
+    parser.add_argument("--check", type=int, default=3000, help="Rows for the all-pairs check (default 3000)")
+    parser.add_argument("--radius", type=float, default=150, help="Meters (default 150)")
+    args = parser.parse_args()
+
+    rows = synth_rows(args.rows, seed=0)
+    subset = rows[:args.check]
+    start = time.perf_counter()
+    expected = brute_force_pairs(subset, args.radius)
+    brute_s = time.perf_counter() - start
+    # min_score below zero keeps every pair within the radius; pairs across countries are never reported
+    found = {(p.a, p.b) for p in find_near_duplicates(subset, args.radius, min_score=-1.0)}
+    same_country = {
+        (a, b) for a, b in expected
+        if not (subset[a].get("Country") and subset[b].get("Country")
+                and subset[a]["Country"].strip().lower() != subset[b]["Country"].strip().lower())
+    }
+    print(f"All-pairs check on {len(subset)} rows: {len(same_country)} pairs | grid found {len(found)} | "
+          f"identical: {found == same_country} | all-pairs scan {brute_s:.2f}s")
+
+    start = time.perf_counter()
+    pairs = find_near_duplicates(rows, args.radius)
+    elapsed = time.perf_counter() - start
+    print(f"Rows: {len(rows)} | {len(pairs)} pairs scoring ≥ 0.7 within {args.radius:g} m | {elapsed:.2f}s "
+          f"({elapsed / len(rows) * 1e6:.0f} µs/row)")
+    return 0 if found == same_country else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
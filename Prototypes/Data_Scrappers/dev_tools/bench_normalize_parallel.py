@@ -0,0 +1,61 @@
+#!/usr/bin/env python3
+"""
+Benchmark batch_normalize's normalize stage: serial vs a process pool, and check both produce
+identical rows (handles included) and the same exclusions.
+
+Raw rows are synthesised for one brand mapping as in bench_field_mapping.py. Handle is left
+unmapped so every handle is generated and the serial uniqueness pass has collisions to settle.
+Geocoding is off.
+
+  python3 dev_tools/bench_normalize_parallel.py
+  python3 dev_tools/bench_normalize_parallel.py --rows 50000 --brand rolex_retailers --workers 8
+"""
+
+import argparse
+import contextlib
+import io
+import json
+import os
+import sys
+import time
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+for path in (ROOT, os.path.dirname(os.path.abspath(__file__))):
+    if path not in sys.path:
+        sys.path.insert(0, path)
+
+from bench_field_mapping import load_values, synth_rows  # noqa: E402
+from data_normalizer import batch_normalize  # noqa: E402
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Benchmark parallel normalization")
+    parser.add_argument("--rows", type=int, default=20000, help="Rows to normalize (default 20000)")
+    parser.add_argument("--brand", default="rolex_retailers", help="Brand whose field_mapping to use")
+    parser.add_argument("--workers", type=int, default=0, help="Pool size (default 0 = one per CPU)")
+    args = parser.parse_args()
+
+    with open(os.path.join(ROOT, "brand_configs.json"), encoding="utf-8") as f:
+        field_mapping = dict(json.load(f)[args.brand]["field_mapping"])
+    field_mapping.pop("Handle", None)
+    rows = synth_rows(field_mapping, load_values(args.rows), seed=0)
+
+    results = {}
+    for label, workers in (("serial", 1), ("parallel", args.workers)):
+        timings = {}
+        start = time.perf_counter()
+        with contextlib.redirect_stdout(io.StringIO()):  # per-store exclusion log
+            results[label] = batch_normalize(
+                rows, field_mapping, geocode_missing=False, stage_timings=timings, workers=workers
+            )
+        elapsed = time.perf_counter() - start
+        print(f"  {label:8s}: normalize {timings['normalize']:.2f}s on {timings['normalize_workers']} "
+              f"process(es), batch {elapsed:.2f}s, {len(results[label][0])} kept")
+
+    identical = results["serial"] == results["parallel"]
+    print(f"Rows: {len(rows)} | identical output: {identical}")
+    return 0 if identical else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,115 @@
+#!/usr/bin/env python3
+"""
+Startup benchmark for universal_scraper.py: how long a freshly spawned scraper process (as the
+backend runs one per brand job) takes to import, and to send its first HTTP request.
+
+A local HTTP server records when the first request arrives; each run spawns
+`universal_scraper.py --url http://127.0.0.1:<port>/stores --type single_call` and reports
+the median of --runs (default 5). The first country lookup (prebuilt country_index) is
+timed separately.
+
+  python3 dev_tools/bench_startup.py
+  python3 dev_tools/bench_startup.py --runs 10
+"""
+
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+import tempfile
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import List, Optional
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+SCRAPER = os.path.join(ROOT, "universal_scraper.py")
+
+_first_request_at: List[Optional[float]] = [None]
+_first_request_event = threading.Event()
+
+
+class _StoresHandler(BaseHTTPRequestHandler):
+    def log_message(self, *args) -> None:
+        pass
+
+    def do_GET(self) -> None:
+        if _first_request_at[0] is None:
+            _first_request_at[0] = time.perf_counter()
+            _first_request_event.set()
+        body = json.dumps([{"id": 1, "name": "Bench Store", "latitude": 46.2, "longitude": 6.1}]).encode()
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+
+def time_import(runs: int) -> List[float]:
+    times = []
+    for _ in range(runs):
+        out = subprocess.check_output(
+            [sys.executable, "-c",
+             "import time; t = time.perf_counter(); import universal_scraper; print(time.perf_counter() - t)"],
+            cwd=ROOT,
+        )
+        times.append(float(out.decode().strip().splitlines()[-1]))
+    return times
+
+
+def time_first_request(runs: int, port: int) -> List[float]:
+    times = []
+    with tempfile.TemporaryDirectory() as tmp:
+        for _ in range(runs):
+            _first_request_at[0] = None
+            _first_request_event.clear()
+            start = time.perf_counter()
+            proc = subprocess.Popen(
+                [sys.executable, SCRAPER, "--url", f"http://127.0.0.1:{port}/stores",
+                 "--type", "single_call", "--no-validate", "-o", os.path.join(tmp, "stores.csv")],
+                cwd=ROOT, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL,
+            )
+            if _first_request_event.wait(timeout=60):
+                times.append(_first_request_at[0] - start)
+            proc.wait(timeout=120)
+    return times
+
+
+def time_first_country_lookup() -> float:
+    out = subprocess.check_output(
+        [sys.executable, "-c",
+         "import time; from country_index import country_variants; t = time.perf_counter(); "
+         "country_variants().get('schweiz'); print(time.perf_counter() - t)"],
+        cwd=ROOT,
+    )
+    return float(out.decode().strip().splitlines()[-1])
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Benchmark universal_scraper startup")
+    parser.add_argument("--runs", type=int, default=5, help="Runs per measurement (default 5)")
+    args = parser.parse_args()
+
+    server = ThreadingHTTPServer(("127.0.0.1", 0), _StoresHandler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    try:
+        imports = time_import(args.runs)
+        first_requests = time_first_request(args.runs, server.server_port)
+    finally:
+        server.shutdown()
+    lookup = time_first_country_lookup()
+
+    print(f"Runs: {args.runs}")
+    print(f"  import universal_scraper : median {statistics.median(imports) * 1000:.0f} ms")
+    if first_requests:
+        print(f"  spawn → first request    : median {statistics.median(first_requests) * 1000:.0f} ms")
+    else:
+        print("  spawn → first request    : no request received")
+    print(f"  first country lookup     : {lookup * 1000:.1f} ms (lazy country_index load)")
+    return 0 if first_requests else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,82 @@
+#!/usr/bin/env python3
+"""
+Benchmark CSVValidator.validate_file(auto_fix=True) on generated master-size files: wall time and
+peak Python heap (tracemalloc) per size. The pass streams rows, so peak memory should grow only by
+the 16-byte duplicate-key fingerprints, not by the rows themselves.
+
+Rows are test_output/*_test_*.csv rows repeated with unique names; every 20th row is a duplicate
+and every 10th has a fixable backslash, so the fix/dedup/rewrite path is exercised.
+
+  python3 dev_tools/bench_validate_csv.py
+  python3 dev_tools/bench_validate_csv.py --rows 20000 100000
+"""
+
+import argparse
+import contextlib
+import csv
+import glob
+import io
+import os
+import sys
+import tempfile
+import time
+import tracemalloc
+from typing import Dict, List
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if ROOT not in sys.path:
+    sys.path.insert(0, ROOT)
+
+from validate_csv import DEFAULT_REQUIRED, CSVValidator  # noqa: E402
+
+
+def load_rows() -> List[Dict[str, str]]:
+    rows: List[Dict[str, str]] = []
+    for path in sorted(glob.glob(os.path.join(ROOT, "test_output", "*_test_*.csv"))):
+        with open(path, newline="", encoding="utf-8") as f:
+            rows.extend(csv.DictReader(f))
+    if not rows:
+        sys.exit("No CSVs in test_output/")
+    return rows
+
+
+def write_file(path: str, rows: List[Dict[str, str]], count: int) -> None:
+    fieldnames = list(rows[0].keys())
+    with open(path, "w", newline="", encoding="utf-8") as f:
+        writer = csv.DictWriter(f, fieldnames=fieldnames, lineterminator="\n", extrasaction="ignore", restval="")
+        writer.writeheader()
+        for i in range(count):
+            n = i - 1 if i % 20 == 19 else i  # every 20th row repeats the previous one
+            row = dict(rows[n % len(rows)])
+            row["Name"] = f"{row['Name']} #{n}"
+            if n % 10 == 0:
+                row["Address Line 1"] = row["Address Line 1"] + "\\"
+            writer.writerow(row)
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Benchmark streaming CSV validation")
+    parser.add_argument("--rows", type=int, nargs="+", default=[10000, 40000], help="File sizes to validate")
+    args = parser.parse_args()
+    rows = load_rows()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        for count in args.rows:
+            path = os.path.join(tmp, f"master_{count}.csv")
+            write_file(path, rows, count)
+            validator = CSVValidator(DEFAULT_REQUIRED, max_rows=None)
+            tracemalloc.start()
+            start = time.perf_counter()
+            with contextlib.redirect_stdout(io.StringIO()):
+                exit_code = validator.validate_file(path, auto_fix=True)
+            elapsed = time.perf_counter() - start
+            _, peak = tracemalloc.get_traced_memory()
+            tracemalloc.stop()
+            print(f"  {count:>7} rows: {elapsed:6.2f}s  peak {peak / 1e6:6.1f} MB  "
+                  f"fixes {validator.fixes_applied}  duplicates removed {validator.duplicates_removed}  "
+                  f"exit {exit_code}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,136 @@
+#!/usr/bin/env python3
+"""
+Benchmark validate_phone: the memoized path vs the legacy per-call version (imports inside the
+function, regexes compiled on use, every number parsed afresh). Also checks both return the same
+string for every input.
+
+The corpus is the Phone/Country pairs from test_output/*.csv, repeated up to --rows
+(default 20k) in file order, so chain numbers recur the way they do in a real brand batch.
+
+  python3 dev_tools/bench_validate_phone.py
+  python3 dev_tools/bench_validate_phone.py --rows 100000
+"""
+
+import argparse
+import csv
+import glob
+import os
+import re
+import sys
+import time
+from typing import Any, List, Tuple
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if ROOT not in sys.path:
+    sys.path.insert(0, ROOT)
+
+import data_normalizer  # noqa: E402
+from data_normalizer import validate_phone  # noqa: E402
+
+
+def _legacy_country_name_to_alpha2(country_name: str):
+    if not country_name:
+        return None
+    s = country_name.strip()
+    if re.match(r'^[A-Za-z]{2}$', s):
+        return s.upper()
+    try:
+        import pycountry
+        result = pycountry.countries.get(name=s)
+        if result:
+            return result.alpha_2
+        results = pycountry.countries.search_fuzzy(s)
+        if results:
+            return results[0].alpha_2
+    except Exception:
+        pass
+    return None
+
+
+def _legacy_normalize_phone_for_parse(phone_str: str) -> str:
+    s = phone_str.strip()
+    s = re.sub(r'\(\+86(\d*)\)\s*', r'+86 \1 ', s)
+    s = re.sub(r'\(\+(\d{1,3})\)\s*', r'+\1 ', s)
+    s = re.sub(r'\s*\(0\)\s*', ' ', s)
+    s = re.sub(r'\(0(\d+)\)', r'\1', s)
+    return s.strip()
+
+
+def legacy_validate_phone(phone: Any, country: str = "") -> str:
+    """validate_phone before memoization."""
+    import phonenumbers
+    from phonenumbers import PhoneNumberFormat
+
+    if not phone:
+        return ""
+    phone_str = str(phone).strip()
+    ext_match = re.search(r'(?:\s+[xX]\s*\d[\d\s]*|\s+ext\.?\s*\d[\d\s]*)$', phone_str, re.IGNORECASE)
+    extension = ext_match.group(0).strip() if ext_match else ""
+    if extension:
+        phone_str = phone_str[: ext_match.start()].strip()
+    phone_str = re.sub(r'[^\d+\-()\s]', '', phone_str)
+    phone_str = re.sub(r'\s+', ' ', phone_str).strip()
+    if not phone_str:
+        return ""
+    normalized = _legacy_normalize_phone_for_parse(phone_str)
+    region = _legacy_country_name_to_alpha2(country) if country else None
+    if region:
+        try:
+            parsed = phonenumbers.parse(normalized, region)
+            if phonenumbers.is_valid_number(parsed):
+                formatted = phonenumbers.format_number(parsed, PhoneNumberFormat.INTERNATIONAL)
+                return (formatted + " " + extension).strip() if extension else formatted
+        except Exception:
+            pass
+    try:
+        parsed = phonenumbers.parse(normalized, None)
+        if phonenumbers.is_valid_number(parsed) or phonenumbers.is_possible_number(parsed):
+            formatted = phonenumbers.format_number(parsed, PhoneNumberFormat.INTERNATIONAL)
+            return (formatted + " " + extension).strip() if extension else formatted
+    except Exception:
+        pass
+    return (phone_str + " " + extension).strip() if extension else phone_str
+
+
+def load_corpus(limit: int) -> List[Tuple[str, str]]:
+    pairs: List[Tuple[str, str]] = []
+    for path in sorted(glob.glob(os.path.join(ROOT, "test_output", "*.csv"))):
+        with open(path, newline="", encoding="utf-8") as f:
+            pairs.extend(
+                (row.get("Phone", ""), row.get("Country", ""))
+                for row in csv.DictReader(f)
+                if row.get("Phone")
+            )
+    if not pairs:
+        sys.exit("No phone numbers in test_output/")
+    return [pairs[i % len(pairs)] for i in range(limit)]
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Benchmark validate_phone")
+    parser.add_argument("--rows", type=int, default=20000, help="Numbers to validate (default 20000)")
+    args = parser.parse_args()
+    if not data_normalizer.PHONENUMBERS_AVAILABLE:
+        sys.exit("phonenumbers is not installed")
+    corpus = load_corpus(args.rows)
+
+    start = time.perf_counter()
+    legacy = [legacy_validate_phone(phone, country) for phone, country in corpus]
+    legacy_s = time.perf_counter() - start
+
+    start = time.perf_counter()
+    memoized = [validate_phone(phone, country) for phone, country in corpus]
+    memoized_s = time.perf_counter() - start
+
+    info = data_normalizer._format_phone_number.cache_info()
+    mismatches = sum(1 for a, b in zip(legacy, memoized) if a != b)
+    print(f"Numbers: {len(corpus)} | distinct: {len(set(corpus))} | parse cache hits: {info.hits}/{info.hits + info.misses}")
+    print(f"  legacy   : {legacy_s:.3f}s  ({legacy_s / len(corpus) * 1e6:.1f} µs/number)")
+    print(f"  memoized : {memoized_s:.3f}s  ({memoized_s / len(corpus) * 1e6:.1f} µs/number)")
+    print(f"  speedup  : {legacy_s / memoized_s:.1f}x")
+    print(f"  mismatches: {mismatches}")
+    return 1 if mismatches else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
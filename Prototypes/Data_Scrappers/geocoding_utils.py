@@ -1,8 +1,18 @@
 #!/usr/bin/env python3
-"""Geocoding via Nominatim (OpenStreetMap). Used by data_normalizer."""
+"""Geocoding via Nominatim (OpenStreetMap). Used by data_normalizer.
 
+Results are cached in-process and in a shared SQLite file, so reruns (each one a
+new process spawned by the backend) skip addresses that were already geocoded.
+"""
+
+import csv
+import os
+import re
+import sqlite3
+import threading
 import time
-from typing import Optional, Tuple
+import unicodedata
+from typing import Callable, Dict, Optional, Tuple
 
 try:
     from geopy.geocoders import Nominatim
@@ -17,10 +27,24 @@ GEOCODER_USER_AGENT = "WatchDNA-StoreLocator/1.0 (https://watchdna.com)"
 GEOCODER_TIMEOUT = 10
 RATE_LIMIT_DELAY_SECONDS = 1.0
 
+# Persistent cache: GEOCODE_CACHE_PATH="" disables it
+GEOCODE_CACHE_PATH = os.environ.get(
+    "GEOCODE_CACHE_PATH",
+    os.path.join(os.path.dirname(os.path.abspath(__file__)), ".cache", "geocode_cache.sqlite3"),
+)
+GEOCODE_CACHE_TTL_SECONDS = 90 * 24 * 3600
+# "Address not found" is remembered for less time: upstream data gets fixed
+GEOCODE_NEGATIVE_TTL_SECONDS = 7 * 24 * 3600
+SQLITE_BUSY_TIMEOUT_SECONDS = 30
+
 _geocoder = None
 _last_geocode_time = 0.0
 _geocode_cache: dict = {}
 
+_cache_conn: Optional[sqlite3.Connection] = None
+_cache_pid: Optional[int] = None
+_cache_lock = threading.Lock()
+
 
 def get_geocoder():
     global _geocoder
@@ -36,25 +60,159 @@ def get_geocoder():
     return _geocoder
 
 
+def normalize_address_key(full_address: str) -> str:
+    """Cache key: NFKC, casefolded, whitespace collapsed, no empty or padded comma parts."""
+    text = unicodedata.normalize("NFKC", full_address).casefold()
+    parts = (re.sub(r"\s+", " ", part).strip(" .") for part in text.split(","))
+    return ", ".join(part for part in parts if part)
+
+
+def geocode_query_key(address: str, city: str = "", state: str = "", country: str = "") -> str:
+    """The normalized query geocode_address looks up; rows with equal keys share one lookup."""
+    return normalize_address_key(", ".join(p for p in (address, city, state, country) if p))
+
+
+def offline_geocoder_from_csv(filename: str) -> Callable[..., Optional[Tuple[float, float]]]:
+    """
+    Local stand-in for geocode_address, backed by a canonical-schema CSV (e.g. a previous export).
+    Same signature; addresses missing from the file return None without any network call.
+    """
+    known: Dict[str, Tuple[float, float]] = {}
+    with open(filename, "r", newline="", encoding="utf-8") as f:
+        for row in csv.DictReader(f):
+            try:
+                coords = (float(row.get("Latitude", "")), float(row.get("Longitude", "")))
+            except ValueError:
+                continue
+            key = geocode_query_key(
+                (row.get("Address Line 1") or "").strip(),
+                (row.get("City") or "").strip(),
+                (row.get("State/Province/Region") or "").strip(),
+                (row.get("Country") or "").strip(),
+            )
+            if key:
+                known.setdefault(key, coords)
+
+    def _lookup(address: str, city: str = "", state: str = "", country: str = "") -> Optional[Tuple[float, float]]:
+        return known.get(geocode_query_key(address, city, state, country))
+
+    return _lookup
+
+
+def _get_cache_conn() -> Optional[sqlite3.Connection]:
+    """Open the shared cache once per process (WAL so parallel scrapers can read while one writes)."""
+    global _cache_conn, _cache_pid
+    if not GEOCODE_CACHE_PATH:
+        return None
+    if _cache_conn is not None and _cache_pid == os.getpid():
+        return _cache_conn
+    try:
+        os.makedirs(os.path.dirname(GEOCODE_CACHE_PATH) or ".", exist_ok=True)
+        conn = sqlite3.connect(
+            GEOCODE_CACHE_PATH,
+            timeout=SQLITE_BUSY_TIMEOUT_SECONDS,
+            isolation_level=None,
+            check_same_thread=False,
+        )
+        conn.execute("PRAGMA journal_mode=WAL")
+        conn.execute("PRAGMA synchronous=NORMAL")
+        conn.execute(
+            "CREATE TABLE IF NOT EXISTS geocode_cache ("
+            " key TEXT PRIMARY KEY,"
+            " lat REAL,"
+            " lon REAL,"
+            " updated_at REAL NOT NULL)"
+        )
+    except sqlite3.Error:
+        return None
+    _cache_conn, _cache_pid = conn, os.getpid()
+    return conn
+
+
+def _cache_get(key: str) -> Tuple[bool, Optional[Tuple[float, float]]]:
+    """(hit, coordinates) from the persistent cache; expired rows count as misses."""
+    with _cache_lock:
+        conn = _get_cache_conn()
+        if conn is None:
+            return False, None
+        try:
+            row = conn.execute(
+                "SELECT lat, lon, updated_at FROM geocode_cache WHERE key = ?", (key,)
+            ).fetchone()
+        except sqlite3.Error:
+            return False, None
+    if row is None:
+        return False, None
+    lat, lon, updated_at = row
+    found = lat is not None and lon is not None
+    ttl = GEOCODE_CACHE_TTL_SECONDS if found else GEOCODE_NEGATIVE_TTL_SECONDS
+    if time.time() - updated_at > ttl:
+        return False, None
+    return True, ((lat, lon) if found else None)
+
+
+def _cache_put(key: str, result: Optional[Tuple[float, float]]) -> None:
+    lat, lon = result if result else (None, None)
+    with _cache_lock:
+        conn = _get_cache_conn()
+        if conn is None:
+            return
+        try:
+            conn.execute(
+                "INSERT OR REPLACE INTO geocode_cache (key, lat, lon, updated_at) VALUES (?, ?, ?, ?)",
+                (key, lat, lon, time.time()),
+            )
+        except sqlite3.Error:
+            pass
+
+
+def purge_geocode_cache() -> int:
+    """
+    Delete expired rows from the persistent cache; returns how many were removed.
+    batch_normalize calls it before geocoding with the default geocoder.
+    """
+    now = time.time()
+    with _cache_lock:
+        conn = _get_cache_conn()
+        if conn is None:
+            return 0
+        try:
+            cur = conn.execute(
+                "DELETE FROM geocode_cache WHERE"
+                " (lat IS NOT NULL AND updated_at < ?) OR (lat IS NULL AND updated_at < ?)",
+                (now - GEOCODE_CACHE_TTL_SECONDS, now - GEOCODE_NEGATIVE_TTL_SECONDS),
+            )
+        except sqlite3.Error:
+            return 0
+        return cur.rowcount
+
+
 def geocode_address(
     address: str,
     city: str = "",
     state: str = "",
     country: str = ""
 ) -> Optional[Tuple[float, float]]:
-    if not GEOPY_AVAILABLE:
-        return None
-
     address_parts = [p for p in (address, city, state, country) if p]
     if not address_parts:
         return None
 
     full_address = ", ".join(address_parts)
-    cache_key = full_address.lower().strip()
+    cache_key = geocode_query_key(address, city, state, country)
+    if not cache_key:
+        return None
 
     if cache_key in _geocode_cache:
         return _geocode_cache[cache_key]
 
+    hit, cached = _cache_get(cache_key)
+    if hit:
+        _geocode_cache[cache_key] = cached
+        return cached
+
+    if not GEOPY_AVAILABLE:
+        return None
+
     geocoder = get_geocoder()
     if not geocoder:
         return None
@@ -72,12 +230,15 @@ def geocode_address(
         if location:
             result = (location.latitude, location.longitude)
             _geocode_cache[cache_key] = result
+            _cache_put(cache_key, result)
             return result
 
         _geocode_cache[cache_key] = None
+        _cache_put(cache_key, None)
         return None
 
     except (GeocoderTimedOut, GeocoderServiceError, GeocoderUnavailable):
+        # Transient: skip for the rest of this run, but let the next run retry
         _geocode_cache[cache_key] = None
         return None
     except Exception:
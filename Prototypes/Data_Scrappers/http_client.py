@@ -0,0 +1,276 @@
+#!/usr/bin/env python3
+"""Brand-scoped pooled HTTP client and per-host rate limiting shared by universal_scraper and viewport_grid.
+
+Brand config ``"engine": "async"`` swaps the pooled ``requests`` client for async_http.AsyncHttpClient.
+"""
+
+import codecs
+import json
+import threading
+import time
+from typing import Any, Callable, Dict, NamedTuple, Optional
+from urllib.parse import urlparse
+
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+DEFAULT_USER_AGENT = "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36"
+DEFAULT_RETRIES = 3
+# urllib3 waits backoff_factor * 2**(n-1) before retry n (none before the first), so 0s, 4s, 8s
+DEFAULT_BACKOFF_FACTOR = 2.0
+DEFAULT_POOL_CONNECTIONS = 10
+DEFAULT_POOL_MAXSIZE = 16
+DEFAULT_REQUESTS_PER_SECOND = 5.0
+RETRY_STATUS_FORCELIST = (429, 500, 502, 503, 504)
+# Store-locator POSTs (e.g. Zenith post_per_country) are read-only queries, so they are safe to retry.
+RETRY_METHODS = frozenset({"GET", "HEAD", "POST"})
+# Link checks (validate_url): pooled keep-alive connections but a single attempt, so a dead
+# link is reported at once instead of after the retry backoff
+URL_CHECK_CONFIG = {"http_pool": {"retries": 0}}
+
+
+def _build_adapter(pool_connections: int, pool_maxsize: int, retries: int, backoff_factor: float) -> HTTPAdapter:
+    retry_strategy = Retry(
+        total=retries,
+        backoff_factor=backoff_factor,
+        status_forcelist=RETRY_STATUS_FORCELIST,
+        allowed_methods=RETRY_METHODS,
+        # Hand the final 5xx/429 back to the caller so raise_for_status() behaves as before
+        raise_on_status=False,
+    )
+    return HTTPAdapter(
+        pool_connections=pool_connections,
+        pool_maxsize=pool_maxsize,
+        max_retries=retry_strategy,
+    )
+
+
+class BrandHttpClient:
+    """
+    One keep-alive ``requests.Session`` per brand job.
+
+    Brand ``custom_headers`` are set on the session, so every request carries them;
+    per-call ``headers`` still override (call sites keep their own Accept/Content-Type).
+    Optional brand config ``http_pool`` object:
+      - pool_maxsize (int): keep-alive connections kept per host (default 16)
+      - per_host (dict): {"api.example.com": 32} pool size overrides for specific hosts
+      - retries (int): urllib3 retries on connect errors and 429/5xx (default 3)
+      - backoff_factor (float): exponential backoff base in seconds (default 2.0)
+    These retries are the only retry layer: callers (fetch_data, fetch_viewport_data) send once.
+    """
+
+    def __init__(self, brand_config: Optional[Dict] = None):
+        brand_config = brand_config or {}
+        pool_cfg = brand_config.get("http_pool") if isinstance(brand_config.get("http_pool"), dict) else {}
+
+        self.retries = int(pool_cfg.get("retries", DEFAULT_RETRIES))
+        self.backoff_factor = float(pool_cfg.get("backoff_factor", DEFAULT_BACKOFF_FACTOR))
+        self.pool_maxsize = max(1, int(pool_cfg.get("pool_maxsize", DEFAULT_POOL_MAXSIZE)))
+
+        self.session = requests.Session()
+        self.session.headers["User-Agent"] = DEFAULT_USER_AGENT
+        custom_headers = brand_config.get("custom_headers")
+        if isinstance(custom_headers, dict):
+            self.session.headers.update(custom_headers)
+
+        default_adapter = _build_adapter(
+            DEFAULT_POOL_CONNECTIONS, self.pool_maxsize, self.retries, self.backoff_factor
+        )
+        self.session.mount("http://", default_adapter)
+        self.session.mount("https://", default_adapter)
+
+        per_host = pool_cfg.get("per_host") if isinstance(pool_cfg.get("per_host"), dict) else {}
+        for host, size in per_host.items():
+            try:
+                host_size = max(1, int(size))
+            except (TypeError, ValueError):
+                continue
+            host = urlparse(host).netloc or str(host).strip().strip("/")
+            if not host:
+                continue
+            # requests picks the longest matching prefix, so these win over the default adapter
+            adapter = _build_adapter(1, host_size, self.retries, self.backoff_factor)
+            self.session.mount(f"http://{host}/", adapter)
+            self.session.mount(f"https://{host}/", adapter)
+
+    def request(self, method: str, url: str, **kwargs: Any) -> requests.Response:
+        return self.session.request(method, url, **kwargs)
+
+    def get(self, url: str, **kwargs: Any) -> requests.Response:
+        return self.session.get(url, **kwargs)
+
+    def post(self, url: str, **kwargs: Any) -> requests.Response:
+        return self.session.post(url, **kwargs)
+
+    def close(self) -> None:
+        self.session.close()
+
+
+_clients: Dict[str, BrandHttpClient] = {}
+_clients_lock = threading.Lock()
+
+
+def http_engine(brand_config: Optional[Dict]) -> str:
+    """``"async"`` when the brand opts into the asyncio engine, else ``"sync"`` (default)."""
+    engine = str((brand_config or {}).get("engine") or "sync").strip().lower()
+    return "async" if engine == "async" else "sync"
+
+
+def _client_key(brand_config: Optional[Dict]) -> str:
+    """Brands with identical headers and pool settings share one client."""
+    if not brand_config:
+        return ""
+    key: Dict[str, Any] = {
+        "custom_headers": brand_config.get("custom_headers"),
+        "http_pool": brand_config.get("http_pool"),
+    }
+    if http_engine(brand_config) == "async":
+        # The async client's per-host limit defaults to the brand's concurrency
+        key.update(
+            engine="async",
+            async_engine=brand_config.get("async_engine"),
+            concurrency=brand_config.get("concurrency"),
+        )
+    return json.dumps(
+        key,
+        sort_keys=True,
+        default=str,
+    )
+
+
+def _new_client(brand_config: Optional[Dict]) -> Any:
+    if http_engine(brand_config) == "async":
+        from async_http import ASYNC_BACKEND, AsyncHttpClient
+
+        if ASYNC_BACKEND:
+            return AsyncHttpClient(brand_config)
+        print("⚠️  engine=async needs aiohttp or httpx — falling back to the sync engine")
+    return BrandHttpClient(brand_config)
+
+
+def get_http_client(brand_config: Optional[Dict] = None) -> BrandHttpClient:
+    """
+    Return the process-wide pooled client for this brand config (created on first use).
+    With ``"engine": "async"`` this is an AsyncHttpClient, which has the same request/get/post surface.
+    """
+    key = _client_key(brand_config)
+    with _clients_lock:
+        client = _clients.get(key)
+        if client is None:
+            client = _new_client(brand_config)
+            _clients[key] = client
+        return client
+
+
+def close_http_clients() -> None:
+    """Close every pooled session (end of a scrape job)."""
+    with _clients_lock:
+        for client in _clients.values():
+            client.close()
+        _clients.clear()
+
+
+class BoundedRead(NamedTuple):
+    text: str
+    size: int  # bytes read
+    stopped: bool  # True when the limit or on_text ended the read before the body did
+
+
+def read_bounded(
+    response: requests.Response,
+    limit: int,
+    on_text: Optional[Callable[[str], bool]] = None,
+    encoding: str = "utf-8",
+    chunk_size: int = 8192,
+) -> BoundedRead:
+    """
+    Read at most ``limit`` bytes of a ``stream=True`` response, then close it so the
+    connection goes back to the pool (``limit=0`` reads nothing).
+
+    Chunks are copied into one preallocated buffer and decoded incrementally (invalid bytes
+    replaced, multi-byte characters split across chunks kept intact), so the cost is linear in
+    the bytes read. ``on_text`` gets each newly decoded piece; returning True stops the read.
+    """
+    try:
+        if limit <= 0:
+            return BoundedRead("", 0, True)
+        buffer = bytearray(limit)
+        view = memoryview(buffer)
+        decoder = codecs.getincrementaldecoder(encoding)(errors="replace")
+        parts = []
+        filled = 0
+        stopped = False
+        for piece in response.iter_content(chunk_size=chunk_size):
+            if not piece:
+                continue
+            n = min(len(piece), limit - filled)
+            view[filled:filled + n] = piece[:n]
+            text = decoder.decode(view[filled:filled + n])
+            filled += n
+            stopped = filled >= limit
+            if stopped:
+                text += decoder.decode(b"", final=True)
+            if text:
+                parts.append(text)
+                if on_text is not None and on_text(text):
+                    stopped = True
+            if stopped:
+                break
+        else:
+            parts.append(decoder.decode(b"", final=True))
+        return BoundedRead("".join(parts), filled, stopped)
+    finally:
+        response.close()
+
+
+class TokenBucket:
+    """
+    Thread-safe token bucket: ``acquire()`` blocks until a request slot is free.
+    ``try_acquire()`` never blocks, so event-loop callers can ``await asyncio.sleep`` the wait instead.
+    """
+
+    def __init__(self, rate: float, burst: int = 1):
+        self.rate = float(rate)
+        self.capacity = float(max(1, burst))
+        self._tokens = self.capacity
+        self._last = time.monotonic()
+        self._lock = threading.Lock()
+
+    def try_acquire(self) -> float:
+        """Take a slot if one is free and return 0.0, else return the seconds until one will be."""
+        with self._lock:
+            now = time.monotonic()
+            self._tokens = min(self.capacity, self._tokens + (now - self._last) * self.rate)
+            self._last = now
+            if self._tokens >= 1.0:
+                self._tokens -= 1.0
+                return 0.0
+            return (1.0 - self._tokens) / self.rate
+
+    def acquire(self) -> None:
+        while True:
+            wait = self.try_acquire()
+            if not wait:
+                return
+            time.sleep(wait)
+
+
+_limiters: Dict[str, TokenBucket] = {}
+_limiters_lock = threading.Lock()
+
+
+def get_rate_limiter(url: str, requests_per_second: Optional[float], burst: int = 1) -> Optional[TokenBucket]:
+    """
+    Return the shared token bucket for ``url``'s host, or None when unthrottled.
+    The first caller for a host fixes its rate, so every strategy hitting that host shares one budget.
+    """
+    if not requests_per_second or requests_per_second <= 0:
+        return None
+    host = urlparse(url).netloc.lower() or url
+    with _limiters_lock:
+        limiter = _limiters.get(host)
+        if limiter is None:
+            limiter = TokenBucket(requests_per_second, burst)
+            _limiters[host] = limiter
+        return limiter
@@ -0,0 +1,282 @@
+#!/usr/bin/env python3
+"""
+Near-duplicate store detection: the same boutique reported a few meters apart by two brand APIs,
+or by this run and a previous master export.
+
+dedup_utils only collapses exact keys (IDs, 5-decimal geo cells, address fingerprints). Here a
+GeoGridIndex hashes coordinates into cells at least ``radius_m`` wide, so every candidate pair
+within the radius sits in neighbouring cells and the search is near-linear instead of all pairs.
+Each candidate pair is then scored by name and address similarity, in the spirit of the
+backend's geo-proximity merge (backend/src/utils/location-merge-core.ts), which stays the
+authority for actually merging Location rows.
+
+  python3 near_duplicates.py output/locations.csv
+  python3 near_duplicates.py new_run.csv --against master.csv --radius 50 --min-score 0.8
+"""
+
+import argparse
+import csv
+import json
+import math
+import re
+import sys
+import unicodedata
+from difflib import SequenceMatcher
+from typing import Any, Dict, Iterator, List, Optional, Sequence, Tuple
+
+from coordinate_utils import EARTH_RADIUS_METERS, haversine_meters, validate_coordinate_value
+
+DEFAULT_RADIUS_METERS = 150  # location-merge-core GEO_PROXIMITY_M: same building, not the same block
+DEFAULT_MIN_SCORE = 0.7
+
+# Weights of the pair score; distance counts least because the radius already bounds it
+NAME_WEIGHT = 0.45
+ADDRESS_WEIGHT = 0.35
+DISTANCE_WEIGHT = 0.20
+
+METERS_PER_DEGREE = EARTH_RADIUS_METERS * math.pi / 180
+_LON_MARGIN = 1.01  # columns a little wider than the radius: covers the chord/arc approximation
+_MIN_PREFIX_NAME_LEN = 8
+
+_NON_ALNUM_RE = re.compile(r'[^a-z0-9]+')
+_ORG_SUFFIX_RE = re.compile(r'(inc|llc|ltd|limited|corporation|corp|company|gmbh|srl|nv|plc|sa|ag)+$')
+_STREET_NUMBER_RE = re.compile(r'\b\d{2,}\b')
+_SUBUNIT_RE = re.compile(r'\b(?:suite|ste|unit|bldg|building)\b\.?\s*#?\s*[a-z0-9]+(?:-[a-z0-9]+)*')
+_STREET_ABBREVIATIONS = {
+    "street": "st", "str": "st", "strasse": "st", "avenue": "ave", "av": "ave", "road": "rd",
+    "boulevard": "blvd", "drive": "dr", "place": "pl", "square": "sq", "lane": "ln",
+}
+
+
+def _fold(text: Any) -> str:
+    """Lower-case with diacritics stripped: "Jean-Jaurès" → "jean-jaures"."""
+    decomposed = unicodedata.normalize("NFKD", str(text or "").strip().lower())
+    return "".join(ch for ch in decomposed if not unicodedata.combining(ch))
+
+
+def name_fingerprint(name: Any) -> str:
+    return _ORG_SUFFIX_RE.sub("", _NON_ALNUM_RE.sub("", _fold(name)))
+
+
+def address_fingerprint(address: Any) -> str:
+    tokens = _NON_ALNUM_RE.sub(" ", _SUBUNIT_RE.sub(" ", _fold(address))).split()
+    return "".join(_STREET_ABBREVIATIONS.get(token, token) for token in tokens)
+
+
+def name_similarity(a: str, b: str) -> float:
+    """0–1 similarity of two name fingerprints; a long shared prefix ("bucherer" / "bucherer rolex") counts as 0.9."""
+    if not a or not b:
+        return 0.0
+    if a == b:
+        return 1.0
+    shorter, longer = (a, b) if len(a) <= len(b) else (b, a)
+    ratio = SequenceMatcher(None, a, b).ratio()
+    if len(shorter) >= _MIN_PREFIX_NAME_LEN and longer.startswith(shorter):
+        return max(ratio, 0.9)
+    return ratio
+
+
+def address_similarity(address_a: Any, address_b: Any, fp_a: str, fp_b: str) -> float:
+    """0–1 similarity of two addresses; 0 when both carry street numbers and none match."""
+    if not fp_a or not fp_b:
+        return 0.0
+    numbers_a = set(_STREET_NUMBER_RE.findall(str(address_a)))
+    numbers_b = set(_STREET_NUMBER_RE.findall(str(address_b)))
+    if numbers_a and numbers_b and not numbers_a & numbers_b:
+        return 0.0
+    if fp_a == fp_b:
+        return 1.0
+    return SequenceMatcher(None, fp_a, fp_b).ratio()
+
+
+def usable_coordinates(lat: Any, lon: Any) -> Optional[Tuple[float, float]]:
+    """(lat, lon) as floats, or None for missing, out-of-range or 0,0 placeholder coordinates."""
+    lat_f = validate_coordinate_value(lat, "latitude")
+    lon_f = validate_coordinate_value(lon, "longitude")
+    if lat_f is None or lon_f is None:
+        return None
+    if abs(lat_f) < 1e-6 and abs(lon_f) < 1e-6:
+        return None
+    return lat_f, lon_f
+
+
+class GeoGridIndex:
+    """
+    Points hashed into latitude rows ``radius_m`` tall; each row is split into longitude columns
+    at least ``radius_m`` wide at the row's most poleward edge (one column near the poles), with
+    wrap-around at ±180°. Any point within ``radius_m`` of a query lies in the 3×3 neighbouring
+    cells, so nearby() touches only those.
+    """
+
+    def __init__(self, radius_m: float = DEFAULT_RADIUS_METERS):
+        if radius_m <= 0:
+            raise ValueError("radius_m must be positive")
+        self.radius_m = radius_m
+        self._row_deg = radius_m / METERS_PER_DEGREE
+        self._columns: Dict[int, int] = {}
+        self._cells: Dict[Tuple[int, int], List[Tuple[Any, float, float]]] = {}
+        self._size = 0
+
+    def __len__(self) -> int:
+        return self._size
+
+    def _row(self, lat: float) -> int:
+        return math.floor(lat / self._row_deg)
+
+    def _column_count(self, row: int) -> int:
+        count = self._columns.get(row)
+        if count is None:
+            # Widest |lat| a neighbour of this row can have: its columns must span radius_m there
+            edge = min(90.0, max(abs(row - 1), abs(row + 2)) * self._row_deg)
+            cos_edge = math.cos(math.radians(edge))
+            count = 1
+            if cos_edge > 0:
+                count = max(1, int(360 * cos_edge / (self._row_deg * _LON_MARGIN)))
+            self._columns[row] = count
+        return count
+
+    def _column(self, lon: float, count: int) -> int:
+        return int((lon + 180.0) / 360.0 * count) % count
+
+    def add(self, item: Any, lat: float, lon: float) -> None:
+        row = self._row(lat)
+        cell = (row, self._column(lon, self._column_count(row)))
+        self._cells.setdefault(cell, []).append((item, lat, lon))
+        self._size += 1
+
+    def nearby(self, lat: float, lon: float) -> Iterator[Tuple[Any, float]]:
+        """(item, distance in meters) for every indexed point within radius_m."""
+        radius = self.radius_m
+        cells = self._cells
+        row = self._row(lat)
+        for r in (row - 1, row, row + 1):
+            count = self._column_count(r)
+            col = self._column(lon, count)
+            for c in {(col - 1) % count, col, (col + 1) % count}:
+                for item, other_lat, other_lon in cells.get((r, c), ()):
+                    distance = haversine_meters(lat, lon, other_lat, other_lon)
+                    if distance <= radius:
+                        yield item, distance
+
+
+class NearDuplicate:
+    """A candidate pair of rows (indices into the inputs) within the radius, with its scores."""
+
+    __slots__ = ("a", "b", "distance_m", "name_score", "address_score", "score")
+
+    def __init__(self, a: int, b: int, distance_m: float, name_score: float, address_score: float, radius_m: float):
+        self.a = a
+        self.b = b
+        self.distance_m = distance_m
+        self.name_score = name_score
+        self.address_score = address_score
+        self.score = (
+            NAME_WEIGHT * name_score
+            + ADDRESS_WEIGHT * address_score
+            + DISTANCE_WEIGHT * (1 - distance_m / radius_m)
+        )
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "a": self.a,
+            "b": self.b,
+            "distance_m": round(self.distance_m, 1),
+            "name_score": round(self.name_score, 3),
+            "address_score": round(self.address_score, 3),
+            "score": round(self.score, 3),
+        }
+
+
+class _Prepared:
+    __slots__ = ("coords", "name_fp", "address", "address_fp", "country")
+
+    def __init__(self, row: Dict[str, Any]):
+        self.coords = usable_coordinates(row.get("Latitude"), row.get("Longitude"))
+        self.name_fp = name_fingerprint(row.get("Name"))
+        self.address = row.get("Address Line 1") or ""
+        self.address_fp = address_fingerprint(self.address)
+        self.country = _fold(row.get("Country"))
+
+
+def _score(a: _Prepared, b: _Prepared, ia: int, ib: int, distance: float, radius_m: float) -> Optional[NearDuplicate]:
+    if a.country and b.country and a.country != b.country:
+        return None  # a border is not a duplicate
+    return NearDuplicate(
+        ia, ib, distance,
+        name_similarity(a.name_fp, b.name_fp),
+        address_similarity(a.address, b.address, a.address_fp, b.address_fp),
+        radius_m,
+    )
+
+
+def find_near_duplicates(
+    rows: Sequence[Dict[str, Any]],
+    radius_m: float = DEFAULT_RADIUS_METERS,
+    min_score: float = DEFAULT_MIN_SCORE,
+    against: Optional[Sequence[Dict[str, Any]]] = None,
+) -> List[NearDuplicate]:
+    """
+    Candidate duplicate pairs among canonical rows (Name, Address Line 1, Country, Latitude,
+    Longitude), best score first. Without ``against`` pairs are within ``rows`` (a < b); with it,
+    ``a`` indexes ``rows`` and ``b`` indexes ``against`` (e.g. this run vs the master set).
+    Rows without usable coordinates are skipped.
+    """
+    prepared = [_Prepared(row) for row in rows]
+    others = prepared if against is None else [_Prepared(row) for row in against]
+    index = GeoGridIndex(radius_m)
+    if against is not None:
+        for j, other in enumerate(others):
+            if other.coords:
+                index.add(j, *other.coords)
+
+    pairs: List[NearDuplicate] = []
+    for i, row in enumerate(prepared):
+        if not row.coords:
+            continue
+        for j, distance in index.nearby(*row.coords):
+            pair = _score(others[j], row, j, i, distance, radius_m) if against is None else \
+                _score(row, others[j], i, j, distance, radius_m)
+            if pair is not None and pair.score >= min_score:
+                pairs.append(pair)
+        if against is None:
+            index.add(i, *row.coords)
+    pairs.sort(key=lambda p: (-p.score, p.a, p.b))
+    return pairs
+
+
+def _read_rows(path: str) -> List[Dict[str, str]]:
+    with open(path, newline="", encoding="utf-8-sig") as f:
+        return list(csv.DictReader(f))
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Find near-duplicate stores by distance and name/address similarity")
+    parser.add_argument("csv", help="Canonical locations CSV")
+    parser.add_argument("--against", help="Compare against this CSV (e.g. the master set) instead of within csv")
+    parser.add_argument("--radius", type=float, default=DEFAULT_RADIUS_METERS, help=f"Meters (default {DEFAULT_RADIUS_METERS})")
+    parser.add_argument("--min-score", type=float, default=DEFAULT_MIN_SCORE, help=f"0–1 (default {DEFAULT_MIN_SCORE})")
+    parser.add_argument("--json", action="store_true", help="Print pairs as JSON")
+    args = parser.parse_args()
+
+    rows = _read_rows(args.csv)
+    against = _read_rows(args.against) if args.against else None
+    pairs = find_near_duplicates(rows, args.radius, args.min_score, against)
+    other_rows = against if against is not None else rows
+    if args.json:
+        print(json.dumps([
+            dict(p.to_dict(), a_handle=rows[p.a].get("Handle", ""), b_handle=other_rows[p.b].get("Handle", ""))
+            for p in pairs
+        ], indent=2))
+        return 0
+
+    print(f"🔍 {len(pairs)} near-duplicate pair(s) within {args.radius:g} m (score ≥ {args.min_score})")
+    for p in pairs:
+        a, b = rows[p.a], other_rows[p.b]
+        print(f"   {p.score:.2f}  {p.distance_m:6.1f} m  name {p.name_score:.2f}  address {p.address_score:.2f}")
+        print(f"         {a.get('Handle', '')}: {a.get('Name', '')} | {a.get('Address Line 1', '')}")
+        print(f"         {b.get('Handle', '')}: {b.get('Name', '')} | {b.get('Address Line 1', '')}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
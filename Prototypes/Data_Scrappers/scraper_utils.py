@@ -3,7 +3,10 @@
 
 import re
 from datetime import datetime
-from typing import Any, Dict, Optional
+from typing import Any, Dict, List, Optional
+
+# Smallest per-response count we are willing to treat as an unannounced API cap
+MIN_INFERRED_RESULT_CAP = 10
 
 
 def dict_get_ci(d: Dict[str, Any], key: str) -> Any:
@@ -21,6 +24,20 @@ def dict_get_ci(d: Dict[str, Any], key: str) -> Any:
     return None
 
 
+def infer_result_cap(counts: List[int]) -> Optional[int]:
+    """
+    Guess an undocumented per-response cap from a batch of result counts (viewport tiles,
+    geohash buckets): the largest count returned two or more times. Real store counts rarely
+    tie exactly at the maximum; truncated responses always do.
+    """
+    if not counts:
+        return None
+    top = max(counts)
+    if top >= MIN_INFERRED_RESULT_CAP and counts.count(top) >= 2:
+        return top
+    return None
+
+
 def log_debug(message: str, level: str = "INFO") -> None:
     timestamp = datetime.now().strftime("%Y-%m-%d %H:%M:%S.%f")[:-3]
     prefix = {
@@ -0,0 +1,130 @@
+#!/usr/bin/env python3
+"""Pytest suite for coordinate_utils.validate_coordinate_columns: the NumPy and pure-Python paths
+must flag every row the way check_coordinate_pair does.
+
+Run with:
+    cd Prototypes/Data_Scrappers
+    pytest test_coordinate_utils.py -v
+"""
+
+import sys
+import os
+
+import pytest
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+import coordinate_utils
+from coordinate_utils import (
+    SUSPECT_SWAPPED,
+    SUSPECT_ZERO_ISLAND,
+    check_coordinate_pair,
+    normalize_coordinate_string,
+    validate_coordinate_columns,
+)
+
+
+# (latitude, longitude, expected check_coordinate_pair result)
+_CASES = [
+    ("46.2", "6.1", (None, None, None, None, None)),
+    (" 46.2 ", "\t6.1", (None, None, None, None, None)),
+    (46.2, 6.1, (None, None, None, None, None)),
+    ("", "6.1", ("empty", None, None, None, None)),
+    ("   ", None, ("empty", None, "empty", None, None)),
+    ("abc", "6.1", ("not_a_number", None, None, None, None)),
+    ("46.2", "n/a", (None, None, "not_a_number", None, None)),
+    ("nan", "6.1", ("invalid_number", None, None, None, None)),
+    ("46.2", "inf", (None, None, "invalid_number", None, None)),
+    ("-Infinity", "-inf", ("invalid_number", None, "invalid_number", None, None)),
+    ("90.0001", "6.1", ("out_of_range", None, None, None, SUSPECT_SWAPPED)),
+    ("-90", "180", (None, None, None, None, None)),
+    ("46.2", "180.5", (None, None, "out_of_range", None, None)),
+    ("200", "6.1", ("out_of_range", None, None, None, None)),  # too far out to be a longitude
+    ("151.20732", "-33.86785", ("out_of_range", None, None, None, SUSPECT_SWAPPED)),
+    ("151.2", "120", ("out_of_range", None, None, None, None)),  # longitude does not fit as a latitude
+    ("151.2", "abc", ("out_of_range", None, "not_a_number", None, None)),
+    ("0", "0", (None, None, None, None, SUSPECT_ZERO_ISLAND)),
+    ("0.0000001", "-0.0", (None, None, None, None, SUSPECT_ZERO_ISLAND)),
+    ("0", "", (None, None, "empty", None, None)),
+    ("0.00001", "0", (None, None, None, None, None)),
+    ("46.12345678", "6.1", (None, 8, None, None, None)),
+    ("46.1234567", "6.123456789012", (None, None, None, 12, None)),
+    ("1e-08", "6.1", (None, None, None, None, None)),  # exponent form counts as 0 decimals
+    ("95.123456789", "6.1", ("out_of_range", None, None, None, SUSPECT_SWAPPED)),  # no precision flag when invalid
+]
+
+
+@pytest.fixture(params=[False, True], ids=["python", "numpy"])
+def use_numpy(request):
+    if request.param:
+        pytest.importorskip("numpy")
+    return request.param
+
+
+def _columns(cases, use_numpy):
+    return validate_coordinate_columns([c[0] for c in cases], [c[1] for c in cases], use_numpy=use_numpy)
+
+
+def _flags(column):
+    return [bool(flag) for flag in column]
+
+
+class TestCheckCoordinatePair:
+    @pytest.mark.parametrize("latitude,longitude,expected", _CASES)
+    def test_cases(self, latitude, longitude, expected):
+        assert check_coordinate_pair(latitude, longitude) == expected
+
+
+class TestValidateCoordinateColumns:
+    def test_checks_match_check_coordinate_pair(self, use_numpy):
+        assert _columns(_CASES, use_numpy).checks() == [expected for _, _, expected in _CASES]
+
+    def test_columns_are_arrays_only_on_the_numpy_path(self, use_numpy):
+        columns = _columns(_CASES, use_numpy)
+        assert isinstance(columns.lat_error, list) is not use_numpy
+        assert len(columns) == len(_CASES)
+
+    def test_flag_columns(self, use_numpy):
+        columns = _columns(_CASES, use_numpy)
+        assert _flags(columns.lat_valid) == [c[2][0] is None for c in _CASES]
+        assert _flags(columns.lon_valid) == [c[2][2] is None for c in _CASES]
+        assert _flags(columns.lat_precise) == [c[2][1] is not None for c in _CASES]
+        assert _flags(columns.lon_precise) == [c[2][3] is not None for c in _CASES]
+        assert _flags(columns.zero_island) == [c[2][4] == SUSPECT_ZERO_ISLAND for c in _CASES]
+        assert _flags(columns.swapped) == [c[2][4] == SUSPECT_SWAPPED for c in _CASES]
+
+    def test_out_of_range_values_are_kept_and_non_finite_become_nan(self, use_numpy):
+        columns = validate_coordinate_columns(["123.5", "inf", "abc"], ["6.1", "6.1", "6.1"], use_numpy=use_numpy)
+        latitude = [float(value) for value in columns.latitude]
+        assert latitude[0] == 123.5
+        assert latitude[1] != latitude[1] and latitude[2] != latitude[2]
+
+    def test_normalized_matches_normalize_coordinate_string(self, use_numpy):
+        lats = [c[0] for c in _CASES]
+        lons = [c[1] for c in _CASES]
+        assert _columns(_CASES, use_numpy).normalized() == (
+            [normalize_coordinate_string(value, "latitude") for value in lats],
+            [normalize_coordinate_string(value, "longitude") for value in lons],
+        )
+
+    def test_paths_agree(self):
+        pytest.importorskip("numpy")
+        numpy_columns = _columns(_CASES, True)
+        python_columns = _columns(_CASES, False)
+        assert numpy_columns.checks() == python_columns.checks()
+        assert numpy_columns.normalized() == python_columns.normalized()
+
+    def test_default_path_follows_numpy_availability(self, monkeypatch):
+        monkeypatch.setattr(coordinate_utils, "NUMPY_AVAILABLE", False)
+        columns = validate_coordinate_columns(["46.2"], ["6.1"])
+        assert isinstance(columns.lat_error, list)
+        assert columns.checks() == [(None, None, None, None, None)]
+
+    def test_empty_columns(self, use_numpy):
+        columns = validate_coordinate_columns([], [], use_numpy=use_numpy)
+        assert len(columns) == 0
+        assert columns.checks() == [] and columns.normalized() == ([], [])
+
+    def test_mismatched_lengths_raise(self, use_numpy):
+        with pytest.raises(ValueError):
+            validate_coordinate_columns(["46.2", "46.3"], ["6.1"], use_numpy=use_numpy)
@@ -0,0 +1,224 @@
+#!/usr/bin/env python3
+"""Pytest suite for data_normalizer.batch_normalize and its dedup/geocode stages.
+
+Run with:
+    cd Prototypes/Data_Scrappers
+    pytest test_data_normalizer.py -v
+"""
+
+import sys
+import os
+
+import pytest
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from data_normalizer import batch_normalize
+
+
+def _fake_geocoder(places):
+    """Geocoder stand-in: (address, city, state) -> coordinates; records every lookup."""
+    calls = []
+
+    def geocode(address, city="", state="", country=""):
+        calls.append((address, city, state, country))
+        return places.get((address, city, state))
+
+    return geocode, calls
+
+
+class TestGeocodeThenDedup:
+    def test_same_street_in_different_states_both_kept(self):
+        raw = [
+            {"Name": "Springfield IL", "Address Line 1": "100 Main St", "City": "Springfield",
+             "State/Province/Region": "IL", "Country": "US"},
+            {"Name": "Springfield MO", "Address Line 1": "100 Main St", "City": "Springfield",
+             "State/Province/Region": "MO", "Country": "US"},
+        ]
+        geocoder, _ = _fake_geocoder({
+            ("100 Main St", "Springfield", "IL"): (39.7817, -89.6501),
+            ("100 Main St", "Springfield", "MO"): (37.2090, -93.2923),
+        })
+        rows, excluded = batch_normalize(raw, geocoder=geocoder)
+        assert [r["Name"] for r in rows] == ["Springfield IL", "Springfield MO"]
+        assert excluded == []
+
+    def test_repeated_query_geocoded_once_and_collapsed(self):
+        raw = [
+            {"Name": f"Boutique {i}", "Address Line 1": "1 Rue du Rhône", "City": "Geneva", "Country": "CH"}
+            for i in range(3)
+        ]
+        geocoder, calls = _fake_geocoder({("1 Rue du Rhône", "Geneva", ""): (46.2044, 6.1432)})
+        timings = {}
+        rows, _ = batch_normalize(raw, geocoder=geocoder, stage_timings=timings)
+        assert len(calls) == 1 and timings["geocoded_rows"] == 3
+        assert [r["Name"] for r in rows] == ["Boutique 0"]
+
+
+class TestPhoneFallback:
+    def test_missing_phonenumbers_warns_once(self, monkeypatch, capsys):
+        import data_normalizer
+
+        monkeypatch.setattr(data_normalizer, "PHONENUMBERS_AVAILABLE", False)
+        monkeypatch.setattr(data_normalizer, "_phone_fallback_warned", False)
+        assert data_normalizer.validate_phone("+41 22 (0)123 45 67 ext. 9") == "+41 22 (0)123 45 67 ext. 9"
+        assert data_normalizer.validate_phone("tel: 022-123") == "022-123"
+        assert capsys.readouterr().out.count("phonenumbers is not installed") == 1
+
+
+class TestGeocodeCachePurge:
+    def test_default_geocoder_run_purges_expired_rows(self, tmp_path, monkeypatch):
+        import time
+        import geocoding_utils
+
+        monkeypatch.setattr(geocoding_utils, "GEOCODE_CACHE_PATH", str(tmp_path / "geocode.sqlite3"))
+        monkeypatch.setattr(geocoding_utils, "_cache_conn", None)
+        now = time.time()
+        geocoding_utils._cache_put("fresh", (1.0, 2.0))
+        geocoding_utils._cache_put("fresh-miss", None)
+        conn = geocoding_utils._get_cache_conn()
+        conn.execute("INSERT INTO geocode_cache VALUES ('old', 1.0, 2.0, ?)",
+                     (now - geocoding_utils.GEOCODE_CACHE_TTL_SECONDS - 60,))
+        conn.execute("INSERT INTO geocode_cache VALUES ('old-miss', NULL, NULL, ?)",
+                     (now - geocoding_utils.GEOCODE_NEGATIVE_TTL_SECONDS - 60,))
+
+        timings = {}
+        raw = [{"Name": "A", "Address Line 1": "1 Rue", "City": "Geneva", "Country": "CH",
+                "Latitude": "46.2", "Longitude": "6.1"}]
+        rows, _ = batch_normalize(raw, stage_timings=timings)
+
+        assert len(rows) == 1
+        assert timings["geocode_cache_purged"] == 2
+        keys = {key for (key,) in conn.execute("SELECT key FROM geocode_cache")}
+        assert keys == {"fresh", "fresh-miss"}
+
+
+class TestUrlCheck:
+    def test_http_check_uses_pooled_single_attempt_client(self):
+        import threading
+        from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+        import http_client
+        from data_normalizer import validate_url
+
+        hits = []
+
+        class Handler(BaseHTTPRequestHandler):
+            protocol_version = "HTTP/1.1"
+
+            def log_message(self, *args):
+                pass
+
+            def _reply(self, body):
+                hits.append((self.command, self.path, self.headers.get("User-Agent")))
+                status = 200 if self.path == "/ok" else 503
+                self.send_response(status)
+                self.send_header("Content-Length", str(len(body)))
+                self.end_headers()
+                if body:
+                    self.wfile.write(body)
+
+            def do_HEAD(self):
+                self._reply(b"")
+
+            def do_GET(self):
+                self._reply(b"x" * 100_000)
+
+        server = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+        threading.Thread(target=server.serve_forever, daemon=True).start()
+        base = f"http://127.0.0.1:{server.server_port}"
+        try:
+            assert validate_url(f"{base}/ok", validate_http=True) == f"{base}/ok"
+            # A 503 is not retried through the backoff: one HEAD, one GET, then rejected
+            assert validate_url(f"{base}/down", validate_http=True) == ""
+        finally:
+            server.shutdown()
+            http_client.close_http_clients()
+        # Sent through the pooled session (its User-Agent), not bare requests
+        ua = http_client.DEFAULT_USER_AGENT
+        assert hits == [("HEAD", "/ok", ua), ("HEAD", "/down", ua), ("GET", "/down", ua)]
+
+
+class TestWriteNormalizedCsv:
+    @staticmethod
+    def _rows(n):
+        return [{"Handle": f"store-{i}", "Name": f"Store {i}", "City": "Geneva", "Country": "Switzerland",
+                 "Latitude": "46.2000000", "Longitude": "6.1000000"} for i in range(n)]
+
+    @staticmethod
+    def _read(path, opener=open):
+        import csv
+        with opener(path, "rt", newline="", encoding="utf-8") as f:
+            return list(csv.DictReader(f))
+
+    @staticmethod
+    def _subset(rows, fields=("Handle", "Name", "City", "Country", "Latitude", "Longitude")):
+        return [{k: row.get(k, "") for k in fields} for row in rows]
+
+    def test_generator_input_streams_and_returns_row_count(self, tmp_path):
+        from data_normalizer import SCHEMA, write_normalized_csv
+
+        path = str(tmp_path / "out" / "locations.csv")
+        consumed = []
+
+        def rows():
+            for row in self._rows(5):
+                consumed.append(row["Handle"])
+                yield row
+
+        assert write_normalized_csv(rows(), path) == 5
+        assert len(consumed) == 5
+        written = self._read(path)
+        assert list(written[0].keys()) == SCHEMA
+        assert self._subset(written) == self._subset(self._rows(5))
+        assert write_normalized_csv(iter(()), path) == 0
+        assert self._read(path) == []
+
+    def test_unix_line_endings_inside_quoted_values(self, tmp_path):
+        from data_normalizer import write_normalized_csv
+
+        path = str(tmp_path / "locations.csv")
+        write_normalized_csv([{"Handle": "a", "Address Line 1": "1 Rue\r\n2nd floor"}], path)
+        with open(path, "rb") as f:
+            data = f.read()
+        assert b"\r" not in data
+        assert self._read(path)[0]["Address Line 1"] == "1 Rue\n2nd floor"
+
+    def test_gzip_round_trip(self, tmp_path):
+        import gzip
+        from data_normalizer import write_normalized_csv
+
+        path = str(tmp_path / "locations.csv.gz")
+        assert write_normalized_csv(self._rows(3), path) == 3
+        assert self._subset(self._read(path, gzip.open)) == self._subset(self._rows(3))
+        with open(path, "rb") as f:
+            first = f.read()
+        # mtime=0: the same rows give the same bytes
+        write_normalized_csv(self._rows(3), path)
+        with open(path, "rb") as f:
+            assert f.read() == first
+
+        plain = str(tmp_path / "plain.csv.gz")
+        write_normalized_csv(self._rows(1), plain, compress=False)
+        assert self._subset(self._read(plain)) == self._subset(self._rows(1))
+
+    def test_failed_write_keeps_old_file_and_removes_tmp(self, tmp_path):
+        from data_normalizer import write_normalized_csv
+
+        path = str(tmp_path / "locations.csv")
+        write_normalized_csv(self._rows(2), path)
+        with open(path, "rb") as f:
+            before = f.read()
+
+        def failing_rows():
+            yield from self._rows(3)
+            raise RuntimeError("upstream scrape failed")
+
+        with pytest.raises(RuntimeError):
+            write_normalized_csv(failing_rows(), path)
+        with open(path, "rb") as f:
+            assert f.read() == before
+        assert sorted(os.listdir(tmp_path)) == ["locations.csv"]
+
+        with pytest.raises(RuntimeError):
+            write_normalized_csv(failing_rows(), str(tmp_path / "new.csv"))
+        assert sorted(os.listdir(tmp_path)) == ["locations.csv"]
@@ -0,0 +1,218 @@
+#!/usr/bin/env python3
+"""Pytest suite for dedup_utils: the int-keyed Deduplicator must keep the rows the string-keyed
+dedup it replaced kept, in batch_normalize, viewport_grid and validate_csv.
+
+Run with:
+    cd Prototypes/Data_Scrappers
+    pytest test_dedup_utils.py -v
+"""
+
+import random
+import re
+import sys
+import os
+
+import pytest
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+import data_normalizer
+import viewport_grid
+from dedup_utils import Deduplicator, address_key, build_keys, dedupe, geo_key, id_key, quantize_coordinate
+from validate_csv import DEFAULT_REQUIRED, CSVValidator
+
+
+# ---------------------------------------------------------------------------
+# The string-keyed implementations the engine replaced, kept verbatim as references
+# ---------------------------------------------------------------------------
+
+def _old_normalizer_key(normalized):
+    _lat_str = normalized.get("Latitude", "").strip()
+    _lon_str = normalized.get("Longitude", "").strip()
+    _addr_fp = re.sub(r'[^a-z0-9]', '', normalized.get("Address Line 1", "").strip().lower())
+    _city_norm = re.sub(r'[^a-z0-9]', '', normalized.get("City", "").strip().lower())
+    _country_norm = normalized.get("Country", "").strip().lower()
+    try:
+        _lat_r = round(float(_lat_str), 5)
+        _lon_r = round(float(_lon_str), 5)
+        combo_key = f"geo|{_lat_r}|{_lon_r}|{_country_norm}"
+    except (ValueError, TypeError):
+        if _addr_fp and _city_norm:
+            combo_key = f"addr|{_addr_fp}|{_city_norm}|{_country_norm}"
+        else:
+            combo_key = None
+    if not combo_key:
+        _h = normalized.get("Handle", "").strip().lower()
+        if _h:
+            combo_key = f"handle|{_h}"
+    return combo_key
+
+
+def _old_normalizer_dedup(rows):
+    seen_combinations = set()
+    kept = []
+    for row in rows:
+        combo_key = _old_normalizer_key(row)
+        if combo_key:
+            if combo_key in seen_combinations:
+                continue
+            seen_combinations.add(combo_key)
+        kept.append(row)
+    return kept
+
+
+def _old_deduplicate_stores(stores, key_field="id"):
+    seen = set()
+    unique_stores = []
+    possible_keys = [key_field, "id", "storeId", "dealerId", "handle", "Handle"]
+    for store in stores:
+        store_id = None
+        for key in possible_keys:
+            if key in store and store[key]:
+                store_id = str(store[key])
+                break
+        if not store_id:
+            name = store.get("name", store.get("nameTranslated", store.get("Name", "")))
+            lat = store.get("lat", store.get("latitude", store.get("Latitude", "")))
+            lng = store.get("lng", store.get("longitude", store.get("Longitude", "")))
+            store_id = f"{name}_{lat}_{lng}"
+        if store_id not in seen:
+            seen.add(store_id)
+            unique_stores.append(store)
+    return unique_stores
+
+
+def _old_dedupe_rows_by_key(rows, key_fields):
+    seen = set()
+    out = []
+    removed = 0
+    for row in rows:
+        key = tuple((row.get(f) or "").strip() for f in key_fields)
+        if all(key):
+            if key in seen:
+                removed += 1
+                continue
+            seen.add(key)
+        out.append(row)
+    return out, removed
+
+
+# ---------------------------------------------------------------------------
+# Random rows with many near and exact collisions
+# ---------------------------------------------------------------------------
+
+# Finite coordinates only: the old string keys told -0.0 from 0.0 and collapsed every "nan" row
+_LATS = ["46.2", "46.20000", "46.200001", "46.2000049", "46.20001", " 46.2 ", "-33.86785", "40.7128", "", "n/a"]
+_LONS = ["6.1", "6.10000", "6.1000004", "6.10001", "151.20732", "-74.006", "", "abc"]
+_ADDRESSES = ["12 Rue de la Paix", "12, rue de la Paix", "12 RUE DE LA PAIX ", "1 Main St", "1 Main St.", "", "--"]
+_CITIES = ["Paris", "paris", " PARIS", "Springfield", "", "?"]
+_COUNTRIES = ["France", "france ", "US", "United States", ""]
+_HANDLES = ["store-a", "Store-A", " store-a ", "store-b", ""]
+
+
+def _random_rows(rng, n):
+    return [
+        {
+            "Latitude": rng.choice(_LATS),
+            "Longitude": rng.choice(_LONS),
+            "Address Line 1": rng.choice(_ADDRESSES),
+            "City": rng.choice(_CITIES),
+            "Country": rng.choice(_COUNTRIES),
+            "Handle": rng.choice(_HANDLES),
+        }
+        for _ in range(n)
+    ]
+
+
+def _random_stores(rng, n):
+    """Raw API stores; coordinates are the same floats whenever they are meant to match."""
+    id_fields = ["id", "storeId", "dealerId", "handle", "Handle", "ref"]
+    stores = []
+    for _ in range(n):
+        store = {}
+        for field in rng.sample(id_fields, rng.randint(0, 2)):
+            store[field] = rng.choice(["A1", "B2", 7, 0, "", None, "C3"])
+        name_field = rng.choice(["name", "nameTranslated", "Name"])
+        store[name_field] = rng.choice(["Boutique", "Boutique Geneva", ""])
+        lat_field, lng_field = rng.choice([("lat", "lng"), ("latitude", "longitude"), ("Latitude", "Longitude")])
+        store[lat_field] = rng.choice([46.2, 40.7128, -33.86785, "", None])
+        store[lng_field] = rng.choice([6.1, -74.006, 151.20732, "", None])
+        stores.append(store)
+    return stores
+
+
+class TestDeduplicatorParity:
+    @pytest.mark.parametrize("seed", range(20))
+    def test_batch_normalize_keeps_old_rows(self, seed):
+        rows = _random_rows(random.Random(seed), 300)
+        kept = data_normalizer._drop_duplicates(rows, {})
+        assert [id(row) for row in kept] == [id(row) for row in _old_normalizer_dedup(rows)]
+
+    @pytest.mark.parametrize("seed", range(20))
+    def test_viewport_keeps_old_stores(self, seed):
+        stores = _random_stores(random.Random(seed), 300)
+        kept = viewport_grid.deduplicate_stores(stores, key_field="ref")
+        assert [id(s) for s in kept] == [id(s) for s in _old_deduplicate_stores(stores, key_field="ref")]
+
+    @pytest.mark.parametrize("seed", range(20))
+    def test_validator_keeps_old_rows(self, seed):
+        rng = random.Random(seed)
+        rows = [
+            {"Name": rng.choice(["A", "A ", "B", ""]), "Address Line 1": rng.choice(["1 Main", " 1 Main", "2 Main"]),
+             "City": rng.choice(["Paris", "Lyon", None])}
+            for _ in range(300)
+        ]
+        validator = CSVValidator(DEFAULT_REQUIRED)
+        key_fields = ["Name", "Address Line 1", "City"]
+        kept, removed = validator.dedupe_rows_by_key(rows, key_fields)
+        old_kept, old_removed = _old_dedupe_rows_by_key(rows, key_fields)
+        assert removed == old_removed
+        assert [id(row) for row in kept] == [id(row) for row in old_kept]
+
+    def test_rule_counts_match_dropped_rows(self):
+        rows = _random_rows(random.Random(0), 300)
+        timings = {}
+        kept = data_normalizer._drop_duplicates(rows, timings)
+        dropped = sum(v for k, v in timings.items() if k.startswith("duplicates_"))
+        assert dropped == len(rows) - len(kept)
+
+
+class TestDeduplicator:
+    def test_batches_match_one_pass(self):
+        keys = build_keys(_random_rows(random.Random(1), 200), data_normalizer._dedup_key)
+        incremental = Deduplicator()
+        for start in range(0, len(keys), 37):
+            incremental.add_keys(keys[start:start + 37])
+        one_pass = dedupe(keys)
+        assert list(incremental.first) == list(one_pass.first)
+        assert incremental.counts() == one_pass.counts()
+
+    def test_collapsed_reports_rule_and_kept_row(self):
+        rows = [
+            {"Latitude": "46.2", "Longitude": "6.1", "Country": "CH"},
+            {"Latitude": "46.200001", "Longitude": "6.1", "Country": "ch"},
+            {"Address Line 1": "1 Main St", "City": "Paris", "Country": "FR"},
+            {"Address Line 1": "1 main st.", "City": "PARIS", "Country": "FR"},
+            {"Handle": "x"},
+            {"Handle": "X "},
+            {},
+            {},
+        ]
+        result = dedupe(build_keys(rows, data_normalizer._dedup_key))
+        assert result.collapsed() == [(1, "geo", 0), (3, "address", 2), (5, "id", 4)]
+        assert result.kept(rows) == [rows[0], rows[2], rows[4], rows[6], rows[7]]
+
+    def test_keys_by_rule(self):
+        assert quantize_coordinate("46.2000049") == quantize_coordinate(" 46.2 ") == 4620000
+        assert quantize_coordinate("nan") is None and quantize_coordinate("") is None
+        assert geo_key("46.2", "6.1", scope=("ch",)) != geo_key("46.2", "6.1", scope=("fr",))
+        assert address_key("", "Paris") == 0 and address_key("1 Main", "?") == 0
+        assert id_key("a", "") == 0 and id_key(" a ", "b") == id_key("a", "b")
+        assert id_key("a") != id_key("a", scope=("handle",))
+
+    def test_viewport_collapses_same_name_in_one_cell(self):
+        # The one intended difference: coordinates written differently but in one GEO_DECIMALS cell
+        stores = [{"name": "Boutique", "lat": "40.712801", "lng": "-74.0060"},
+                  {"name": "Boutique", "lat": "40.7128", "lng": "-74.006"}]
+        assert viewport_grid.deduplicate_stores(stores) == stores[:1]
+        assert _old_deduplicate_stores(stores) == stores
@@ -0,0 +1,134 @@
+#!/usr/bin/env python3
+"""Pytest suite for http_client.TokenBucket and get_rate_limiter (fake clock, no network).
+
+Run with:
+    cd Prototypes/Data_Scrappers
+    pytest test_http_client.py -v
+"""
+
+import sys
+import os
+import threading
+
+import pytest
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+import http_client
+from http_client import TokenBucket, get_rate_limiter
+
+
+class _FakeClock:
+    """Stands in for http_client's time module: sleep() advances monotonic() instead of blocking."""
+
+    def __init__(self, now=1000.0):
+        self.now = now
+        self.sleeps = []
+
+    def monotonic(self):
+        return self.now
+
+    def sleep(self, seconds):
+        self.sleeps.append(seconds)
+        self.now += seconds
+
+    def advance(self, seconds):
+        self.now += seconds
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    fake = _FakeClock()
+    monkeypatch.setattr(http_client, "time", fake)
+    return fake
+
+
+class TestTokenBucket:
+    def test_try_acquire_spends_burst_then_reports_wait(self, clock):
+        bucket = TokenBucket(rate=2, burst=2)
+        assert bucket.try_acquire() == 0.0
+        assert bucket.try_acquire() == 0.0
+        assert bucket.try_acquire() == pytest.approx(0.5)
+        # A refused try_acquire takes nothing: the wait shrinks as the clock moves
+        clock.advance(0.2)
+        assert bucket.try_acquire() == pytest.approx(0.3)
+        clock.advance(0.3)
+        assert bucket.try_acquire() == 0.0
+        assert bucket.try_acquire() == pytest.approx(0.5)
+        assert clock.sleeps == []
+
+    def test_idle_time_refills_only_up_to_burst(self, clock):
+        bucket = TokenBucket(rate=10, burst=3)
+        for _ in range(3):
+            assert bucket.try_acquire() == 0.0
+        clock.advance(3600)
+        assert [bucket.try_acquire() for _ in range(4)] == [0.0, 0.0, 0.0, pytest.approx(0.1)]
+
+    def test_burst_below_one_still_allows_one_request(self, clock):
+        bucket = TokenBucket(rate=1, burst=0)
+        assert bucket.try_acquire() == 0.0
+        assert bucket.try_acquire() == pytest.approx(1.0)
+
+    def test_acquire_sleeps_exactly_the_wait(self, clock):
+        bucket = TokenBucket(rate=4, burst=1)
+        start = clock.now
+        for _ in range(5):
+            bucket.acquire()
+        # First request is free, then one every 1/rate seconds
+        assert clock.sleeps == [pytest.approx(0.25)] * 4
+        assert clock.now - start == pytest.approx(1.0)
+
+    def test_acquire_does_not_sleep_when_a_token_is_free(self, clock):
+        bucket = TokenBucket(rate=1, burst=2)
+        bucket.acquire()
+        clock.advance(5)
+        bucket.acquire()
+        bucket.acquire()
+        assert clock.sleeps == []
+
+    def test_concurrent_try_acquire_grants_at_most_burst(self, clock):
+        bucket = TokenBucket(rate=1, burst=5)
+        granted = []
+        barrier = threading.Barrier(20)
+
+        def worker():
+            barrier.wait()
+            if bucket.try_acquire() == 0.0:
+                granted.append(1)
+
+        threads = [threading.Thread(target=worker) for _ in range(20)]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+        assert len(granted) == 5
+
+
+class TestGetRateLimiter:
+    @pytest.fixture(autouse=True)
+    def _fresh_limiters(self, monkeypatch):
+        monkeypatch.setattr(http_client, "_limiters", {})
+
+    @pytest.mark.parametrize("rate", [None, 0, -1])
+    def test_unthrottled(self, rate):
+        assert get_rate_limiter("https://api.example.com/stores", rate) is None
+
+    def test_one_bucket_per_host(self):
+        limiter = get_rate_limiter("https://api.example.com/stores?page=1", 4)
+        assert get_rate_limiter("https://API.example.com/v2/locator", 4) is limiter
+        assert get_rate_limiter("https://other.example.com/stores", 4) is not limiter
+        assert get_rate_limiter("http://api.example.com:8080/stores", 4) is not limiter
+
+    def test_first_caller_fixes_the_rate(self):
+        first = get_rate_limiter("https://api.example.com/a", 2, burst=3)
+        again = get_rate_limiter("https://api.example.com/b", 50, burst=10)
+        assert again is first
+        assert (again.rate, again.capacity) == (2.0, 3.0)
+
+    def test_shared_bucket_paces_callers_together(self, clock):
+        a = get_rate_limiter("https://api.example.com/stores", 2)
+        b = get_rate_limiter("https://api.example.com/viewport", 2)
+        a.acquire()
+        b.acquire()
+        a.acquire()
+        assert clock.sleeps == [pytest.approx(0.5)] * 2
@@ -0,0 +1,226 @@
+#!/usr/bin/env python3
+"""Pytest suite for universal_scraper expansion strategies (fake HTTP clients, no network).
+
+Run with:
+    cd Prototypes/Data_Scrappers
+    pytest test_universal_scraper.py -v
+"""
+
+import sys
+import os
+import threading
+
+import pytest
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+import universal_scraper
+from async_http import ASYNC_BACKEND
+from http_client import DEFAULT_REQUESTS_PER_SECOND, close_http_clients
+
+
+class _FakeResponse:
+    def __init__(self, payload, status_code=200):
+        self.payload = payload
+        self.status_code = status_code
+
+    def raise_for_status(self):
+        if self.status_code >= 400:
+            raise RuntimeError(f"HTTP {self.status_code}")
+
+    def json(self):
+        return self.payload
+
+
+class _FakeClient:
+    """Routes GETs to handler(url) and records every URL requested."""
+
+    def __init__(self, handler):
+        self.handler = handler
+        self.urls = []
+
+    def get(self, url, **kwargs):
+        self.urls.append(url)
+        return self.handler(url)
+
+
+class TestGeohashRefinement:
+    BASE = "https://api.example.com/points"
+
+    def _run(self, monkeypatch, handler, cfg):
+        client = _FakeClient(handler)
+        monkeypatch.setattr(universal_scraper, "get_http_client", lambda brand_config=None: client)
+        config = {"geohash_prefix_expansion": dict(cfg, delay=0)}
+        stores = universal_scraper.scrape_geohash_prefix_expansion(self.BASE, brand_config=config)
+        return stores, client.urls
+
+    def _handler(self, url):
+        """Root claims more stores than exist; every 2-char bucket has 5, longer prefixes repeat their parent's."""
+        if url == self.BASE:
+            return _FakeResponse({"total": 100000, "items": []})
+        prefix = url.rsplit("/", 1)[-1]
+        return _FakeResponse({"items": [{"id": f"{prefix[:2]}-{i}"} for i in range(5)]})
+
+    def test_unreachable_total_stops_when_round_adds_nothing(self, monkeypatch):
+        stores, urls = self._run(monkeypatch, self._handler, {"refine_max_requests": 10 ** 6})
+        assert len(stores) == 32 * 32 * 5
+        # root + first pass + exactly one refinement round of every bucket
+        assert len(urls) == 1 + 1024 + 1024 * 32
+
+    def test_refinement_request_budget(self, monkeypatch):
+        stores, urls = self._run(monkeypatch, self._handler, {"refine_max_requests": 320})
+        assert len(stores) == 32 * 32 * 5
+        assert len(urls) == 1 + 1024 + 320
+
+    def test_only_near_cap_buckets_refined(self, monkeypatch):
+        def handler(url):
+            if url == self.BASE:
+                return _FakeResponse({"total": 100000, "items": []})
+            prefix = url.rsplit("/", 1)[-1]
+            # "00" hits the 50-item cap; every other bucket is small and complete
+            count = 50 if prefix == "00" else 3
+            return _FakeResponse({"items": [{"id": f"{prefix}-{i}"} for i in range(count)]})
+
+        _, urls = self._run(monkeypatch, handler, {"max_prefix_length": 2, "refine_rounds": 5})
+        assert len(urls) == 1 + 1024  # max_prefix_length reached: nothing refinable
+
+        _, urls = self._run(monkeypatch, handler, {"max_prefix_length": 3, "refine_rounds": 5})
+        refined = {u.rsplit("/", 1)[-1][:2] for u in urls[1 + 1024:]}
+        assert refined == {"00"}
+
+
+@pytest.fixture
+def slow_json_server():
+    """Local server: every GET sleeps 0.1s and returns one store named after the path; tracks peak
+    concurrency and the requests made per path."""
+    import json
+    import threading
+    import time
+    from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+    state = {"active": 0, "peak": 0, "hits": {}}
+    lock = threading.Lock()
+
+    class Handler(BaseHTTPRequestHandler):
+        def log_message(self, *args):
+            pass
+
+        def do_GET(self):
+            with lock:
+                state["active"] += 1
+                state["peak"] = max(state["peak"], state["active"])
+                state["hits"][self.path] = state["hits"].get(self.path, 0) + 1
+            time.sleep(0.1)
+            with lock:
+                state["active"] -= 1
+            body = json.dumps({"stores": [{"id": self.path, "name": self.path}]}).encode()
+            self.send_response(200)
+            self.send_header("Content-Type", "application/json")
+            self.send_header("Content-Length", str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+
+    server = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    yield f"http://127.0.0.1:{server.server_port}", state
+    server.shutdown()
+
+
+@pytest.mark.skipif(ASYNC_BACKEND is None, reason="async engine needs aiohttp or httpx")
+class TestAsyncEngine:
+    @pytest.fixture(autouse=True)
+    def _fresh_clients(self):
+        close_http_clients()
+        yield
+        close_http_clients()
+
+    def test_defaults_to_sync_request_budget(self):
+        workers, rps = universal_scraper._concurrency_settings({"engine": "async", "concurrency": 4})
+        assert workers == 4 and rps == DEFAULT_REQUESTS_PER_SECOND
+
+    def test_fetch_urls_batch_runs_as_coroutines(self, slow_json_server, monkeypatch):
+        base, state = slow_json_server
+
+        def no_threads(*args, **kwargs):
+            raise AssertionError("async engine fell back to worker threads")
+
+        monkeypatch.setattr(universal_scraper, "ThreadPoolExecutor", no_threads)
+        config = {"engine": "async", "concurrency": 4, "requests_per_second": 1000}
+        urls = [f"{base}/page-{i}" for i in range(12)]
+        stores = universal_scraper.scrape_pagination_fetch_urls(urls, brand_config=config)
+        assert [store["id"] for store in stores] == [f"/page-{i}" for i in range(12)]
+        assert 1 < state["peak"] <= 4
+
+
+    def test_timeouts_are_retried_like_the_sync_client(self, slow_json_server):
+        import requests
+        from async_http import AsyncHttpClient
+
+        base, state = slow_json_server
+        client = AsyncHttpClient({"http_pool": {"retries": 2, "backoff_factor": 0.01}})
+        try:
+            with pytest.raises(requests.exceptions.Timeout):
+                client.get(f"{base}/always-slow", timeout=0.02)
+        finally:
+            client.close()
+        assert state["hits"]["/always-slow"] == 1 + 2
+
+
+class TestRadiusExpansionOrder:
+    # Center 1 repeats center 0's stores on its first two pages, then lists two more. In center
+    # order those two full pages add nothing, so center 1 stops before reaching e and f.
+    CENTER_STORES = [list("abcd"), list("abcdef"), list("gh")]
+
+    class _PagedClient:
+        pool_maxsize = 16
+
+        def __init__(self, center_stores, slow_center):
+            self.center_stores = center_stores
+            self.slow_center = slow_center
+            self.requests = 0
+            self._lock = threading.Lock()
+
+        def get(self, url, params=None, **kwargs):
+            import time
+
+            with self._lock:
+                self.requests += 1
+            center = int(float(params["lat"]))
+            if center == self.slow_center:
+                time.sleep(0.05)  # finishes last when centers run concurrently
+            offset, per = int(params["offset"]), int(params["per"])
+            stores = self.center_stores[center]
+            page = [{"id": sid, "name": sid} for sid in stores[offset:offset + per]]
+            return _FakeResponse({"response": {"entities": page, "count": len(stores)}})
+
+    def _run(self, monkeypatch, concurrency, center_stores=None):
+        client = self._PagedClient(center_stores or self.CENTER_STORES, slow_center=0)
+        self.client = client
+        monkeypatch.setattr(universal_scraper, "get_http_client", lambda brand_config=None: client)
+        config = {
+            "concurrency": concurrency,
+            "requests_per_second": 1000,
+            "radius_expansion_delay_seconds": 0,
+            "radius_expansion_centers": [[f"c{i}", i, 0] for i in range(len(client.center_stores))],
+        }
+        stores = universal_scraper.scrape_radius_expansion(
+            "https://api.example.com/search", {"r": "100", "per": "2"}, brand_config=config
+        )
+        return [store["id"] for store in stores]
+
+    def test_concurrent_matches_sequential_whatever_finishes_first(self, monkeypatch):
+        sequential = self._run(monkeypatch, 1)
+        assert sequential == list("abcdgh")
+        assert self._run(monkeypatch, 3) == sequential
+
+    def test_concurrent_centers_skip_pages_earlier_windows_cover(self, monkeypatch):
+        # Six overlapping centers (e.g. neighbouring European cities) that all list the same 8 stores
+        overlapping = [list("abcdefgh")] * 6
+        sequential = self._run(monkeypatch, 1, overlapping)
+        sequential_requests = self.client.requests
+        # Center 0 pages through all 4 pages; every later center stops after 2 full pages of nothing new
+        assert sequential == list("abcdefgh") and sequential_requests == 4 + 5 * 2
+
+        assert self._run(monkeypatch, 2, overlapping) == sequential
+        # Only c1, paged alongside c0 before c0's stores are known, reads past its second page
+        assert self.client.requests == sequential_requests + 2
@@ -0,0 +1,166 @@
+#!/usr/bin/env python3
+"""Pytest suite for validate_csv.CSVValidator: validate_rows must report what validate_file reports.
+
+Run with:
+    cd Prototypes/Data_Scrappers
+    pytest test_validate_csv.py -v
+"""
+
+import csv
+import importlib.util
+import sys
+import os
+
+import pytest
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+# Loaded by path: once universal_scraper is imported, "validate_csv" on sys.path is the
+# tools/validate_csv.py launcher, which re-exports the validator but not its module constants
+_spec = importlib.util.spec_from_file_location(
+    "_validate_csv_under_test", os.path.join(os.path.dirname(os.path.abspath(__file__)), "validate_csv.py")
+)
+validate_csv = importlib.util.module_from_spec(_spec)
+_spec.loader.exec_module(validate_csv)
+DEFAULT_REQUIRED = validate_csv.DEFAULT_REQUIRED
+CSVValidator = validate_csv.CSVValidator
+
+
+FIELDNAMES = [
+    "Handle", "Name", "Status", "Address Line 1", "City", "State/Province/Region", "Country",
+    "Phone", "Website", "Latitude", "Longitude",
+]
+
+
+def _store(i, **overrides):
+    row = {
+        "Handle": f"store-{i}", "Name": f"Store {i}", "Status": "TRUE", "Address Line 1": f"{i} Main St",
+        "City": "Geneva", "State/Province/Region": "", "Country": "Switzerland", "Phone": "",
+        "Website": f"https://example.com/stores/{i}", "Latitude": f"46.{i:05d}", "Longitude": "6.14",
+    }
+    row.update(overrides)
+    return row
+
+
+def _rows():
+    """Clean rows plus every kind of issue: fixable values, duplicates, bad and missing data."""
+    rows = [_store(i) for i in range(40)]
+    rows += [
+        _store(1, Handle="store-1-copy"),  # duplicate Name + Address + City
+        _store(2, Name=" Store 2 ", Handle="store-2-copy"),  # same key once stripped
+        _store(41, Website="example.com/stores/41"),  # missing scheme
+        _store(42, Website="HTTPS://example.com/stores/42"),
+        _store(43, Country="usa"),  # country alias
+        _store(44, Latitude="123.5"),  # out of range
+        _store(45, Longitude="abc"),
+        _store(46, Latitude="46.1"),  # low precision
+        _store(47, City=""),  # required and empty; never deduped
+        _store(47, City=""),
+        _store(48, Name="Store\\48"),  # backslash
+        _store(49, Latitude=46.2, Longitude=6.1, Phone=None),  # not strings, as from batch_normalize
+    ]
+    return rows
+
+
+def _write_csv(path, rows):
+    with open(path, "w", newline="", encoding="utf-8") as f:
+        writer = csv.DictWriter(f, fieldnames=FIELDNAMES, lineterminator="\n")
+        writer.writeheader()
+        for row in rows:
+            writer.writerow(row)
+
+
+def _read_csv(path):
+    with open(path, newline="", encoding="utf-8") as f:
+        return list(csv.DictReader(f))
+
+
+def _report(validator):
+    report = validator.get_json_report()
+    report.pop("file")
+    return report, validator.fixes_applied, validator.duplicates_removed
+
+
+class TestValidateRowsParity:
+    @pytest.mark.parametrize("auto_fix", [False, True])
+    @pytest.mark.parametrize("limit", [None, 30])
+    def test_same_report_and_rows_as_validate_file(self, tmp_path, monkeypatch, auto_fix, limit):
+        # Small batches so the coordinate columns are checked over several batches
+        monkeypatch.setattr(validate_csv, "COORDINATE_BATCH_ROWS", 16)
+        path = tmp_path / "locations.csv"
+        _write_csv(path, _rows())
+
+        from_file = CSVValidator(DEFAULT_REQUIRED, limit=limit)
+        assert from_file.validate_file(str(path), auto_fix=auto_fix) == validate_csv.EXIT_OK
+
+        rows = _rows()
+        originals = [dict(row) for row in rows]
+        from_rows = CSVValidator(DEFAULT_REQUIRED, limit=limit)
+        exit_code, kept = from_rows.validate_rows(rows, FIELDNAMES, auto_fix=auto_fix)
+
+        assert exit_code == validate_csv.EXIT_OK
+        assert _report(from_rows) == _report(from_file)
+        assert rows == originals  # input dicts are not modified
+        if auto_fix:
+            assert from_file.duplicates_removed == 2 and from_file.fixes_applied > 0
+            assert kept == _read_csv(path)
+
+    def test_duplicates_reported_without_auto_fix(self, tmp_path):
+        path = tmp_path / "locations.csv"
+        _write_csv(path, _rows())
+        validator = CSVValidator(DEFAULT_REQUIRED)
+        validator.validate_file(str(path))
+        duplicates = [w.details["rows"] for w in validator.warnings if w.warning_type == "duplicate"]
+        # Rows are 1-based after the header: store 1 is row 3, its copy row 42
+        assert duplicates == [[3, 42], [4, 43]]
+
+
+class TestCoordinateWarnings:
+    @staticmethod
+    def _warnings(validator, warning_type):
+        return [w.details for w in validator.warnings if w.warning_type == warning_type]
+
+    def test_zero_and_swapped_coordinates_warn_without_failing_the_row(self):
+        validator = CSVValidator(DEFAULT_REQUIRED)
+        assert validator.validate_row(_store(1, Latitude="0", Longitude="0.0"), 2)
+        assert self._warnings(validator, "zero_coordinates") == [{"row": 2}]
+        assert not validator.errors
+
+        # Swapped columns: the latitude is out of range, so the row is an error and a warning
+        assert not validator.validate_row(_store(2, Latitude="151.20732", Longitude="-33.86785"), 3)
+        assert self._warnings(validator, "swapped_coordinates") == [
+            {"row": 3, "latitude": "151.20732", "longitude": "-33.86785"}
+        ]
+        assert [(e.row, e.field, e.issue) for e in validator.errors] == [(3, "Latitude", "out_of_range")]
+
+    def test_no_suspect_warnings_for_ordinary_or_unfixable_rows(self):
+        validator = CSVValidator(DEFAULT_REQUIRED)
+        validator.validate_row(_store(1), 2)
+        validator.validate_row(_store(2, Latitude="0", Longitude=""), 3)  # 0 with a blank longitude
+        validator.validate_row(_store(3, Latitude="200", Longitude="6.1"), 4)  # not a longitude either
+        assert not self._warnings(validator, "zero_coordinates")
+        assert not self._warnings(validator, "swapped_coordinates")
+
+    def test_precision_warning_only_for_valid_values(self):
+        validator = CSVValidator(DEFAULT_REQUIRED)
+        validator.validate_row(_store(1, Latitude="46.123456789", Longitude="6.1234567"), 2)
+        validator.validate_row(_store(2, Latitude="95.123456789"), 3)
+        assert self._warnings(validator, "precision") == [{"row": 2, "field": "Latitude", "decimals": 9}]
+
+    def test_batched_checks_warn_like_per_row_checks(self, monkeypatch):
+        monkeypatch.setattr(validate_csv, "COORDINATE_BATCH_ROWS", 2)
+        rows = [
+            _store(1, Latitude="0", Longitude="0"),
+            _store(2, Latitude="151.2", Longitude="-33.8"),
+            _store(3, Latitude="46.123456789"),
+            _store(4),
+            _store(5, Latitude="-120.5", Longitude="45"),
+        ]
+        per_row = CSVValidator(DEFAULT_REQUIRED)
+        for row_num, row in enumerate(rows, start=2):
+            per_row.validate_row(dict(row), row_num)
+        batched = CSVValidator(DEFAULT_REQUIRED)
+        batched.validate_rows(rows, FIELDNAMES)
+        for warning_type in ("zero_coordinates", "swapped_coordinates", "precision"):
+            assert self._warnings(batched, warning_type) == self._warnings(per_row, warning_type)
+        assert [w["row"] for w in self._warnings(batched, "swapped_coordinates")] == [3, 6]
@@ -0,0 +1,187 @@
+#!/usr/bin/env python3
+"""Pytest suite for viewport_grid (fake HTTP client, no network).
+
+Run with:
+    cd Prototypes/Data_Scrappers
+    pytest test_viewport_grid.py -v
+"""
+
+import sys
+import os
+import time
+from urllib.parse import parse_qs, urlparse
+
+import requests
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+import viewport_grid
+
+
+VIEWPORT_PARAMS = {
+    "northEastLat": "ne_lat",
+    "northEastLng": "ne_lng",
+    "southWestLat": "sw_lat",
+    "southWestLng": "sw_lng",
+}
+
+
+class _FakeResponse:
+    def __init__(self, payload):
+        self.payload = payload
+        self.text = "[]" if payload == [] else "stores"
+
+    def raise_for_status(self):
+        pass
+
+    def json(self):
+        return self.payload
+
+
+class _TileClient:
+    """Answers viewport GETs with handler(sw_lat, sw_lng, ne_lat, ne_lng); records every tile."""
+
+    def __init__(self, handler):
+        self.handler = handler
+        self.tiles = []
+
+    def get(self, url, **kwargs):
+        params = {k: float(v[0]) for k, v in parse_qs(urlparse(url).query).items()}
+        tile = (params["sw_lat"], params["sw_lng"], params["ne_lat"], params["ne_lng"])
+        self.tiles.append(tile)
+        return self.handler(*tile)
+
+
+class TestViewportFailures:
+    BOUNDS = {"min_lat": 0, "max_lat": 20, "min_lng": 0, "max_lng": 20}
+
+    @staticmethod
+    def _handler(sw_lat, sw_lng, ne_lat, ne_lng):
+        """Tile (0, 0) is down; tile (0, 10) is saturated at 3 stores; every other tile is empty."""
+        if (sw_lat, sw_lng) == (0, 0) and ne_lat == 10:
+            raise requests.exceptions.ConnectionError("connection reset")
+        if sw_lat >= 0 and sw_lng >= 10 and ne_lat <= 10:
+            size = ne_lat - sw_lat
+            count = 3 if size == 10 else 1
+            return _FakeResponse([{"id": f"{sw_lat}-{sw_lng}-{size}-{i}"} for i in range(count)])
+        return _FakeResponse([])
+
+    def test_failed_request_is_not_an_empty_tile(self):
+        client = _TileClient(self._handler)
+        down = viewport_grid.build_viewport_url(
+            "https://api.example.com/v", {"sw_lat": 0, "sw_lng": 0, "ne_lat": 10, "ne_lng": 10}, VIEWPORT_PARAMS
+        )
+        empty = viewport_grid.build_viewport_url(
+            "https://api.example.com/v", {"sw_lat": 10, "sw_lng": 0, "ne_lat": 20, "ne_lng": 10}, VIEWPORT_PARAMS
+        )
+        assert viewport_grid.fetch_viewport_data(down, http_client=client) is None
+        assert viewport_grid.fetch_viewport_data(empty, http_client=client) == []
+
+    def test_adaptive_reports_failed_tile_separately(self, capsys):
+        client = _TileClient(self._handler)
+        stores = viewport_grid.scrape_viewport_api(
+            "https://api.example.com/v", VIEWPORT_PARAMS, grid_type="country", grid_size=10,
+            focus_region=self.BOUNDS, delay_between_requests=0, http_client=client,
+            adaptive=True, max_results_per_tile=3, min_tile_size=1,
+        )
+        out = capsys.readouterr().out
+        # The saturated tile was split into four 1-store quadrants; the failed one was not split
+        assert len(stores) == 3 + 4
+        assert len(client.tiles) == 4 + 4
+        assert "1 failed" in out and "2 empty" in out
+        assert "1 viewport(s) failed after retries" in out
+
+
+class _AsyncTileClient(_TileClient):
+    """Async-engine stand-in: tiles must arrive through request_many, one batch per grid level."""
+
+    is_async = True
+
+    def __init__(self, handler):
+        super().__init__(handler)
+        self.batches = []
+
+    def get(self, url, **kwargs):
+        raise AssertionError("async engine must not fetch tiles one by one")
+
+    def request_many(self, calls, limiter=None):
+        self.batches.append(len(calls))
+        results = []
+        for method, url, kwargs in calls:
+            assert method == "GET"
+            try:
+                results.append(_TileClient.get(self, url, **kwargs))
+            except Exception as e:
+                results.append(e)
+        return results
+
+
+class TestViewportAsyncEngine:
+    def test_levels_sent_through_request_many(self, capsys):
+        kwargs = dict(
+            grid_type="country", grid_size=10, focus_region=TestViewportFailures.BOUNDS,
+            delay_between_requests=0, adaptive=True, max_results_per_tile=3, min_tile_size=1,
+        )
+        sequential = viewport_grid.scrape_viewport_api(
+            "https://api.example.com/v", VIEWPORT_PARAMS, http_client=_TileClient(TestViewportFailures._handler), **kwargs
+        )
+        client = _AsyncTileClient(TestViewportFailures._handler)
+        stores = viewport_grid.scrape_viewport_api(
+            "https://api.example.com/v", VIEWPORT_PARAMS, http_client=client, max_workers=4,
+            requests_per_second=1000, **kwargs
+        )
+        # Coarse level, then the saturated tile's four quadrants
+        assert client.batches == [4, 4]
+        assert stores == sequential
+        assert "1 viewport(s) failed after retries" in capsys.readouterr().out
+
+
+class TestViewportConcurrency:
+    BOUNDS = {"min_lat": 0, "max_lat": 40, "min_lng": 0, "max_lng": 40}
+
+    @staticmethod
+    def _handler(sw_lat, sw_lng, ne_lat, ne_lng):
+        """
+        Tiles earlier in grid order answer slowest, so they complete last. Every tile also
+        returns the chain's flagship under one id, tagged with the tile that answered, so only
+        a "first in grid order wins" dedup keeps the sequential path's copy.
+        """
+        time.sleep(0.002 * (40 - sw_lat - sw_lng / 10))
+        tile = f"{sw_lat:g},{sw_lng:g}"
+        return _FakeResponse([{"id": "flagship", "tile": tile}, {"id": f"store-{tile}", "tile": tile}])
+
+    def test_results_in_input_order_despite_uneven_latency(self):
+        urls = [
+            viewport_grid.build_viewport_url(
+                "https://api.example.com/v",
+                {"sw_lat": lat, "sw_lng": lng, "ne_lat": lat + 10, "ne_lng": lng + 10}, VIEWPORT_PARAMS,
+            )
+            for lat in range(0, 40, 10) for lng in range(0, 40, 10)
+        ]
+        completed = []
+
+        def handler(*tile):
+            response = self._handler(*tile)
+            completed.append(tile[:2])
+            return response
+
+        results = viewport_grid._fetch_viewports_concurrently(
+            urls, "", None, _TileClient(handler), max_workers=8, requests_per_second=None,
+            update_interval=100, start_time=time.time(),
+        )
+        expected = [(float(lat), float(lng)) for lat in range(0, 40, 10) for lng in range(0, 40, 10)]
+        assert completed != expected  # the slow first tiles really finished out of order
+        assert [stores[1]["id"] for stores in results] == [f"store-{lat:g},{lng:g}" for lat, lng in expected]
+
+    def test_same_dedup_output_as_sequential(self):
+        kwargs = dict(grid_type="country", grid_size=10, focus_region=self.BOUNDS, delay_between_requests=0)
+        sequential = viewport_grid.scrape_viewport_api(
+            "https://api.example.com/v", VIEWPORT_PARAMS, http_client=_TileClient(self._handler), **kwargs
+        )
+        concurrent = viewport_grid.scrape_viewport_api(
+            "https://api.example.com/v", VIEWPORT_PARAMS, http_client=_TileClient(self._handler),
+            max_workers=8, requests_per_second=1000, **kwargs
+        )
+        assert len(sequential) == 1 + 16
+        assert sequential[0] == {"id": "flagship", "tile": "0,0"}
+        assert concurrent == sequential
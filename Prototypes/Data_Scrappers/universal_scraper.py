@@ -20,93 +20,21 @@ import sys
 import os
 import time
 import json
-from typing import Dict, List, Any, Optional, Tuple
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from typing import Callable, Dict, List, Any, Optional, Set, Tuple
 from urllib.parse import urlparse, urljoin
 
-from scraper_utils import log_debug, dict_get_ci
+from scraper_utils import log_debug, dict_get_ci, infer_result_cap
+from country_index import country_variants
 
 
 # ---------------------------------------------------------------------------
-# Country-name normalisation (built once at module load from Babel + pycountry)
+# Country-name normalisation (prebuilt Babel + pycountry index, see country_index)
 # ---------------------------------------------------------------------------
 
-def _build_country_name_map() -> dict:
-    """
-    Return a dict mapping any known country-name variant (lower-case) to the
-    ISO 3166 canonical English name.  Covers ~3 500+ variants across all major
-    languages by combining:
-      • pycountry  – alpha_2, alpha_3, English name, official_name, common_name
-      • Babel      – localised territory names for every locale in the CLDR data
-    Falls back gracefully if either library is unavailable.
-    """
-    mapping: dict = {}
-    try:
-        import pycountry
-        for c in pycountry.countries:
-            eng = c.name
-            for key in (c.alpha_2, c.alpha_3, eng,
-                        getattr(c, 'common_name', None),
-                        getattr(c, 'official_name', None)):
-                if key:
-                    mapping[key.lower()] = eng
-    except Exception:
-        pass
-
-    try:
-        from babel import Locale
-        import pycountry as _pc
-        for locale_code in [
-            'af', 'ar', 'az', 'be', 'bg', 'bn', 'bs', 'ca', 'cs', 'cy',
-            'da', 'de', 'el', 'en', 'es', 'et', 'eu', 'fa', 'fi', 'fr',
-            'ga', 'gl', 'gu', 'he', 'hi', 'hr', 'hu', 'hy', 'id', 'is',
-            'it', 'ja', 'ka', 'kk', 'km', 'kn', 'ko', 'ky', 'lo', 'lt',
-            'lv', 'mk', 'ml', 'mn', 'mr', 'ms', 'my', 'nb', 'ne', 'nl',
-            'or', 'pa', 'pl', 'pt', 'ro', 'ru', 'si', 'sk', 'sl', 'sq',
-            'sr', 'sv', 'sw', 'ta', 'te', 'th', 'tl', 'tr', 'uk', 'ur',
-            'uz', 'vi', 'zh', 'zu',
-        ]:
-            try:
-                loc = Locale.parse(locale_code)
-                for alpha2, local_name in loc.territories.items():
-                    c = _pc.countries.get(alpha_2=alpha2)
-                    if c and local_name:
-                        mapping[local_name.lower()] = c.name
-            except Exception:
-                pass
-    except Exception:
-        pass
-
-    # Manual overrides for common abbreviations / colloquial names not in CLDR
-    mapping.update({
-        'uk': 'United Kingdom',
-        'usa': 'United States',
-        'u.s.a.': 'United States',
-        'u.s.': 'United States',
-        'uae': 'United Arab Emirates',
-        'u.a.e.': 'United Arab Emirates',
-        'south korea': 'South Korea',
-        'north korea': 'North Korea',
-        'taiwan': 'Taiwan',
-        'hong kong': 'Hong Kong',
-        'macau': 'Macao',
-        'macao': 'Macao',
-        'czech republic': 'Czechia',
-        'slovak republic': 'Slovakia',
-        'ivory coast': "Côte d'Ivoire",
-        'congo': 'Congo',
-        'dr congo': 'Congo, The Democratic Republic of the',
-        'drc': 'Congo, The Democratic Republic of the',
-        'trinidad': 'Trinidad and Tobago',
-    })
-    return mapping
-
-
-_COUNTRY_NAME_MAP: dict = _build_country_name_map()
-
-
 def _normalize_country(name: str) -> str:
     """Return the canonical English country name, or the original string if unknown."""
-    return _COUNTRY_NAME_MAP.get(name.lower().strip(), name.strip())
+    return country_variants().get(name.lower().strip(), name.strip())
 
 
 # ---------------------------------------------------------------------------
@@ -172,6 +100,37 @@ def _get_custom_headers(brand_config: Optional[Dict]) -> Optional[Dict]:
     return None
 
 
+def _concurrency_settings(brand_config: Optional[Dict]) -> Tuple[int, Optional[float]]:
+    """
+    Return (max_workers, requests_per_second) from brand_config ``concurrency`` /
+    ``requests_per_second``. Workers default to 1 (sequential, legacy pacing) and are
+    capped at the brand client's pool size so every worker keeps a warm connection.
+
+    Concurrent runs are paced at DEFAULT_REQUESTS_PER_SECOND unless configured, on either
+    engine. The async engine always fans out (its per-host semaphore bounds the sockets).
+    """
+    workers = 1
+    rps: Optional[float] = None
+    if brand_config:
+        try:
+            workers = max(1, int(brand_config.get("concurrency") or 1))
+        except (TypeError, ValueError):
+            workers = 1
+        try:
+            raw_rps = brand_config.get("requests_per_second")
+            rps = float(raw_rps) if raw_rps is not None else None
+        except (TypeError, ValueError):
+            rps = None
+    client = get_http_client(brand_config)
+    if getattr(client, "is_async", False):
+        workers = max(workers, client.per_host_limit)
+    if workers > 1 and not rps:
+        rps = DEFAULT_REQUESTS_PER_SECOND
+    if workers > 1:
+        workers = min(workers, client.pool_maxsize)
+    return workers, rps
+
+
 def _country_expansion_request_headers(brand_config: Optional[Dict]) -> Dict[str, str]:
     """Headers for scrape_country_expansion (JSON APIs + optional custom_headers / legacy headers)."""
     merged: Dict[str, str] = {"User-Agent": "Mozilla/5.0", "Accept": "application/json"}
@@ -185,16 +144,28 @@ def _country_expansion_request_headers(brand_config: Optional[Dict]) -> Dict[str
 
 # Request/retry constants
 DEFAULT_REQUEST_TIMEOUT = 120
-DEFAULT_RETRIES = 3
-DEFAULT_BACKOFF_FACTOR = 2
 DEFAULT_VIEWPORT_GRID_SIZE = 20
 DEFAULT_DELAY_BETWEEN_REQUESTS = 0.5
+# Geohash expansion: extra rounds/requests spent chasing a root total, and how close to the
+# per-bucket cap a bucket must be to count as possibly truncated
+GEOHASH_REFINE_ROUNDS = 3
+GEOHASH_REFINE_MAX_REQUESTS = 2000
+GEOHASH_NEAR_CAP_RATIO = 0.9
 
 # Add paths
 sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
 sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "..", "tools"))
 
 from locator_type_detector import detect_locator_type
+from http_client import (
+    BrandHttpClient,
+    DEFAULT_REQUESTS_PER_SECOND,
+    TokenBucket,
+    close_http_clients,
+    get_http_client,
+    get_rate_limiter,
+    http_engine,
+)
 
 
 def _print_technique_comparison(technique_metrics: Dict[str, Any]) -> None:
@@ -236,8 +207,8 @@ def _collect_data_quality_warnings(stores: List[Dict[str, Any]]) -> List[str]:
         warnings.append(f"{no_phone} store(s) have no phone number")
     return warnings
 from pattern_detector import detect_data_pattern
-from data_normalizer import batch_normalize, write_normalized_csv
-from validate_csv import CSVValidator, DEFAULT_REQUIRED
+from data_normalizer import SCHEMA, batch_normalize, write_normalized_csv
+from validate_csv import CSVValidator, DEFAULT_REQUIRED, EXIT_OK
 from extraction_techniques import (
     extract_stores_from_html_generic,
     enrich_stores_from_detail_pages,
@@ -246,22 +217,29 @@ from extraction_techniques import (
 )
 
 
-def fetch_data(url: str, headers: Optional[Dict] = None, timeout: int = DEFAULT_REQUEST_TIMEOUT, retries: int = DEFAULT_RETRIES) -> Any:
+def fetch_data(
+    url: str,
+    headers: Optional[Dict] = None,
+    timeout: int = DEFAULT_REQUEST_TIMEOUT,
+    client: Optional[BrandHttpClient] = None,
+) -> Any:
     """
-    Fetch data from URL with retry logic and configurable timeout
+    Fetch data from URL with configurable timeout
+    
+    Connect errors, timeouts and 429/5xx responses are retried with exponential backoff by
+    the client (http_pool.retries / backoff_factor, see http_client), so there is no retry
+    loop here on top of it.
     
     Args:
         url: URL to fetch
         headers: Optional custom headers
         timeout: Request timeout in seconds (default: 120)
-        retries: Number of retry attempts (default: 3)
+        client: Pooled brand client (default: shared client without brand headers)
     
     Returns:
         Parsed JSON data or HTML/text content
     """
     import requests
-    from requests.adapters import HTTPAdapter
-    from urllib3.util.retry import Retry
     
     log_debug(f"Fetching data from: {url[:100]}...", "DEBUG")
     start_time = time.time()
@@ -275,69 +253,81 @@ def fetch_data(url: str, headers: Optional[Dict] = None, timeout: int = DEFAULT_
     if headers:
         default_headers.update(headers)
     
-    # Create session with retry strategy
-    session = requests.Session()
+    # Keep-alive session with status/connect retries (see http_client)
+    session = client or get_http_client()
     
-    # Configure retry strategy
-    retry_strategy = Retry(
-        total=retries,
-        backoff_factor=DEFAULT_BACKOFF_FACTOR,
-        status_forcelist=[429, 500, 502, 503, 504],  # Retry on these status codes
-        allowed_methods=["GET", "HEAD"]  # Only retry safe methods
-    )
-    
-    adapter = HTTPAdapter(max_retries=retry_strategy)
-    session.mount("http://", adapter)
-    session.mount("https://", adapter)
+    try:
+        response = session.get(url, timeout=timeout, headers=default_headers)
+        response.raise_for_status()
+    except requests.exceptions.Timeout:
+        log_debug(f"Request timed out after {timeout}s (retries exhausted)", "ERROR")
+        raise
+    except requests.exceptions.RequestException as e:
+        log_debug(f"Request failed: {str(e)[:100]}", "WARN")
+        raise
     
-    # Attempt request with retries
-    last_error = None
-    for attempt in range(retries + 1):
-        try:
-            if attempt > 0:
-                wait_time = 2 ** attempt  # Exponential backoff: 2, 4, 8 seconds
-                log_debug(f"Retry attempt {attempt}/{retries} after {wait_time}s...", "WARN")
-                time.sleep(wait_time)
-            
-            response = session.get(url, timeout=timeout, headers=default_headers)
-            response.raise_for_status()
-            
-            elapsed = time.time() - start_time
-            log_debug(f"Response received: {response.status_code} | Size: {len(response.content)} bytes | Time: {elapsed:.2f}s", "DEBUG")
-            
+    elapsed = time.time() - start_time
+    log_debug(f"Response received: {response.status_code} | Size: {len(response.content)} bytes | Time: {elapsed:.2f}s", "DEBUG")
+    return _response_data(response)
+
+
+def _response_data(response: Any) -> Any:
+    """Parsed JSON, JSONP, or the HTML/text body of a successful response."""
+    try:
+        data = response.json()
+        log_debug(f"Response type: JSON | Top-level keys: {list(data.keys()) if isinstance(data, dict) else 'array'}", "DEBUG")
+        return data
+    except (ValueError, json.JSONDecodeError):
+        # Try JSONP (e.g. callback([...]) or SMcallback2([...]))
+        data = _parse_jsonp(response.text)
+        if data is not None:
+            log_debug(f"Response type: JSONP | Parsed successfully", "DEBUG")
+            return data
+        log_debug(f"Response type: HTML/Text | Length: {len(response.text)} chars", "DEBUG")
+        return response.text
+
+
+def fetch_data_many(
+    urls: List[str],
+    headers: Optional[Dict] = None,
+    client: Optional[BrandHttpClient] = None,
+    max_workers: int = 1,
+    limiter: Optional[TokenBucket] = None,
+) -> List[Any]:
+    """
+    fetch_data for several URLs at once; results in URL order, a failed URL yields its exception.
+
+    On the async engine the batch runs as coroutines on the client's event loop (request_many,
+    retried by the client as fetch_data is); otherwise fetch_data runs on max_workers threads. ``limiter`` paces every request on both engines.
+    """
+    session = client or get_http_client()
+    if getattr(session, "is_async", False):
+        request_headers = {"User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36"}
+        if headers:
+            request_headers.update(headers)
+        calls = [("GET", url, {"headers": request_headers, "timeout": DEFAULT_REQUEST_TIMEOUT}) for url in urls]
+        results = []
+        for url, response in zip(urls, session.request_many(calls, limiter=limiter)):
             try:
-                data = response.json()
-                log_debug(f"Response type: JSON | Top-level keys: {list(data.keys()) if isinstance(data, dict) else 'array'}", "DEBUG")
-                return data
-            except (ValueError, json.JSONDecodeError):
-                # Try JSONP (e.g. callback([...]) or SMcallback2([...]))
-                data = _parse_jsonp(response.text)
-                if data is not None:
-                    log_debug(f"Response type: JSONP | Parsed successfully", "DEBUG")
-                    return data
-                log_debug(f"Response type: HTML/Text | Length: {len(response.text)} chars", "DEBUG")
-                return response.text
-                
-        except requests.exceptions.Timeout as e:
-            last_error = e
-            if attempt < retries:
-                log_debug(f"Request timed out after {timeout}s (attempt {attempt + 1}/{retries + 1})", "WARN")
-                continue
-            else:
-                log_debug(f"Request timed out after {retries + 1} attempts", "ERROR")
-                raise
-        except requests.exceptions.RequestException as e:
-            last_error = e
-            if attempt < retries:
-                log_debug(f"Request failed: {str(e)[:100]} (attempt {attempt + 1}/{retries + 1})", "WARN")
-                continue
-            else:
-                raise
-    
-    # If we get here, all retries failed
-    if last_error:
-        raise last_error
-    raise Exception("Failed to fetch data after all retries")
+                if isinstance(response, Exception):
+                    raise response
+                response.raise_for_status()
+                results.append(_response_data(response))
+            except Exception as e:
+                log_debug(f"Request failed for {url[:100]}: {str(e)[:100]}", "WARN")
+                results.append(e)
+        return results
+
+    def _fetch(url: str) -> Any:
+        try:
+            if limiter:
+                limiter.acquire()
+            return fetch_data(url, headers=headers, client=session)
+        except Exception as e:
+            return e
+
+    with ThreadPoolExecutor(max_workers=max(1, max_workers)) as executor:
+        return list(executor.map(_fetch, urls))
 
 
 def _parse_jsonp(text: str):
@@ -913,7 +903,7 @@ def extract_stores_from_html_js(html_content: str) -> List[Dict]:
                                 # Decide if rest is a known country or a city name.
                                 # If it resolves to a known country we treat it as country-only.
                                 normalised = _normalize_country(rest)
-                                if normalised != rest or rest.lower() in _COUNTRY_NAME_MAP:
+                                if normalised != rest or rest.lower() in country_variants():
                                     out['Postal/ZIP Code'] = postal
                                     out['Country']         = normalised
                                 else:
@@ -1138,7 +1128,8 @@ def scrape_single_call(
     print("📡 Fetching stores...")
     log_debug("Starting single-call scrape strategy", "DEBUG")
 
-    data = fetch_data(url, headers=custom_headers)
+    client = get_http_client(brand_config)
+    data = fetch_data(url, headers=custom_headers, client=client)
 
     # Try JSON first
     if isinstance(data, (list, dict)):
@@ -1185,7 +1176,7 @@ def scrape_single_call(
     log_debug("Attempting HTML/JavaScript extraction", "DEBUG")
     if compare_techniques:
         def _fetch(u):
-            r = fetch_data(u, headers=custom_headers)
+            r = fetch_data(u, headers=custom_headers, client=client)
             return r if isinstance(r, str) else ""
         stores, metrics = run_extraction_with_techniques(
             data,
@@ -1260,6 +1251,88 @@ def _radius_page_fingerprint(entities: List[Any]) -> Tuple[str, ...]:
     return tuple(sorted(keys))
 
 
+def _radius_store_id(store: Dict) -> Optional[str]:
+    """Store identity for radius expansion: API id, else name|address|city, else name|lat|lng."""
+    profile = store.get('profile', {}) if isinstance(store.get('profile'), dict) else {}
+
+    store_id = store.get('ID') or store.get('id')
+    if not store_id and profile:
+        meta = profile.get('meta', {})
+        if isinstance(meta, dict):
+            store_id = meta.get('id')
+
+    if not store_id:
+        name = store.get('name') or (profile.get('name') if profile else '')
+        addr = ''
+        city_val = ''
+        if profile:
+            addr_obj = profile.get('address', {})
+            if isinstance(addr_obj, dict):
+                addr = addr_obj.get('line1', '')
+                city_val = addr_obj.get('city', '')
+        if not addr:
+            addr = store.get('address1', '') or store.get('address', '')
+        if not city_val:
+            city_val = store.get('city', city_val)
+        name_n = str(name).lower().strip() if name else ''
+        addr_n = str(addr).lower().strip() if addr else ''
+        city_n = str(city_val).lower().strip() if city_val else ''
+        if name_n and addr_n:
+            store_id = f"{name_n}|{addr_n}|{city_n}"
+
+    if not store_id:
+        name = store.get('name') or (profile.get('name') if profile else '')
+        geo_lat = store.get('latitude')
+        geo_lng = store.get('longitude')
+        if geo_lat is None and profile:
+            geo = profile.get('geocodedCoordinate', {})
+            if isinstance(geo, dict):
+                geo_lat = geo.get('lat')
+                geo_lng = geo.get('long')
+        if name and geo_lat is not None and geo_lng is not None:
+            store_id = f"{str(name).lower().strip()}|{geo_lat}|{geo_lng}"
+
+    return str(store_id) if store_id else None
+
+
+class _RadiusCoverage:
+    """
+    Store IDs and page fingerprints already returned by the centers paged so far, in center
+    order. A center stops paginating once its pages add nothing new.
+    """
+
+    def __init__(self):
+        self._ids: Set[str] = set()
+        self._page_fps: Set[Tuple[str, ...]] = set()
+
+    def claim(self, store_ids: List[Optional[str]]) -> int:
+        """Record IDs and return how many were new (ID-less stores always count as new)."""
+        new_count = 0
+        for sid in store_ids:
+            if sid is None:
+                new_count += 1
+            elif sid not in self._ids:
+                self._ids.add(sid)
+                new_count += 1
+        return new_count
+
+    def copy(self) -> '_RadiusCoverage':
+        """Snapshot for a center paged ahead of the in-order pass."""
+        clone = _RadiusCoverage()
+        clone._ids = set(self._ids)
+        clone._page_fps = set(self._page_fps)
+        return clone
+
+    def page_already_seen(self, page_fp: Tuple[str, ...]) -> bool:
+        """True if another page with exactly these IDs was seen; otherwise remember this one."""
+        if not page_fp or not any(page_fp):
+            return False
+        if page_fp in self._page_fps:
+            return True
+        self._page_fps.add(page_fp)
+        return False
+
+
 def scrape_radius_expansion(
     url: str,
     url_params: Dict,
@@ -1267,8 +1340,7 @@ def scrape_radius_expansion(
     brand_config: Optional[Dict] = None,
 ) -> List[Dict]:
     """Expand radius-based API using multiple center points worldwide."""
-    import requests
-
+    client = get_http_client(brand_config)
     req_headers = _radius_expansion_request_headers(brand_config)
     config_centers = _parse_radius_expansion_centers(brand_config)
     loop_delay = 0.3
@@ -1449,21 +1521,46 @@ def scrape_radius_expansion(
         page_sz = int(_craw[0] if isinstance(_craw, list) else _craw)
         page_sz = max(1, min(page_sz, 200))
 
-    all_stores = []
-    seen_ids = set()
+    max_workers, requests_per_second = _concurrency_settings(brand_config)
+    concurrent = max_workers > 1
+    limiter = get_rate_limiter(url, requests_per_second) if concurrent else None
+    # Opt-in: stop a center as soon as one of its pages is identical to an earlier center's page
+    skip_covered = bool((brand_config or {}).get("radius_skip_covered_centers"))
 
     print(f"   Using {len(major_cities)} center points with {radius_key}={radius}")
     if use_sfcc_start_count:
         print(f"   SFCC-style pagination: count={page_sz}, iterating start=0,{page_sz},...")
+    if concurrent:
+        print(f"   Fetching centers concurrently ({max_workers} workers)")
     print(f"   Starting multi-point radius expansion...")
 
-    for i, (city_name, city_lat, city_lng) in enumerate(major_cities, 1):
-        print(f"   [{i}/{len(major_cities)}] {city_name}...", end=" ", flush=True)
-
+    def _fetch_page(params: Dict) -> Any:
+        if limiter:
+            limiter.acquire()
+        response = client.get(
+            url.split('?')[0], params=params, timeout=15, headers=req_headers
+        )
+        response.raise_for_status()
+        return response.json()
+
+    def _scrape_center(
+        city_name: str,
+        city_lat: float,
+        city_lng: float,
+        coverage: _RadiusCoverage,
+        fetch_page: Callable[[Dict], Any],
+        pause: bool,
+    ) -> Tuple[List[Dict], int, bool]:
+        """
+        Page through one center. Returns (entities, new_id_count, covered) where covered means
+        the center stopped because a page was identical to one an earlier center returned
+        (only with radius_skip_covered_centers). pause sleeps loop_delay between pages.
+        """
         offset = 0
         start_off = 0
         page = 1
-        stores_from_city = []
+        center_entities: List[Dict] = []
+        center_new = 0
         prev_page_fp: Optional[Tuple[str, ...]] = None
         empty_full_pages = 0
 
@@ -1485,11 +1582,7 @@ def scrape_radius_expansion(
                 params['l'] = lang
 
             try:
-                response = requests.get(
-                    url.split('?')[0], params=params, timeout=15, headers=req_headers
-                )
-                response.raise_for_status()
-                data = response.json()
+                data = fetch_page(params)
 
                 if isinstance(data, list):
                     entities = data
@@ -1512,58 +1605,6 @@ def scrape_radius_expansion(
                 if not entities:
                     break
 
-                new_stores = []
-                for store in entities:
-                    if not isinstance(store, dict):
-                        continue
-
-                    profile = store.get('profile', {}) if isinstance(store.get('profile'), dict) else {}
-
-                    store_id = store.get('ID') or store.get('id')
-                    if not store_id and profile:
-                        meta = profile.get('meta', {})
-                        if isinstance(meta, dict):
-                            store_id = meta.get('id')
-
-                    if not store_id:
-                        name = store.get('name') or (profile.get('name') if profile else '')
-                        addr = ''
-                        city_val = ''
-                        if profile:
-                            addr_obj = profile.get('address', {})
-                            if isinstance(addr_obj, dict):
-                                addr = addr_obj.get('line1', '')
-                                city_val = addr_obj.get('city', '')
-                        if not addr:
-                            addr = store.get('address1', '') or store.get('address', '')
-                        if not city_val:
-                            city_val = store.get('city', city_val)
-                        name_n = str(name).lower().strip() if name else ''
-                        addr_n = str(addr).lower().strip() if addr else ''
-                        city_n = str(city_val).lower().strip() if city_val else ''
-                        if name_n and addr_n:
-                            store_id = f"{name_n}|{addr_n}|{city_n}"
-
-                    if not store_id:
-                        name = store.get('name') or (profile.get('name') if profile else '')
-                        geo_lat = store.get('latitude')
-                        geo_lng = store.get('longitude')
-                        if geo_lat is None and profile:
-                            geo = profile.get('geocodedCoordinate', {})
-                            if isinstance(geo, dict):
-                                geo_lat = geo.get('lat')
-                                geo_lng = geo.get('long')
-                        if name and geo_lat is not None and geo_lng is not None:
-                            store_id = f"{str(name).lower().strip()}|{geo_lat}|{geo_lng}"
-
-                    if store_id:
-                        if store_id not in seen_ids:
-                            seen_ids.add(store_id)
-                            new_stores.append(store)
-                    else:
-                        log_debug(f"Store without ID found: {store.get('name', 'Unknown')}", "WARN")
-                        new_stores.append(store)
-
                 page_fp = _radius_page_fingerprint(entities)
                 if prev_page_fp is not None and page_fp and page_fp == prev_page_fp:
                     log_debug(
@@ -1573,12 +1614,24 @@ def scrape_radius_expansion(
                     )
                     break
                 prev_page_fp = page_fp
+                if skip_covered and coverage.page_already_seen(page_fp):
+                    log_debug(
+                        f"{city_name} page {page} is identical to a page from an earlier center — "
+                        "results already covered; stopping this center",
+                        "DEBUG",
+                    )
+                    return center_entities, center_new, True
+
+                store_dicts = [s for s in entities if isinstance(s, dict)]
+                new_count = coverage.claim([_radius_store_id(s) for s in store_dicts])
+                center_entities.extend(store_dicts)
+                center_new += new_count
 
                 if use_sfcc_start_count:
                     full_page = len(entities) >= page_sz
                 else:
                     full_page = per is not None and len(entities) >= int(per)
-                if not new_stores:
+                if not new_count:
                     if full_page:
                         empty_full_pages += 1
                         if empty_full_pages >= 2:
@@ -1589,21 +1642,16 @@ def scrape_radius_expansion(
                             )
                             break
                     else:
-                        stores_from_city.extend(new_stores)
                         break
                 else:
                     empty_full_pages = 0
 
-                stores_from_city.extend(new_stores)
-
                 if use_sfcc_start_count:
                     total_api = None
                     if isinstance(data, dict):
                         total_api = data.get('total')
                         if total_api is None and isinstance(data.get('response'), dict):
                             total_api = data['response'].get('total')
-                    if not entities:
-                        break
                     if total_api is not None:
                         try:
                             if start_off + len(entities) >= int(total_api):
@@ -1617,13 +1665,14 @@ def scrape_radius_expansion(
                     if page > 500:
                         log_debug(f"Reached page limit (500) for {city_name}, stopping", "WARN")
                         break
-                    time.sleep(loop_delay)
+                    if pause:
+                        time.sleep(loop_delay)
                     continue
 
                 count = data.get('response', {}).get('count', len(entities)) if isinstance(data, dict) else len(entities)
                 if per is None or len(entities) < int(per):
                     break
-                if count and len(stores_from_city) >= int(count):
+                if count and center_new >= int(count):
                     break
 
                 offset += int(per)
@@ -1633,14 +1682,96 @@ def scrape_radius_expansion(
                     log_debug(f"Reached page limit (100) for {city_name}, stopping", "WARN")
                     break
 
-                time.sleep(loop_delay)
+                if pause:
+                    time.sleep(loop_delay)
             except Exception as e:
                 log_debug(f"Error fetching from {city_name}: {e}", "WARN")
                 break
-        
-        all_stores.extend(stores_from_city)
-        print(f"+{len(stores_from_city)} stores (total: {len(all_stores)})")
-    
+
+        return center_entities, center_new, False
+
+    all_stores: List[Dict] = []
+    seen_ids: Set[str] = set()
+    covered_centers = 0
+
+    def _merge(entities: List[Dict]) -> int:
+        """Append entities not yet in all_stores (center order decides which copy is kept)."""
+        added = 0
+        for store in entities:
+            store_id = _radius_store_id(store)
+            if store_id:
+                if store_id in seen_ids:
+                    continue
+                seen_ids.add(store_id)
+            else:
+                log_debug(f"Store without ID found: {store.get('name', 'Unknown')}", "WARN")
+            all_stores.append(store)
+            added += 1
+        return added
+
+    def _page_key(params: Dict) -> Tuple[Tuple[str, str], ...]:
+        return tuple(sorted((str(k), str(v)) for k, v in params.items()))
+
+    def _recording(cache: Dict) -> Callable[[Dict], Any]:
+        def fetch(params: Dict) -> Any:
+            try:
+                data = _fetch_page(params)
+            except Exception as e:
+                cache[_page_key(params)] = e
+                raise
+            cache[_page_key(params)] = data
+            return data
+        return fetch
+
+    def _replaying(cache: Dict) -> Callable[[Dict], Any]:
+        def fetch(params: Dict) -> Any:
+            key = _page_key(params)
+            if key not in cache:
+                # A page the center's own pass stopped before; fetch it now
+                return _fetch_page(params)
+            if isinstance(cache[key], Exception):
+                raise cache[key]
+            return cache[key]
+        return fetch
+
+    # Cross-center stops are decided in center order against this coverage, so results match the sequential pass
+    coverage = _RadiusCoverage()
+    total_centers = len(major_cities)
+
+    def _replay(i: int, city_name: str, city_lat: float, city_lng: float,
+                fetch_page: Callable[[Dict], Any], pause: bool) -> bool:
+        print(f"   [{i}/{total_centers}] {city_name}...", end=" ", flush=True)
+        entities, _, covered = _scrape_center(city_name, city_lat, city_lng, coverage, fetch_page, pause)
+        added = _merge(entities)
+        print(f"+{added} stores (total: {len(all_stores)})")
+        return covered
+
+    if concurrent:
+        # Centers run in windows of max_workers. Each center of a window first pages on its own
+        # against a snapshot of what earlier windows returned, so it stops where they already
+        # cover it and what it fetches never depends on which center finishes first. The window
+        # is then replayed in center order; pages the replay needs beyond a center's own pass
+        # are fetched at that point.
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            for start in range(0, total_centers, max_workers):
+                window = major_cities[start:start + max_workers]
+                caches: List[Dict] = [{} for _ in window]
+                list(executor.map(
+                    lambda job: _scrape_center(*job),
+                    [
+                        (name, lat, lng, coverage.copy(), _recording(cache), False)
+                        for (name, lat, lng), cache in zip(window, caches)
+                    ],
+                ))
+                for offset, ((name, lat, lng), cache) in enumerate(zip(window, caches)):
+                    covered = _replay(start + offset + 1, name, lat, lng, _replaying(cache), False)
+                    covered_centers += int(covered)
+    else:
+        for i, (name, lat, lng) in enumerate(major_cities, 1):
+            covered_centers += int(_replay(i, name, lat, lng, _fetch_page, True))
+
+    if covered_centers:
+        print(f"   ⏭️  {covered_centers} center(s) stopped early — results already covered by other centers")
     print(f"   ✅ Multi-point expansion complete: {len(all_stores)} unique stores")
     return all_stores
 
@@ -1652,7 +1783,7 @@ def scrape_viewport_expansion(
     brand_config: Optional[Dict] = None,
 ) -> List[Dict]:
     """Expand viewport-based API using grid scraping"""
-    from viewport_grid import scrape_viewport_api, get_region_preset
+    from viewport_grid import scrape_viewport_api, get_region_preset, DEFAULT_MIN_TILE_SIZE
 
     print(f"🗺️  Viewport API detected - expanding to {region}")
 
@@ -1689,6 +1820,21 @@ def scrape_viewport_expansion(
                 pass
 
     req_headers = _get_custom_headers(brand_config)
+    max_workers, requests_per_second = _concurrency_settings(brand_config)
+
+    # viewport_adaptive: true | {"max_results": 100, "min_tile_size": 0.25}
+    adaptive_cfg = (brand_config or {}).get("viewport_adaptive")
+    adaptive = bool(adaptive_cfg)
+    max_results_per_tile: Optional[int] = None
+    min_tile_size = DEFAULT_MIN_TILE_SIZE
+    if isinstance(adaptive_cfg, dict):
+        try:
+            if adaptive_cfg.get("max_results") is not None:
+                max_results_per_tile = max(1, int(adaptive_cfg["max_results"]))
+            if adaptive_cfg.get("min_tile_size") is not None:
+                min_tile_size = max(0.01, float(adaptive_cfg["min_tile_size"]))
+        except (TypeError, ValueError):
+            log_debug("Invalid viewport_adaptive settings — using defaults", "WARN")
 
     grid_type = "world" if region == "world" else "focused"
     focus_region = None if region == "world" else get_region_preset(region)
@@ -1703,6 +1849,12 @@ def scrape_viewport_expansion(
         delay_between_requests=DEFAULT_DELAY_BETWEEN_REQUESTS,
         focus_region=focus_region,
         request_headers=req_headers,
+        http_client=get_http_client(brand_config),
+        max_workers=max_workers,
+        requests_per_second=requests_per_second,
+        adaptive=adaptive,
+        max_results_per_tile=max_results_per_tile,
+        min_tile_size=min_tile_size,
     )
 
     return stores
@@ -1710,7 +1862,7 @@ def scrape_viewport_expansion(
 
 def scrape_country_expansion(url: str, url_params: Dict, region: str = "world", countries_dict: Dict = None, brand_config: Dict = None, use_watch_countries: bool = False) -> List[Dict]:
     """Expand country-filter API by iterating through countries, with optional pagination support"""
-    import requests
+    client = get_http_client(brand_config)
     
     # Try to load comprehensive watch store countries list
     watch_countries_file = os.path.join(os.path.dirname(__file__), "watch_store_countries.json")
@@ -1781,75 +1933,91 @@ def scrape_country_expansion(url: str, url_params: Dict, region: str = "world",
     # Check if pagination is needed (has offset or per parameter)
     has_pagination = "offset" in url_params or "per" in url_params or "per_page" in url_params
     per_page = int(url_params.get("per", url_params.get("per_page", 50)))
-    
-    all_stores = []
-    seen_ids = set()
-    
-    for i, country_code in enumerate(countries_list, 1):
+    headers = _country_expansion_request_headers(brand_config)
+    inject_country_field = (brand_config or {}).get("inject_country_field")
+
+    max_workers, requests_per_second = _concurrency_settings(brand_config)
+    concurrent = max_workers > 1
+    limiter = get_rate_limiter(url, requests_per_second) if concurrent else None
+
+    def _extract_country_stores(data: Any) -> List[Any]:
+        # Extract stores using data_path from brand_config if available
+        if brand_config and brand_config.get("data_path"):
+            current = data
+            for key in brand_config["data_path"].split("."):
+                if isinstance(current, dict):
+                    current = current.get(key)
+                else:
+                    current = None
+                    break
+            return current if isinstance(current, list) else []
+        # Fallback: try common paths
+        if isinstance(data, list):
+            return data
+        if isinstance(data, dict):
+            response_data = data.get('response', data)
+            return response_data.get('entities', []) or response_data.get('results', []) or response_data.get('data', [])
+        return []
+
+    def _fetch_country(country_code: str) -> Optional[List[Any]]:
+        """All raw stores for one country (offset pages stay sequential); None if the request failed."""
         country_name = country_names.get(country_code, country_code)
         param_value = country_id_map.get(country_code, country_code) if country_id_map else country_code
+        params = url_params.copy()
+        params[country_param] = param_value
+        if qp_param:
+            params[qp_param] = country_name
 
-        # Handle pagination for this country
-        if has_pagination:
-            offset = 0
-            country_stores = []
-            
-            while True:
-                params = url_params.copy()
-                params[country_param] = param_value
-                if qp_param:
-                    params[qp_param] = country_name
-                if "offset" in url_params:
-                    params["offset"] = str(offset)
-                
-                try:
-                    headers = _country_expansion_request_headers(brand_config)
-                    response = requests.get(url.split('?')[0], params=params, timeout=30, headers=headers)
-                    response.raise_for_status()
-                    data = response.json()
-                    
-                    # Extract stores using data_path from brand_config if available
-                    stores = []
-                    if brand_config and brand_config.get("data_path"):
-                        data_path = brand_config["data_path"].split(".")
-                        current = data
-                        for key in data_path:
-                            if isinstance(current, dict):
-                                current = current.get(key)
-                            else:
-                                current = None
-                                break
-                        if isinstance(current, list):
-                            stores = current
-                    else:
-                        # Fallback: try common paths
-                        if isinstance(data, list):
-                            stores = data
-                        elif isinstance(data, dict):
-                            response_data = data.get('response', data)
-                            stores = response_data.get('entities', []) or response_data.get('results', []) or response_data.get('data', [])
-                    
-                    if not stores:
-                        break
-                    
-                    country_stores.extend(stores)
-                    
-                    # Check if we've reached the end
-                    total_count = data.get('response', {}).get('count', 0) if isinstance(data, dict) else 0
-                    if len(stores) < per_page or (total_count > 0 and len(country_stores) >= total_count):
-                        break
-                    
-                    offset += per_page
-                    time.sleep(0.5)  # Rate limiting
-                    
-                except Exception as e:
-                    log_debug(f"Error fetching {country_code} offset {offset}: {e}", "WARN")
+        if not has_pagination:
+            # No pagination - single request per country
+            try:
+                if limiter:
+                    limiter.acquire()
+                response = client.get(url.split('?')[0], params=params, timeout=30, headers=headers)
+                response.raise_for_status()
+                return _extract_country_stores(response.json())
+            except Exception as e:
+                log_debug(f"Error fetching {country_code}: {e}", "WARN")
+                return None
+
+        offset = 0
+        country_stores: List[Any] = []
+        while True:
+            if "offset" in url_params:
+                params["offset"] = str(offset)
+            try:
+                if limiter:
+                    limiter.acquire()
+                response = client.get(url.split('?')[0], params=params, timeout=30, headers=headers)
+                response.raise_for_status()
+                data = response.json()
+                stores = _extract_country_stores(data)
+                if not stores:
                     break
-            
-            # Deduplicate stores for this country
-            inject_country_field = (brand_config or {}).get("inject_country_field")
-            new_stores = 0
-            for store in country_stores:
+
+                country_stores.extend(stores)
+
+                # Check if we've reached the end
+                total_count = data.get('response', {}).get('count', 0) if isinstance(data, dict) else 0
+                if len(stores) < per_page or (total_count > 0 and len(country_stores) >= total_count):
+                    break
+
+                offset += per_page
+                if not concurrent:
+                    time.sleep(0.5)  # Rate limiting
+            except Exception as e:
+                log_debug(f"Error fetching {country_code} offset {offset}: {e}", "WARN")
+                break
+        return country_stores
+
+    all_stores = []
+    seen_ids = set()
+
+    def _merge_country(i: int, country_code: str, country_stores: List[Any]) -> None:
+        country_name = country_names.get(country_code, country_code)
+        new_stores = 0
+        for store in country_stores:
+            if has_pagination:
                 store_id = None
                 if isinstance(store, dict):
                     if inject_country_field:
@@ -1872,68 +2040,46 @@ def scrape_country_expansion(url: str, url_params: Dict, region: str = "world",
                                 addr = addr_obj.get('line1', '')
                         if name and addr:
                             store_id = f"{name}|{addr}"
-                
-                if store_id and store_id not in seen_ids:
-                    all_stores.append(store)
-                    seen_ids.add(store_id)
-                    new_stores += 1
-            
-            if new_stores > 0:
-                print(f"  [{i}/{len(countries_list)}] {country_code}: +{new_stores} stores (total: {len(all_stores)})")
-        else:
-            # No pagination - single request per country
-            params = url_params.copy()
-            params[country_param] = param_value
-            if qp_param:
-                params[qp_param] = country_name
-            
-            try:
-                headers = _country_expansion_request_headers(brand_config)
-                response = requests.get(url.split('?')[0], params=params, timeout=30, headers=headers)
-                response.raise_for_status()
-                data = response.json()
-                
-                # Extract stores
-                stores = []
-                if brand_config and brand_config.get("data_path"):
-                    data_path = brand_config["data_path"].split(".")
-                    current = data
-                    for key in data_path:
-                        if isinstance(current, dict):
-                            current = current.get(key)
-                        else:
-                            current = None
-                            break
-                    if isinstance(current, list):
-                        stores = current
-                else:
-                    if isinstance(data, list):
-                        stores = data
-                    elif isinstance(data, dict):
-                        response_data = data.get('response', data)
-                        stores = response_data.get('entities', []) or response_data.get('results', []) or response_data.get('data', [])
-                
+                if not store_id:
+                    continue
+            else:
                 # Inject iterated country into each store record so field_mapping can read it
                 # (used by APIs that return only an internal country id, e.g. Seiko UUIDs)
-                inject_country_field = (brand_config or {}).get("inject_country_field")
-                new_stores = 0
-                for store in stores:
-                    if inject_country_field and isinstance(store, dict):
-                        store[inject_country_field] = country_name
+                if inject_country_field and isinstance(store, dict):
+                    store[inject_country_field] = country_name
+                if isinstance(store, dict):
                     store_id = store.get("id") or store.get("store_id") or str(store)
-                    if store_id not in seen_ids:
-                        all_stores.append(store)
-                        seen_ids.add(store_id)
-                        new_stores += 1
-
-                if new_stores > 0:
-                    print(f"  [{i}/{len(countries_list)}] {country_code}: +{new_stores} stores (total: {len(all_stores)})")
-
-                time.sleep(0.3)
-
-            except Exception as e:
-                log_debug(f"Error fetching {country_code}: {e}", "WARN")
+                else:
+                    store_id = str(store)
+            if store_id not in seen_ids:
+                all_stores.append(store)
+                seen_ids.add(store_id)
+                new_stores += 1
+
+        if new_stores > 0:
+            print(f"  [{i}/{len(countries_list)}] {country_code}: +{new_stores} stores (total: {len(all_stores)})")
+
+    if concurrent:
+        # Countries fan out; results are merged in list order so output (and CSV diffs) stay stable
+        print(f"   Fetching countries concurrently ({max_workers} workers)")
+        fetched: List[Optional[List[Any]]] = [None] * len(countries_list)
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            futures = {executor.submit(_fetch_country, code): idx for idx, code in enumerate(countries_list)}
+            for done, future in enumerate(as_completed(futures), 1):
+                fetched[futures[future]] = future.result()
+                if done % 10 == 0 or done == len(countries_list):
+                    print(f"   … {done}/{len(countries_list)} countries fetched")
+        for i, (country_code, country_stores) in enumerate(zip(countries_list, fetched), 1):
+            if country_stores is not None:
+                _merge_country(i, country_code, country_stores)
+    else:
+        for i, country_code in enumerate(countries_list, 1):
+            country_stores = _fetch_country(country_code)
+            if country_stores is None:
                 continue
+            _merge_country(i, country_code, country_stores)
+            if not has_pagination:
+                time.sleep(0.3)
 
     return all_stores
 
@@ -2019,31 +2165,47 @@ def scrape_geohash_prefix_expansion(base_url: str, brand_config: Optional[Dict]
 
     Strategy:
     1. Fetch root once to read the expected total.
-    2. Enumerate all prefixes of ``prefix_length`` (default 2) over the standard
-       geohash alphabet (32 chars).
-    3. GET ``{base_url}/{prefix}``, extract ``items`` (or configured data_path).
-    4. Dedupe by ``id`` and ``key`` fields.
-    5. Warn if final count does not match root total.
+    2. Enumerate all prefixes of ``start_length`` (default ``prefix_length``, 2)
+       over the standard geohash alphabet (32 chars).
+    3. GET ``{base_url}/{prefix}``, extract ``items`` (or configured data_path),
+       level by level (in parallel when brand ``concurrency`` > 1).
+    4. Empty buckets are never refined. Non-empty buckets shorter than
+       ``prefix_length`` are refined (unless ``max_items`` proves them complete),
+       and buckets whose item count hits the API cap (``max_items``, or inferred
+       from repeated maximum counts) are refined up to ``max_prefix_length``.
+    5. Dedupe by ``id`` and ``key`` fields.
+    6. If the result is still short of the root total, refine the buckets at or
+       near the cap (the largest first-pass bucket size when no cap is known)
+       again. Stops when a round adds no new stores, after ``refine_rounds``
+       rounds (default 3) or once ``refine_max_requests`` extra requests
+       (default 2000) would be exceeded, then warns.
     """
-    import requests
     import itertools
 
     cfg = brand_config.get("geohash_prefix_expansion", {}) if brand_config else {}
     prefix_length: int = int(cfg.get("prefix_length", 2))
+    start_length: int = max(1, min(int(cfg.get("start_length", prefix_length)), prefix_length))
+    max_prefix_length: int = max(prefix_length, int(cfg.get("max_prefix_length", prefix_length + 3)))
+    max_items: Optional[int] = int(cfg["max_items"]) if cfg.get("max_items") else None
     alphabet: str = cfg.get("alphabet", "0123456789bcdefghjkmnpqrstuvwxyz")
     items_key: str = cfg.get("items_key", "items")
     delay: float = float(cfg.get("delay", 0.15))
+    refine_rounds: int = max(0, int(cfg.get("refine_rounds", GEOHASH_REFINE_ROUNDS)))
+    refine_max_requests: int = max(0, int(cfg.get("refine_max_requests", GEOHASH_REFINE_MAX_REQUESTS)))
 
     base_url = base_url.rstrip("/")
     custom_headers = _get_custom_headers(brand_config)
     request_headers = {"User-Agent": "Mozilla/5.0"}
     if custom_headers:
         request_headers.update(custom_headers)
+    client = get_http_client(brand_config)
+    max_workers, requests_per_second = _concurrency_settings(brand_config)
+    limiter = get_rate_limiter(base_url, requests_per_second) if max_workers > 1 else None
 
     # Fetch root once to get the expected total for validation
     root_total: Optional[int] = None
     try:
-        resp = requests.get(base_url, headers=request_headers, timeout=15)
+        resp = client.get(base_url, headers=request_headers, timeout=15)
         resp.raise_for_status()
         root_data = resp.json()
         if isinstance(root_data, dict):
@@ -2055,17 +2217,20 @@ def scrape_geohash_prefix_expansion(base_url: str, brand_config: Optional[Dict]
     except Exception as e:
         log_debug(f"Could not fetch root for total count: {e}", "WARN")
 
-    total_prefixes = len(alphabet) ** prefix_length
-    print(f"   Fetching {total_prefixes} prefix buckets (length={prefix_length})…")
-
-    seen: dict = {}  # keyed by unique store id to dedupe
-    errors = 0
+    def _fetch_bucket(prefix: str) -> Optional[List[Dict]]:
+        """Items in one prefix bucket, or None if the request failed."""
+        try:
+            if limiter:
+                limiter.acquire()
+            resp = client.get(f"{base_url}/{prefix}", headers=request_headers, timeout=15)
+        except Exception as e:
+            resp = e
+        return _bucket_items(prefix, resp)
 
-    for chars in itertools.product(alphabet, repeat=prefix_length):
-        prefix = "".join(chars)
-        url = f"{base_url}/{prefix}"
+    def _bucket_items(prefix: str, resp: Any) -> Optional[List[Dict]]:
         try:
-            resp = requests.get(url, headers=request_headers, timeout=15)
+            if isinstance(resp, Exception):
+                raise resp
             resp.raise_for_status()
             data = resp.json()
             items = []
@@ -2073,32 +2238,113 @@ def scrape_geohash_prefix_expansion(base_url: str, brand_config: Optional[Dict]
                 items = data.get(items_key, [])
             elif isinstance(data, list):
                 items = data
-            for store in items:
-                if not isinstance(store, dict):
-                    continue
-                uid = store.get("id") or store.get("key") or store.get("ID")
-                key = str(uid) if uid is not None else f"{store.get('latitude','')},{store.get('longitude','')},{store.get('name','')}"
-                if key not in seen:
-                    seen[key] = store
-            time.sleep(delay)
+            return [store for store in items if isinstance(store, dict)]
         except Exception as e:
             log_debug(f"Geohash prefix error for {prefix}: {e}", "WARN")
-            errors += 1
-            continue
+            return None
+
+    def _fetch_buckets(prefixes: List[str]) -> List[Optional[List[Dict]]]:
+        if max_workers <= 1:
+            results = []
+            for prefix in prefixes:
+                results.append(_fetch_bucket(prefix))
+                time.sleep(delay)
+            return results
+        if getattr(client, "is_async", False):
+            # One batch of coroutines on the client's event loop instead of blocking worker threads
+            calls = [("GET", f"{base_url}/{prefix}", {"headers": request_headers, "timeout": 15}) for prefix in prefixes]
+            responses = client.request_many(calls, limiter=limiter)
+            return [_bucket_items(prefix, resp) for prefix, resp in zip(prefixes, responses)]
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            return list(executor.map(_fetch_bucket, prefixes))
+
+    seen: dict = {}  # keyed by unique store id to dedupe
+    leaves: Dict[str, int] = {}  # non-empty buckets that were not refined -> item count
+    stats = {"requests": 0, "errors": 0, "empty": 0, "refined": 0}
+    cap: List[Optional[int]] = [max_items]
+
+    def _run_levels(level: List[str]) -> None:
+        """Fetch prefixes breadth-first, refining incomplete buckets into longer prefixes."""
+        while level:
+            print(f"   Fetching {len(level)} prefix buckets (length={len(level[0])})…")
+            results = _fetch_buckets(level)
+            stats["requests"] += len(level)
+            if cap[0] is None:
+                cap[0] = infer_result_cap([len(items) for items in results if items])
+                if cap[0]:
+                    log_debug(f"Inferred per-bucket item cap: {cap[0]}", "DEBUG")
+            next_level: List[str] = []
+            for prefix, items in zip(level, results):
+                if items is None:
+                    stats["errors"] += 1
+                    continue
+                if not items:
+                    stats["empty"] += 1
+                    continue
+                for store in items:
+                    uid = store.get("id") or store.get("key") or store.get("ID")
+                    key = str(uid) if uid is not None else f"{store.get('latitude','')},{store.get('longitude','')},{store.get('name','')}"
+                    if key not in seen:
+                        seen[key] = store
+                saturated = cap[0] is not None and len(items) >= cap[0]
+                below_floor = len(prefix) < prefix_length and not (max_items and len(items) < max_items)
+                if (saturated or below_floor) and len(prefix) < max_prefix_length:
+                    next_level.extend(prefix + c for c in alphabet)
+                    stats["refined"] += 1
+                else:
+                    if saturated:
+                        log_debug(f"Bucket {prefix} still saturated at max_prefix_length ({len(items)} items)", "WARN")
+                    leaves[prefix] = len(items)
+            level = next_level
+
+    _run_levels(["".join(chars) for chars in itertools.product(alphabet, repeat=start_length)])
+
+    # Validate against the root total: if stores are missing, buckets at or near the cap are the
+    # likeliest truncated ones, so refine them. The threshold is fixed up front (never drifts down
+    # to small buckets), and the loop stops when a round finds nothing new or the budget runs out:
+    # a root total that can't be reached (hidden rows, stores without coordinates) must not
+    # split every leaf down to max_prefix_length.
+    near_cap = cap[0] or max(leaves.values(), default=0)
+    threshold = max(1, int(near_cap * GEOHASH_NEAR_CAP_RATIO))
+    first_pass_requests = stats["requests"]
+    for _ in range(refine_rounds):
+        if not (root_total and len(seen) < root_total and max_items is None):
+            break
+        retry = sorted(
+            (p for p, n in leaves.items() if n >= threshold and len(p) < max_prefix_length),
+            key=lambda p: (-leaves[p], p),
+        )
+        # Count every request made while refining, including saturated sub-buckets split further
+        retry = retry[:(refine_max_requests - (stats["requests"] - first_pass_requests)) // len(alphabet)]
+        if not retry:
+            break
+        print(f"   ⚠️  {root_total - len(seen)} stores missing — refining {len(retry)} bucket(s) with ≥{threshold} items")
+        for prefix in retry:
+            del leaves[prefix]
+        stats["refined"] += len(retry)
+        before = len(seen)
+        _run_levels([prefix + c for prefix in retry for c in alphabet])
+        if len(seen) == before:
+            log_debug("Refinement round found no new stores — stopping", "WARN")
+            break
 
     all_stores = list(seen.values())
-    log_debug(f"Geohash expansion complete | {len(all_stores)} unique stores | {errors} errors", "SUCCESS")
-    print(f"   ✅ {len(all_stores)} unique stores collected across {total_prefixes} buckets")
+    log_debug(
+        f"Geohash expansion complete | {len(all_stores)} unique stores | {stats['requests']} requests | "
+        f"{stats['refined']} refined | {stats['empty']} empty | {stats['errors']} errors",
+        "SUCCESS",
+    )
+    print(f"   ✅ {len(all_stores)} unique stores collected across {stats['requests']} buckets")
 
     if root_total and len(all_stores) != root_total:
         diff = root_total - len(all_stores)
         if diff > 0:
             log_debug(
                 f"Store count mismatch: got {len(all_stores)}, expected {root_total} ({diff} missing). "
-                "Consider increasing prefix_length if buckets are being truncated.",
+                "Consider raising max_prefix_length or setting max_items if buckets are being truncated.",
                 "WARN",
             )
-            print(f"   ⚠️  {diff} stores may be missing — root total is {root_total}. Consider prefix_length=3 if counts diverge.")
+            print(f"   ⚠️  {diff} stores may be missing — root total is {root_total}.")
         else:
             log_debug(f"Store count {len(all_stores)} slightly exceeds root total {root_total} (dupes removed from overlapping buckets)", "DEBUG")
 
@@ -2124,7 +2370,6 @@ def scrape_post_per_country(base_url: str, brand_config: Optional[Dict] = None)
       - ``stop_on_empty`` (bool, default False): if True, stop after N
         consecutive empty country responses (currently unused, reserved).
     """
-    import requests
     import copy
 
     cfg = brand_config.get("post_per_country", {}) if brand_config else {}
@@ -2154,6 +2399,7 @@ def scrape_post_per_country(base_url: str, brand_config: Optional[Dict] = None)
     }
     if custom_headers:
         request_headers.update(custom_headers)
+    client = get_http_client(brand_config)
 
     def _interpolate(obj, country_code):
         if isinstance(obj, dict):
@@ -2186,39 +2432,66 @@ def scrape_post_per_country(base_url: str, brand_config: Optional[Dict] = None)
                     return v
         return []
 
-    print(f"🌍 POST-per-country expansion — {len(countries)} countries")
-    seen: dict = {}
-    errors = 0
+    max_workers, requests_per_second = _concurrency_settings(brand_config)
+    concurrent = max_workers > 1
+    limiter = get_rate_limiter(base_url, requests_per_second) if concurrent else None
 
-    for i, country_code in enumerate(countries, 1):
+    def _post_country(country_code: str) -> Optional[List[Any]]:
         body = _interpolate(copy.deepcopy(body_template), country_code)
         try:
-            resp = requests.post(base_url, headers=request_headers, json=body, timeout=20)
+            if limiter:
+                limiter.acquire()
+            resp = client.post(base_url, headers=request_headers, json=body, timeout=20)
             resp.raise_for_status()
-            data = resp.json()
-            items = _extract_items(data)
-            new_count = 0
-            for store in items:
-                if not isinstance(store, dict):
-                    continue
-                uid = (
-                    store.get("id")
-                    or store.get("ID")
-                    or store.get("seller_code")
-                    or store.get("code")
-                    or f"{store.get('name','')}|{country_code}|{json.dumps(store.get('address',''), sort_keys=True, default=str)[:80]}"
-                )
-                key = str(uid)
-                if key not in seen:
-                    seen[key] = store
-                    new_count += 1
-            if i % 10 == 0 or new_count > 0:
-                print(f"   [{i}/{len(countries)}] {country_code}: +{new_count} (total {len(seen)})")
-            time.sleep(delay)
+            return _extract_items(resp.json())
         except Exception as e:
             log_debug(f"POST-per-country error for {country_code}: {e}", "WARN")
-            errors += 1
-            continue
+            return None
+
+    print(f"🌍 POST-per-country expansion — {len(countries)} countries")
+    seen: dict = {}
+    errors = 0
+
+    def _merge_items(i: int, country_code: str, items: List[Any]) -> None:
+        new_count = 0
+        for store in items:
+            if not isinstance(store, dict):
+                continue
+            uid = (
+                store.get("id")
+                or store.get("ID")
+                or store.get("seller_code")
+                or store.get("code")
+                or f"{store.get('name','')}|{country_code}|{json.dumps(store.get('address',''), sort_keys=True, default=str)[:80]}"
+            )
+            key = str(uid)
+            if key not in seen:
+                seen[key] = store
+                new_count += 1
+        if i % 10 == 0 or new_count > 0:
+            print(f"   [{i}/{len(countries)}] {country_code}: +{new_count} (total {len(seen)})")
+
+    if concurrent:
+        # Fan out the POSTs, then merge in country order so the output order is deterministic
+        print(f"   Posting concurrently ({max_workers} workers)")
+        fetched: List[Optional[List[Any]]] = [None] * len(countries)
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            futures = {executor.submit(_post_country, code): idx for idx, code in enumerate(countries)}
+            for future in as_completed(futures):
+                fetched[futures[future]] = future.result()
+        for i, (country_code, items) in enumerate(zip(countries, fetched), 1):
+            if items is None:
+                errors += 1
+                continue
+            _merge_items(i, country_code, items)
+    else:
+        for i, country_code in enumerate(countries, 1):
+            items = _post_country(country_code)
+            if items is None:
+                errors += 1
+                continue
+            _merge_items(i, country_code, items)
+            time.sleep(delay)
 
     all_stores = list(seen.values())
     log_debug(f"POST-per-country complete | {len(all_stores)} unique stores | {errors} errors", "SUCCESS")
@@ -2403,7 +2676,8 @@ def scrape_stores_by_api_country_catalog(brand_config: Dict) -> List[Dict]:
         except (TypeError, ValueError):
             delay = 0.3
 
-    raw = fetch_data(countries_url, headers=custom_headers)
+    client = get_http_client(brand_config)
+    raw = fetch_data(countries_url, headers=custom_headers, client=client)
     if not isinstance(raw, dict):
         raise ValueError(
             f"Country catalog response must be a JSON object, got {type(raw).__name__}"
@@ -2436,46 +2710,75 @@ def scrape_stores_by_api_country_catalog(brand_config: Dict) -> List[Dict]:
 
     seen_ids: set = set()
     all_stores: List[Dict] = []
+    max_workers, requests_per_second = _concurrency_settings(brand_config)
+    concurrent = max_workers > 1
+    limiter = get_rate_limiter(template, requests_per_second) if concurrent else None
 
-    print(
-        f"🌐 API country catalog: {len(pairs)} countries — fetching stores per country"
-    )
-    for i, (cid, cname) in enumerate(pairs):
-        page_url = template.format(country_id=cid)
+    def _catalog_country_stores(cid: str, data: Any) -> Optional[List[Any]]:
         try:
-            data = fetch_data(page_url, headers=custom_headers)
-            stores = _extract_stores_from_json_for_brand(data, brand_config)
-            new_count = 0
-            for store in stores:
-                if inject_key and isinstance(store, dict) and cname:
-                    store[inject_key] = cname
-                sid = None
-                if isinstance(store, dict):
-                    sid = store.get("ID") or store.get("id") or store.get("storeID")
-                    if not sid and isinstance(store.get("profile"), dict):
-                        meta = store["profile"].get("meta") or {}
-                        if isinstance(meta, dict):
-                            sid = meta.get("id")
-                    if sid is None:
-                        sid = store.get("identifier")
-                key = str(sid) if sid is not None else None
-                if key and key in seen_ids:
-                    continue
-                if key:
-                    seen_ids.add(key)
-                all_stores.append(store)
-                new_count += 1
-            label = cname or cid
-            print(
-                f"  Country {i + 1}/{len(pairs)} ({label}): +{new_count} stores "
-                f"(total: {len(all_stores)})"
-            )
+            if isinstance(data, Exception):
+                raise data
+            return _extract_stores_from_json_for_brand(data, brand_config)
         except Exception as e:
             log_debug(
                 f"stores_by_api_countries error for country {cid}: {e}",
                 "WARN",
             )
-        time.sleep(delay)
+            return None
+
+    def _fetch_catalog_country(cid: str) -> Optional[List[Any]]:
+        try:
+            data = fetch_data(template.format(country_id=cid), headers=custom_headers, client=client)
+        except Exception as e:
+            data = e
+        return _catalog_country_stores(cid, data)
+
+    def _merge_catalog_country(i: int, cid: str, cname: str, stores: List[Any]) -> None:
+        new_count = 0
+        for store in stores:
+            if inject_key and isinstance(store, dict) and cname:
+                store[inject_key] = cname
+            sid = None
+            if isinstance(store, dict):
+                sid = store.get("ID") or store.get("id") or store.get("storeID")
+                if not sid and isinstance(store.get("profile"), dict):
+                    meta = store["profile"].get("meta") or {}
+                    if isinstance(meta, dict):
+                        sid = meta.get("id")
+                if sid is None:
+                    sid = store.get("identifier")
+            key = str(sid) if sid is not None else None
+            if key and key in seen_ids:
+                continue
+            if key:
+                seen_ids.add(key)
+            all_stores.append(store)
+            new_count += 1
+        label = cname or cid
+        print(
+            f"  Country {i + 1}/{len(pairs)} ({label}): +{new_count} stores "
+            f"(total: {len(all_stores)})"
+        )
+
+    print(
+        f"🌐 API country catalog: {len(pairs)} countries — fetching stores per country"
+    )
+    if concurrent:
+        # Same merge order as the sequential path, so dedup keeps the same first occurrence
+        fetched = fetch_data_many(
+            [template.format(country_id=cid) for cid, _ in pairs],
+            headers=custom_headers, client=client, max_workers=max_workers, limiter=limiter,
+        )
+        for i, ((cid, cname), data) in enumerate(zip(pairs, fetched)):
+            stores = _catalog_country_stores(cid, data)
+            if stores is not None:
+                _merge_catalog_country(i, cid, cname, stores)
+    else:
+        for i, (cid, cname) in enumerate(pairs):
+            stores = _fetch_catalog_country(cid)
+            if stores is not None:
+                _merge_catalog_country(i, cid, cname, stores)
+            time.sleep(delay)
 
     return all_stores
 
@@ -2489,6 +2792,7 @@ def scrape_pagination_fetch_urls(
     omits reliable total counts.
     """
     custom_headers = _get_custom_headers(brand_config)
+    client = get_http_client(brand_config)
     seen_ids: set = set()
     all_stores: List[Dict] = []
     delay = 0.3
@@ -2498,39 +2802,77 @@ def scrape_pagination_fetch_urls(
         except (TypeError, ValueError):
             delay = 0.3
 
-    for i, page_url in enumerate(urls):
-        page_url = (page_url or "").strip()
-        if not page_url:
-            continue
+    max_workers, requests_per_second = _concurrency_settings(brand_config)
+    concurrent = max_workers > 1
+    urls = [(page_url or "").strip() for page_url in urls]
+    limiter = get_rate_limiter(next((u for u in urls if u), ""), requests_per_second) if concurrent else None
+
+    def _page_stores(page_url: str, data: Any) -> Optional[List[Any]]:
         try:
-            data = fetch_data(page_url, headers=custom_headers)
-            stores = _extract_stores_from_json_for_brand(data, brand_config)
-            new_count = 0
-            for store in stores:
-                sid = None
-                if isinstance(store, dict):
-                    sid = store.get("ID") or store.get("id") or store.get("storeID")
-                    if not sid and isinstance(store.get("profile"), dict):
-                        meta = store["profile"].get("meta") or {}
-                        if isinstance(meta, dict):
-                            sid = meta.get("id")
-                key = str(sid) if sid is not None else None
-                if key and key in seen_ids:
-                    continue
-                if key:
-                    seen_ids.add(key)
-                all_stores.append(store)
-                new_count += 1
-            print(f"  URL {i + 1}/{len(urls)}: +{new_count} stores (total: {len(all_stores)})")
+            if isinstance(data, Exception):
+                raise data
+            return _extract_stores_from_json_for_brand(data, brand_config)
         except Exception as e:
             log_debug(f"pagination_fetch_urls error for {page_url[:80]}: {e}", "WARN")
+            return None
+
+    def _fetch_page(page_url: str) -> Optional[List[Any]]:
+        try:
+            data = fetch_data(page_url, headers=custom_headers, client=client)
+        except Exception as e:
+            data = e
+        return _page_stores(page_url, data)
+
+    def _merge_page(i: int, stores: List[Any]) -> None:
+        new_count = 0
+        for store in stores:
+            sid = None
+            if isinstance(store, dict):
+                sid = store.get("ID") or store.get("id") or store.get("storeID")
+                if not sid and isinstance(store.get("profile"), dict):
+                    meta = store["profile"].get("meta") or {}
+                    if isinstance(meta, dict):
+                        sid = meta.get("id")
+            key = str(sid) if sid is not None else None
+            if key and key in seen_ids:
+                continue
+            if key:
+                seen_ids.add(key)
+            all_stores.append(store)
+            new_count += 1
+        print(f"  URL {i + 1}/{len(urls)}: +{new_count} stores (total: {len(all_stores)})")
+
+    if concurrent:
+        indexed = [(i, page_url) for i, page_url in enumerate(urls) if page_url]
+        fetched = fetch_data_many(
+            [page_url for _, page_url in indexed],
+            headers=custom_headers, client=client, max_workers=max_workers, limiter=limiter,
+        )
+        for (i, page_url), data in zip(indexed, fetched):
+            stores = _page_stores(page_url, data)
+            if stores is not None:
+                _merge_page(i, stores)
+        return all_stores
+
+    for i, page_url in enumerate(urls):
+        if not page_url:
+            continue
+        stores = _fetch_page(page_url)
+        if stores is not None:
+            _merge_page(i, stores)
         time.sleep(delay)
     return all_stores
 
 
-def scrape_paginated(url: str, url_params: Dict, is_token_based: bool = False, custom_headers: Optional[Dict] = None) -> List[Dict]:
+def scrape_paginated(
+    url: str,
+    url_params: Dict,
+    is_token_based: bool = False,
+    custom_headers: Optional[Dict] = None,
+    brand_config: Optional[Dict] = None,
+) -> List[Dict]:
     """Expand paginated API by following all pages (supports both page numbers, tokens, and offset)"""
-    import requests
+    client = get_http_client(brand_config)
     
     print("📄 Pagination detected - following pages")
     
@@ -2607,7 +2949,7 @@ def scrape_paginated(url: str, url_params: Dict, is_token_based: bool = False, c
                 del params[offset_param]
         
         try:
-            response = requests.get(url.split('?')[0], params=params, timeout=15, headers=request_headers)
+            response = client.get(url.split('?')[0], params=params, timeout=15, headers=request_headers)
             response.raise_for_status()
             data = response.json()
             
@@ -2740,6 +3082,7 @@ def universal_scrape(
     brand_config: Optional[Dict] = None,
     compare_techniques: bool = False,
     dry_run: bool = False,
+    engine: Optional[str] = None,
 ) -> Dict[str, Any]:
     """
     Universal scraper - auto-detects and handles everything
@@ -2751,12 +3094,16 @@ def universal_scrape(
         force_type: Force specific type (viewport, country, pagination, single)
         validate_output: Validate output CSV
         dry_run: If True, skip geocoding, keep rows without coordinates, and skip CSV validation
+        engine: "sync" (default) or "async"; overrides brand config ``engine``. The async engine
+            runs requests as coroutines with per-host concurrency limits (see async_http)
     
     Returns:
         Dict with results
     """
     if dry_run:
         validate_output = False
+    if engine:
+        brand_config = {**(brand_config or {}), "engine": engine}
 
     results = {
         "success": False,
@@ -2777,6 +3124,8 @@ def universal_scrape(
     print()
     log_debug(f"Starting scraper | URL: {url[:100]}", "INFO")
     log_debug(f"Region: {region} | Force type: {force_type or 'auto-detect'}", "INFO")
+    if http_engine(brand_config) == "async":
+        log_debug("HTTP engine: async (per-host concurrency limits)", "INFO")
     
     # Step 1: Fetch sample and detect
     print("🔍 Analyzing endpoint...")
@@ -2794,7 +3143,7 @@ def universal_scrape(
     else:
         try:
             log_debug("Fetching sample data for detection...", "DEBUG")
-            sample_data = fetch_data(url, headers=initial_headers)
+            sample_data = fetch_data(url, headers=initial_headers, client=get_http_client(brand_config))
             log_debug(f"Sample data retrieved successfully", "SUCCESS")
         except Exception as e:
             log_debug(f"Failed to fetch sample data: {e}", "ERROR")
@@ -2953,7 +3302,13 @@ def universal_scrape(
                     log_debug("Token-based pagination detected (using pageToken)", "DEBUG")
                 
                 custom_headers = _get_custom_headers(brand_config)
-                stores = scrape_paginated(url, url_params, is_token_based=is_token_based, custom_headers=custom_headers)
+                stores = scrape_paginated(
+                    url,
+                    url_params,
+                    is_token_based=is_token_based,
+                    custom_headers=custom_headers,
+                    brand_config=brand_config,
+                )
                 results["expansion_used"] = True
         
         elif detected_type == "viewport":
@@ -3083,14 +3438,22 @@ def universal_scrape(
     if brand_config and brand_config.get("url_base"):
         field_mapping["_url_base"] = brand_config["url_base"]
     
+    normalize_timings: Dict[str, float] = {}
+    try:
+        normalize_workers = int((brand_config or {}).get("normalize_workers", 1))
+    except (TypeError, ValueError):
+        normalize_workers = 1
     normalized, excluded_stores = batch_normalize(
         stores,
         field_mapping,
         geocode_missing=not dry_run,
         allow_missing_coordinates=dry_run,
+        stage_timings=normalize_timings,
+        workers=normalize_workers,
     )
     results["stores_normalized"] = len(normalized)
     results["excluded_stores"] = excluded_stores
+    results["normalize_timings"] = normalize_timings
     norm_time = time.time() - norm_start
     
     # Calculate how many were filtered out
@@ -3103,31 +3466,8 @@ def universal_scrape(
         log_debug(f"Filter reason: Missing required fields (name, address, coordinates)", "DEBUG")
     print()
     
-    # Step 4: Write CSV
-    print(f"💾 Writing to {output_file}...")
-    log_debug("PHASE 4: CSV Export", "INFO")
-    print(f"   Creating CSV file with {len(normalized)} records...")
-    log_debug(f"Output file: {output_file}", "DEBUG")
-    
-    os.makedirs(os.path.dirname(output_file) if os.path.dirname(output_file) else ".", exist_ok=True)
-    write_start = time.time()
-    write_normalized_csv(normalized, output_file)
-    write_time = time.time() - write_start
-
-    # Write dropped records to companion JSON file (for admin UI)
-    dropped_file = output_file.rsplit(".csv", 1)[0] + "_dropped.json"
-    if excluded_stores:
-        with open(dropped_file, "w", encoding="utf-8") as f:
-            json.dump({"excluded_stores": excluded_stores, "count": len(excluded_stores)}, f, indent=2)
-    elif os.path.exists(dropped_file):
-        os.remove(dropped_file)  # Remove stale dropped file from previous run
-    
-    file_size = os.path.getsize(output_file) / 1024  # KB
-    log_debug(f"CSV export complete | Size: {file_size:.1f} KB | Time: {write_time:.2f}s", "SUCCESS")
-    print(f"   ✅ Saved {len(normalized)} records ({file_size:.1f} KB)")
-    print()
-    
-    # Step 5: Validate and Auto-Fix Data Quality Issues
+    # Step 4: Validate and auto-fix in memory, so the CSV is written exactly once
+    export_rows = normalized
     if validate_output:
         print("📋 Validating and fixing data quality issues...")
         try:
@@ -3139,23 +3479,15 @@ def universal_scrape(
                 show_bad=False
             )
             
-            # Auto-fix data quality issues (backslashes, control characters, etc.)
-            exit_code = validator.validate_file(output_file, auto_fix=True)
-            
-            # Remove duplicates if any were found
-            duplicates_removed = validator.remove_duplicates_from_file(output_file)
+            # One pass: auto-fix (backslashes, control characters, etc.), drop duplicates,
+            # and validate the fixed rows exactly as they will be written
+            exit_code, validated_rows = validator.validate_rows(normalized, SCHEMA, auto_fix=True)
+            if exit_code == EXIT_OK:
+                export_rows = validated_rows
+            duplicates_removed = validator.duplicates_removed
             if duplicates_removed > 0:
                 print(f"   🔧 Removed {duplicates_removed} duplicate row(s)")
             
-            # Re-validate after fixes
-            validator = CSVValidator(
-                required_headers=DEFAULT_REQUIRED,
-                warn_duplicates=True,
-                fail_duplicates=False,
-                show_bad=False
-            )
-            exit_code = validator.validate_file(output_file, auto_fix=False)
-            
             results["validation_performed"] = True
             results["validation_passed"] = len(validator.errors) == 0
             results["validation_warnings"] = len(validator.warnings)
@@ -3204,6 +3536,31 @@ def universal_scrape(
     else:
         results["validation_performed"] = False
     
+    # Step 5: Write CSV
+    print(f"💾 Writing to {output_file}...")
+    log_debug("PHASE 5: CSV Export", "INFO")
+    print(f"   Creating CSV file with {len(export_rows)} records...")
+    log_debug(f"Output file: {output_file}", "DEBUG")
+    
+    os.makedirs(os.path.dirname(output_file) if os.path.dirname(output_file) else ".", exist_ok=True)
+    write_start = time.time()
+    write_normalized_csv(export_rows, output_file)
+    write_time = time.time() - write_start
+
+    # Write dropped records to companion JSON file (for admin UI)
+    dropped_file = output_file.rsplit(".csv", 1)[0] + "_dropped.json"
+    if excluded_stores:
+        with open(dropped_file, "w", encoding="utf-8") as f:
+            json.dump({"excluded_stores": excluded_stores, "count": len(excluded_stores)}, f, indent=2)
+    elif os.path.exists(dropped_file):
+        os.remove(dropped_file)  # Remove stale dropped file from previous run
+    
+    file_size = os.path.getsize(output_file) / 1024  # KB
+    log_debug(f"CSV export complete | Size: {file_size:.1f} KB | Time: {write_time:.2f}s", "SUCCESS")
+    print(f"   ✅ Saved {len(export_rows)} records ({file_size:.1f} KB)")
+    print()
+    
+    
     results["success"] = True
     
     # Collect data-quality warnings from normalized output
@@ -3274,6 +3631,8 @@ Auto-detects everything and uses the right strategy!
                         help='Run multiple extraction techniques and compare data quality (HTML pages only)')
     parser.add_argument('--dry-run', action='store_true',
                         help='No geocoding; keep rows without lat/lon; skip validation (address/text QA)')
+    parser.add_argument('--engine', choices=['sync', 'async'],
+                        help='HTTP engine (default: brand config "engine", else sync). async needs aiohttp or httpx')
     args = parser.parse_args()
     
     # Parse brand config if provided
@@ -3317,7 +3676,9 @@ Auto-detects everything and uses the right strategy!
         brand_config=brand_config,
         compare_techniques=args.compare_techniques,
         dry_run=args.dry_run,
+        engine=args.engine,
     )
+    close_http_clients()
     
     # Summary
     print("=" * 80)
@@ -6,7 +6,8 @@ Validates CSV files for header correctness and row-level data quality.
 Two entry points:
   - validate_csv(path): Lightweight boolean check for programmatic use. Returns True/False.
   - CSVValidator: Full validation with auto-fix, duplicate detection, and detailed reports.
-    Use validate_file() for file validation, or --check-urls for HTTP URL verification.
+    Use validate_file() for file validation, validate_rows() for in-memory rows before export,
+    or --check-urls for HTTP URL verification.
 
 Can be used as:
   1. CLI tool: python validate_csv.py locations.csv
@@ -21,11 +22,22 @@ import argparse
 import os
 import re
 from pathlib import Path
-from typing import List, Dict, Tuple, Set, Any, Optional
+from typing import Callable, List, Dict, Iterable, Tuple, Set, Any, Optional
 from collections import defaultdict
+from contextlib import nullcontext
 
 from scraper_utils import resolve_partial_url
 from country_normalize import normalize_country
+from dedup_utils import build_keys, dedupe, id_key
+from coordinate_utils import (
+    SUSPECT_SWAPPED,
+    SUSPECT_ZERO_ISLAND,
+    COORDINATE_DECIMALS,
+    CoordinateCheck,
+    check_coordinate_pair,
+    coordinate_decimals,
+    validate_coordinate_columns,
+)
 from urllib.parse import urlparse
 
 # Handle Windows console encoding
@@ -113,7 +125,14 @@ def fix_common_url_scheme_issues(url_str: str) -> str:
 
 # Warnings
 MAX_ROWS_WARNING = 10000
-COORDINATE_PRECISION_WARNING = 7
+COORDINATE_PRECISION_WARNING = COORDINATE_DECIMALS
+# Rows whose coordinates are checked together as one column pair while streaming; small enough
+# that the buffered rows stay a fraction of the streaming pass's memory
+COORDINATE_BATCH_ROWS = 512
+
+
+def _duplicate_key(row: Dict[str, str]) -> Tuple[str, ...]:
+    return tuple((row.get(field) or "").strip() for field in DEFAULT_DUPLICATE_KEY)
 
 
 class ValidationError:
@@ -178,6 +197,8 @@ class CSVValidator:
         self.rows_checked = 0
         self.file_path = ""
         self.fixes_applied = 0
+        self.duplicates_removed = 0
+        self._file_warnings_at = 0
 
     def validate_headers(self, fieldnames: List[str]) -> bool:
         """Validate CSV headers. Returns True if valid, False otherwise."""
@@ -240,15 +261,16 @@ class CSVValidator:
 
     def check_coordinate_precision(self, value: float, field: str, row_num: int):
         """Warn if coordinate has too many decimal places"""
-        str_value = str(value)
-        if '.' in str_value:
-            decimals = len(str_value.split('.')[1])
-            if decimals > COORDINATE_PRECISION_WARNING:
-                self.warnings.append(ValidationWarning(
-                    "precision",
-                    f"Row {row_num}: {field} has {decimals} decimal places (>{COORDINATE_PRECISION_WARNING})",
-                    {"row": row_num, "field": field, "decimals": decimals}
-                ))
+        decimals = coordinate_decimals(value)
+        if decimals > COORDINATE_PRECISION_WARNING:
+            self._warn_precision(field, decimals, row_num)
+
+    def _warn_precision(self, field: str, decimals: int, row_num: int):
+        self.warnings.append(ValidationWarning(
+            "precision",
+            f"Row {row_num}: {field} has {decimals} decimal places (>{COORDINATE_PRECISION_WARNING})",
+            {"row": row_num, "field": field, "decimals": decimals}
+        ))
 
     def validate_url(self, value: str, field: str, row_num: int, check_http: bool = False,
                      url_base: Optional[str] = None) -> Tuple[bool, Optional[str], Optional[str]]:
@@ -273,9 +295,13 @@ class CSVValidator:
         if check_http:
             try:
                 import requests
-                response = requests.head(url_str, timeout=5, allow_redirects=True)
+                from http_client import URL_CHECK_CONFIG, get_http_client, read_bounded
+                client = get_http_client(URL_CHECK_CONFIG)
+                response = client.request("HEAD", url_str, timeout=5, allow_redirects=True)
                 if response.status_code >= 400:
-                    response = requests.get(url_str, timeout=5, allow_redirects=True, stream=True)
+                    # Status only: the body is never downloaded
+                    response = client.get(url_str, timeout=5, allow_redirects=True, stream=True)
+                    read_bounded(response, 0)
                     if response.status_code >= 400:
                         return False, url_str, f"http_error_{response.status_code}"
             except requests.exceptions.Timeout:
@@ -416,9 +442,10 @@ class CSVValidator:
                         {"row": row_num, "field": field}
                     ))
 
-    def validate_row(self, row: Dict[str, str], row_num: int) -> bool:
+    def validate_row(self, row: Dict[str, str], row_num: int, coordinates: Optional[CoordinateCheck] = None) -> bool:
         """
         Validate a single data row.
+        coordinates: the row's check_coordinate_pair result when already computed for a whole batch.
         Returns True if valid, False if errors found.
         """
         has_errors = False
@@ -443,29 +470,41 @@ class CSVValidator:
                 )
                 has_errors = True
 
+        if coordinates is None:
+            coordinates = check_coordinate_pair(row.get("Latitude", ""), row.get("Longitude", ""))
+        lat_error, lat_decimals, lon_error, lon_decimals, suspect = coordinates
+
         # Validate Latitude
-        lat_valid, lat_value, lat_error = self.validate_coordinate(
-            row.get("Latitude", ""), is_latitude=True
-        )
-        if not lat_valid:
+        if lat_error:
             self.errors.append(ValidationError(
                 row_num, "Latitude", lat_error, row.get("Latitude", "")
             ))
             has_errors = True
-        elif lat_value is not None:
-            self.check_coordinate_precision(lat_value, "Latitude", row_num)
+        elif lat_decimals:
+            self._warn_precision("Latitude", lat_decimals, row_num)
 
         # Validate Longitude
-        lon_valid, lon_value, lon_error = self.validate_coordinate(
-            row.get("Longitude", ""), is_latitude=False
-        )
-        if not lon_valid:
+        if lon_error:
             self.errors.append(ValidationError(
                 row_num, "Longitude", lon_error, row.get("Longitude", "")
             ))
             has_errors = True
-        elif lon_value is not None:
-            self.check_coordinate_precision(lon_value, "Longitude", row_num)
+        elif lon_decimals:
+            self._warn_precision("Longitude", lon_decimals, row_num)
+
+        if suspect == SUSPECT_ZERO_ISLAND:
+            self.warnings.append(ValidationWarning(
+                "zero_coordinates",
+                f"Row {row_num}: Latitude/Longitude are 0,0 (placeholder, not a store location)",
+                {"row": row_num}
+            ))
+        elif suspect == SUSPECT_SWAPPED:
+            self.warnings.append(ValidationWarning(
+                "swapped_coordinates",
+                f"Row {row_num}: Latitude {row.get('Latitude', '').strip()} is out of range; "
+                f"Latitude and Longitude look swapped",
+                {"row": row_num, "latitude": row.get("Latitude", ""), "longitude": row.get("Longitude", "")}
+            ))
 
         # Validate Website URL (if present)
         website = row.get("Website", "").strip()
@@ -543,18 +582,8 @@ class CSVValidator:
         Keep the first row for each non-empty key tuple; drop subsequent duplicates.
         Rows with any empty key field are always kept (not deduped).
         """
-        seen: Set[Tuple[str, ...]] = set()
-        out: List[Dict[str, str]] = []
-        removed = 0
-        for row in rows:
-            key = tuple((row.get(f) or "").strip() for f in key_fields)
-            if all(key):
-                if key in seen:
-                    removed += 1
-                    continue
-                seen.add(key)
-            out.append(row)
-        return out, removed
+        result = dedupe(build_keys(rows, lambda row: id_key(*((row.get(f) or "") for f in key_fields))))
+        return result.kept(rows), result.removed
 
     def remove_duplicates_from_file(self, file_path: str, output_path: str = None) -> int:
         """
@@ -570,10 +599,9 @@ class CSVValidator:
         if output_path is None:
             output_path = file_path
         
-        key_fields = DEFAULT_DUPLICATE_KEY
-        seen_keys = set()
-        unique_rows = []
+        seen_keys: Set[int] = set()
         duplicates_removed = 0
+        tmp_path = f"{output_path}.tmp"
         
         try:
             with open(file_path, 'r', encoding='utf-8-sig') as f:
@@ -584,38 +612,53 @@ class CSVValidator:
                     print(f"❌ No headers found in {file_path}")
                     return 0
                 
-                for row in reader:
-                    # Build key tuple from key fields
-                    key = tuple(row.get(field, "").strip() for field in key_fields)
-                    
-                    # Only check for duplicates if all key fields are non-empty
-                    if all(k for k in key):
-                        if key in seen_keys:
-                            duplicates_removed += 1
-                            continue
-                        seen_keys.add(key)
-                    
-                    unique_rows.append(row)
-            
-            # Write back to file with Unix line endings
-            with open(output_path, 'w', newline='', encoding='utf-8') as f:
-                writer = csv.DictWriter(f, fieldnames=headers, lineterminator='\n')
-                writer.writeheader()
-                writer.writerows(unique_rows)
-            
-            # Post-process to ensure Unix line endings (\n only)
-            with open(output_path, 'rb') as f:
-                content = f.read()
-            content = content.replace(b'\r\n', b'\n')
-            with open(output_path, 'wb') as f:
-                f.write(content)
+                # Stream to a temp file next to the output: only int64 key hashes stay in memory
+                with open(tmp_path, 'w', newline='', encoding='utf-8') as out:
+                    writer = csv.DictWriter(out, fieldnames=headers, lineterminator='\n')
+                    writer.writeheader()
+                    for row in reader:
+                        # Only check for duplicates if all key fields are non-empty
+                        fingerprint = id_key(*_duplicate_key(row))
+                        if fingerprint:
+                            if fingerprint in seen_keys:
+                                duplicates_removed += 1
+                                continue
+                            seen_keys.add(fingerprint)
+                        
+                        writer.writerow(row)
             
+            os.replace(tmp_path, output_path)
             return duplicates_removed
             
         except Exception as e:
             print(f"❌ Error removing duplicates: {e}")
+            if os.path.exists(tmp_path):
+                os.remove(tmp_path)
             return 0
 
+    def fix_row(self, row: Dict[str, str], fieldnames: List[str]) -> int:
+        """Apply fix_data_quality to every field and normalize Website / Image URL in place. Returns fixes made."""
+        fixes_count = 0
+        for field in fieldnames:
+            if field in row:
+                original = row[field]
+                fixed = self.fix_data_quality(row[field], field)
+                if fixed != original:
+                    row[field] = fixed
+                    fixes_count += 1
+        # Also normalize URLs (Website and Image URL)
+        for url_field in ["Website", "Image URL"]:
+            if url_field in fieldnames and url_field in row:
+                url_value = row[url_field].strip()
+                if url_value:
+                    url_valid, normalized_url, _ = self.validate_url(
+                        url_value, url_field, 0, check_http=False
+                    )
+                    if normalized_url and normalized_url != url_value:
+                        row[url_field] = normalized_url
+                        fixes_count += 1
+        return fixes_count
+
     def fix_file_data_quality(self, file_path: str, output_path: str = None) -> int:
         """
         Fix data quality issues in a CSV file.
@@ -638,24 +681,7 @@ class CSVValidator:
                 
                 # Fix each row
                 for row in rows:
-                    for field in headers:
-                        if field in row:
-                            original = row[field]
-                            fixed = self.fix_data_quality(row[field], field)
-                            if fixed != original:
-                                row[field] = fixed
-                                fixes_count += 1
-                    # Also normalize URLs (Website and Image URL)
-                    for url_field in ["Website", "Image URL"]:
-                        if url_field in headers and url_field in row:
-                            url_value = row[url_field].strip()
-                            if url_value:
-                                url_valid, normalized_url, _ = self.validate_url(
-                                    url_value, url_field, 0, check_http=False
-                                )
-                                if normalized_url and normalized_url != url_value:
-                                    row[url_field] = normalized_url
-                                    fixes_count += 1
+                    fixes_count += self.fix_row(row, headers)
             
             # Write fixed data back
             with open(output_path, 'w', newline='', encoding='utf-8') as f:
@@ -678,7 +704,11 @@ class CSVValidator:
 
     def validate_file(self, file_path: str, auto_fix: bool = False) -> int:
         """
-        Validate a CSV file.
+        Validate a CSV file in one streaming pass.
+        With auto_fix, rows are fixed and deduplicated (same Name, Address Line 1, City; first kept)
+        as they are read and written to a temp file that replaces the original when anything changed.
+        Only duplicate-key fingerprints are kept in memory, so large master files validate in flat memory.
+        Counts are left in fixes_applied and duplicates_removed.
         Returns exit code.
         """
         self.file_path = file_path
@@ -688,6 +718,7 @@ class CSVValidator:
             print(f"❌ File not found: {file_path}")
             return EXIT_USAGE
 
+        tmp_path = f"{file_path}.tmp"
         try:
             with open(file_path, 'r', newline='', encoding='utf-8') as f:
                 reader = csv.DictReader(f)
@@ -710,112 +741,39 @@ class CSVValidator:
                 print("✅ Header validation passed")
                 print()
 
-                # Read all rows into memory (needed for duplicate detection)
-                all_rows = list(reader)
-                total_rows = len(all_rows)
-
-                # Check for empty file
-                if total_rows == 0:
-                    self.warnings.append(ValidationWarning(
-                        "empty_file",
-                        "No data rows found in file"
-                    ))
-
-                # Check for suspiciously large files
-                if self.max_rows and total_rows > self.max_rows:
-                    self.warnings.append(ValidationWarning(
-                        "large_file",
-                        f"File has {total_rows} rows (>{self.max_rows})",
-                        {"rows": total_rows, "threshold": self.max_rows}
-                    ))
-
-                # Auto-fix data quality issues if requested
-                dedup_removed = 0
+                fieldnames = list(reader.fieldnames)
                 if auto_fix:
                     print("🔧 Auto-fixing data quality issues...")
-                    fixes_count = 0
-                    for row in all_rows:
-                        for field in reader.fieldnames:
-                            if field in row:
-                                original = row[field]
-                                fixed = self.fix_data_quality(row[field], field)
-                                if fixed != original:
-                                    row[field] = fixed
-                                    fixes_count += 1
-                        # Also normalize URLs (Website and Image URL)
-                        for url_field in ["Website", "Image URL"]:
-                            if url_field in reader.fieldnames and url_field in row:
-                                url_value = row[url_field].strip()
-                                if url_value:
-                                    url_valid, normalized_url, _ = self.validate_url(
-                                        url_value, url_field, 0, check_http=False
-                                    )
-                                    if normalized_url and normalized_url != url_value:
-                                        row[url_field] = normalized_url
-                                        fixes_count += 1
-
-                    all_rows, dedup_removed = self.dedupe_rows_by_key(
-                        all_rows, list(DEFAULT_DUPLICATE_KEY)
-                    )
-                    if dedup_removed > 0:
-                        print(
-                            f"✅ Removed {dedup_removed} duplicate row(s) "
-                            f"(same {', '.join(DEFAULT_DUPLICATE_KEY)}, kept first)"
-                        )
-                        print()
-
-                    if fixes_count > 0 or dedup_removed > 0:
-                        # Write fixed data back to file
-                        with open(file_path, 'w', newline='', encoding='utf-8') as f:
-                            writer = csv.DictWriter(f, fieldnames=reader.fieldnames, lineterminator='\n')
-                            writer.writeheader()
-                            writer.writerows(all_rows)
-                        
-                        # Post-process to ensure Unix line endings
-                        with open(file_path, 'rb') as f:
-                            content = f.read()
-                        content = content.replace(b'\r\n', b'\n')
-                        with open(file_path, 'wb') as f:
-                            f.write(content)
-                        
-                        if fixes_count > 0:
-                            print(f"✅ Fixed {fixes_count} data quality issue(s)")
-                            print()
-                        
-                        # Re-read the fixed file for validation
-                        with open(file_path, 'r', newline='', encoding='utf-8') as f:
-                            reader = csv.DictReader(f)
-                            all_rows = list(reader)
-
-                # Validate rows
-                rows_to_check = all_rows[:self.limit] if self.limit else all_rows
-                self.rows_checked = len(rows_to_check)
-
-                print(f"Validating {self.rows_checked} rows...")
+                print("Validating rows...")
                 print()
-
-                for idx, row in enumerate(rows_to_check, start=2):
-                    self.validate_row(row, idx)
-
-                # Detect duplicates
-                if self.warn_duplicates or self.fail_duplicates:
-                    duplicates = self.detect_duplicates(all_rows)
-                    for key, row_nums in duplicates:
-                        key_str = ", ".join(f"{k}" for k in key)
-                        message = f"Duplicate found: ({key_str}) in rows {row_nums}"
-
-                        if self.fail_duplicates:
-                            self.errors.append(ValidationError(
-                                row_nums[0], "duplicate", message
-                            ))
-                        else:
-                            self.warnings.append(ValidationWarning(
-                                "duplicate",
-                                message,
-                                {"key": list(key), "rows": row_nums}
-                            ))
-
-                return EXIT_OK
+                with open(tmp_path, 'w', newline='', encoding='utf-8') if auto_fix else nullcontext() as out:
+                    emit = None
+                    if auto_fix:
+                        writer = csv.DictWriter(out, fieldnames=fieldnames, lineterminator='\n')
+                        writer.writeheader()
+                        emit = writer.writerow
+                    rows_read, fixes_count, dedup_removed = self._validate_stream(reader, fieldnames, emit, auto_fix)
+
+            self._add_row_count_warnings(rows_read)
+            self.fixes_applied = fixes_count
+            self.duplicates_removed = dedup_removed
+            if auto_fix:
+                if fixes_count > 0 or dedup_removed > 0:
+                    os.replace(tmp_path, file_path)
+                else:
+                    os.remove(tmp_path)
+                if dedup_removed > 0:
+                    print(
+                        f"✅ Removed {dedup_removed} duplicate row(s) "
+                        f"(same {', '.join(DEFAULT_DUPLICATE_KEY)}, kept first)"
+                    )
+                if fixes_count > 0:
+                    print(f"✅ Fixed {fixes_count} data quality issue(s)")
+                if fixes_count > 0 or dedup_removed > 0:
+                    print()
+            print(f"Validated {self.rows_checked} rows")
+            print()
+            return EXIT_OK
 
         except IOError as e:
             print(f"❌ IO Error: {e}")
@@ -825,6 +783,144 @@ class CSVValidator:
             import traceback
             traceback.print_exc()
             return EXIT_EXCEPTION
+        finally:
+            if auto_fix and os.path.exists(tmp_path):
+                os.remove(tmp_path)
+
+    def validate_rows(
+        self, rows: Iterable[Dict[str, Any]], fieldnames: List[str], auto_fix: bool = False
+    ) -> Tuple[int, List[Dict[str, str]]]:
+        """
+        Validate in-memory row dicts (e.g. batch_normalize output) exactly as validate_file would
+        validate the same rows written with these fieldnames, without touching disk.
+        Returns (exit code, rows to export): with auto_fix the rows are fixed and deduplicated.
+        Input dicts are not modified.
+        """
+        self.file_path = ""
+        if not self.validate_headers(fieldnames):
+            return EXIT_SCHEMA, []
+
+        # Same values a CSV round trip would give: every field present, as a string
+        as_written = (
+            {field: "" if row.get(field) is None else str(row.get(field)) for field in fieldnames}
+            for row in rows
+        )
+        kept: List[Dict[str, str]] = []
+        try:
+            rows_read, fixes_count, dedup_removed = self._validate_stream(
+                as_written, fieldnames, lambda row: kept.append(dict(row)), auto_fix
+            )
+        except Exception as e:
+            print(f"❌ Unexpected error: {e}")
+            import traceback
+            traceback.print_exc()
+            return EXIT_EXCEPTION, []
+        self._add_row_count_warnings(rows_read)
+        self.fixes_applied = fixes_count
+        self.duplicates_removed = dedup_removed
+        return EXIT_OK, kept
+
+    def _add_row_count_warnings(self, rows_read: int) -> None:
+        """empty_file / large_file lead the list, as when the whole file was read up front."""
+        file_warnings = []
+        if rows_read == 0:
+            file_warnings.append(ValidationWarning(
+                "empty_file",
+                "No data rows found in file"
+            ))
+        if self.max_rows and rows_read > self.max_rows:
+            file_warnings.append(ValidationWarning(
+                "large_file",
+                f"File has {rows_read} rows (>{self.max_rows})",
+                {"rows": rows_read, "threshold": self.max_rows}
+            ))
+        self.warnings[self._file_warnings_at:self._file_warnings_at] = file_warnings
+
+    def _validate_stream(
+        self,
+        rows: Iterable[Dict[str, str]],
+        fieldnames: List[str],
+        emit: Optional[Callable[[Dict[str, str]], Any]],
+        fix: bool,
+    ) -> Tuple[int, int, int]:
+        """
+        The single pass behind validate_file and validate_rows. With fix, each row is fixed and
+        dropped if its duplicate key was already kept. Kept rows go to emit (before validate_row,
+        which may rewrite URLs it only warns about) and are validated COORDINATE_BATCH_ROWS at a time,
+        so the batch's coordinates are checked as columns. Returns
+        (rows read, fixes applied, duplicates removed); duplicate warnings/errors are added at the end.
+        """
+        self._file_warnings_at = len(self.warnings)
+        track_duplicates = (self.warn_duplicates or self.fail_duplicates) and not fix
+        written: Set[int] = set()
+        first_rows: Dict[int, int] = {}
+        duplicates: Dict[int, Tuple[Tuple[str, ...], List[int]]] = {}
+        rows_read = fixes_count = dedup_removed = kept = 0
+        pending: List[Tuple[Dict[str, str], int]] = []
+
+        for row in rows:
+            rows_read += 1
+            if fix:
+                fixes_count += self.fix_row(row, fieldnames)
+                # Short rows read back as "" once written
+                for field, value in row.items():
+                    if value is None:
+                        row[field] = ""
+            key = _duplicate_key(row)
+            fingerprint = id_key(*key)
+            if fix and fingerprint:
+                if fingerprint in written:
+                    dedup_removed += 1
+                    continue
+                written.add(fingerprint)
+
+            kept += 1
+            row_num = kept + 1  # Row 1 is the header
+            if emit is not None:
+                emit(row)
+            if track_duplicates and fingerprint:
+                first_row = first_rows.setdefault(fingerprint, row_num)
+                if first_row != row_num:
+                    if fingerprint in duplicates:
+                        duplicates[fingerprint][1].append(row_num)
+                    else:
+                        duplicates[fingerprint] = (key, [first_row, row_num])
+            if not self.limit or kept <= self.limit:
+                pending.append((row, row_num))
+                if len(pending) >= COORDINATE_BATCH_ROWS:
+                    self._validate_batch(pending)
+        self._validate_batch(pending)
+
+        self.rows_checked = min(kept, self.limit) if self.limit else kept
+
+        # In first-occurrence order, as detect_duplicates reports them
+        for key, row_nums in sorted(duplicates.values(), key=lambda entry: entry[1][0]):
+            key_str = ", ".join(f"{k}" for k in key)
+            message = f"Duplicate found: ({key_str}) in rows {row_nums}"
+
+            if self.fail_duplicates:
+                self.errors.append(ValidationError(
+                    row_nums[0], "duplicate", message
+                ))
+            else:
+                self.warnings.append(ValidationWarning(
+                    "duplicate",
+                    message,
+                    {"key": list(key), "rows": row_nums}
+                ))
+        return rows_read, fixes_count, dedup_removed
+
+    def _validate_batch(self, batch: List[Tuple[Dict[str, str], int]]) -> None:
+        """validate_row over buffered rows, their coordinates checked as one column pair; empties batch."""
+        if not batch:
+            return
+        columns = validate_coordinate_columns(
+            [row.get("Latitude", "") for row, _ in batch],
+            [row.get("Longitude", "") for row, _ in batch],
+        )
+        for (row, row_num), coordinates in zip(batch, columns.checks()):
+            self.validate_row(row, row_num, coordinates)
+        batch.clear()
 
     def print_report(self, show_details: bool = True):
         """Print human-readable validation report with detailed information"""
@@ -4,10 +4,14 @@
 import requests
 import time
 import math
-from typing import List, Dict, Any, Optional
+from array import array
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from typing import Any, Dict, List, Optional
 from urllib.parse import urlencode
 
-from scraper_utils import log_debug
+from scraper_utils import log_debug, infer_result_cap
+from dedup_utils import Deduplicator, dedupe, format_counts, geo_key, id_key, id_keys
+from http_client import BrandHttpClient, DEFAULT_REQUESTS_PER_SECOND, get_http_client, get_rate_limiter
 
 
 def generate_world_grid(grid_size: int = 20) -> List[Dict[str, float]]:
@@ -116,73 +120,239 @@ def _merged_viewport_headers(extra: Optional[Dict[str, str]] = None) -> Dict[str
     return h
 
 
+def _viewport_stores(resp: Any, data_path: str = "") -> List[Dict[str, Any]]:
+    """Store list in a viewport response ([] for an empty or non-list body); raises on HTTP errors."""
+    resp.raise_for_status()
+    if not resp.text or resp.text.strip() == '':
+        return []
+    try:
+        data = resp.json()
+    except ValueError:
+        return []
+    if data_path:
+        keys = data_path.split('.')
+        for key in keys:
+            if isinstance(data, dict):
+                data = data.get(key, [])
+            else:
+                return []
+    if isinstance(data, list):
+        return data
+    else:
+        return []
+
+
 def fetch_viewport_data(
     url: str,
     data_path: str = "",
     timeout: int = 15,
-    retry_count: int = 3,
     request_headers: Optional[Dict[str, str]] = None,
-) -> List[Dict[str, Any]]:
+    http_client: Optional[BrandHttpClient] = None,
+) -> Optional[List[Dict[str, Any]]]:
+    """
+    Stores in one viewport: [] when the tile is empty (or its body is not a store list),
+    None when the request failed, so a failed tile is never mistaken for an empty one.
+    Timeouts, connect errors and 429/5xx are retried by the client (http_pool.retries).
+    """
+    headers = _merged_viewport_headers(request_headers)
+    client = http_client or get_http_client()
+    try:
+        return _viewport_stores(client.get(url, timeout=timeout, headers=headers), data_path)
+    except requests.exceptions.RequestException as e:
+        log_debug(f"Viewport request failed: {str(e)[:100]}", "WARN")
+        return None
+    except Exception as e:
+        log_debug(f"Viewport request failed: {str(e)[:100]}", "WARN")
+        return None
+
+
+def fetch_viewports_async(
+    urls: List[str],
+    data_path: str = "",
+    timeout: int = 15,
+    request_headers: Optional[Dict[str, str]] = None,
+    http_client: Any = None,
+    limiter: Optional[Any] = None,
+) -> List[Optional[List[Dict[str, Any]]]]:
+    """
+    fetch_viewport_data for a batch of tiles on the async engine: one request_many call, so the
+    tiles run as coroutines on the client's event loop. Results are in URL order.
+    """
     headers = _merged_viewport_headers(request_headers)
-    for attempt in range(retry_count):
+    calls = [("GET", url, {"timeout": timeout, "headers": headers}) for url in urls]
+    results: List[Optional[List[Dict[str, Any]]]] = []
+    for resp in http_client.request_many(calls, limiter=limiter):
         try:
-            resp = requests.get(url, timeout=timeout, headers=headers)
-            resp.raise_for_status()
-            if not resp.text or resp.text.strip() == '':
-                return []
-            try:
-                data = resp.json()
-            except ValueError:
-                return []
-            if data_path:
-                keys = data_path.split('.')
-                for key in keys:
-                    if isinstance(data, dict):
-                        data = data.get(key, [])
-                    else:
-                        return []
-            if isinstance(data, list):
-                return data
-            else:
-                return []
-                
-        except requests.exceptions.Timeout:
-            if attempt < retry_count - 1:
-                time.sleep(1 * (attempt + 1))
-                continue
-            else:
-                return []
-        except requests.exceptions.RequestException:
-            return []
-        except Exception:
-            return []
-    
-    return []
+            if isinstance(resp, Exception):
+                raise resp
+            results.append(_viewport_stores(resp, data_path))
+        except Exception as e:
+            log_debug(f"Viewport request failed: {str(e)[:100]}", "WARN")
+            results.append(None)
+    return results
+
+
+def _store_fallback_key(store: Dict[str, Any]) -> int:
+    # No ID: same name in the same GEO_DECIMALS cell
+    name = store.get("name", store.get("nameTranslated", store.get("Name", "")))
+    lat = store.get("lat", store.get("latitude", store.get("Latitude", "")))
+    lng = store.get("lng", store.get("longitude", store.get("Longitude", "")))
+    return geo_key(lat, lng, scope=(str(name),)) or id_key(f"{name}_{lat}_{lng}")
+
+
+def store_dedup_keys(stores: List[Dict[str, Any]], key_field: str = "id") -> array:
+    """Dedup key column for raw API stores: first available ID field, else name + geo cell."""
+    get = dict.get
+    # Falsy IDs (0, "") are skipped like missing ones; the trailing None keeps a last falsy one out
+    keys = id_keys([
+        get(store, key_field) or get(store, "id") or get(store, "storeId")
+        or get(store, "dealerId") or get(store, "handle") or get(store, "Handle") or None
+        for store in stores
+    ])
+    for i, key in enumerate(keys):
+        if not key:
+            keys[i] = _store_fallback_key(stores[i])
+    return keys
 
 
 def deduplicate_stores(stores: List[Dict[str, Any]], key_field: str = "id") -> List[Dict[str, Any]]:
-    seen = set()
-    unique_stores = []
-    possible_keys = [key_field, "id", "storeId", "dealerId", "handle", "Handle"]
-    
-    for store in stores:
-        # Find the first available ID field
-        store_id = None
-        for key in possible_keys:
-            if key in store and store[key]:
-                store_id = str(store[key])
-                break
-        if not store_id:
-            name = store.get("name", store.get("nameTranslated", store.get("Name", "")))
-            lat = store.get("lat", store.get("latitude", store.get("Latitude", "")))
-            lng = store.get("lng", store.get("longitude", store.get("Longitude", "")))
-            store_id = f"{name}_{lat}_{lng}"
-        
-        if store_id not in seen:
-            seen.add(store_id)
-            unique_stores.append(store)
-    
-    return unique_stores
+    deduplicator = dedupe(store_dedup_keys(stores, key_field))
+    if deduplicator.removed:
+        log_debug(f"Duplicates by rule: {format_counts(deduplicator.counts())}", "DEBUG")
+    return deduplicator.kept(stores)
+
+
+def _print_viewport_progress(
+    done: int, total: int, total_found: int, empty_viewports: int, failed_viewports: int, start_time: float
+) -> None:
+    percent_complete = (done / total) * 100
+    elapsed = time.time() - start_time
+    estimated_total = (elapsed / done) * total if done > 0 else 0
+    remaining = estimated_total - elapsed
+    failed = f" | {failed_viewports} failed" if failed_viewports else ""
+    print(f"   [{percent_complete:5.1f}%] {done}/{total} viewports | {total_found} stores | {empty_viewports} empty{failed} | ETA: {remaining/60:.1f}min")
+
+
+def _fetch_viewports_sequentially(
+    urls: List[str],
+    data_path: str,
+    request_headers: Optional[Dict[str, str]],
+    http_client: Optional[BrandHttpClient],
+    delay_between_requests: float,
+    update_interval: int,
+    start_time: float,
+) -> List[Optional[List[Dict[str, Any]]]]:
+    results: List[Optional[List[Dict[str, Any]]]] = []
+    total_found = 0
+    empty_viewports = 0
+    failed_viewports = 0
+    for i, url in enumerate(urls, 1):
+        stores = fetch_viewport_data(url, data_path, request_headers=request_headers, http_client=http_client)
+        results.append(stores)
+        if stores is None:
+            failed_viewports += 1
+        elif stores:
+            total_found += len(stores)
+        else:
+            empty_viewports += 1
+        if i % update_interval == 0 or i == len(urls):
+            _print_viewport_progress(i, len(urls), total_found, empty_viewports, failed_viewports, start_time)
+        if i < len(urls):
+            time.sleep(delay_between_requests)
+    return results
+
+
+def _fetch_viewports_concurrently(
+    urls: List[str],
+    data_path: str,
+    request_headers: Optional[Dict[str, str]],
+    http_client: Optional[BrandHttpClient],
+    max_workers: int,
+    requests_per_second: Optional[float],
+    update_interval: int,
+    start_time: float,
+) -> List[Optional[List[Dict[str, Any]]]]:
+    """
+    Fetch every viewport URL on a bounded thread pool, paced by the host's token bucket; on the
+    async engine the whole batch goes to fetch_viewports_async instead.
+    Returns one store list (None if the request failed) per URL in input order, so dedup keeps
+    the same "first wins" result as the sequential path. Progress counts completed tiles, which
+    keeps the ETA honest.
+    """
+    limiter = get_rate_limiter(urls[0], requests_per_second) if urls else None
+    if getattr(http_client, "is_async", False):
+        results = fetch_viewports_async(
+            urls, data_path, request_headers=request_headers, http_client=http_client, limiter=limiter
+        )
+        if results:
+            _print_viewport_progress(
+                len(results), len(results), sum(len(stores) for stores in results if stores),
+                sum(1 for stores in results if stores == []), sum(1 for stores in results if stores is None),
+                start_time,
+            )
+        return results
+
+    def _fetch(url: str) -> Optional[List[Dict[str, Any]]]:
+        if limiter:
+            limiter.acquire()
+        return fetch_viewport_data(url, data_path, request_headers=request_headers, http_client=http_client)
+
+    results: List[Optional[List[Dict[str, Any]]]] = [None for _ in urls]
+    done = 0
+    total_found = 0
+    empty_viewports = 0
+    failed_viewports = 0
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        futures = {executor.submit(_fetch, url): idx for idx, url in enumerate(urls)}
+        for future in as_completed(futures):
+            stores = future.result()
+            results[futures[future]] = stores
+            done += 1
+            if stores is None:
+                failed_viewports += 1
+            elif stores:
+                total_found += len(stores)
+            else:
+                empty_viewports += 1
+            if done % update_interval == 0 or done == len(urls):
+                _print_viewport_progress(done, len(urls), total_found, empty_viewports, failed_viewports, start_time)
+    return results
+
+
+# Adaptive (quadtree) mode: never split below this many degrees per side
+DEFAULT_MIN_TILE_SIZE = 0.25
+
+
+def split_viewport(viewport: Dict[str, float]) -> List[Dict[str, float]]:
+    """Split a viewport into its four quadrants (SW, SE, NW, NE)."""
+    mid_lat = (viewport["sw_lat"] + viewport["ne_lat"]) / 2
+    mid_lng = (viewport["sw_lng"] + viewport["ne_lng"]) / 2
+    return [
+        {"sw_lat": viewport["sw_lat"], "sw_lng": viewport["sw_lng"], "ne_lat": mid_lat, "ne_lng": mid_lng},
+        {"sw_lat": viewport["sw_lat"], "sw_lng": mid_lng, "ne_lat": mid_lat, "ne_lng": viewport["ne_lng"]},
+        {"sw_lat": mid_lat, "sw_lng": viewport["sw_lng"], "ne_lat": viewport["ne_lat"], "ne_lng": mid_lng},
+        {"sw_lat": mid_lat, "sw_lng": mid_lng, "ne_lat": viewport["ne_lat"], "ne_lng": viewport["ne_lng"]},
+    ]
+
+
+def _generate_viewports(
+    grid_type: str,
+    grid_size: int,
+    focus_region: Optional[Dict[str, float]],
+) -> List[Dict[str, float]]:
+    if grid_type == "focused" and focus_region:
+        log_debug(f"Generating focused grid: center=({focus_region['center_lat']}, {focus_region['center_lng']}) radius={focus_region.get('radius', 10)}°", "DEBUG")
+        return generate_focused_grid(
+            focus_region["center_lat"],
+            focus_region["center_lng"],
+            focus_region.get("radius", 10),
+            grid_size
+        )
+    if grid_type == "country" and focus_region:
+        log_debug(f"Generating country grid: bounds={focus_region}", "DEBUG")
+        return generate_country_grid(focus_region, grid_size)
+    log_debug("Generating world grid (full global coverage)", "DEBUG")
+    return generate_world_grid(grid_size)
 
 
 def scrape_viewport_api(
@@ -196,61 +366,109 @@ def scrape_viewport_api(
     progress_interval: int = 50,
     focus_region: Optional[Dict[str, float]] = None,
     request_headers: Optional[Dict[str, str]] = None,
+    http_client: Optional[BrandHttpClient] = None,
+    max_workers: int = 1,
+    requests_per_second: Optional[float] = None,
+    adaptive: bool = False,
+    max_results_per_tile: Optional[int] = None,
+    min_tile_size: float = DEFAULT_MIN_TILE_SIZE,
 ) -> List[Dict[str, Any]]:
+    """
+    Walk a viewport grid and return deduplicated stores.
+
+    With ``max_workers`` > 1 tiles are fetched concurrently and the fixed
+    ``delay_between_requests`` sleep is replaced by a per-host token bucket
+    (``requests_per_second``, default DEFAULT_REQUESTS_PER_SECOND), on either engine.
+
+    With ``adaptive`` the grid is only the coarse first level: empty tiles are
+    dropped, and a tile whose response looks truncated (``max_results_per_tile``,
+    or a cap inferred from repeated maximum counts) is split into four until
+    ``min_tile_size`` degrees.
+
+    Tiles whose request failed (after the client's retries) are counted and reported
+    separately from empty ones: their area was not scanned, at any depth.
+    """
+    concurrent = max_workers > 1
+    if concurrent and not requests_per_second:
+        requests_per_second = DEFAULT_REQUESTS_PER_SECOND
     log_debug("Starting viewport API scraper", "INFO")
-    log_debug(f"Grid type: {grid_type} | Grid size: {grid_size}° | Delay: {delay_between_requests}s", "DEBUG")
-    if grid_type == "focused" and focus_region:
-        log_debug(f"Generating focused grid: center=({focus_region['center_lat']}, {focus_region['center_lng']}) radius={focus_region.get('radius', 10)}°", "DEBUG")
-        viewports = generate_focused_grid(
-            focus_region["center_lat"],
-            focus_region["center_lng"],
-            focus_region.get("radius", 10),
-            grid_size
-        )
-    elif grid_type == "country" and focus_region:
-        log_debug(f"Generating country grid: bounds={focus_region}", "DEBUG")
-        viewports = generate_country_grid(focus_region, grid_size)
+    if concurrent:
+        log_debug(f"Grid type: {grid_type} | Grid size: {grid_size}° | Workers: {max_workers} | Rate: {requests_per_second}/s", "DEBUG")
     else:
-        log_debug("Generating world grid (full global coverage)", "DEBUG")
-        viewports = generate_world_grid(grid_size)
+        log_debug(f"Grid type: {grid_type} | Grid size: {grid_size}° | Delay: {delay_between_requests}s", "DEBUG")
+    viewports = _generate_viewports(grid_type, grid_size, focus_region)
     
     log_debug(f"Grid generated: {len(viewports)} viewports", "SUCCESS")
-    print(f"🌍 Generated {len(viewports)} viewports (grid_size={grid_size}°)")
-    print(f"   Estimated time: ~{len(viewports) * delay_between_requests / 60:.1f} minutes")
+    print(f"🌍 Generated {len(viewports)} viewports (grid_size={grid_size}°{', adaptive' if adaptive else ''})")
+    if concurrent:
+        print(f"   Estimated time: ~{len(viewports) / requests_per_second / 60:.1f} minutes ({max_workers} workers)")
+    else:
+        print(f"   Estimated time: ~{len(viewports) * delay_between_requests / 60:.1f} minutes")
     print(f"   Starting viewport scraping...")
     
-    all_stores = []
-    empty_viewports = 0
+    # Overlapping tiles return the same store many times: dedup each batch as it arrives
+    deduplicator = Deduplicator()
+    unique_stores: List[Dict[str, Any]] = []
+    dedup_time = 0.0
     start_time = time.time()
     update_interval = max(10, progress_interval // 5)
-
-    for i, viewport in enumerate(viewports, 1):
-        url = build_viewport_url(base_url, viewport, viewport_params, additional_params)
-        stores = fetch_viewport_data(url, data_path, request_headers=request_headers)
-        
-        if stores:
-            all_stores.extend(stores)
+    tile_cap = max_results_per_tile
+    level = viewports
+    depth = 0
+    requests_made = 0
+    split_tiles = 0
+    failed_tiles: List[Dict[str, float]] = []
+
+    while level:
+        urls = [build_viewport_url(base_url, vp, viewport_params, additional_params) for vp in level]
+        if concurrent:
+            results = _fetch_viewports_concurrently(
+                urls, data_path, request_headers, http_client, max_workers,
+                requests_per_second, update_interval, start_time,
+            )
         else:
-            empty_viewports += 1
-        if i % update_interval == 0 or i == len(viewports):
-            total_found = len(all_stores)
-            percent_complete = (i / len(viewports)) * 100
-            elapsed = time.time() - start_time
-            estimated_total = (elapsed / i) * len(viewports) if i > 0 else 0
-            remaining = estimated_total - elapsed
-            
-            print(f"   [{percent_complete:5.1f}%] {i}/{len(viewports)} viewports | {total_found} stores | {empty_viewports} empty | ETA: {remaining/60:.1f}min")
-        if i < len(viewports):
-            time.sleep(delay_between_requests)
-    print(f"\n🔍 Deduplicating results...")
-    log_debug(f"Starting deduplication | Input: {len(all_stores)} stores", "DEBUG")
-    dedup_start = time.time()
-    
-    unique_stores = deduplicate_stores(all_stores)
-    dedup_time = time.time() - dedup_start
-    
-    duplicates_removed = len(all_stores) - len(unique_stores)
-    log_debug(f"Deduplication complete | Output: {len(unique_stores)} unique | Removed: {duplicates_removed} duplicates | Time: {dedup_time:.2f}s", "SUCCESS")
+            results = _fetch_viewports_sequentially(
+                urls, data_path, request_headers, http_client,
+                delay_between_requests, update_interval, start_time,
+            )
+        requests_made += len(urls)
+        failed_tiles.extend(vp for vp, stores in zip(level, results) if stores is None)
+        dedup_start = time.time()
+        for stores in results:
+            if stores:
+                unique_stores.extend(deduplicator.filter(stores, store_dedup_keys(stores)))
+        dedup_time += time.time() - dedup_start
+        if not adaptive:
+            break
+
+        if tile_cap is None:
+            tile_cap = infer_result_cap([len(stores) for stores in results if stores is not None])
+            if tile_cap:
+                log_debug(f"Inferred per-viewport result cap: {tile_cap}", "DEBUG")
+        next_level: List[Dict[str, float]] = []
+        for vp, stores in zip(level, results):
+            # Empty and failed tiles are dropped; only saturated tiles are refined
+            if not stores or not tile_cap or len(stores) < tile_cap:
+                continue
+            if min(vp["ne_lat"] - vp["sw_lat"], vp["ne_lng"] - vp["sw_lng"]) / 2 < min_tile_size:
+                log_debug(f"Viewport at min size still saturated ({len(stores)} stores): {vp}", "WARN")
+                continue
+            next_level.extend(split_viewport(vp))
+            split_tiles += 1
+        depth += 1
+        if next_level:
+            print(f"   🔎 Depth {depth}: splitting {len(next_level) // 4} saturated viewport(s) into {len(next_level)}")
+        level = next_level
+
+    if adaptive:
+        log_debug(f"Adaptive viewports: {requests_made} requests | {split_tiles} splits | {len(failed_tiles)} failed | depth {depth}", "INFO")
+    if failed_tiles:
+        log_debug(f"{len(failed_tiles)} viewport request(s) failed; first: {failed_tiles[0]}", "WARN")
+        print(f"⚠️  {len(failed_tiles)} viewport(s) failed after retries — their areas were not scanned")
+    duplicates_removed = deduplicator.removed
+    log_debug(f"Deduplication complete | Input: {len(deduplicator)} stores | Output: {len(unique_stores)} unique | Removed: {duplicates_removed} duplicates | Time: {dedup_time:.2f}s", "SUCCESS")
+    if duplicates_removed:
+        log_debug(f"Duplicates by rule: {format_counts(deduplicator.counts())}", "DEBUG")
     print(f"✅ Found {len(unique_stores)} unique stores ({duplicates_removed} duplicates removed)")
     
     total_time = time.time() - start_time
@@ -339,5 +557,11 @@ if __name__ == "__main__":
     assert len(deduped) == 2, f"Expected 2 unique stores, got {len(deduped)}"
     print(f"Deduplication: {len(sample_stores)} → {len(deduped)} stores")
 
+    quads = split_viewport({"sw_lat": 0, "sw_lng": 0, "ne_lat": 10, "ne_lng": 20})
+    assert len(quads) == 4 and quads[3] == {"sw_lat": 5, "sw_lng": 10, "ne_lat": 10, "ne_lng": 20}
+    assert infer_result_cap([3, 50, 50, 12]) == 50, "Repeated maximum should be read as a cap"
+    assert infer_result_cap([3, 50, 12]) is None, "A single maximum is not evidence of a cap"
+    print(f"Adaptive split: 1 → {len(quads)} quadrants")
+
     print("\n✅ All self-tests passed")
 
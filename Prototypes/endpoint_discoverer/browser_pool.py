@@ -0,0 +1,394 @@
+#!/usr/bin/env python3
+"""Long-lived headless Chrome sessions shared by EndpointDiscoverer jobs, plus CDP network-idle waits."""
+
+import atexit
+import json
+import os
+import queue
+import shutil
+import threading
+import time
+from functools import lru_cache
+from typing import Callable, Dict, List, Optional, Tuple
+from urllib.parse import urlparse
+
+from selenium import webdriver
+from selenium.webdriver.chrome.options import Options
+from selenium.webdriver.chrome.service import Service
+from webdriver_manager.chrome import ChromeDriverManager
+
+# Browsers kept warm per pool; discover_many runs this many pages at once
+BROWSER_POOL_SIZE = int(os.environ.get("DISCOVERY_BROWSER_POOL_SIZE", "2"))
+# A browser is restarted after this many jobs so long-lived Chrome memory growth stays bounded
+BROWSER_MAX_JOBS = 25
+
+# The network counts as idle once at most this many requests are in flight (analytics beacons and
+# long-polls never finish) and no request started or finished for the idle window
+NETWORK_IDLE_MAX_INFLIGHT = 2
+NETWORK_IDLE_POLL_SECONDS = 0.1
+
+# Mocked geolocation so map-based store locators (e.g. SFCC) fire API calls.
+# Without this, headless Chrome has no location and the map stays blank.
+_GEOLOCATION_OVERRIDE = {
+    'latitude': 40.7128,    # New York City
+    'longitude': -74.0060,
+    'accuracy': 100,
+}
+
+_REQUEST_STARTED = 'Network.requestWillBeSent'
+_REQUEST_DONE = frozenset({'Network.loadingFinished', 'Network.loadingFailed'})
+
+
+@lru_cache(maxsize=1)
+def find_chrome_binary() -> Optional[str]:
+    """Chrome/Chromium binary on PATH (None: let Selenium locate one)."""
+    for binary_name in ['chromium-browser', 'chromium', 'google-chrome', 'chrome']:
+        binary_path = shutil.which(binary_name)
+        if binary_path:
+            print(f"  Found browser: {binary_path}")
+            return binary_path
+    return None
+
+
+@lru_cache(maxsize=1)
+def resolve_chromedriver() -> str:
+    """
+    ChromeDriver path, resolved once per process: the system driver (matches installed
+    Chromium) first, then webdriver-manager. Failures are not cached.
+    """
+    for chromedriver_name in ['chromium-chromedriver', 'chromedriver']:
+        chromedriver_path = shutil.which(chromedriver_name)
+        if chromedriver_path:
+            print(f"  ✓ Found system ChromeDriver: {chromedriver_path}")
+            return chromedriver_path
+
+    print("  ⚠️  System ChromeDriver not found, using webdriver-manager...")
+    try:
+        driver_path = ChromeDriverManager().install()
+    except Exception as wdm_error:
+        print(f"  ⚠️  webdriver-manager failed: {wdm_error}")
+        raise Exception(
+            f"Failed to setup ChromeDriver.\n"
+            f"Please install: sudo apt-get install chromium-chromedriver\n"
+            f"Or download from: https://chromedriver.chromium.org/"
+        )
+    print(f"  ✓ Using ChromeDriver: {driver_path}")
+    return driver_path
+
+
+def _chrome_options(headless: bool) -> Options:
+    """Chrome options with network logging"""
+    chrome_options = Options()
+
+    chrome_binary = find_chrome_binary()
+    if chrome_binary:
+        chrome_options.binary_location = chrome_binary
+
+    if headless:
+        chrome_options.add_argument('--headless=new')  # Use new headless mode
+    chrome_options.add_argument('--no-sandbox')
+    chrome_options.add_argument('--disable-dev-shm-usage')
+    chrome_options.add_argument('--disable-gpu')
+    chrome_options.add_argument('--window-size=1920,1080')
+    chrome_options.add_argument('--disable-software-rasterizer')
+    chrome_options.add_argument('--disable-extensions')
+    chrome_options.add_argument('--disable-setuid-sandbox')
+    chrome_options.add_argument('--disable-background-timer-throttling')
+    chrome_options.add_argument('--disable-backgrounding-occluded-windows')
+    chrome_options.add_argument('--disable-renderer-backgrounding')
+    chrome_options.add_argument('--disable-blink-features=AutomationControlled')
+    chrome_options.add_experimental_option('excludeSwitches', ['enable-automation'])
+    chrome_options.add_experimental_option('useAutomationExtension', False)
+    # Grant geolocation without a permission prompt so map-based store locators
+    # (e.g. SFCC/Demandware) fire their API calls in headless mode.
+    chrome_options.add_argument('--use-fake-ui-for-media-stream')
+    chrome_options.add_experimental_option('prefs', {
+        'profile.default_content_setting_values.geolocation': 1,  # 1 = allow
+    })
+
+    # Enable performance logging to capture network requests
+    chrome_options.set_capability('goog:loggingPrefs', {'performance': 'ALL'})
+    chrome_options.set_capability('goog:chromeOptions', {
+        'perfLoggingPrefs': {
+            'enableNetwork': True,
+            'enablePage': True
+        }
+    })
+    return chrome_options
+
+
+def create_driver(headless: bool = True, page_load_timeout: int = 30) -> webdriver.Chrome:
+    """Start a Selenium Chrome driver with network logging, CDP network monitoring and mocked geolocation"""
+    chrome_options = _chrome_options(headless)
+    try:
+        driver = webdriver.Chrome(service=Service(resolve_chromedriver()), options=chrome_options)
+
+        # Enable CDP (Chrome DevTools Protocol) for better network capture
+        try:
+            driver.execute_cdp_cmd('Network.enable', {})
+            print("  ✓ Enabled Chrome DevTools Protocol network monitoring")
+        except Exception as cdp_error:
+            print(f"  ⚠️  CDP not available (may still work): {cdp_error}")
+
+        try:
+            driver.execute_cdp_cmd('Emulation.setGeolocationOverride', _GEOLOCATION_OVERRIDE)
+            print("  ✓ Mocked geolocation to New York City (40.71°N, 74.00°W)")
+        except Exception as geo_error:
+            print(f"  ⚠️  Could not mock geolocation: {geo_error}")
+
+        driver.set_page_load_timeout(page_load_timeout)
+        print("  ✓ Driver setup complete")
+        return driver
+
+    except Exception as e:
+        error_msg = str(e)
+        print(f"  ❌ Driver setup error: {error_msg}")
+
+        # Provide helpful error messages
+        if "version" in error_msg.lower() or "chromedriver" in error_msg.lower():
+            raise Exception(
+                f"ChromeDriver version mismatch or not found.\n"
+                f"Install with: sudo apt-get install chromium-chromedriver\n"
+                f"Or download matching version from: https://chromedriver.chromium.org/\n"
+                f"Original error: {e}"
+            )
+        elif not find_chrome_binary():
+            raise Exception(
+                f"Chrome/Chromium browser not found.\n"
+                f"Install with: sudo apt-get install chromium-browser\n"
+                f"Original error: {e}"
+            )
+        else:
+            raise Exception(f"Failed to setup Chrome driver: {e}")
+
+
+class NetworkIdleTracker:
+    """
+    Follows a driver's in-flight requests through the CDP Network events in its performance log.
+
+    Reading the performance log consumes it, so every entry read while waiting is kept in
+    ``entries`` for the caller's network capture.
+    """
+
+    def __init__(self, driver, max_inflight: int = NETWORK_IDLE_MAX_INFLIGHT):
+        self.driver = driver
+        self.max_inflight = max_inflight
+        self.entries: List[Dict] = []
+        self._inflight = set()
+        self.available = True
+
+    def poll(self) -> int:
+        """Read new performance log entries; returns how many requests started or finished."""
+        if not self.available:
+            return 0
+        try:
+            logs = self.driver.get_log('performance')
+        except Exception:
+            # No performance log (e.g. logging disabled): waits fall back to document.readyState
+            self.available = False
+            return 0
+        events = 0
+        for log in logs:
+            self.entries.append(log)
+            raw = log.get('message', '')
+            if 'Network.' not in raw:
+                continue
+            try:
+                msg_data = json.loads(raw).get('message', {})
+            except (json.JSONDecodeError, TypeError, AttributeError):
+                continue
+            method = msg_data.get('method', '')
+            request_id = (msg_data.get('params') or {}).get('requestId')
+            if not request_id:
+                continue
+            if method == _REQUEST_STARTED:
+                self._inflight.add(request_id)
+                events += 1
+            elif method in _REQUEST_DONE:
+                self._inflight.discard(request_id)
+                events += 1
+        return events
+
+    @property
+    def inflight(self) -> int:
+        return len(self._inflight)
+
+    def wait_for_idle(self, idle_time: float = 0.5, timeout: float = 10.0) -> bool:
+        """
+        Block until no request has started or finished for idle_time seconds with at most
+        max_inflight still open, or until timeout. Returns True if the network went idle.
+        """
+        start = time.monotonic()
+        deadline = start + timeout
+        last_activity = start
+        while True:
+            now = time.monotonic()
+            if self.poll():
+                last_activity = now
+            if not self.available:
+                return self._wait_for_ready_state(deadline)
+            if self.inflight <= self.max_inflight and now - last_activity >= idle_time:
+                return True
+            if now >= deadline:
+                return False
+            time.sleep(NETWORK_IDLE_POLL_SECONDS)
+
+    def _wait_for_ready_state(self, deadline: float) -> bool:
+        while time.monotonic() < deadline:
+            try:
+                if self.driver.execute_script('return document.readyState') == 'complete':
+                    return True
+            except Exception:
+                return False
+            time.sleep(NETWORK_IDLE_POLL_SECONDS)
+        return False
+
+    def drain(self) -> List[Dict]:
+        """All performance log entries read so far (including any not yet polled), then forget them."""
+        self.poll()
+        entries, self.entries = self.entries, []
+        return entries
+
+
+def reset_driver(driver) -> None:
+    """
+    Return a used browser to a clean state for the next job: extra windows closed, the last
+    site's cookies/storage/cache cleared, blank page loaded and leftover performance logs dropped.
+    Raises if the browser no longer responds.
+    """
+    handles = driver.window_handles
+    for handle in handles[1:]:
+        driver.switch_to.window(handle)
+        driver.close()
+    driver.switch_to.window(handles[0])
+
+    parsed = urlparse(driver.current_url or '')
+    if parsed.scheme in ('http', 'https') and parsed.netloc:
+        try:
+            driver.execute_cdp_cmd('Storage.clearDataForOrigin', {
+                'origin': f"{parsed.scheme}://{parsed.netloc}",
+                'storageTypes': 'all',
+            })
+        except Exception:
+            pass
+    for command in ('Network.clearBrowserCookies', 'Network.clearBrowserCache'):
+        try:
+            driver.execute_cdp_cmd(command, {})
+        except Exception:
+            pass
+
+    driver.get('about:blank')
+    try:
+        driver.execute_cdp_cmd('Emulation.setGeolocationOverride', _GEOLOCATION_OVERRIDE)
+    except Exception:
+        pass
+    try:
+        driver.get_log('performance')
+    except Exception:
+        pass
+
+
+class BrowserPool:
+    """
+    Up to ``size`` Chrome drivers that are started on first use and kept warm between jobs.
+
+    ``acquire`` blocks while all drivers are busy; ``release`` resets the driver with
+    reset_driver and keeps it for the next job, or quits it if the reset fails or it has
+    served BROWSER_MAX_JOBS jobs.
+    """
+
+    def __init__(
+        self,
+        size: int = BROWSER_POOL_SIZE,
+        headless: bool = True,
+        driver_factory: Optional[Callable[[], object]] = None,
+        max_jobs: int = BROWSER_MAX_JOBS,
+    ):
+        self.size = max(1, size)
+        self.headless = headless
+        self.max_jobs = max_jobs
+        self._driver_factory = driver_factory or (lambda: create_driver(headless=self.headless))
+        self._slots = threading.BoundedSemaphore(self.size)
+        self._idle: "queue.LifoQueue[Tuple[object, int]]" = queue.LifoQueue()
+        self._jobs: Dict[int, int] = {}  # id(driver) -> jobs served
+        self._lock = threading.Lock()
+        self._closed = False
+
+    def acquire(self, page_load_timeout: Optional[int] = None):
+        """A warm driver, or a new one while the pool has not reached size."""
+        if self._closed:
+            raise RuntimeError("BrowserPool is closed")
+        self._slots.acquire()
+        try:
+            try:
+                driver, jobs = self._idle.get_nowait()
+            except queue.Empty:
+                driver, jobs = self._driver_factory(), 0
+            else:
+                print("  ✓ Reusing warm browser from pool")
+            with self._lock:
+                self._jobs[id(driver)] = jobs
+            if page_load_timeout:
+                driver.set_page_load_timeout(page_load_timeout)
+            return driver
+        except BaseException:
+            self._slots.release()
+            raise
+
+    def release(self, driver) -> None:
+        """Hand a driver back after a job (reset for reuse, or quit)."""
+        try:
+            with self._lock:
+                jobs = self._jobs.pop(id(driver), 0) + 1
+            keep = not self._closed and jobs < self.max_jobs
+            if keep:
+                try:
+                    reset_driver(driver)
+                except Exception as e:
+                    print(f"  ⚠️  Browser reset failed, restarting it next time: {str(e)[:100]}")
+                    keep = False
+            if keep:
+                self._idle.put((driver, jobs))
+            else:
+                _quit(driver)
+        finally:
+            self._slots.release()
+
+    def close(self) -> None:
+        """Quit every idle driver; drivers still in use are quit when released."""
+        self._closed = True
+        while True:
+            try:
+                driver, _ = self._idle.get_nowait()
+            except queue.Empty:
+                break
+            _quit(driver)
+
+
+def _quit(driver) -> None:
+    try:
+        driver.quit()
+    except Exception:
+        pass
+
+
+_pools: Dict[bool, BrowserPool] = {}
+_pools_lock = threading.Lock()
+
+
+def get_browser_pool(headless: bool = True) -> BrowserPool:
+    """Process-wide pool per headless mode, so every EndpointDiscoverer reuses the same browsers."""
+    with _pools_lock:
+        pool = _pools.get(headless)
+        if pool is None or pool._closed:
+            pool = _pools[headless] = BrowserPool(headless=headless)
+        return pool
+
+
+@atexit.register
+def close_browser_pools() -> None:
+    with _pools_lock:
+        pools = list(_pools.values())
+        _pools.clear()
+    for pool in pools:
+        pool.close()
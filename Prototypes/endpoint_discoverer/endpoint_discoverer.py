@@ -3,19 +3,14 @@
 
 import argparse
 import concurrent.futures
+import copy
 import json
 import re
-import time
 from typing import Dict, List, Optional, Any
-from urllib.parse import urlparse, parse_qs, urlencode
-from selenium import webdriver
-from selenium.webdriver.chrome.service import Service
-from selenium.webdriver.chrome.options import Options
+from urllib.parse import urlparse, parse_qs, urlencode, urljoin
 from selenium.webdriver.common.by import By
 from selenium.webdriver.support.ui import WebDriverWait
-from webdriver_manager.chrome import ChromeDriverManager
 from bs4 import BeautifulSoup
-import requests
 
 import sys
 import os
@@ -29,15 +24,17 @@ _data_scrappers_dir = os.path.join(_parent_dir, 'Data_Scrappers')
 if _data_scrappers_dir not in sys.path:
     sys.path.insert(1, _data_scrappers_dir)
 
+from browser_pool import BrowserPool, NetworkIdleTracker, get_browser_pool
 from network_analyzer import NetworkAnalyzer
 from pattern_detector import PatternDetector
 
 try:
-    from endpoint_verifier import EndpointVerifier
+    from endpoint_verifier import EndpointVerifier, rank_after_verification
     VERIFIER_AVAILABLE = True
 except ImportError as e:
     VERIFIER_AVAILABLE = False
     EndpointVerifier = None
+    rank_after_verification = None
     _verifier_import_error = str(e)
 
 
@@ -58,6 +55,27 @@ _STORE_API_PROBE_PATHS = [
     '/api/establishments',
 ]
 
+_USER_AGENT = 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36'
+
+# HTTP-only discovery ends without a browser when its top endpoint is an API with stores at
+# least this confident (verified when verification is on)
+STATIC_DISCOVERY_MIN_CONFIDENCE = 0.8
+# API-like URLs taken from raw page source per page
+STATIC_MAX_EMBEDDED_URLS = 24
+
+# Quoted absolute URLs, and quoted site paths naming a store/API resource, in page source
+_EMBEDDED_URL_RE = re.compile(
+    r'["\'](https?://[^"\'\s<>]+|/[^"\'\s<>]*?(?:api|json|store|locat|retailer|dealer|boutique)[^"\'\s<>]*)["\']',
+    re.IGNORECASE,
+)
+
+# Quiet period (no request started or finished) that counts as "page settled", and how long to wait for it
+PAGE_IDLE_SECONDS = 1.0
+PAGE_IDLE_TIMEOUT_SECONDS = 20
+# Same after a page interaction (map pan, filter change, load more)
+INTERACTION_IDLE_SECONDS = 0.5
+INTERACTION_IDLE_TIMEOUT_SECONDS = 3
+
 # Small European viewport used for probing — cheap, ~100–400 results for most brands.
 _VIEWPORT_PROBE_PARAMS = {
     'northEastLat': '55.0',
@@ -68,11 +86,25 @@ _VIEWPORT_PROBE_PARAMS = {
 
 
 class EndpointDiscoverer:
-    def __init__(self, headless: bool = True, timeout: int = 30, verify_endpoints: bool = True):
+    def __init__(self, headless: bool = True, timeout: int = 30, verify_endpoints: bool = True,
+                 browser_pool: Optional[BrowserPool] = None, fast_discovery: bool = True):
+        """
+        Args:
+            headless: Run Chrome without a window
+            timeout: Page load timeout in seconds
+            verify_endpoints: Verify discovered endpoints with the scraping methods
+            browser_pool: Browsers to run on; by default the process-wide pool for this headless mode
+            fast_discovery: Try HTTP-only probes on the raw page before launching Chrome
+        """
         self.headless = headless
         self.timeout = timeout
+        self.fast_discovery = fast_discovery
+        self.browser_pool = browser_pool or get_browser_pool(headless)
         self.driver = None
+        self.network_idle: Optional[NetworkIdleTracker] = None
         self.network_analyzer = NetworkAnalyzer()
+        # Page fetches and probes share the analyzer's keep-alive session
+        self.http = self.network_analyzer.session
         self.pattern_detector = PatternDetector()
         self.verify_endpoints = verify_endpoints and VERIFIER_AVAILABLE
         if self.verify_endpoints:
@@ -84,125 +116,21 @@ class EndpointDiscoverer:
                 print(f"  ⚠️  Endpoint verifier not available: {error_msg}")
         
     def _setup_driver(self):
-        """Setup Selenium Chrome driver with network logging"""
-        chrome_options = Options()
-        
-        # Try to find Chrome/Chromium binary
-        import shutil
-        chrome_binary = None
-        for binary_name in ['chromium-browser', 'chromium', 'google-chrome', 'chrome']:
-            binary_path = shutil.which(binary_name)
-            if binary_path:
-                chrome_binary = binary_path
-                print(f"  Found browser: {binary_path}")
-                break
-        
-        if chrome_binary:
-            chrome_options.binary_location = chrome_binary
-        
-        if self.headless:
-            chrome_options.add_argument('--headless=new')  # Use new headless mode
-        chrome_options.add_argument('--no-sandbox')
-        chrome_options.add_argument('--disable-dev-shm-usage')
-        chrome_options.add_argument('--disable-gpu')
-        chrome_options.add_argument('--window-size=1920,1080')
-        chrome_options.add_argument('--disable-software-rasterizer')
-        chrome_options.add_argument('--disable-extensions')
-        chrome_options.add_argument('--disable-setuid-sandbox')
-        chrome_options.add_argument('--disable-background-timer-throttling')
-        chrome_options.add_argument('--disable-backgrounding-occluded-windows')
-        chrome_options.add_argument('--disable-renderer-backgrounding')
-        chrome_options.add_argument('--disable-blink-features=AutomationControlled')
-        chrome_options.add_experimental_option('excludeSwitches', ['enable-automation'])
-        chrome_options.add_experimental_option('useAutomationExtension', False)
-        # Grant geolocation without a permission prompt so map-based store locators
-        # (e.g. SFCC/Demandware) fire their API calls in headless mode.
-        chrome_options.add_argument('--use-fake-ui-for-media-stream')
-        chrome_options.add_experimental_option('prefs', {
-            'profile.default_content_setting_values.geolocation': 1,  # 1 = allow
-        })
-        
-        # Enable performance logging to capture network requests
-        chrome_options.set_capability('goog:loggingPrefs', {'performance': 'ALL'})
-        chrome_options.set_capability('goog:chromeOptions', {
-            'perfLoggingPrefs': {
-                'enableNetwork': True,
-                'enablePage': True
-            }
-        })
-        
-        try:
-            # Try to use system chromedriver first (matches installed Chromium)
-            system_chromedriver = None
-            for chromedriver_name in ['chromium-chromedriver', 'chromedriver']:
-                chromedriver_path = shutil.which(chromedriver_name)
-                if chromedriver_path:
-                    system_chromedriver = chromedriver_path
-                    print(f"  ✓ Found system ChromeDriver: {system_chromedriver}")
-                    break
-            
-            if system_chromedriver:
-                # Use system chromedriver
-                service = Service(system_chromedriver)
-                self.driver = webdriver.Chrome(service=service, options=chrome_options)
-            else:
-                # Fall back to webdriver-manager
-                print("  ⚠️  System ChromeDriver not found, using webdriver-manager...")
-                try:
-                    driver_path = ChromeDriverManager().install()
-                    print(f"  ✓ Using ChromeDriver: {driver_path}")
-                    service = Service(driver_path)
-                    self.driver = webdriver.Chrome(service=service, options=chrome_options)
-                except Exception as wdm_error:
-                    print(f"  ⚠️  webdriver-manager failed: {wdm_error}")
-                    raise Exception(
-                        f"Failed to setup ChromeDriver.\n"
-                        f"Please install: sudo apt-get install chromium-chromedriver\n"
-                        f"Or download from: https://chromedriver.chromium.org/"
-                    )
-            
-            # Enable CDP (Chrome DevTools Protocol) for better network capture
-            try:
-                self.driver.execute_cdp_cmd('Network.enable', {})
-                print("  ✓ Enabled Chrome DevTools Protocol network monitoring")
-            except Exception as cdp_error:
-                print(f"  ⚠️  CDP not available (may still work): {cdp_error}")
+        """Take a warm Chrome driver with network logging from the browser pool"""
+        self.driver = self.browser_pool.acquire(page_load_timeout=self.timeout)
+        self.network_idle = NetworkIdleTracker(self.driver)
 
-            # Mock geolocation so map-based store locators (e.g. SFCC) fire API calls.
-            # Without this, headless Chrome has no location and the map stays blank.
-            try:
-                self.driver.execute_cdp_cmd('Emulation.setGeolocationOverride', {
-                    'latitude': 40.7128,    # New York City
-                    'longitude': -74.0060,
-                    'accuracy': 100,
-                })
-                print("  ✓ Mocked geolocation to New York City (40.71°N, 74.00°W)")
-            except Exception as geo_error:
-                print(f"  ⚠️  Could not mock geolocation: {geo_error}")
-            
-            self.driver.set_page_load_timeout(self.timeout)
-            print("  ✓ Driver setup complete")
-            
-        except Exception as e:
-            error_msg = str(e)
-            print(f"  ❌ Driver setup error: {error_msg}")
-            
-            # Provide helpful error messages
-            if "version" in error_msg.lower() or "chromedriver" in error_msg.lower():
-                raise Exception(
-                    f"ChromeDriver version mismatch or not found.\n"
-                    f"Install with: sudo apt-get install chromium-chromedriver\n"
-                    f"Or download matching version from: https://chromedriver.chromium.org/\n"
-                    f"Original error: {e}"
-                )
-            elif not chrome_binary:
-                raise Exception(
-                    f"Chrome/Chromium browser not found.\n"
-                    f"Install with: sudo apt-get install chromium-browser\n"
-                    f"Original error: {e}"
-                )
-            else:
-                raise Exception(f"Failed to setup Chrome driver: {e}")
+    def _release_driver(self):
+        """Hand the driver back to the pool, reset for the next job"""
+        driver, self.driver, self.network_idle = self.driver, None, None
+        if driver:
+            self.browser_pool.release(driver)
+
+    def _wait_for_network_idle(self, idle_time: float, timeout: float) -> bool:
+        """Wait until the page's network goes quiet (CDP request events), at most timeout seconds"""
+        if not self.network_idle:
+            return False
+        return self.network_idle.wait_for_idle(idle_time=idle_time, timeout=timeout)
         
     def _interact_with_page(self, url: str) -> List[str]:
         """
@@ -246,12 +174,15 @@ class EndpointDiscoverer:
         
         # Wait for page to fully load and JavaScript to execute.
         # Hash-routed map pages (e.g. #lat=...&lng=...) fire their SFCC API call during a
-        # second render cycle triggered by the hash — give them extra time.
+        # second render cycle triggered by the hash — require a longer quiet period.
         parsed_initial = urlparse(url)
         has_map_hash = any(k in (parsed_initial.fragment or '').lower() for k in ('lat', 'lng', 'lon'))
-        initial_wait = 6 if has_map_hash else 4
-        print(f"  ⏳ Waiting {initial_wait}s for page to initialize...")
-        time.sleep(initial_wait)
+        idle_window = PAGE_IDLE_SECONDS * 2 if has_map_hash else PAGE_IDLE_SECONDS
+        print(f"  ⏳ Waiting for page network to go idle ({idle_window:.1f}s quiet)...")
+        if self._wait_for_network_idle(idle_window, PAGE_IDLE_TIMEOUT_SECONDS):
+            print(f"  ✓ Network idle")
+        else:
+            print(f"  ⚠️  Network still busy after {PAGE_IDLE_TIMEOUT_SECONDS}s (continuing anyway)")
         
         # Try to wait for common store locator elements
         try:
@@ -278,13 +209,12 @@ class EndpointDiscoverer:
                 if interaction():
                     successful_interactions += 1
                     print(f"  ✓ {name} triggered")
-                    time.sleep(1)
+                    self._wait_for_network_idle(INTERACTION_IDLE_SECONDS, INTERACTION_IDLE_TIMEOUT_SECONDS)
                     captured = _capture_current_url()
                     if captured:
                         print(f"  ✓ Captured URL after {name}: {captured[:80]}...")
                 else:
                     print(f"  ⊘ {name} not available")
-                time.sleep(2)
             except Exception as e:
                 print(f"  ⊘ {name} failed: {str(e)[:100]}")
                 continue
@@ -296,9 +226,9 @@ class EndpointDiscoverer:
         _capture_current_url()
         
         # Final wait — map-heavy pages can be slow to resolve their first API call
-        final_wait = 5 if has_map_hash else 3
-        print(f"  ⏳ Final wait {final_wait}s for delayed requests...")
-        time.sleep(final_wait)
+        final_timeout = 5 if has_map_hash else 3
+        print(f"  ⏳ Final wait (up to {final_timeout}s) for delayed requests...")
+        self._wait_for_network_idle(idle_window, final_timeout)
         
         return seen_urls
     
@@ -329,7 +259,7 @@ class EndpointDiscoverer:
                                 
                                 # Move to center and click
                                 actions.move_to_element(map_element).move_by_offset(10, 10).click().perform()
-                                time.sleep(0.5)
+                                self._wait_for_network_idle(0.3, 1.0)
                                 
                                 # Try dragging to trigger pan
                                 actions.move_to_element(map_element).click_and_hold().move_by_offset(50, 50).release().perform()
@@ -475,7 +405,8 @@ class EndpointDiscoverer:
         
         # Method 2: Use performance logs (more compatible)
         try:
-            logs = self.driver.get_log('performance')
+            # Entries read while waiting for network idle are buffered by the tracker
+            logs = self.network_idle.drain() if self.network_idle else self.driver.get_log('performance')
             print(f"  📡 Captured {len(logs)} performance log entries")
             
             for log in logs:
@@ -631,20 +562,19 @@ class EndpointDiscoverer:
         
         return False
 
-    def _extract_sfcc_store_api_urls_from_page(self) -> List[Dict]:
+    def _extract_sfcc_store_api_urls_from_page(self, source: Optional[str] = None) -> List[Dict]:
         """
-        Pull SFCC / Demandware store search URLs from rendered page source.
+        Pull SFCC / Demandware store search URLs from page source (the rendered page
+        unless raw HTML is given).
         These often call api.<brand>.<tld>/s/.../dw/shop/vXX_XX/stores?client_id=... and may
         be missed when performance logs truncate or the map loads late (hash routing).
 
         Also tries to attach a discovered client_id to the base URL so the verifier
         can make a real test request.
         """
-        if not self.driver:
-            return []
-        try:
-            source = self.driver.page_source or ''
-        except Exception:
+        if source is None:
+            source = self._rendered_page_source()
+        if not source:
             return []
 
         # Escaped URLs in JSON strings: https:\/\/api...
@@ -709,21 +639,23 @@ class EndpointDiscoverer:
             print(f"  ✓ Extracted {len(out)} SFCC /dw/shop/.../stores URL(s) from page source")
         return out
     
-    def _analyze_html_content(self, url: str) -> Optional[Dict]:
+    def _analyze_html_content(self, url: str, html: Optional[str] = None) -> Optional[Dict]:
         """
         Analyze HTML content for embedded store data
         
         Args:
             url: URL to analyze
+            html: Raw HTML already fetched from url (fetched here if None)
             
         Returns:
             Dictionary with detected HTML patterns or None
         """
         try:
-            response = requests.get(url, timeout=15, headers={
-                'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36'
-            })
-            html = response.text
+            if html is None:
+                response = self.http.get(url, timeout=15, headers={
+                    'User-Agent': _USER_AGENT
+                })
+                html = response.text
             
             # Quick check: does HTML contain store-related patterns?
             store_patterns = [
@@ -835,8 +767,8 @@ class EndpointDiscoverer:
             query = urlencode(params)
             url = f"{base_scheme}://{base_netloc}{base_path}?{query}"
             try:
-                response = requests.get(url, timeout=10, headers={
-                    'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36',
+                response = self.http.get(url, timeout=10, headers={
+                    'User-Agent': _USER_AGENT,
                     'Accept': 'text/html, application/json, */*'
                 })
                 if response.status_code != 200:
@@ -874,27 +806,12 @@ class EndpointDiscoverer:
         
         return results
     
-    def _probe_related_api_domains(self, store_locator_url: str) -> List[Dict]:
-        """
-        Find related brand subdomains mentioned in the rendered page and probe them
-        with known store-API path patterns.
-
-        This handles cases like Rolex where the store locator lives on
-        www.rolex.com but the actual API is on retailers.rolex.com.
-        Probes all (domain, path) combinations concurrently.
-        """
-        if not self.driver:
-            return []
-
-        try:
-            source = self.driver.page_source
-        except Exception:
-            return []
-
+    def _related_api_domains(self, store_locator_url: str, source: str) -> set:
+        """Related brand subdomains (scheme://host) quoted in page source, minus CDN/media/tracking hosts"""
         parsed_base = urlparse(store_locator_url)
         base_parts = parsed_base.netloc.split('.')
         if len(base_parts) < 2:
-            return []
+            return set()
         brand_tld = '.'.join(base_parts[-2:])   # e.g. "rolex.com"
 
         # Extract all quoted https URLs from the rendered source
@@ -913,17 +830,33 @@ class EndpointDiscoverer:
             'fonts', 'content', 'files', 'metrics', 'analytics', 'tracking',
             'mail', 'email', 'smtp',
         }
-        related_domains = {
+        return {
             d for d in related_domains
             if urlparse(d).hostname.split('.')[0].lower() not in _NON_API_SUBDOMAIN_PREFIXES
         }
 
+    def _probe_related_api_domains(self, store_locator_url: str, source: Optional[str] = None,
+                                   exclude_domains: frozenset = frozenset()) -> List[Dict]:
+        """
+        Find related brand subdomains mentioned in the page (rendered unless raw HTML
+        source is given) and probe them with known store-API path patterns.
+
+        This handles cases like Rolex where the store locator lives on
+        www.rolex.com but the actual API is on retailers.rolex.com.
+        Probes all (domain, path) combinations concurrently; exclude_domains were already probed.
+        """
+        if source is None:
+            source = self._rendered_page_source()
+        if not source:
+            return []
+
+        related_domains = self._related_api_domains(store_locator_url, source) - exclude_domains
         if not related_domains:
             return []
 
         print(f"  🔎 Probing {len(related_domains)} related brand domain(s): {', '.join(related_domains)}")
 
-        headers = {'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36'}
+        headers = {'User-Agent': _USER_AGENT}
 
         # Track first successful hit per domain so we only return one result per domain
         domain_hits: Dict[str, Dict] = {}
@@ -931,7 +864,7 @@ class EndpointDiscoverer:
         def _probe(domain: str, path: str) -> Optional[Dict]:
             probe_url = f"{domain}{path}"
             try:
-                resp = requests.get(
+                resp = self.http.get(
                     probe_url,
                     params=_VIEWPORT_PROBE_PARAMS,
                     headers=headers,
@@ -1014,29 +947,153 @@ class EndpointDiscoverer:
         
         return False
     
+    def _rendered_page_source(self) -> str:
+        """Source of the page currently loaded in the browser ('' without a driver)"""
+        if not self.driver:
+            return ''
+        try:
+            return self.driver.page_source or ''
+        except Exception:
+            return ''
+
+    def _fetch_page_html(self, store_locator_url: str) -> Optional[str]:
+        """Raw HTML of the store locator page over plain HTTP (no JavaScript), or None"""
+        try:
+            response = self.http.get(store_locator_url, timeout=15, headers={
+                'User-Agent': _USER_AGENT,
+                'Accept': 'text/html,application/xhtml+xml,*/*;q=0.8',
+            })
+        except Exception as e:
+            print(f"  ⚠️  Could not fetch page over HTTP: {str(e)[:100]}")
+            return None
+        if response.status_code != 200:
+            print(f"  ⚠️  Page returned HTTP {response.status_code} without a browser")
+            return None
+        return response.text
+
+    def _extract_embedded_api_urls(self, store_locator_url: str, source: str) -> List[Dict]:
+        """
+        API-looking URLs quoted in raw page source (inline config, JSON blobs, fetch calls),
+        resolved against the page URL. Template URLs (``{id}``, ``${...}``) are skipped.
+        """
+        norm = source.replace('\\/', '/')
+        out: List[Dict] = []
+        seen = set()
+        for m in _EMBEDDED_URL_RE.finditer(norm):
+            raw = m.group(1)
+            if any(t in raw for t in ('{', '}', '$', '+')):
+                continue
+            url = urljoin(store_locator_url, raw)
+            if url in seen or url.split('#')[0] == store_locator_url.split('#')[0]:
+                continue
+            seen.add(url)
+            if self.network_analyzer._should_skip_url(url) or not self._is_relevant_request(url, ''):
+                continue
+            if not any(re.search(pat, url.lower()) for pat in NetworkAnalyzer.API_PATTERNS):
+                continue
+            out.append({
+                'url': url,
+                'method': 'GET',
+                'status': 0,
+                'mimeType': '',
+                'headers': {},
+            })
+            if len(out) >= STATIC_MAX_EMBEDDED_URLS:
+                break
+        if out:
+            print(f"  ✓ Found {len(out)} API-like URL(s) embedded in page source")
+        return out
+
+    def _discover_static(self, store_locator_url: str) -> Dict[str, Any]:
+        """
+        HTTP-only probes on the raw page: API URLs embedded in the source, SFCC /dw/shop/ URLs,
+        proactive query-param variations and related brand API domains.
+
+        Returns:
+            {'html': raw HTML or None, 'requests': candidate request dicts,
+             'probed_domains': related domains already probed}
+        """
+        static = {'html': None, 'requests': [], 'probed_domains': frozenset()}
+        print("\n⚡ HTTP-only discovery (no browser)...")
+        html = self._fetch_page_html(store_locator_url)
+        static['html'] = html
+
+        def _add(reqs: List[Dict]):
+            for req in reqs:
+                if not any(r.get('url') == req['url'] for r in static['requests']):
+                    static['requests'].append(req)
+
+        if html:
+            _add([{
+                'url': store_locator_url,
+                'method': 'GET',
+                'status': 200,
+                'mimeType': 'text/html',
+                'headers': {},
+            }])
+            _add(self._extract_embedded_api_urls(store_locator_url, html))
+            _add(self._extract_sfcc_store_api_urls_from_page(html))
+            probed = frozenset(self._related_api_domains(store_locator_url, html))
+            _add(self._probe_related_api_domains(store_locator_url, html))
+            static['probed_domains'] = probed
+
+        # Proactive URL variation testing (e.g. Bulgari: ?country-region=US&per=50&offset=0)
+        _add(self._try_proactive_url_variations(store_locator_url))
+        return static
+
+    def _is_conclusive(self, endpoints: List[Dict]) -> bool:
+        """
+        Whether the top endpoint is good enough to skip the browser: an API (not HTML, whose
+        JavaScript may still call a better one) with stores and at least
+        STATIC_DISCOVERY_MIN_CONFIDENCE; it must have verified when verification is on.
+        """
+        if not endpoints:
+            return False
+        top = endpoints[0]
+        if top.get('type') == 'html' or top.get('confidence', 0) < STATIC_DISCOVERY_MIN_CONFIDENCE:
+            return False
+        if self.verify_endpoints and self.verifier:
+            return bool(top.get('verified')) and (top.get('verified_store_count') or 0) > 0
+        return (top.get('store_count') or 0) > 0
+
     def discover(self, store_locator_url: str) -> Dict[str, Any]:
         """
-        Discover API endpoint from store locator page
+        Discover API endpoint from store locator page.
+
+        Cheap HTTP-only probes run first (unless fast_discovery is off); Chrome is only
+        launched when they find no conclusive endpoint.
         
         Args:
             store_locator_url: URL of the store locator page
             
         Returns:
-            Dictionary with discovered endpoint information
+            Dictionary with discovered endpoint information; 'discovery_tier' is
+            'http' or 'browser'
         """
-        result = {
-            'success': False,
-            'url': store_locator_url,
-            'endpoints': [],
-            'suggested_config': None,
-            'errors': []
-        }
-        
+        print(f"\n{'='*80}")
+        print(f"Discovering endpoints from: {store_locator_url}")
+        print(f"{'='*80}\n")
+
+        static = None
+        static_result = None
+        if self.fast_discovery:
+            try:
+                static = self._discover_static(store_locator_url)
+                if static['requests']:
+                    result = self._new_result(store_locator_url, 'http')
+                    self._analyze_and_suggest(store_locator_url, static['requests'], result, static['html'])
+                    if self._is_conclusive(result['endpoints']):
+                        print("\n⚡ HTTP-only discovery found a verified endpoint — skipping browser")
+                        result['success'] = True
+                        return result
+                    static_result = result
+                print("\n⚡ Nothing conclusive without a browser — launching Chrome")
+            except Exception as e:
+                print(f"  ⚠️  HTTP-only discovery failed: {str(e)[:100]}")
+
+        result = self._new_result(store_locator_url, 'browser')
         try:
             self._setup_driver()
-            print(f"\n{'='*80}")
-            print(f"Discovering endpoints from: {store_locator_url}")
-            print(f"{'='*80}\n")
             
             # Interact with page to trigger API calls
             navigation_urls = self._interact_with_page(store_locator_url)
@@ -1063,116 +1120,57 @@ class EndpointDiscoverer:
                     })
                     print(f"  ✓ Added URL from page navigation: {nav_url[:80]}...")
             
-            # Proactive URL variation testing (e.g. Bulgari: ?country-region=US&per=50&offset=0)
-            print("\n🔬 Trying proactive URL variations...")
-            proactive_requests = self._try_proactive_url_variations(store_locator_url)
-            for req in proactive_requests:
-                if not any(r.get('url') == req['url'] for r in network_requests):
-                    network_requests.append(req)
+            if static is not None:
+                # HTTP-only candidates (incl. proactive variations) were already collected
+                if static_result is None:
+                    for req in static['requests']:
+                        if not any(r.get('url') == req['url'] for r in network_requests):
+                            network_requests.append(req)
+            else:
+                # Proactive URL variation testing (e.g. Bulgari: ?country-region=US&per=50&offset=0)
+                print("\n🔬 Trying proactive URL variations...")
+                proactive_requests = self._try_proactive_url_variations(store_locator_url)
+                for req in proactive_requests:
+                    if not any(r.get('url') == req['url'] for r in network_requests):
+                        network_requests.append(req)
 
             # Probe related brand subdomains found in the rendered page source.
             # Handles cases like Rolex (www.rolex.com page, retailers.rolex.com API).
             print("\n🔎 Probing related brand domains from page config...")
-            related_domain_requests = self._probe_related_api_domains(store_locator_url)
+            rendered_source = self._rendered_page_source()
+            related_domain_requests = self._probe_related_api_domains(
+                store_locator_url,
+                rendered_source,
+                exclude_domains=static['probed_domains'] if static else frozenset(),
+            )
             for req in related_domain_requests:
                 if not any(r.get('url') == req['url'] for r in network_requests):
                     network_requests.append(req)
 
             # SFCC store locator: API URL is often embedded in JS (api.* + /dw/shop/v.../stores)
             print("\n📎 Scanning page source for SFCC store API URLs...")
-            for req in self._extract_sfcc_store_api_urls_from_page():
+            for req in self._extract_sfcc_store_api_urls_from_page(rendered_source):
                 if not any(r.get('url') == req['url'] for r in network_requests):
                     network_requests.append(req)
 
             if len(network_requests) == 0:
                 print(f"  ⚠️  No network requests captured - trying alternative method...")
                 # Try capturing from page source or checking if data is embedded
-                time.sleep(2)
+                self._wait_for_network_idle(PAGE_IDLE_SECONDS, 2)
                 network_requests = self._capture_network_requests()
             
-            print(f"  Found {len(network_requests)} potential API requests")
-            
-            # Analyze HTML content for embedded data FIRST (before network analysis)
-            # This helps us identify HTML pages with store data
-            print("\n📄 Analyzing HTML content...")
-            html_analysis = self._analyze_html_content(store_locator_url)
-            if html_analysis:
-                result['html_analysis'] = html_analysis
-                if html_analysis.get('store_count_estimate'):
-                    print(f"  ✓ Found embedded store data: ~{html_analysis.get('store_count_estimate')} stores")
-                elif html_analysis.get('pattern_matches'):
-                    print(f"  ✓ Found store data patterns: {html_analysis.get('pattern_matches')} matches")
-            
-            # Analyze network requests
-            print("\n🔍 Analyzing network requests...")
-            analyzed_endpoints = self.network_analyzer.analyze_requests(network_requests, store_locator_url)
-            
-            # Boost confidence for HTML endpoints that match the store locator URL and have store data
-            if html_analysis and (html_analysis.get('store_count_estimate') or html_analysis.get('pattern_matches', 0) >= 2):
-                for endpoint in analyzed_endpoints:
-                    # If this endpoint is the HTML page itself and has store data
-                    if endpoint.get('type') == 'html' and endpoint.get('url') == store_locator_url:
-                        # Significantly boost confidence
-                        endpoint['confidence'] = min(endpoint.get('confidence', 0) + 0.4, 1.0)
-                        if html_analysis.get('store_count_estimate'):
-                            endpoint['store_count'] = html_analysis.get('store_count_estimate')
-                        endpoint['indicators'].append('html_with_embedded_store_data')
-                        print(f"  ✓ Boosted confidence for HTML endpoint with embedded store data")
-                
-                # Re-sort endpoints by confidence after boosting
-                analyzed_endpoints.sort(key=lambda x: (x.get('confidence', 0), x.get('store_count', 0) or 0), reverse=True)
-            
-            # Show which endpoints had base URL variations found
-            for endpoint in analyzed_endpoints:
-                if endpoint.get('is_base_url'):
-                    print(f"  ✓ Found base URL for: {endpoint.get('url', '')[:80]}...")
-                    if endpoint.get('original_url'):
-                        print(f"    (removed location params from: {endpoint.get('original_url', '')[:80]}...)")
-            
-            # Verify endpoints using existing scraping methods (if enabled)
-            # Do this BEFORE pattern detection so pattern detector can use verified data
-            if self.verify_endpoints and self.verifier and analyzed_endpoints:
-                print("\n🔬 Verifying endpoints with scraping methods...")
-                print(f"   Testing {len(analyzed_endpoints)} endpoints...")
-                
-                try:
-                    verified_endpoints = self.verifier.verify_multiple(analyzed_endpoints)
-                    
-                    # Show verification results
-                    verified_count = sum(1 for ep in verified_endpoints if ep.get('verified'))
-                    print(f"   ✓ Verified {verified_count}/{len(verified_endpoints)} endpoints")
-                    for endpoint in verified_endpoints[:5]:  # Show top 5
-                        if endpoint.get('verified'):
-                            store_count = endpoint.get('verified_store_count', 0)
-                            url_display = endpoint.get('optimized_url') or endpoint.get('url', '')
-                            if endpoint.get('optimized_url'):
-                                print(f"      • {url_display[:60]}... → {store_count} stores (optimized radius) ({endpoint.get('verification_time', 0):.2f}s)")
-                            else:
-                                print(f"      • {url_display[:60]}... → {store_count} stores ({endpoint.get('verification_time', 0):.2f}s)")
-                        elif endpoint.get('verification_error'):
-                            error_msg = endpoint.get('verification_error', '')
-                            print(f"      ⊘ {endpoint.get('url', '')[:60]}... → {error_msg[:80]}")
-                    
-                    analyzed_endpoints = verified_endpoints
-                except Exception as e:
-                    print(f"   ⚠️  Verification failed: {e}")
-                    import traceback
-                    traceback.print_exc()
-            elif self.verify_endpoints and not self.verifier:
-                print("\n⚠️  Endpoint verification skipped (verifier not available)")
-            
-            result['endpoints'] = analyzed_endpoints
-            
-            # Detect patterns and suggest configuration
-            # Use verified endpoints if available (they have better data)
-            print("\n🎯 Detecting endpoint patterns...")
-            suggested_config = self.pattern_detector.detect_and_suggest(
-                analyzed_endpoints,
-                html_analysis,
-                store_locator_url
+            if static_result is not None:
+                # Already analyzed and verified by the HTTP-only pass; only new requests are analyzed
+                analyzed_urls = {req['url'] for req in static['requests']}
+                network_requests = [r for r in network_requests if r.get('url') not in analyzed_urls]
+                print(f"  Found {len(network_requests)} potential API requests not seen without a browser")
+            else:
+                print(f"  Found {len(network_requests)} potential API requests")
+
+            self._analyze_and_suggest(
+                store_locator_url, network_requests, result, static['html'] if static else None,
+                prior=static_result,
             )
-            result['suggested_config'] = suggested_config
-            
             result['success'] = True
             
         except Exception as e:
@@ -1180,36 +1178,166 @@ class EndpointDiscoverer:
             print(f"\n❌ Error: {e}")
         
         finally:
-            if self.driver:
-                self.driver.quit()
+            self._release_driver()
         
         return result
 
+    @staticmethod
+    def _new_result(store_locator_url: str, tier: str) -> Dict[str, Any]:
+        return {
+            'success': False,
+            'url': store_locator_url,
+            'discovery_tier': tier,
+            'endpoints': [],
+            'suggested_config': None,
+            'errors': []
+        }
 
-def main():
-    """Command line interface"""
-    parser = argparse.ArgumentParser(
-        description='Discover API endpoints from store locator pages',
-        formatter_class=argparse.RawDescriptionHelpFormatter
-    )
-    
-    parser.add_argument('--url', required=True, help='Store locator page URL')
-    parser.add_argument('--headless', action='store_true', default=True, help='Run browser in headless mode')
-    parser.add_argument('--output', help='Output file for results (JSON)')
-    parser.add_argument('--no-verify', action='store_true', help='Skip endpoint verification (faster but less accurate)')
-    
-    args = parser.parse_args()
-    
-    discoverer = EndpointDiscoverer(headless=args.headless, verify_endpoints=not args.no_verify)
-    result = discoverer.discover(args.url)
-    
-    # Print results
+    def _analyze_and_suggest(self, store_locator_url: str, network_requests: List[Dict],
+                             result: Dict[str, Any], html: Optional[str] = None,
+                             prior: Optional[Dict[str, Any]] = None) -> None:
+        """
+        Analyze candidate requests, verify them and suggest a config; fills result's
+        'html_analysis', 'endpoints' and 'suggested_config'.
+
+        Args:
+            html: Raw page HTML if already fetched (saves refetching it for HTML analysis)
+            prior: An earlier result for the same page (the HTTP-only pass); its HTML analysis
+                and verified endpoints are reused and network_requests should hold only
+                requests it has not analyzed
+        """
+        # Analyze HTML content for embedded data FIRST (before network analysis)
+        # This helps us identify HTML pages with store data
+        if prior is not None:
+            html_analysis = prior.get('html_analysis')
+        else:
+            print("\n📄 Analyzing HTML content...")
+            html_analysis = self._analyze_html_content(store_locator_url, html)
+        if html_analysis:
+            result['html_analysis'] = html_analysis
+            if html_analysis.get('store_count_estimate'):
+                print(f"  ✓ Found embedded store data: ~{html_analysis.get('store_count_estimate')} stores")
+            elif html_analysis.get('pattern_matches'):
+                print(f"  ✓ Found store data patterns: {html_analysis.get('pattern_matches')} matches")
+        
+        # Analyze network requests
+        print("\n🔍 Analyzing network requests...")
+        analyzed_endpoints = self.network_analyzer.analyze_requests(network_requests, store_locator_url)
+        
+        # Boost confidence for HTML endpoints that match the store locator URL and have store data
+        if html_analysis and (html_analysis.get('store_count_estimate') or html_analysis.get('pattern_matches', 0) >= 2):
+            for endpoint in analyzed_endpoints:
+                # If this endpoint is the HTML page itself and has store data
+                if endpoint.get('type') == 'html' and endpoint.get('url') == store_locator_url:
+                    # Significantly boost confidence
+                    endpoint['confidence'] = min(endpoint.get('confidence', 0) + 0.4, 1.0)
+                    if html_analysis.get('store_count_estimate'):
+                        endpoint['store_count'] = html_analysis.get('store_count_estimate')
+                    endpoint['indicators'].append('html_with_embedded_store_data')
+                    print(f"  ✓ Boosted confidence for HTML endpoint with embedded store data")
+            
+            # Re-sort endpoints by confidence after boosting
+            analyzed_endpoints.sort(key=lambda x: (x.get('confidence', 0), x.get('store_count', 0) or 0), reverse=True)
+        
+        # Show which endpoints had base URL variations found
+        for endpoint in analyzed_endpoints:
+            if endpoint.get('is_base_url'):
+                print(f"  ✓ Found base URL for: {endpoint.get('url', '')[:80]}...")
+                if endpoint.get('original_url'):
+                    print(f"    (removed location params from: {endpoint.get('original_url', '')[:80]}...)")
+        
+        # Verify endpoints using existing scraping methods (if enabled)
+        # Do this BEFORE pattern detection so pattern detector can use verified data
+        if self.verify_endpoints and self.verifier and analyzed_endpoints:
+            print("\n🔬 Verifying endpoints with scraping methods...")
+            print(f"   Testing {len(analyzed_endpoints)} endpoints...")
+            
+            try:
+                verified_endpoints = self.verifier.verify_multiple(analyzed_endpoints)
+                
+                # Show verification results
+                verified_count = sum(1 for ep in verified_endpoints if ep.get('verified'))
+                print(f"   ✓ Verified {verified_count}/{len(verified_endpoints)} endpoints")
+                for endpoint in verified_endpoints[:5]:  # Show top 5
+                    if endpoint.get('verified'):
+                        store_count = endpoint.get('verified_store_count', 0)
+                        url_display = endpoint.get('optimized_url') or endpoint.get('url', '')
+                        if endpoint.get('optimized_url'):
+                            print(f"      • {url_display[:60]}... → {store_count} stores (optimized radius) ({endpoint.get('verification_time', 0):.2f}s)")
+                        else:
+                            print(f"      • {url_display[:60]}... → {store_count} stores ({endpoint.get('verification_time', 0):.2f}s)")
+                    elif endpoint.get('verification_error'):
+                        error_msg = endpoint.get('verification_error', '')
+                        print(f"      ⊘ {endpoint.get('url', '')[:60]}... → {error_msg[:80]}")
+                
+                analyzed_endpoints = verified_endpoints
+            except Exception as e:
+                print(f"   ⚠️  Verification failed: {e}")
+                import traceback
+                traceback.print_exc()
+        elif self.verify_endpoints and not self.verifier:
+            print("\n⚠️  Endpoint verification skipped (verifier not available)")
+
+        if prior is not None:
+            analyzed_endpoints = self._merge_endpoints(prior.get('endpoints') or [], analyzed_endpoints)
+        
+        result['endpoints'] = analyzed_endpoints
+        
+        # Detect patterns and suggest configuration
+        # Use verified endpoints if available (they have better data)
+        print("\n🎯 Detecting endpoint patterns...")
+        suggested_config = self.pattern_detector.detect_and_suggest(
+            analyzed_endpoints,
+            html_analysis,
+            store_locator_url
+        )
+        result['suggested_config'] = suggested_config
+
+    def _merge_endpoints(self, earlier: List[Dict], new: List[Dict]) -> List[Dict]:
+        """Endpoints from both passes (earlier wins on the same URL), ranked as one list."""
+        seen = {ep.get('url') for ep in earlier}
+        merged = list(earlier) + [ep for ep in new if ep.get('url') not in seen]
+        if self.verify_endpoints and self.verifier:
+            merged.sort(key=rank_after_verification, reverse=True)
+        else:
+            merged.sort(key=lambda x: (x.get('confidence', 0), x.get('store_count', 0) or 0), reverse=True)
+        return merged
+
+    def discover_many(self, store_locator_urls: List[str], max_workers: Optional[int] = None) -> List[Dict[str, Any]]:
+        """
+        Discover several store locator pages at once, one pooled browser per page.
+
+        Args:
+            store_locator_urls: Store locator page URLs
+            max_workers: Pages run at once (default: the browser pool size)
+
+        Returns:
+            discover() results in the order of store_locator_urls
+        """
+        if not store_locator_urls:
+            return []
+        workers = min(max_workers or self.browser_pool.size, len(store_locator_urls))
+        if workers <= 1:
+            return [self.discover(url) for url in store_locator_urls]
+        with concurrent.futures.ThreadPoolExecutor(max_workers=workers) as executor:
+            return list(executor.map(lambda url: self._for_job().discover(url), store_locator_urls))
+
+    def _for_job(self) -> 'EndpointDiscoverer':
+        """Copy with its own driver slot, sharing the pool, analyzer, detector and verifier"""
+        job = copy.copy(self)
+        job.driver = None
+        job.network_idle = None
+        return job
+
+
+def _print_result(result: Dict[str, Any]) -> None:
+    """Print one discover() result"""
     print(f"\n{'='*80}")
     print("DISCOVERY RESULTS")
     print(f"{'='*80}\n")
     
     if result['success']:
-        print(f"✅ Successfully analyzed: {args.url}\n")
+        print(f"✅ Successfully analyzed: {result['url']}\n")
         
         if result['endpoints']:
             print(f"Found {len(result['endpoints'])} potential endpoints:\n")
@@ -1238,16 +1366,61 @@ def main():
             print("📋 Suggested Brand Configuration:\n")
             print(json.dumps(result['suggested_config'], indent=2))
     else:
-        print(f"❌ Failed to discover endpoints")
+        print(f"❌ Failed to discover endpoints for: {result['url']}")
         if result['errors']:
             print("\nErrors:")
             for error in result['errors']:
                 print(f"  - {error}")
+
+
+def _read_urls_file(path: str) -> List[str]:
+    """Store locator URLs from a file, one per line ('#' comments and blank lines skipped)"""
+    with open(path, encoding='utf-8') as f:
+        return [line.strip() for line in f if line.strip() and not line.lstrip().startswith('#')]
+
+
+def main():
+    """Command line interface"""
+    parser = argparse.ArgumentParser(
+        description='Discover API endpoints from store locator pages',
+        formatter_class=argparse.RawDescriptionHelpFormatter
+    )
+    
+    parser.add_argument('--url', action='append', default=[],
+                        help='Store locator page URL (repeat for several pages)')
+    parser.add_argument('--urls-file', help='File with one store locator page URL per line')
+    parser.add_argument('--workers', type=int,
+                        help='Pages discovered at once with several URLs (default: browser pool size)')
+    parser.add_argument('--headless', action='store_true', default=True, help='Run browser in headless mode')
+    parser.add_argument('--output', help='Output file for results (JSON; a list when several URLs are given)')
+    parser.add_argument('--no-verify', action='store_true', help='Skip endpoint verification (faster but less accurate)')
+    parser.add_argument('--browser-only', action='store_true', help='Skip the HTTP-only probes and always launch Chrome')
+    
+    args = parser.parse_args()
+    urls = list(args.url)
+    if args.urls_file:
+        urls.extend(_read_urls_file(args.urls_file))
+    if not urls:
+        parser.error('give at least one --url or a --urls-file')
+    
+    discoverer = EndpointDiscoverer(
+        headless=args.headless,
+        verify_endpoints=not args.no_verify,
+        fast_discovery=not args.browser_only,
+    )
+    # One process, one warm browser pool for every page
+    results = discoverer.discover_many(urls, max_workers=args.workers)
+    
+    for result in results:
+        _print_result(result)
+    if len(results) > 1:
+        succeeded = sum(1 for r in results if r['success'])
+        print(f"\n📊 {succeeded}/{len(results)} page(s) analyzed successfully")
     
-    # Save to file if requested
+    # Save to file if requested (a single URL keeps the single-result format)
     if args.output:
         with open(args.output, 'w') as f:
-            json.dump(result, f, indent=2)
+            json.dump(results[0] if len(results) == 1 else results, f, indent=2)
         print(f"\n💾 Results saved to: {args.output}")
 
 
@@ -3,11 +3,33 @@
 
 import sys
 import os
+import json
+import sqlite3
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from typing import Dict, List, Optional, Any
-from urllib.parse import urlparse, parse_qs
+from urllib.parse import urlparse, parse_qs, parse_qsl, urlencode, urlsplit, urlunsplit
 
 DISCOVERY_SAMPLE_LIMIT = 15
 
+# Endpoints verified at once by verify_multiple; 1 verifies them one by one
+VERIFY_WORKERS = 4
+# Candidates below this confidence are skipped once a trusted endpoint has verified
+EARLY_SKIP_CONFIDENCE = 0.8
+
+# Persistent cache: ENDPOINT_VERIFY_CACHE_PATH="" disables it
+VERIFICATION_CACHE_PATH = os.environ.get(
+    "ENDPOINT_VERIFY_CACHE_PATH",
+    os.path.join(os.path.dirname(os.path.abspath(__file__)), ".cache", "verification_cache.sqlite3"),
+)
+VERIFICATION_CACHE_TTL_SECONDS = 24 * 3600
+# Endpoints that answered but yielded no stores; errored verifications are never kept on disk
+VERIFICATION_NEGATIVE_TTL_SECONDS = 3600
+SQLITE_BUSY_TIMEOUT_SECONDS = 30
+
+_DEFAULT_PORTS = {'http': 80, 'https': 443}
+
 _PAGE_SIZE_KEYS = frozenset({'limit', 'per', 'per_page', 'take', 'page_size', 'count', 'pagesize'})
 
 # Verified responses from these URLs are often nested product/page context — not locator APIs.
@@ -34,6 +56,31 @@ def _url_with_sample_limit(url: str, limit: int = DISCOVERY_SAMPLE_LIMIT) -> str
     sep = '&' if parsed.query else '?'
     return f"{url}{sep}limit={limit}"
 
+def verification_cache_key(url: str, headers: Optional[Dict] = None) -> str:
+    """
+    Cache key for a verification: the URL with scheme and host lower-cased, the default port
+    and fragment dropped and query parameters sorted, plus the headers with lower-cased names
+    in sorted order. No headers and empty headers share a key.
+    """
+    parsed = urlsplit(url.strip())
+    scheme = parsed.scheme.lower()
+    host = parsed.hostname or ''
+    if ':' in host:
+        host = f"[{host}]"
+    try:
+        port = parsed.port
+    except ValueError:
+        port = None
+    if port and port != _DEFAULT_PORTS.get(scheme):
+        host = f"{host}:{port}"
+    userinfo = parsed.netloc.rpartition('@')[0]
+    netloc = f"{userinfo}@{host}" if userinfo else host
+    query = urlencode(sorted(parse_qsl(parsed.query, keep_blank_values=True)))
+    normalized = urlunsplit((scheme, netloc, parsed.path or '/', query, ''))
+    header_items = sorted((str(k).strip().lower(), str(v).strip()) for k, v in (headers or {}).items())
+    return f"{normalized}|{json.dumps(header_items, ensure_ascii=False)}"
+
+
 _current_dir = os.path.dirname(os.path.abspath(__file__))
 _parent_dir = os.path.dirname(_current_dir)
 _data_scrappers_dir = os.path.join(_parent_dir, 'Data_Scrappers')
@@ -85,18 +132,120 @@ if SCRAPING_METHODS_AVAILABLE and 'pattern_detector' not in sys.modules:
         detect_data_pattern = None
 
 
+def rank_after_verification(ep: Dict) -> tuple:
+    """
+    Sort key (use reverse=True) for verified endpoints: prefer real locator APIs over beacons
+    that happen to embed a tiny "stores" array. Previously (verified, store_count, confidence)
+    put 2-store false positives above stronger unverified candidates.
+    """
+    url = ep.get('url') or ''
+    sc = ep.get('verified_store_count') or 0
+    conf = float(ep.get('confidence') or 0)
+    verified_ok = bool(ep.get('verified')) and sc > 0
+    suspicious = _is_suspected_tracking_or_personalization_url(url)
+    junk_verified = verified_ok and suspicious and sc < _MIN_STORES_TO_TRUST_SUSPICIOUS_HOST
+    if verified_ok and not junk_verified:
+        group = 2
+    elif not verified_ok:
+        group = 1
+    else:
+        group = 0
+    return (group, conf, sc)
+
+
 class EndpointVerifier:
     """Verify endpoints using existing scraping methods"""
     
-    def __init__(self, cache_results: bool = True):
+    def __init__(
+        self,
+        cache_results: bool = True,
+        cache_path: Optional[str] = VERIFICATION_CACHE_PATH,
+        max_workers: int = VERIFY_WORKERS,
+    ):
         """
         Initialize verifier
         
         Args:
             cache_results: Cache verification results to avoid re-testing
+            cache_path: SQLite file that keeps error-free results across runs for
+                VERIFICATION_CACHE_TTL_SECONDS ("" or None: in-memory only)
+            max_workers: Endpoints verify_multiple verifies at once
         """
         self.cache_results = cache_results
-        self.verification_cache = {}  # url -> verification_result
+        self.cache_path = cache_path
+        self.max_workers = max(1, max_workers)
+        self.verification_cache = {}  # verification_cache_key -> verification_result
+        self._cache_conn: Optional[sqlite3.Connection] = None
+        self._cache_pid: Optional[int] = None
+        self._cache_lock = threading.Lock()
+
+    def _get_cache_conn(self) -> Optional[sqlite3.Connection]:
+        """Open the persistent cache once per process (WAL so parallel discoveries can share it)."""
+        if not self.cache_path:
+            return None
+        if self._cache_conn is not None and self._cache_pid == os.getpid():
+            return self._cache_conn
+        try:
+            os.makedirs(os.path.dirname(self.cache_path) or ".", exist_ok=True)
+            conn = sqlite3.connect(
+                self.cache_path,
+                timeout=SQLITE_BUSY_TIMEOUT_SECONDS,
+                isolation_level=None,
+                check_same_thread=False,
+            )
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            conn.execute(
+                "CREATE TABLE IF NOT EXISTS verification_cache ("
+                " key TEXT PRIMARY KEY,"
+                " success INTEGER NOT NULL,"
+                " result TEXT NOT NULL,"
+                " updated_at REAL NOT NULL)"
+            )
+        except sqlite3.Error:
+            return None
+        self._cache_conn, self._cache_pid = conn, os.getpid()
+        return conn
+
+    def _cache_get(self, key: str) -> Optional[Dict[str, Any]]:
+        """Result from the persistent cache; expired rows count as misses."""
+        with self._cache_lock:
+            conn = self._get_cache_conn()
+            if conn is None:
+                return None
+            try:
+                row = conn.execute(
+                    "SELECT success, result, updated_at FROM verification_cache WHERE key = ?", (key,)
+                ).fetchone()
+            except sqlite3.Error:
+                return None
+        if row is None:
+            return None
+        success, payload, updated_at = row
+        ttl = VERIFICATION_CACHE_TTL_SECONDS if success else VERIFICATION_NEGATIVE_TTL_SECONDS
+        if time.time() - updated_at > ttl:
+            return None
+        try:
+            return json.loads(payload)
+        except ValueError:
+            return None
+
+    def _cache_put(self, key: str, result: Dict[str, Any]) -> None:
+        try:
+            payload = json.dumps(result, default=str)
+        except (TypeError, ValueError):
+            return
+        with self._cache_lock:
+            conn = self._get_cache_conn()
+            if conn is None:
+                return
+            try:
+                conn.execute(
+                    "INSERT OR REPLACE INTO verification_cache (key, success, result, updated_at) VALUES (?, ?, ?, ?)",
+                    (key, 1 if result.get('success') else 0, payload, time.time()),
+                )
+            except sqlite3.Error:
+                pass
     
     def optimize_radius_endpoint(self, url: str, custom_headers: Dict = None, timeout: int = 10) -> Dict[str, Any]:
         """
@@ -347,15 +496,20 @@ class EndpointVerifier:
                 'verification_time': float
             }
         """
-        import time
         start_time = time.time()
         
-        # Check cache
-        cache_key = f"{url}|{str(custom_headers)}"
-        if self.cache_results and cache_key in self.verification_cache:
-            cached = self.verification_cache[cache_key].copy()
-            cached['cached'] = True
-            return cached
+        # Check cache: this run's results first, then earlier runs' from disk
+        cache_key = verification_cache_key(url, custom_headers)
+        if self.cache_results:
+            cached = self.verification_cache.get(cache_key)
+            if cached is None:
+                cached = self._cache_get(cache_key)
+                if cached is not None:
+                    self.verification_cache[cache_key] = cached
+            if cached is not None:
+                cached = cached.copy()
+                cached['cached'] = True
+                return cached
         
         result = {
             'success': False,
@@ -495,9 +649,12 @@ class EndpointVerifier:
         
         result['verification_time'] = time.time() - start_time
         
-        # Cache result
+        # Cache result. Errors (timeouts, rate limits, parse failures) are often transient:
+        # they are kept for this run only, so the next run verifies the endpoint again.
         if self.cache_results:
             self.verification_cache[cache_key] = result.copy()
+            if result['success'] or not result['error']:
+                self._cache_put(cache_key, result)
         
         return result
     
@@ -511,6 +668,8 @@ class EndpointVerifier:
 
         Stops early once a high-confidence verified endpoint is found so
         lower-confidence candidates don't trigger unnecessary HTTP requests.
+        Up to max_workers endpoints are verified at once; the results are
+        the same as verifying them one by one in list order.
 
         Args:
             endpoints: List of endpoint dicts with 'url' key
@@ -519,9 +678,7 @@ class EndpointVerifier:
             List of endpoints with verification results added
         """
         verified_endpoints = []
-        # Only "trusted" verifications should trigger early-skip of lower-confidence candidates.
-        # A CQuotient beacon can verify with 2 bogus stores and must not skip the real /dw/shop/ URL.
-        best_trusted_verified_count = 0
+        to_verify = []
 
         for endpoint in endpoints:
             url = endpoint.get('url', '')
@@ -564,9 +721,14 @@ class EndpointVerifier:
                 verified_endpoints.append(endpoint)
                 continue
 
+            to_verify.append(endpoint)
+            verified_endpoints.append(endpoint)
+
+        outcomes, trusted_at = self._verify_in_order(to_verify)
+        for i, endpoint in enumerate(to_verify):
             # Early exit: a high-confidence verified result means remaining
             # lower-confidence candidates are unlikely to be better.
-            if best_trusted_verified_count > 0 and endpoint.get('confidence', 0) < 0.8:
+            if i > trusted_at and endpoint.get('confidence', 0) < EARLY_SKIP_CONFIDENCE:
                 endpoint.update({
                     'verified': False,
                     'verified_store_count': 0,
@@ -580,128 +742,192 @@ class EndpointVerifier:
                 })
                 if 'indicators' not in endpoint:
                     endpoint['indicators'] = []
-                verified_endpoints.append(endpoint)
                 continue
-            
-            # Extract custom headers if present
-            custom_headers = endpoint.get('headers') or endpoint.get('custom_headers')
-            if custom_headers is None:
-                custom_headers = {}
-            else:
-                custom_headers = dict(custom_headers)
-            # Many store locator APIs (Bell & Ross, Breitling, etc.) return JSON only with Accept: application/json
-            if any(domain in url.lower() for domain in ['stores.bellross.com', 'store.breitling.com', 'stores.']):
-                custom_headers.setdefault('Accept', 'application/json')
-            
-            # Check if this is a radius-based endpoint that might need optimization.
-            # max_distance is SFCC's radius param; also skip SFCC /dw/shop/stores since
-            # they need lat+lng at runtime and are optimized by pattern_detector instead.
-            parsed = urlparse(url)
-            params = parse_qs(parsed.query, keep_blank_values=True)
-            is_sfcc = '/dw/shop/' in parsed.path.lower() and '/stores' in parsed.path.lower()
-            radius_params = ['r', 'radius', 'distance']
-            is_radius_endpoint = not is_sfcc and any(p in params for p in radius_params)
-            
-            # For radius endpoints, try optimizing first
-            optimized_url = url
-            if is_radius_endpoint:
-                try:
-                    print(f"   🔍 Optimizing radius endpoint: systematically testing configurations...")
-                    print(f"      (Like manually testing: trying each radius/center/pagination combo until one works)")
-                    optimization = self.optimize_radius_endpoint(url, custom_headers=custom_headers, timeout=10)
-                    if optimization.get('success') and optimization.get('best_store_count', 0) > 0:
-                        optimized_url = optimization['optimized_url']
-                        endpoint['original_url'] = url  # Keep original for reference
-                        endpoint['optimized_url'] = optimized_url
-                        endpoint['optimization_info'] = {
+            self._apply_verification(endpoint, outcomes[i])
+
+        verified_endpoints.sort(key=rank_after_verification, reverse=True)
+        
+        return verified_endpoints
+    
+    def _verify_in_order(self, endpoints: List[Dict]) -> tuple:
+        """
+        (outcomes by index, index of the first trusted verification or len(endpoints)).
+
+        Candidates after the first trusted verification that are below
+        EARLY_SKIP_CONFIDENCE get no outcome. Only "trusted" verifications count:
+        a CQuotient beacon can verify with 2 bogus stores and must not skip the
+        real /dw/shop/ URL. With several workers, later candidates start before
+        earlier ones finish; the ones a trusted result makes unnecessary are
+        cancelled if not started yet and their outcome discarded if they were,
+        so the result matches verifying one by one.
+        """
+        outcomes: Dict[int, Dict[str, Any]] = {}
+        trusted_at = len(endpoints)
+
+        def skippable(i: int) -> bool:
+            return i > trusted_at and endpoints[i].get('confidence', 0) < EARLY_SKIP_CONFIDENCE
+
+        if self.max_workers == 1 or len(endpoints) <= 1:
+            for i, endpoint in enumerate(endpoints):
+                if skippable(i):
+                    continue
+                outcomes[i] = self._verify_endpoint(endpoint)
+                if outcomes[i]['trusted'] and i < trusted_at:
+                    trusted_at = i
+            return outcomes, trusted_at
+
+        pool = ThreadPoolExecutor(max_workers=min(self.max_workers, len(endpoints)))
+        try:
+            pending = {pool.submit(self._verify_endpoint, endpoint): i for i, endpoint in enumerate(endpoints)}
+            for future in as_completed(list(pending)):
+                i = pending.pop(future)
+                if future.cancelled():
+                    continue
+                outcomes[i] = future.result()
+                if outcomes[i]['trusted'] and i < trusted_at:
+                    trusted_at = i
+                    for other, j in pending.items():
+                        if skippable(j):
+                            other.cancel()
+                # Stop once only skippable candidates are still running
+                if all(skippable(j) for j in pending.values()):
+                    break
+        finally:
+            # Already-running skippable candidates finish in the background
+            pool.shutdown(wait=False, cancel_futures=True)
+        # A skippable candidate may have finished before an earlier one turned out trusted
+        return {i: outcome for i, outcome in outcomes.items() if not skippable(i)}, trusted_at
+
+    def _verify_endpoint(self, endpoint: Dict) -> Dict[str, Any]:
+        """
+        Optimize (radius endpoints) and quick-verify one endpoint without modifying it.
+
+        Returns:
+            {'verification': quick_verify result, 'url': URL verified,
+             'optimization': keys to add to the endpoint, 'trusted': bool}
+        """
+        url = endpoint.get('url', '')
+        optimization_fields: Dict[str, Any] = {}
+
+        # Extract custom headers if present
+        custom_headers = endpoint.get('headers') or endpoint.get('custom_headers')
+        if custom_headers is None:
+            custom_headers = {}
+        else:
+            custom_headers = dict(custom_headers)
+        # Many store locator APIs (Bell & Ross, Breitling, etc.) return JSON only with Accept: application/json
+        if any(domain in url.lower() for domain in ['stores.bellross.com', 'store.breitling.com', 'stores.']):
+            custom_headers.setdefault('Accept', 'application/json')
+        
+        # Check if this is a radius-based endpoint that might need optimization.
+        # max_distance is SFCC's radius param; also skip SFCC /dw/shop/stores since
+        # they need lat+lng at runtime and are optimized by pattern_detector instead.
+        parsed = urlparse(url)
+        params = parse_qs(parsed.query, keep_blank_values=True)
+        is_sfcc = '/dw/shop/' in parsed.path.lower() and '/stores' in parsed.path.lower()
+        radius_params = ['r', 'radius', 'distance']
+        is_radius_endpoint = not is_sfcc and any(p in params for p in radius_params)
+        
+        # For radius endpoints, try optimizing first
+        optimized_url = url
+        if is_radius_endpoint:
+            try:
+                print(f"   🔍 Optimizing radius endpoint: systematically testing configurations...")
+                print(f"      (Like manually testing: trying each radius/center/pagination combo until one works)")
+                optimization = self.optimize_radius_endpoint(url, custom_headers=custom_headers, timeout=10)
+                if optimization.get('success') and optimization.get('best_store_count', 0) > 0:
+                    optimized_url = optimization['optimized_url']
+                    optimization_fields = {
+                        'original_url': url,  # Keep original for reference
+                        'optimized_url': optimized_url,
+                        'optimization_info': {
                             'radius_used': optimization.get('radius_used'),
                             'center_used': optimization.get('center_used'),
                             'tested_variants': len(optimization.get('tested_variants', [])),
                             'best_store_count': optimization.get('best_store_count')
                         }
-                        print(f"   ✓ Found best variant: radius={optimization.get('radius_used')}, center={optimization.get('center_used', 'N/A')}, stores={optimization.get('best_store_count', 0)}")
-                    elif optimization.get('optimized_url') != url:
-                        # Even if no stores found, use optimized URL if it's different
-                        optimized_url = optimization['optimized_url']
-                        endpoint['original_url'] = url
-                        endpoint['optimized_url'] = optimized_url
-                        endpoint['optimization_info'] = {
+                    }
+                    print(f"   ✓ Found best variant: radius={optimization.get('radius_used')}, center={optimization.get('center_used', 'N/A')}, stores={optimization.get('best_store_count', 0)}")
+                elif optimization.get('optimized_url') != url:
+                    # Even if no stores found, use optimized URL if it's different
+                    optimized_url = optimization['optimized_url']
+                    optimization_fields = {
+                        'original_url': url,
+                        'optimized_url': optimized_url,
+                        'optimization_info': {
                             'radius_used': optimization.get('radius_used'),
                             'center_used': optimization.get('center_used'),
                             'tested_variants': len(optimization.get('tested_variants', []))
                         }
-                except Exception as e:
-                    # If optimization fails, continue with original URL
-                    print(f"   ⚠️  Radius optimization failed: {str(e)[:100]}")
-                    pass
-            
-            # Quick verify (using optimized URL if available)
-            verification = self.quick_verify(optimized_url, custom_headers=custom_headers)
-            
-            # Merge verification results into endpoint
-            verified_count = verification['store_count']
-            endpoint.update({
-                'verified': verification['success'],
-                'verified_store_count': verified_count,
-                # Promote to store_count so downstream consumers (frontend, pattern_detector)
-                # see a definitive count; only overwrite if verification actually returned data.
-                'store_count': verified_count if verified_count else endpoint.get('store_count'),
-                'verified_type': verification['detected_type'],
-                'verified_is_region_specific': verification['is_region_specific'],
-                'verification_error': verification.get('error'),
-                'verification_time': verification['verification_time'],
-                'sample_stores': verification.get('sample_stores', []),
-                'data_path': verification.get('data_path', ''),
-                'field_mapping': verification.get('field_mapping', {})
-            })
-            
-            # Update URL to optimized version if it was optimized
-            if optimized_url != url:
-                endpoint['url'] = optimized_url
-            
-            # Ensure indicators list exists
-            if 'indicators' not in endpoint:
-                endpoint['indicators'] = []
-            
-            # Update confidence based on verification
-            if verification['success'] and verification.get('store_count', 0) > 0:
-                current_confidence = endpoint.get('confidence', 0)
-                endpoint['confidence'] = min(current_confidence + 0.2, 1.0)
-                endpoint['indicators'].append(f"verified:{verification['store_count']}_stores")
-                sc = verification['store_count'] or 0
-                final_url = endpoint.get('url') or ''
-                suspicious = _is_suspected_tracking_or_personalization_url(final_url)
-                trusted = not (suspicious and sc < _MIN_STORES_TO_TRUST_SUSPICIOUS_HOST)
-                if trusted and sc > best_trusted_verified_count:
-                    best_trusted_verified_count = sc
-
-            verified_endpoints.append(endpoint)
+                    }
+            except Exception as e:
+                # If optimization fails, continue with original URL
+                print(f"   ⚠️  Radius optimization failed: {str(e)[:100]}")
+                pass
         
-        # Re-sort after verification: prefer real locator APIs over beacons that happen to
-        # embed a tiny "stores" array. Previously (verified, store_count, confidence) put
-        # 2-store false positives above stronger unverified candidates.
-        def _rank_after_verify(ep: Dict) -> tuple:
-            url = ep.get('url') or ''
-            sc = ep.get('verified_store_count') or 0
-            conf = float(ep.get('confidence') or 0)
-            verified_ok = bool(ep.get('verified')) and sc > 0
-            suspicious = _is_suspected_tracking_or_personalization_url(url)
-            junk_verified = verified_ok and suspicious and sc < _MIN_STORES_TO_TRUST_SUSPICIOUS_HOST
-            if verified_ok and not junk_verified:
-                group = 2
-            elif not verified_ok:
-                group = 1
-            else:
-                group = 0
-            return (group, conf, sc)
+        # Quick verify (using optimized URL if available)
+        verification = self.quick_verify(optimized_url, custom_headers=custom_headers)
+
+        trusted = False
+        if verification['success'] and verification.get('store_count', 0) > 0:
+            sc = verification['store_count'] or 0
+            suspicious = _is_suspected_tracking_or_personalization_url(optimized_url)
+            trusted = not (suspicious and sc < _MIN_STORES_TO_TRUST_SUSPICIOUS_HOST)
+        return {
+            'verification': verification,
+            'url': optimized_url,
+            'optimization': optimization_fields,
+            'trusted': trusted,
+        }
+
+    @staticmethod
+    def _apply_verification(endpoint: Dict, outcome: Dict[str, Any]) -> None:
+        """Merge a _verify_endpoint outcome into its endpoint."""
+        verification = outcome['verification']
+        endpoint.update(outcome['optimization'])
+
+        # Merge verification results into endpoint
+        verified_count = verification['store_count']
+        endpoint.update({
+            'verified': verification['success'],
+            'verified_store_count': verified_count,
+            # Promote to store_count so downstream consumers (frontend, pattern_detector)
+            # see a definitive count; only overwrite if verification actually returned data.
+            'store_count': verified_count if verified_count else endpoint.get('store_count'),
+            'verified_type': verification['detected_type'],
+            'verified_is_region_specific': verification['is_region_specific'],
+            'verification_error': verification.get('error'),
+            'verification_time': verification['verification_time'],
+            'sample_stores': verification.get('sample_stores', []),
+            'data_path': verification.get('data_path', ''),
+            'field_mapping': verification.get('field_mapping', {})
+        })
+        
+        # Update URL to optimized version if it was optimized
+        if outcome['url'] != endpoint.get('url', ''):
+            endpoint['url'] = outcome['url']
+        
+        # Ensure indicators list exists
+        if 'indicators' not in endpoint:
+            endpoint['indicators'] = []
+        
+        # Update confidence based on verification
+        if verification['success'] and verification.get('store_count', 0) > 0:
+            current_confidence = endpoint.get('confidence', 0)
+            endpoint['confidence'] = min(current_confidence + 0.2, 1.0)
+            endpoint['indicators'].append(f"verified:{verification['store_count']}_stores")
 
-        verified_endpoints.sort(key=_rank_after_verify, reverse=True)
-        
-        return verified_endpoints
-    
     def clear_cache(self):
-        """Clear verification cache"""
+        """Clear verification cache, in memory and on disk"""
         self.verification_cache.clear()
+        with self._cache_lock:
+            conn = self._get_cache_conn()
+            if conn is None:
+                return
+            try:
+                conn.execute("DELETE FROM verification_cache")
+            except sqlite3.Error:
+                pass
 
 
 def verify_endpoint(url: str, custom_headers: Dict = None) -> Dict[str, Any]:
@@ -2,19 +2,152 @@
 """Analyzes network requests to identify store locator API endpoints."""
 
 import json
+import os
 import re
-from typing import Dict, List, Optional, Any
+import sys
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from typing import Dict, Iterator, List, Optional, Any, Tuple
 from urllib.parse import urlparse, parse_qs, urlencode
 import requests
+from requests.adapters import HTTPAdapter
+
+# Shared HTTP helpers live with the scrapers; appended so same-named modules here still win
+_data_scrappers_dir = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'Data_Scrappers')
+if _data_scrappers_dir not in sys.path:
+    sys.path.append(_data_scrappers_dir)
+
+from http_client import read_bounded
 
 DISCOVERY_SAMPLE_LIMIT = 15
 
+# Candidates are fetched concurrently by this many workers sharing one keep-alive session
+FETCH_WORKERS = 8
+# A JSON endpoint at least this confident that returned stores ends the analysis early
+SHORT_CIRCUIT_CONFIDENCE = 0.9
+# An HTML page read stops early once this many store patterns and store-like objects were seen
+HTML_EVIDENCE_PATTERNS = 3
+HTML_EVIDENCE_STORE_OBJECTS = 50
+
 # Page-size params: do not append ?limit= (breaks APIs that use count= / start= only, e.g. SFCC dw/shop)
 _PAGE_SIZE_PARAM_KEYS = frozenset(
     {'limit', 'per', 'per_page', 'take', 'page_size', 'count', 'pagesize', 'page_size'}
 )
 
 
+# Embedded store-data checks run on HTML pages: '"stores": [' style keys...
+_HTML_STORE_KEY_PATTERNS = [
+    re.compile(pattern, re.IGNORECASE) for pattern in (
+        r'"stores?"\s*:\s*\[',
+        r'"locations?"\s*:\s*\[',
+        r'"points?"\s*:\s*\[',
+        r'"establishments?"\s*:\s*\[',
+        r'"retailers?"\s*:\s*\[',
+    )
+]
+# ...an unfinished key at the end of a piece (opening quote onwards) that the next piece may complete
+_HTML_STORE_KEY_PARTIAL_RE = re.compile(r'"[A-Za-z]*"?\s*(?::\s*)?')
+# ...and "first ... second" on one line (the regexes data-lat.*data-lng and latitude.*longitude),
+# tracked as tokens so a match may span any length of a single-line minified page
+_HTML_LINE_TOKEN_PAIRS = [
+    re.compile(r'(data-lat)|(data-lng)|(\n)', re.IGNORECASE),  # Data attributes
+    re.compile(r'(latitude)|(longitude)|(\n)', re.IGNORECASE),  # Coordinate patterns
+]
+# Store-like objects in HTML: {...}, no nested braces, with a name/title and a lat/latitude
+# after it (the regex \{[^{}]*"(?:name|title)"[^{}]*"(?:lat|latitude)"[^{}]*\}), tracked the same way;
+# the lookaheads let a key share its quote with a neighbouring one, as the regex allows
+_HTML_STORE_OBJECT_TOKENS_RE = re.compile(r'(\{)|(\})|(?=("(?:name|title)"))|(?=("(?:lat|latitude)"))', re.IGNORECASE)
+# Characters kept between pieces so a token split across them is still seen
+_HTML_TOKEN_CARRY = len('"latitude"') - 1
+
+
+class HtmlStoreScanner:
+    """
+    Runs the HTML store-data checks on a page as it is read, piece by piece, with the same
+    result as running them on the whole page at once.
+
+    Each piece is scanned together with only what the previous piece left unfinished: an
+    open '"key', or the last few characters of a possibly split token. Line- and object-wide
+    checks keep their progress as flags, so a match may span any length of a single-line page.
+    """
+
+    def __init__(self):
+        self.matched_patterns = set()
+        self.store_objects = 0
+        self._key_carry = ''
+        self._token_carry = ''
+        self._fed = 0
+        self._first_token_on_line = [False] * len(_HTML_LINE_TOKEN_PAIRS)
+        self._in_object = False
+        self._object_name_end = None
+        self._object_has_lat = False
+
+    def feed(self, text: str) -> None:
+        window = self._key_carry + text
+        for i, pattern in enumerate(_HTML_STORE_KEY_PATTERNS):
+            if i not in self.matched_patterns and pattern.search(window):
+                self.matched_patterns.add(i)
+        self._key_carry = self._unfinished_key(window)
+
+        window = self._token_carry + text
+        skip = len(self._token_carry)  # tokens ending in here were handled by the previous piece
+        for j, pattern in enumerate(_HTML_LINE_TOKEN_PAIRS):
+            index = len(_HTML_STORE_KEY_PATTERNS) + j
+            if index in self.matched_patterns:
+                continue
+            for match in pattern.finditer(window):
+                if match.end() <= skip:
+                    continue
+                if match.group(3):
+                    self._first_token_on_line[j] = False
+                elif match.group(1):
+                    self._first_token_on_line[j] = True
+                elif self._first_token_on_line[j]:
+                    self.matched_patterns.add(index)
+                    break
+        self._scan_objects(window, skip)
+        self._token_carry = window[-_HTML_TOKEN_CARRY:]
+        self._fed += len(text)
+
+    def _scan_objects(self, window: str, skip: int) -> None:
+        base = self._fed - skip  # position of window[0] in the page
+        for match in _HTML_STORE_OBJECT_TOKENS_RE.finditer(window):
+            brace_open, brace_close, name, lat = match.groups()
+            start = match.start()
+            if start + len(brace_open or brace_close or name or lat) <= skip:
+                continue
+            if brace_open:
+                self._in_object, self._object_name_end, self._object_has_lat = True, None, False
+            elif brace_close:
+                if self._in_object and self._object_has_lat:
+                    self.store_objects += 1
+                self._in_object = False
+            elif not self._in_object:
+                continue
+            elif name:
+                if self._object_name_end is None:
+                    self._object_name_end = base + start + len(name)
+            elif self._object_name_end is not None and base + start >= self._object_name_end:
+                self._object_has_lat = True
+
+    @staticmethod
+    def _unfinished_key(window: str) -> str:
+        """Tail of window from the opening quote of a key pattern that has started but not finished."""
+        last = window.rfind('"')
+        for start in (window.rfind('"', 0, last) if last > 0 else -1, last):
+            if start >= 0 and _HTML_STORE_KEY_PARTIAL_RE.fullmatch(window, start):
+                return window[start:]
+        return ''
+
+    @property
+    def found_patterns(self) -> int:
+        return len(self.matched_patterns)
+
+    def has_enough_evidence(self) -> bool:
+        """Enough store data seen that reading further would not change the verdict."""
+        return (self.found_patterns >= HTML_EVIDENCE_PATTERNS
+                and self.store_objects >= HTML_EVIDENCE_STORE_OBJECTS)
+
+
 def _url_with_sample_limit(url: str, limit: int = DISCOVERY_SAMPLE_LIMIT) -> str:
     parsed = urlparse(url)
     params = parse_qs(parsed.query, keep_blank_values=True)
@@ -44,8 +177,22 @@ class NetworkAnalyzer:
         r'/dw/shop/',  # Salesforce Commerce Cloud (SFCC) shop APIs
     ]
     
-    def __init__(self):
-        pass
+    def __init__(self, max_workers: int = FETCH_WORKERS, short_circuit: bool = True,
+                 session: Optional[requests.Session] = None):
+        """
+        Args:
+            max_workers: Candidates analyzed at once (1 = one after another)
+            short_circuit: Stop analyzing once a high-confidence JSON endpoint with stores is found
+            session: Shared HTTP session; by default one keep-alive session sized to max_workers
+        """
+        self.max_workers = max(1, max_workers)
+        self.short_circuit = short_circuit
+        if session is None:
+            session = requests.Session()
+            adapter = HTTPAdapter(pool_connections=self.max_workers, pool_maxsize=self.max_workers)
+            session.mount('http://', adapter)
+            session.mount('https://', adapter)
+        self.session = session
 
     # Maximum number of candidate URLs to run full analysis (including HTTP fetches) on.
     # Pre-filtering by keyword relevance keeps this fast without losing accuracy.
@@ -69,46 +216,103 @@ class NetworkAnalyzer:
         return score
 
     def analyze_requests(self, requests: List[Dict], base_url: str) -> List[Dict]:
-        analyzed = []
-
-        # Filter and pre-sort by keyword relevance, then cap to avoid excessive HTTP fetches
-        candidates = [r for r in requests if r.get('url') and not self._should_skip_url(r['url'])]
-        candidates.sort(key=lambda r: self._keyword_score(r['url']), reverse=True)
-        candidates = candidates[:self.MAX_CANDIDATES]
+        # Candidate order first, so ties rank exactly as a one-by-one pass would
+        analyzed = [analysis for _, analysis in sorted(self.iter_analyzed(requests, base_url), key=lambda x: x[0])]
 
-        for req in candidates:
-            url = req.get('url', '')
-            
-            # Analyze the endpoint
-            analysis = self._analyze_endpoint(url, req, base_url)
-            if analysis:
-                # Try to find base URL without location-specific parameters
-                base_variations = self._find_base_url_variations(url, req, base_url)
-                
-                # Test each variation and keep the best one
-                best_analysis = analysis
-                best_store_count = analysis.get('store_count', 0) or 0
-                
-                for variation_url in base_variations:
-                    variation_analysis = self._analyze_endpoint(variation_url, req, base_url)
-                    if variation_analysis:
-                        variation_store_count = variation_analysis.get('store_count', 0) or 0
-                        
-                        # Prefer variation if it has more stores or same stores but cleaner URL
-                        if variation_store_count > best_store_count or \
-                           (variation_store_count == best_store_count and 
-                            len(variation_url) < len(best_analysis['url'])):
-                            best_analysis = variation_analysis
-                            best_store_count = variation_store_count
-                            best_analysis['is_base_url'] = True
-                            best_analysis['original_url'] = url
-                
-                analyzed.append(best_analysis)
-        
         # Sort by confidence score, then by store count
         analyzed.sort(key=lambda x: (x.get('confidence', 0), x.get('store_count', 0) or 0), reverse=True)
         
         return analyzed
+
+    def _candidates(self, requests: List[Dict]) -> List[Dict]:
+        # Filter and pre-sort by keyword relevance, then cap to avoid excessive HTTP fetches
+        candidates = [r for r in requests if r.get('url') and not self._should_skip_url(r['url'])]
+        candidates.sort(key=lambda r: self._keyword_score(r['url']), reverse=True)
+        return candidates[:self.MAX_CANDIDATES]
+
+    def iter_analyzed(self, requests: List[Dict], base_url: str) -> Iterator[Tuple[int, Dict]]:
+        """
+        Analyze candidate requests on up to max_workers threads and yield (candidate rank,
+        analysis) as each finishes, most relevant candidates started first. With short_circuit,
+        stops after the first high-confidence JSON endpoint with stores (plus any others already
+        finished): candidates not yet started are dropped and in-flight ones are left to finish
+        without being waited on.
+        """
+        candidates = self._candidates(requests)
+        if not candidates:
+            return
+        if self.max_workers == 1:
+            for rank, req in enumerate(candidates):
+                analysis = self._analyze_candidate(req, base_url)
+                if analysis:
+                    yield rank, analysis
+                    if self.short_circuit and self._is_decisive(analysis):
+                        return
+            return
+
+        executor = ThreadPoolExecutor(max_workers=min(self.max_workers, len(candidates)))
+        try:
+            futures = {
+                executor.submit(self._analyze_candidate, req, base_url): rank
+                for rank, req in enumerate(candidates)
+            }
+            pending = dict(futures)
+            for future in as_completed(futures):
+                rank = pending.pop(future)
+                analysis = future.result()
+                if analysis:
+                    yield rank, analysis
+                    if self.short_circuit and self._is_decisive(analysis):
+                        # Keep whatever else already finished; it costs nothing more
+                        for other, other_rank in pending.items():
+                            if other.done() and not other.cancelled():
+                                other_analysis = other.result()
+                                if other_analysis:
+                                    yield other_rank, other_analysis
+                        return
+        finally:
+            executor.shutdown(wait=False, cancel_futures=True)
+
+    def _is_decisive(self, analysis: Dict) -> bool:
+        """A JSON response with stores, confident enough that the remaining candidates cannot matter."""
+        return (
+            analysis.get('type') != 'html'
+            and (analysis.get('store_count') or 0) > 0
+            and analysis.get('confidence', 0) >= SHORT_CIRCUIT_CONFIDENCE
+            and not any(i.startswith('html_with_store_data') for i in analysis.get('indicators', []))
+        )
+
+    def _analyze_candidate(self, req: Dict, base_url: str) -> Optional[Dict]:
+        """_analyze_endpoint on one captured request and its base URL variations; the best of them."""
+        url = req.get('url', '')
+
+        # Analyze the endpoint
+        analysis = self._analyze_endpoint(url, req, base_url)
+        if not analysis:
+            return None
+
+        # Try to find base URL without location-specific parameters
+        base_variations = self._find_base_url_variations(url, req, base_url)
+
+        # Test each variation and keep the best one
+        best_analysis = analysis
+        best_store_count = analysis.get('store_count', 0) or 0
+
+        for variation_url in base_variations:
+            variation_analysis = self._analyze_endpoint(variation_url, req, base_url)
+            if variation_analysis:
+                variation_store_count = variation_analysis.get('store_count', 0) or 0
+
+                # Prefer variation if it has more stores or same stores but cleaner URL
+                if variation_store_count > best_store_count or \
+                   (variation_store_count == best_store_count and
+                    len(variation_url) < len(best_analysis['url'])):
+                    best_analysis = variation_analysis
+                    best_store_count = variation_store_count
+                    best_analysis['is_base_url'] = True
+                    best_analysis['original_url'] = url
+
+        return best_analysis
     
     def _should_skip_url(self, url: str) -> bool:
         """Check if URL should be skipped"""
@@ -317,18 +521,12 @@ class NetworkAnalyzer:
                     # Special handling for HTML content - check for embedded store data
                     # (country_filter URLs like ?country-region=US can also return HTML)
                     if isinstance(response, dict) and 'html' in response:
-                        html_content = response['html']
-                        # Check for embedded store data patterns
-                        store_patterns = [
-                            r'"stores?"\s*:\s*\[',
-                            r'"locations?"\s*:\s*\[',
-                            r'"points?"\s*:\s*\[',
-                            r'"establishments?"\s*:\s*\[',
-                            r'"retailers?"\s*:\s*\[',
-                            r'data-lat.*data-lng',  # Data attributes
-                            r'latitude.*longitude',  # Coordinate patterns
-                        ]
-                        found_patterns = sum(1 for pattern in store_patterns if re.search(pattern, html_content, re.IGNORECASE))
+                        # Check for embedded store data patterns (already scanned while streaming)
+                        scan = response.get('html_scan')
+                        if scan is None:
+                            scan = HtmlStoreScanner()
+                            scan.feed(response['html'])
+                        found_patterns = scan.found_patterns
                         
                         if found_patterns > 0:
                             # HTML page has embedded store data - significantly boost confidence
@@ -336,8 +534,8 @@ class NetworkAnalyzer:
                             indicators.append(f"html_with_store_data:{found_patterns}_patterns")
                             # Estimate store count from patterns (rough heuristic)
                             if not store_count:
-                                # Count store-like objects in the HTML
-                                store_matches = len(re.findall(r'\{[^{}]*"(?:name|title)"[^{}]*"(?:lat|latitude)"[^{}]*\}', html_content, re.IGNORECASE))
+                                # Count store-like objects in the HTML (a lower bound if the read stopped early)
+                                store_matches = scan.store_objects
                                 if store_matches > 0:
                                     store_count = store_matches
                     
@@ -433,8 +631,9 @@ class NetworkAnalyzer:
 
         For JSON/API endpoints, tries a sample-limited URL first to avoid
         downloading thousands of stores (e.g. Omega 1400 stores).
-        For HTML endpoints, streams the response and reads only the first
-        200 KB to keep detection fast without downloading the full page.
+        For HTML endpoints, streams the response and reads at most the first
+        200 KB, running store detection as it goes and stopping once there is
+        enough evidence (see HtmlStoreScanner.has_enough_evidence).
         """
         headers = {
             'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36',
@@ -457,7 +656,7 @@ class NetworkAnalyzer:
             limited_url = _url_with_sample_limit(url)
             if limited_url != url:
                 try:
-                    response = requests.get(limited_url, headers=headers, timeout=timeout)
+                    response = self.session.get(limited_url, headers=headers, timeout=timeout)
                     response.raise_for_status()
                     data = self._parse_response(response)
                     count = self._count_stores(data) if data else None
@@ -466,27 +665,29 @@ class NetworkAnalyzer:
                 except Exception:
                     pass  # Fall through to full URL
 
-        # For HTML responses stream and read only HTML_READ_LIMIT bytes
+        # For HTML responses stream at most HTML_READ_LIMIT bytes, scanning as they arrive
         if is_html:
             try:
-                response = requests.get(url, headers=headers, timeout=timeout, stream=True)
-                response.raise_for_status()
-                chunk = b''
-                for piece in response.iter_content(chunk_size=8192):
-                    chunk += piece
-                    if len(chunk) >= self.HTML_READ_LIMIT:
-                        break
-                response.close()
+                response = self.session.get(url, headers=headers, timeout=timeout, stream=True)
                 try:
-                    text = chunk.decode('utf-8', errors='replace')
+                    response.raise_for_status()
                 except Exception:
-                    text = chunk.decode('latin-1', errors='replace')
-                return {'html': text}
+                    # Hand the connection back to the shared pool even when the request fails
+                    response.close()
+                    raise
+                scan = HtmlStoreScanner()
+
+                def _scan(text: str) -> bool:
+                    scan.feed(text)
+                    return scan.has_enough_evidence()
+
+                read = read_bounded(response, self.HTML_READ_LIMIT, on_text=_scan)
+                return {'html': read.text, 'html_scan': scan}
             except Exception:
                 return None
 
         try:
-            response = requests.get(url, headers=headers, timeout=timeout)
+            response = self.session.get(url, headers=headers, timeout=timeout)
             response.raise_for_status()
             return self._parse_response(response)
         except requests.exceptions.Timeout:
@@ -10,6 +10,7 @@ verifies that the discoverer succeeds, and checks that the discovered endpoint/c
 matches what we already know works.
 """
 
+import re
 import sys
 import os
 import pytest
@@ -232,3 +233,582 @@ class TestCquotientFiltering:
         ]
         endpoints.sort(key=_rank_after_verify, reverse=True)
         assert "dw/shop" in endpoints[0]["url"]
+
+
+# ---------------------------------------------------------------------------
+# Verification: concurrent early skip and the persistent cache (no network)
+# ---------------------------------------------------------------------------
+
+class TestVerifyInOrder:
+    """_verify_in_order with a worker pool must return what verifying one by one returns."""
+
+    # (confidence, seconds, trusted): index 1 is trusted, so the low-confidence ones after it are skipped
+    PLAN = [(0.9, 0.15, False), (0.5, 0.02, True), (0.9, 0.05, False), (0.5, 0.3, True)] + [(0.5, 0.1, True)] * 6
+
+    @classmethod
+    def _run(cls, max_workers):
+        import threading
+        import time
+        from endpoint_verifier import EndpointVerifier
+
+        started = []
+        lock = threading.Lock()
+
+        class FakeVerifier(EndpointVerifier):
+            def _verify_endpoint(self, endpoint):
+                with lock:
+                    started.append(endpoint["url"])
+                time.sleep(endpoint["seconds"])
+                return {"verification": {"store_count": 1}, "url": endpoint["url"],
+                        "optimization": {}, "trusted": endpoint["trusted"]}
+
+        endpoints = [{"url": f"https://api.example.com/{i}", "confidence": conf, "seconds": secs, "trusted": trusted}
+                     for i, (conf, secs, trusted) in enumerate(cls.PLAN)]
+        verifier = FakeVerifier(cache_results=False, cache_path="", max_workers=max_workers)
+        outcomes, trusted_at = verifier._verify_in_order(endpoints)
+        return outcomes, trusted_at, started
+
+    def test_concurrent_matches_one_by_one(self):
+        sequential = self._run(1)
+        concurrent = self._run(4)
+        assert sequential[:2] == concurrent[:2]
+        assert sorted(sequential[0]) == [0, 1, 2] and sequential[1] == 1
+        assert len(sequential[2]) == 3
+
+    def test_unstarted_skippable_candidates_are_cancelled(self):
+        _, _, started = self._run(4)
+        # Workers start 0-3, then 4 when 1 finishes; 5-9 are cancelled once 1 is trusted
+        assert sorted(started) == [f"https://api.example.com/{i}" for i in range(5)]
+
+
+class TestVerificationCache:
+    def test_cache_key_normalization(self):
+        from endpoint_verifier import verification_cache_key as key
+
+        assert key("HTTPS://API.Example.com:443/stores?b=2&a=1#map") == key("https://api.example.com/stores?a=1&b=2")
+        assert key("http://api.example.com") == key("http://api.example.com:80/")
+        assert key("http://api.example.com:8080/") != key("http://api.example.com/")
+        assert key("https://api.example.com/Stores") != key("https://api.example.com/stores")
+        assert key("https://api.example.com/s", {"Accept": "application/json", "X-Key": "1"}) == \
+            key("https://api.example.com/s", {"x-key": "1", "accept": "application/json "})
+        assert key("https://api.example.com/s", {}) == key("https://api.example.com/s", None)
+        assert key("https://api.example.com/s", {"X-Key": "1"}) != key("https://api.example.com/s")
+
+    def test_ttl_by_outcome(self, tmp_path, monkeypatch):
+        import endpoint_verifier
+        from endpoint_verifier import EndpointVerifier
+
+        verifier = EndpointVerifier(cache_path=str(tmp_path / "cache.sqlite3"))
+        now = 1_000_000.0
+        monkeypatch.setattr(endpoint_verifier.time, "time", lambda: now)
+        verifier._cache_put("found", {"success": True, "store_count": 3})
+        verifier._cache_put("empty", {"success": False, "store_count": None})
+
+        now += endpoint_verifier.VERIFICATION_NEGATIVE_TTL_SECONDS + 1
+        assert verifier._cache_get("found") == {"success": True, "store_count": 3}
+        assert verifier._cache_get("empty") is None
+        now += endpoint_verifier.VERIFICATION_CACHE_TTL_SECONDS
+        assert verifier._cache_get("found") is None
+
+    def test_errors_are_not_persisted(self, tmp_path, monkeypatch):
+        import endpoint_verifier
+        from endpoint_verifier import EndpointVerifier, verification_cache_key
+
+        def detect(url, data):
+            if "broken" in url:
+                raise ValueError("unexpected payload")
+            return {"detected_type": "single_call"}
+
+        responses = {"found": {"stores": [{"name": "A"}]}, "empty": {"stores": []}, "broken": {"stores": []}}
+        monkeypatch.setattr(endpoint_verifier, "fetch_data",
+                            lambda url, headers=None, timeout=10: responses[url.rsplit("/", 1)[-1].split("?")[0]])
+        monkeypatch.setattr(endpoint_verifier, "detect_locator_type", detect)
+        monkeypatch.setattr(endpoint_verifier, "detect_data_pattern", None)
+
+        cache_path = str(tmp_path / "cache.sqlite3")
+        verifier = EndpointVerifier(cache_path=cache_path)
+        for name in responses:
+            verifier.quick_verify(f"https://api.example.com/{name}")
+        assert verifier.quick_verify("https://api.example.com/broken")["cached"] is True  # this run only
+
+        fresh = EndpointVerifier(cache_path=cache_path)
+        assert fresh._cache_get(verification_cache_key("https://api.example.com/found"))["store_count"] == 1
+        assert fresh._cache_get(verification_cache_key("https://api.example.com/empty"))["success"] is False
+        assert fresh._cache_get(verification_cache_key("https://api.example.com/broken")) is None
+
+
+# ---------------------------------------------------------------------------
+# Concurrent candidate analysis (local HTTP server, no browser or network)
+# ---------------------------------------------------------------------------
+
+@pytest.fixture(scope="module")
+def local_store_api():
+    """Local server: /api/stores/<n> returns n stores as JSON, /api/other an unrelated JSON
+    object, /page an HTML page with embedded store data. Every response waits 50 ms."""
+    import json
+    import threading
+    import time
+    from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+    class Handler(BaseHTTPRequestHandler):
+        def log_message(self, *args):
+            pass
+
+        def do_GET(self):
+            time.sleep(0.05)
+            path = self.path.split("?")[0]
+            if path.startswith("/api/stores/"):
+                count = int(path.rsplit("/", 1)[-1])
+                stores = [{"name": f"Store {i}", "lat": 46.2, "lng": 6.1, "city": "Geneva"} for i in range(count)]
+                body, content_type = json.dumps({"stores": stores}).encode(), "application/json"
+            elif path.startswith("/api/other"):
+                body, content_type = b'{"ok": true}', "application/json"
+            elif path.startswith("/page"):
+                body, content_type = b'<html><script>{"stores": [{"name": "A", "lat": 1}]}</script></html>', "text/html"
+            else:
+                self.send_response(404)
+                self.end_headers()
+                return
+            self.send_response(200)
+            self.send_header("Content-Type", content_type)
+            self.send_header("Content-Length", str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+
+    server = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    base = f"http://127.0.0.1:{server.server_port}"
+    requests = (
+        [{"url": f"{base}/api/stores/{n}?city=geneva", "mimeType": "application/json"} for n in range(1, 9)]
+        + [{"url": f"{base}/api/other{i}", "mimeType": "application/json"} for i in range(8)]
+        + [{"url": f"{base}/page{i}", "mimeType": "text/html"} for i in range(4)]
+    )
+    yield base, requests
+    server.shutdown()
+
+
+class TestConcurrentAnalysis:
+    """analyze_requests fans candidates out over a worker pool; the ranking must not depend on
+    which fetch finishes first, and a confident JSON store endpoint ends the analysis early."""
+
+    def test_pool_matches_one_by_one(self, local_store_api):
+        from network_analyzer import NetworkAnalyzer
+
+        base, requests = local_store_api
+        pooled = NetworkAnalyzer(max_workers=8, short_circuit=False).analyze_requests(requests, base)
+        serial = NetworkAnalyzer(max_workers=1, short_circuit=False).analyze_requests(requests, base)
+        assert pooled == serial
+        assert pooled[0]["store_count"] == 8
+
+    def test_short_circuit_on_confident_json(self, local_store_api):
+        from network_analyzer import SHORT_CIRCUIT_CONFIDENCE, NetworkAnalyzer
+
+        base, requests = local_store_api
+        full = NetworkAnalyzer(short_circuit=False).analyze_requests(requests, base)
+        early = NetworkAnalyzer().analyze_requests(requests, base)
+        assert 0 < len(early) < len(full)
+        top = early[0]
+        assert top["type"] != "html" and top["store_count"] > 0
+        assert top["confidence"] >= SHORT_CIRCUIT_CONFIDENCE
+
+
+# ---------------------------------------------------------------------------
+# Browser pool and network-idle waits (fake drivers, no browser)
+# ---------------------------------------------------------------------------
+
+def _perf_entry(method: str, request_id: str) -> dict:
+    import json
+    return {"message": json.dumps({"message": {"method": method, "params": {"requestId": request_id}}})}
+
+
+class _FakeDriver:
+    """Just enough of a Selenium driver for BrowserPool and NetworkIdleTracker."""
+
+    def __init__(self, log_batches=None, fail_reset=False):
+        self.log_batches = list(log_batches or [])
+        self.fail_reset = fail_reset
+        self.current_url = "https://brand.example/stores"
+        self.window_handles = ["main"]
+        self.visited = []
+        self.quit_called = False
+        self.switch_to = self
+
+    def window(self, handle):
+        pass
+
+    def set_page_load_timeout(self, timeout):
+        pass
+
+    def execute_cdp_cmd(self, command, params):
+        return {}
+
+    def get(self, url):
+        if self.fail_reset:
+            raise RuntimeError("browser gone")
+        self.visited.append(url)
+        self.current_url = url
+
+    def get_log(self, kind):
+        return self.log_batches.pop(0) if self.log_batches else []
+
+    def quit(self):
+        self.quit_called = True
+
+
+class TestBrowserPool:
+    def test_driver_is_reset_and_reused(self):
+        from browser_pool import BrowserPool
+
+        created = []
+        pool = BrowserPool(size=1, driver_factory=lambda: created.append(_FakeDriver()) or created[-1])
+        first = pool.acquire()
+        pool.release(first)
+        second = pool.acquire()
+        pool.release(second)
+        assert second is first and len(created) == 1
+        assert first.visited == ["about:blank", "about:blank"]
+
+    def test_driver_replaced_after_failed_reset_or_max_jobs(self):
+        from browser_pool import BrowserPool
+
+        broken = _FakeDriver(fail_reset=True)
+        pool = BrowserPool(size=1, driver_factory=lambda: broken)
+        pool.release(pool.acquire())
+        assert broken.quit_called
+
+        drivers = []
+        pool = BrowserPool(size=1, max_jobs=2, driver_factory=lambda: drivers.append(_FakeDriver()) or drivers[-1])
+        for _ in range(3):
+            pool.release(pool.acquire())
+        assert len(drivers) == 2 and drivers[0].quit_called
+
+    def test_network_idle_waits_for_inflight_requests(self):
+        from browser_pool import NetworkIdleTracker
+
+        driver = _FakeDriver(log_batches=[
+            [_perf_entry("Network.requestWillBeSent", "1"), _perf_entry("Network.requestWillBeSent", "2")],
+            [],
+            [_perf_entry("Network.loadingFinished", "1"), _perf_entry("Network.loadingFailed", "2")],
+        ])
+        tracker = NetworkIdleTracker(driver, max_inflight=0)
+        assert tracker.wait_for_idle(idle_time=0.2, timeout=5) is True
+        assert tracker.inflight == 0
+        # Entries read while waiting are kept for network capture
+        assert len(tracker.drain()) == 4 and tracker.entries == []
+
+    def test_network_idle_times_out_while_busy(self):
+        from browser_pool import NetworkIdleTracker
+
+        driver = _FakeDriver(log_batches=[[_perf_entry("Network.requestWillBeSent", str(i))] for i in range(100)])
+        assert NetworkIdleTracker(driver, max_inflight=0).wait_for_idle(idle_time=0.2, timeout=0.5) is False
+
+
+# ---------------------------------------------------------------------------
+# discover_many against local HTML fixtures (needs Chrome + ChromeDriver)
+# ---------------------------------------------------------------------------
+
+_LOCATOR_PAGE = """<html><body><div id="list"></div><script>
+setTimeout(function () {
+  fetch('/api/stores/%d?country=US').then(function (r) { return r.json(); }).then(function (d) {
+    document.getElementById('list').textContent = d.stores.length + ' stores';
+  });
+}, 300);
+</script></body></html>"""
+
+
+@pytest.fixture(scope="module")
+def local_locator_pages():
+    """Local server: /locator/<n> is a page that fetches /api/stores/<n> from JavaScript."""
+    import json
+    import shutil
+    import threading
+    from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+    pytest.importorskip("selenium")
+    if not any(shutil.which(b) for b in ("chromium-browser", "chromium", "google-chrome", "chrome")):
+        pytest.skip("Chrome/Chromium not installed")
+
+    class Handler(BaseHTTPRequestHandler):
+        def log_message(self, *args):
+            pass
+
+        def do_GET(self):
+            path = self.path.split("?")[0]
+            count = int(path.rsplit("/", 1)[-1]) if path[-1:].isdigit() else 0
+            if path.startswith("/locator/"):
+                body, content_type = (_LOCATOR_PAGE % count).encode(), "text/html"
+            elif path.startswith("/api/stores/"):
+                stores = [{"name": f"Store {i}", "address": "1 Main St", "city": "Geneva",
+                           "latitude": 46.2, "longitude": 6.1} for i in range(count)]
+                body, content_type = json.dumps({"stores": stores}).encode(), "application/json"
+            else:
+                self.send_response(404)
+                self.end_headers()
+                return
+            self.send_response(200)
+            self.send_header("Content-Type", content_type)
+            self.send_header("Content-Length", str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+
+    server = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    yield f"http://127.0.0.1:{server.server_port}"
+    server.shutdown()
+
+
+class TestDiscoverMany:
+    def test_pages_discovered_concurrently_on_pooled_browsers(self, local_locator_pages):
+        from browser_pool import BrowserPool
+
+        pool = BrowserPool(size=2)
+        try:
+            discoverer = EndpointDiscoverer(headless=True, timeout=30, verify_endpoints=False, browser_pool=pool)
+            urls = [f"{local_locator_pages}/locator/{n}" for n in (3, 5, 7)]
+            results = discoverer.discover_many(urls)
+        finally:
+            pool.close()
+
+        assert [r["url"] for r in results] == urls
+        for n, result in zip((3, 5, 7), results):
+            assert result["success"] is True, result.get("errors")
+            found = [ep.get("url", "") for ep in result["endpoints"]]
+            assert any(f"/api/stores/{n}" in u for u in found), found
+
+    @staticmethod
+    def _run_cli(monkeypatch, tmp_path, argv):
+        """Run main() with discover_many stubbed; return (calls, saved JSON)"""
+        import json
+        import endpoint_discoverer
+
+        calls = []
+
+        def fake_discover_many(self, urls, max_workers=None):
+            calls.append((list(urls), max_workers))
+            return [{"url": u, "success": True, "endpoints": [], "errors": []} for u in urls]
+
+        monkeypatch.setattr(EndpointDiscoverer, "discover_many", fake_discover_many)
+        output = tmp_path / "out.json"
+        monkeypatch.setattr(sys, "argv", ["endpoint_discoverer.py", *argv, "--output", str(output)])
+        endpoint_discoverer.main()
+        return calls, json.loads(output.read_text())
+
+    def test_cli_batches_repeated_urls_and_urls_file(self, monkeypatch, tmp_path):
+        urls_file = tmp_path / "urls.txt"
+        urls_file.write_text("# brands\nhttps://b.example/stores\n\nhttps://c.example/stores\n")
+        calls, saved = self._run_cli(monkeypatch, tmp_path, [
+            "--url", "https://a.example/stores", "--urls-file", str(urls_file), "--workers", "2",
+        ])
+        urls = ["https://a.example/stores", "https://b.example/stores", "https://c.example/stores"]
+        assert calls == [(urls, 2)]
+        assert [r["url"] for r in saved] == urls
+
+    def test_cli_single_url_keeps_single_result_output(self, monkeypatch, tmp_path):
+        calls, saved = self._run_cli(monkeypatch, tmp_path, ["--url", "https://a.example/stores"])
+        assert calls == [(["https://a.example/stores"], None)]
+        assert saved["url"] == "https://a.example/stores"
+
+
+# ---------------------------------------------------------------------------
+# HTTP-only discovery tier (local HTTP server, browser must not start)
+# ---------------------------------------------------------------------------
+
+@pytest.fixture(scope="module")
+def local_static_site():
+    """Local server: /embedded quotes its store API in an inline config, /bare has no API URL."""
+    import json
+    import threading
+    from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+    class Handler(BaseHTTPRequestHandler):
+        def log_message(self, *args):
+            pass
+
+        def do_GET(self):
+            path = self.path.split("?")[0]
+            if path == "/embedded":
+                body = b'<html><script>window.config = {"storesApi": "\\/api\\/stores\\/all"};</script></html>'
+                content_type = "text/html"
+            elif path == "/bare":
+                body, content_type = b"<html><body>Find a boutique</body></html>", "text/html"
+            elif path == "/api/stores/all":
+                stores = [{"name": f"Store {i}", "address": "1 Main St", "city": "Geneva",
+                           "lat": 46.2, "lng": 6.1} for i in range(12)]
+                body, content_type = json.dumps({"stores": stores}).encode(), "application/json"
+            else:
+                self.send_response(404)
+                self.end_headers()
+                return
+            self.send_response(200)
+            self.send_header("Content-Type", content_type)
+            self.send_header("Content-Length", str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+
+    server = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    yield f"http://127.0.0.1:{server.server_port}"
+    server.shutdown()
+
+
+class TestHttpOnlyDiscovery:
+    @staticmethod
+    def _discoverer_without_browser():
+        from browser_pool import BrowserPool
+
+        launches = []
+
+        def no_browser():
+            launches.append(1)
+            raise RuntimeError("browser launched")
+
+        pool = BrowserPool(size=1, driver_factory=no_browser)
+        return EndpointDiscoverer(verify_endpoints=False, browser_pool=pool), launches
+
+    def test_embedded_api_found_without_browser(self, local_static_site):
+        discoverer, launches = self._discoverer_without_browser()
+        result = discoverer.discover(f"{local_static_site}/embedded")
+        assert result["success"] is True and result["discovery_tier"] == "http"
+        assert result["endpoints"][0]["url"].startswith(f"{local_static_site}/api/stores/all")
+        assert launches == []
+
+    def test_browser_launched_when_nothing_conclusive(self, local_static_site):
+        discoverer, launches = self._discoverer_without_browser()
+        result = discoverer.discover(f"{local_static_site}/bare")
+        assert result["discovery_tier"] == "browser" and launches == [1]
+        assert result["success"] is False and "browser launched" in result["errors"][0]
+
+    def test_browser_pass_analyzes_only_new_requests(self, local_static_site, monkeypatch):
+        discoverer, _ = self._discoverer_without_browser()
+        api_url = f"{local_static_site}/api/stores/all"
+        # A browser that only ever sees the page's store API call
+        for name, value in {
+            "_setup_driver": lambda: None,
+            "_release_driver": lambda: None,
+            "_interact_with_page": lambda url: [],
+            "_capture_network_requests": lambda: [
+                {"url": api_url, "method": "GET", "status": 200, "mimeType": "application/json", "headers": {}}
+            ],
+            "_capture_performance_api_requests": lambda seen: [],
+            "_rendered_page_source": lambda: "",
+        }.items():
+            monkeypatch.setattr(discoverer, name, value)
+
+        analyzed, html_analyses = [], []
+        analyze_requests = discoverer.network_analyzer.analyze_requests
+        analyze_html = discoverer._analyze_html_content
+
+        def record_requests(requests, base_url):
+            analyzed.append(sorted(r["url"] for r in requests))
+            return analyze_requests(requests, base_url)
+
+        def record_html(url, html=None):
+            html_analyses.append(url)
+            return analyze_html(url, html)
+
+        monkeypatch.setattr(discoverer.network_analyzer, "analyze_requests", record_requests)
+        monkeypatch.setattr(discoverer, "_analyze_html_content", record_html)
+
+        result = discoverer.discover(f"{local_static_site}/bare")
+        assert result["success"] is True and result["discovery_tier"] == "browser"
+        assert len(analyzed) == 2 and analyzed[1] == [api_url]
+        assert f"{local_static_site}/bare" in analyzed[0] and api_url not in analyzed[0]
+        assert len(html_analyses) == 1
+        assert result["endpoints"][0]["url"].startswith(api_url)
+
+
+# ---------------------------------------------------------------------------
+# Bounded streaming HTML read
+# ---------------------------------------------------------------------------
+
+class _StreamedResponse:
+    def __init__(self, pieces):
+        self.pieces = pieces
+        self.served = 0
+        self.closed = False
+
+    def iter_content(self, chunk_size):
+        for piece in self.pieces:
+            self.served += 1
+            yield piece
+
+    def close(self):
+        self.closed = True
+
+
+class TestBoundedStreamingRead:
+    PAGE = (
+        '<html><body data-lat="1" data-lng="2">latitude and longitude\n<script>var s = {"stores": ['
+        + ",".join('{"name": "Bütik %d", "lat": 46.2, "lng": 6.1}' % i for i in range(80))
+        + ']};</script>\n</body></html>'
+    )
+
+    @staticmethod
+    def _pieces(data: bytes, size: int):
+        return [data[i:i + size] for i in range(0, len(data), size)]
+
+    def test_limit_and_split_characters(self):
+        from http_client import read_bounded
+
+        data = self.PAGE.encode("utf-8")
+        response = _StreamedResponse(self._pieces(data, 7))
+        read = read_bounded(response, 1000)
+        assert read.text == data[:1000].decode("utf-8", errors="replace")
+        assert read.size == 1000 and read.stopped and response.closed
+        full = read_bounded(_StreamedResponse(self._pieces(data, 7)), len(data) + 1)
+        assert full.text == self.PAGE and not full.stopped
+
+    def test_streamed_scan_matches_whole_page_scan(self):
+        from network_analyzer import HtmlStoreScanner
+
+        whole = HtmlStoreScanner()
+        whole.feed(self.PAGE)
+        streamed = HtmlStoreScanner()
+        for i in range(0, len(self.PAGE), 13):
+            streamed.feed(self.PAGE[i:i + 13])
+        assert streamed.matched_patterns == whole.matched_patterns
+        assert streamed.store_objects == whole.store_objects == 80
+
+    # The checks as they ran on the whole page before streaming
+    WHOLE_PAGE_PATTERNS = [
+        r'"stores?"\s*:\s*\[', r'"locations?"\s*:\s*\[', r'"points?"\s*:\s*\[',
+        r'"establishments?"\s*:\s*\[', r'"retailers?"\s*:\s*\[',
+        r'data-lat.*data-lng', r'latitude.*longitude',
+    ]
+
+    @pytest.mark.parametrize("piece", [1, 5, 13, 4096])
+    def test_long_single_line_page_matches_whole_page_search(self, piece):
+        from network_analyzer import HtmlStoreScanner
+
+        filler = "x" * (35 * 1024)
+        page = (
+            '<div data-lat="1">' + filler + '<b data-LNG="2">' + filler + '"retailers"\n  :  ['
+            + ' LATITUDE ' + filler + '{"title": "A", "latitude": 1' + filler + '} longitude\nlatitude'
+            + '"points" : {' + filler + '"location"'
+        )
+        assert len(page) > 16 * 1024 and page.count("\n") == 2
+        expected = {i for i, pattern in enumerate(self.WHOLE_PAGE_PATTERNS)
+                    if re.search(pattern, page, re.IGNORECASE)}
+        assert expected == {4, 5, 6}
+
+        scan = HtmlStoreScanner()
+        for i in range(0, len(page), piece):
+            scan.feed(page[i:i + piece])
+        assert scan.matched_patterns == expected
+        assert scan.store_objects == len(re.findall(
+            r'\{[^{}]*"(?:name|title)"[^{}]*"(?:lat|latitude)"[^{}]*\}', page, re.IGNORECASE)) == 1
+
+    def test_read_stops_once_evidence_found(self):
+        from http_client import read_bounded
+        from network_analyzer import HTML_EVIDENCE_STORE_OBJECTS, HtmlStoreScanner
+
+        scan = HtmlStoreScanner()
+
+        def on_text(text):
+            scan.feed(text)
+            return scan.has_enough_evidence()
+
+        response = _StreamedResponse(self._pieces(self.PAGE.encode("utf-8"), 256))
+        read = read_bounded(response, 200 * 1024, on_text=on_text)
+        assert read.stopped and response.served < len(response.pieces)
+        assert HTML_EVIDENCE_STORE_OBJECTS <= scan.store_objects < 80